@@ -335,16 +335,15 @@ def _step_source() -> tuple[str, str, dict]:
                 return "EXIT", "", {}
             continue
         # Check for images and videos
-        from idt_core.scanner import scan_images
-        from idt_core.video import scan_videos
+        from idt_core.scanner import VIDEO_EXTENSIONS, iter_media, scan_images
         try:
-            first_img = next(scan_images(p))
+            first_img = next(scan_images(p, sort=False))
             print(f"Found images (e.g. {first_img.name})")
         except StopIteration:
             first_img = None
 
         try:
-            first_vid = next(scan_videos(p))
+            first_vid = next(iter_media(p, VIDEO_EXTENSIONS))
             print(f"Found videos (e.g. {first_vid.name}) — frames will be extracted automatically")
         except StopIteration:
             first_vid = None
@@ -130,10 +130,52 @@ def _metadata_args(p: argparse.ArgumentParser) -> None:
     )
     p.add_argument(
         "--geocode", action="store_true",
-        help="Reverse-geocode GPS coordinates to city/state (requires internet; adds 1s/photo delay)",
+        help="Reverse-geocode GPS coordinates to city/state (online by default: requires internet; adds 1s/photo delay)",
+    )
+    p.add_argument(
+        "--geocoder", choices=["online", "offline", "refine"], default=None,
+        help="Where --geocode looks places up (implies --geocode): online = OpenStreetMap; "
+             "offline = local GeoNames gazetteer, no network; refine = offline, improved online when reachable",
+    )
+    p.add_argument(
+        "--gazetteer", metavar="PATH", type=Path, default=None,
+        help="GeoNames cities file or folder for --geocoder offline/refine (default: ~/.idt/gazetteer)",
     )
 
 
+def _geocode_mode(args):
+    """RunOptions.geocode for these args: False, or one of metadata.GEOCODE_MODES."""
+    mode = getattr(args, "geocoder", None)
+    if mode:
+        return mode
+    return "online" if getattr(args, "geocode", False) else False
+
+
+def _geocode_progress(args):
+    """RunOptions.on_geocode for these args: a running count of the location
+    lookups made before describing (one a second, so minutes on a big folder)."""
+    if getattr(args, "quiet", False) or not _geocode_mode(args):
+        return None
+
+    def report(done, total):
+        _set_console_title(f"IDT - Looking Up Locations ({done} of {total})")
+        print(f"\rLocations: {done} of {total} looked up", end="\n" if done == total else "",
+              flush=True)
+    return report
+
+
+def _require_gazetteer(args) -> None:
+    """Exit with instructions when an offline geocoder is chosen but no gazetteer is installed."""
+    if _geocode_mode(args) not in ("offline", "refine"):
+        return
+    from idt_core.gazetteer import GazetteerNotFound, load_gazetteer
+    try:
+        load_gazetteer(getattr(args, "gazetteer", None))
+    except GazetteerNotFound as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
 # ------------------------------------------------------------------ #
 # Workspace resolution                                                 #
 # ------------------------------------------------------------------ #
@@ -296,8 +338,8 @@ def _launch_gui_describe(source: Path, args) -> None:
         cmd += ["--model", args.model]
     if getattr(args, "prompt", None):
         cmd += ["--prompt", args.prompt]
-    if getattr(args, "geocode", False):
-        cmd += ["--geocode"]
+    if _geocode_mode(args):
+        cmd += ["--geocode", "--geocoder", _geocode_mode(args)]
     _copy = getattr(args, "copy_originals", None)
     if _copy is True:
         cmd += ["--copy-originals"]
@@ -312,9 +354,11 @@ def _launch_gui_describe(source: Path, args) -> None:
 
 def cmd_describe(args):
     from idt_core.pipeline import WorkspacePipeline, RunOptions
+    from idt_core.payload_cache import shared_cache
     from idt_core.progress import Progress
     from idt_core.config import UserConfig
 
+    _require_gazetteer(args)
     stdin_mode = getattr(args, "stdin", False) or args.source == "-"
     if stdin_mode:
         _cmd_describe_stdin(args)
@@ -381,8 +425,10 @@ def cmd_describe(args):
         print(f"Images:     {total_items} in workspace")
         print(f"Provider:   {provider_name}  model: {model}")
         print(f"Prompt:     {prompt_name}")
+        if getattr(args, "jobs", 1) and args.jobs > 1:
+            print(f"Jobs:       {args.jobs} images at once")
         if args.extract_metadata:
-            gcstr = " + geocoding" if args.geocode else ""
+            gcstr = f" + geocoding ({_geocode_mode(args)})" if _geocode_mode(args) else ""
             print(f"Metadata:   EXIF extraction enabled{gcstr}")
         print()
 
@@ -396,7 +442,7 @@ def cmd_describe(args):
     # Save prompt/geocode now; provider+model only saved after a successful run
     # so a completely-failed run doesn't poison the workspace with a bad provider.
     ws.defaults.prompt_name = prompt_name
-    ws.geocode_enabled = bool(args.geocode)
+    ws.geocode_enabled = bool(_geocode_mode(args))
     ws.save_manifest()
 
     provider = _make_provider(provider_name, model, args.ollama_host)
@@ -407,7 +453,12 @@ def cmd_describe(args):
         redescribe=args.redescribe,
         limit=args.limit,
         extract_metadata=args.extract_metadata,
-        geocode=args.geocode,
+        geocode=_geocode_mode(args),
+        gazetteer_path=args.gazetteer,
+        on_geocode=_geocode_progress(args),
+        concurrency=max(1, getattr(args, "jobs", 1) or 1),
+        full_resolution=bool(getattr(args, "full_resolution", False)),
+        payload_cache=shared_cache(),
     )
 
     # Checking every referenced original for existence walks the whole library,
@@ -441,6 +492,10 @@ def cmd_describe(args):
             print("Use --redescribe to generate additional descriptions.")
         return
 
+    if getattr(args, "batch_api", False):
+        _describe_with_batch_api(ws, provider, options, args, len(queue))
+        return
+
     progress = Progress(total=len(queue), quiet=args.quiet)
     progress.start(f"{provider_name} / {model}")
 
@@ -491,20 +546,103 @@ def cmd_describe(args):
         _auto_export_workspace(ws, args.quiet)
 
 
+def _describe_with_batch_api(ws, provider, options, args, queued: int) -> None:
+    """
+    describe --batch-api: send the queue to the vendor's batch endpoint, then
+    poll until every job has finished and its results are in the bundle.
+
+    The job ids are in the manifest from the moment each job is accepted, so
+    if this process stops (Ctrl+C, reboot) running the same command again
+    picks the run up where it left off instead of submitting it twice.
+    """
+    import time as _time
+    from idt_core.batch_api import STATE_KEY, batch_client_for
+    from idt_core.pipeline import WorkspacePipeline
+    from idt_core.progress import Progress
+
+    # A run in progress is collected with the provider and model it was
+    # submitted with, whatever this invocation resolved to.
+    state = (ws.batch_state or {}).get(STATE_KEY)
+    if state and (state["provider"], state["model"]) != (provider.provider_name, provider.model_name):
+        provider = _make_provider(state["provider"], state["model"], args.ollama_host)
+
+    client = batch_client_for(provider)
+    if client is None:
+        print(f"Error: --batch-api needs a provider with a batch endpoint (anthropic, openai), "
+              f"not {provider.provider_name!r}.", file=sys.stderr)
+        sys.exit(1)
+
+    pipeline = WorkspacePipeline(ws, provider)
+    described = errors = 0
+    if state:
+        progress = Progress(total=state["total"], quiet=args.quiet)
+        progress.current = state["done"]
+        progress.message(f"Resuming the batch run submitted {state['submitted']} "
+                         f"({state['provider']} / {state['model']}, {len(state['jobs'])} job(s) pending)")
+    else:
+        progress = Progress(total=queued, quiet=args.quiet)
+        progress.start(f"{provider.provider_name} / {provider.model_name}, batch API")
+        for event in pipeline.submit_batch(client, options):
+            errors += 1
+            progress.update(event.item.display_name, success=False, error=event.error)
+        state = pipeline.pending_batch()
+        if state:
+            progress.message(f"Submitted {state['total'] - state['done']} image(s) in "
+                             f"{len(state['jobs'])} batch job(s). Results usually arrive within "
+                             f"a few hours; the vendors allow up to 24.")
+
+    poll = max(0, getattr(args, "batch_poll", 60) or 0)
+    try:
+        while True:
+            for event in pipeline.collect_batch(client):
+                if event.success:
+                    described += 1
+                else:
+                    errors += 1
+                progress.update(event.item.display_name, success=event.success, error=event.error)
+            if not pipeline.pending_batch() or poll == 0:
+                break
+            _set_console_title(f"IDT - Waiting for batch results ({progress.current} of {progress.total})")
+            _time.sleep(poll)
+    except KeyboardInterrupt:
+        progress.message("\nStopped waiting. The batch jobs keep running; run this command "
+                         "again to collect their results.")
+        return
+
+    if pipeline.pending_batch():
+        progress.message("Batch jobs are still running. Run this command again to collect the results.")
+    else:
+        progress.summary(described=described, errors=errors)
+
+    if described > 0:
+        ws.defaults.provider = provider.provider_name
+        ws.defaults.model = provider.model_name
+        ws.has_any_descriptions = True
+        ws.save_manifest()
+        if not getattr(args, "no_export", False):
+            _auto_export_workspace(ws, args.quiet)
+
+
 def _extract_one_video_into_workspace(ws, video: Path, opts,
-                                      source_root: Path = None) -> list:
+                                      source_root: Path = None, result=None,
+                                      frames_name: str = None) -> list:
     """
     Extract one video's frames into ws.derived_dir("frames")/<stem>/ and register
     the video (reference item) plus each frame (extracted_frame item) in the
     workspace. Returns the list of frame WorkspaceItems (for describing).
 
+    result: a VideoExtractionResult already extracted (by _extract_video_batch)
+    — only registered, not extracted again. frames_name: the frames folder it
+    was extracted into, when not the stem (see frame_dir_names).
+
     Raises ImportError if opencv-python is not installed.
     """
     from idt_core.video import extract_frames_to_dir
     from idt_core.workspace import WorkspaceItem
 
-    frames_dir = ws.derived_dir("frames") / video.stem
-    result = extract_frames_to_dir(video, frames_dir, opts)
+    frames_name = frames_name or video.stem
+    if result is None:
+        result = extract_frames_to_dir(video, ws.derived_dir("frames") / frames_name, opts)
 
     # Register the video as a reference-mode item (no copy — videos are large).
     #
@@ -543,7 +681,7 @@ def _extract_one_video_into_workspace(ws, video: Path, opts,
     for frame_path in result.frame_paths:
         # Frames already live in derived/frames/ — reference them there rather
         # than copying into images/ (that would duplicate every frame).
-        frame_wi = ws.add_image(frame_path, subfolder=f"frames/{video.stem}", copy=False)
+        frame_wi = ws.add_image(frame_path, subfolder=f"frames/{frames_name}", copy=False)
         frame_wi.item_type = "extracted_frame"
         frame_wi.parent_video = video_gui_path
         ws.save_item(frame_wi)
@@ -556,9 +694,31 @@ def _extract_one_video_into_workspace(ws, video: Path, opts,
     return frame_items
 
 
+def _extract_video_batch(ws, videos: list, opts, workers=None, on_done=None) -> list:
+    """
+    Extract every video's frames into ws.derived_dir("frames")/<name>/ at once,
+    one video (or time segment of a long one) per process, each name from
+    frame_dir_names(videos). on_done(n, result) is called as each video
+    finishes. Returns the results in *videos* order.
+
+    Raises ImportError if opencv-python is not installed.
+    """
+    from idt_core.video import frame_dir_names, iter_extract_videos
+
+    frames_root = ws.derived_dir("frames")
+    results = [None] * len(videos)
+    jobs = [(video, frames_root / name)
+            for video, name in zip(videos, frame_dir_names(videos))]
+    for n, (index, result) in enumerate(iter_extract_videos(jobs, opts, workers), start=1):
+        results[index] = result
+        if on_done:
+            on_done(n, result)
+    return results
+
+
 def _extract_videos_into_workspace(ws, source: Path, args) -> None:
     """Scan source for videos, extract frames, and add them to the workspace."""
-    from idt_core.video import scan_videos, VideoExtractionOptions
+    from idt_core.video import frame_dir_names, scan_videos, VideoExtractionOptions
     videos = list(scan_videos(source))
     if not videos:
         return
@@ -574,20 +734,34 @@ def _extract_videos_into_workspace(ws, source: Path, args) -> None:
     # Setup Wizard" for a guideme run -- for the entire extraction, which reads
     # as a hung wizard rather than work in progress.
     _set_console_title(f"IDT - Extracting Video Frames (0 of {len(videos)})")
-    for _n, video in enumerate(videos, start=1):
+
+    def _done(n, result):
+        nonlocal total_frames
+        total_frames += len(result.frame_paths)
+        _set_console_title(
+            f"IDT - Extracting Video Frames ({n} of {len(videos)}, "
+            f"{total_frames} frames)"
+        )
+        if not args.quiet:
+            if result.error:
+                print(f"  {result.video_path.name}: skipped ({result.error})")
+            else:
+                print(f"  {result.video_path.name}: {len(result.frame_paths)} frames")
+
+    try:
+        results = _extract_video_batch(ws, videos, opts, on_done=_done)
+    except ImportError:
+        cv_missing = True
+        results = []
+    for video, result, name in zip(videos, results, frame_dir_names(videos)):
+        if result.error:
+            continue
         try:
-            frame_items = _extract_one_video_into_workspace(ws, video, opts, source)
-            total_frames += len(frame_items)
-            _set_console_title(
-                f"IDT - Extracting Video Frames ({_n} of {len(videos)}, "
-                f"{total_frames} frames)"
-            )
-            if not args.quiet:
-                print(f"  {video.name}: {len(frame_items)} frames")
-        except ImportError:
-            cv_missing = True
-            break
+            _extract_one_video_into_workspace(ws, video, opts, source, result=result,
+                                              frames_name=name)
         except Exception as exc:
+            # One video that cannot be registered must not stop the others.
+            total_frames -= len(result.frame_paths)
             if not args.quiet:
                 print(f"  {video.name}: skipped ({exc})")
     if cv_missing and not args.quiet:
@@ -620,6 +794,7 @@ def _cmd_describe_stdin(args):
     """
     from idt_core.workspace import source_relative_subfolder
     from idt_core.pipeline import WorkspacePipeline, RunOptions
+    from idt_core.payload_cache import shared_cache
     from idt_core.progress import Progress
     from idt_core.config import UserConfig
 
@@ -670,7 +845,7 @@ def _cmd_describe_stdin(args):
         print()
 
     ws.defaults.prompt_name = prompt_name
-    ws.geocode_enabled = bool(args.geocode)
+    ws.geocode_enabled = bool(_geocode_mode(args))
     ws.save_manifest()
 
     options = RunOptions(
@@ -678,7 +853,10 @@ def _cmd_describe_stdin(args):
         prompt_text=prompt_text,
         redescribe=args.redescribe,
         extract_metadata=args.extract_metadata,
-        geocode=args.geocode,
+        geocode=_geocode_mode(args),
+        gazetteer_path=args.gazetteer,
+        on_geocode=_geocode_progress(args),
+        payload_cache=shared_cache(),
     )
     progress = Progress(total=len(items), quiet=args.quiet)
     described = errors = 0
@@ -725,6 +903,7 @@ def cmd_download(args):
     Download images from a URL into a workspace, and optionally describe them.
 
     idt download https://www.nytimes.com/ --max 20 --describe --prompt aialttext
+    idt download https://example.com/gallery/ --depth 2 --max-pages 50
     """
     from idt_core.downloader import download_into_workspace
     from idt_core.config import UserConfig
@@ -752,12 +931,18 @@ def cmd_download(args):
             pct = int(i / total * 100) if total else 0
             print(f"  {i} of {total}  {pct}%  {url[:60]}", end="\r", flush=True)
 
+    def _on_page(i: int, url: str) -> None:
+        if not args.quiet and args.depth:
+            print(f"  page {i}  {url[:70]}", end="\r", flush=True)
+
     try:
         result = download_into_workspace(
             ws, args.url,
             min_width=min_w, min_height=min_h,
             timeout=args.timeout, max_images=args.max_images,
-            on_progress=_on_progress,
+            on_progress=_on_progress, workers=args.jobs,
+            max_depth=args.depth, max_pages=args.max_pages,
+            same_domain=not args.any_domain, on_page=_on_page,
         )
     except ImportError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -797,6 +982,7 @@ def cmd_download(args):
     if args.describe and result.downloaded > 0:
         print()
         from idt_core.pipeline import WorkspacePipeline, RunOptions
+        from idt_core.payload_cache import shared_cache
         from idt_core.progress import Progress
 
         # Only inherit provider/model from the workspace once it has a real
@@ -823,6 +1009,7 @@ def cmd_download(args):
             # so it never touches other, already-described images sharing this
             # workspace.
             redescribe=args.redescribe,
+            payload_cache=shared_cache(),
         )
         progress = Progress(total=result.downloaded, quiet=args.quiet)
         described = errors = 0
@@ -895,6 +1082,7 @@ def cmd_video(args):
         mode=mode,
         interval_seconds=args.interval,
         scene_threshold=args.scene,
+        min_scene_seconds=args.min_scene,
         max_frames=args.max_frames,
     )
 
@@ -905,21 +1093,27 @@ def cmd_video(args):
         print(f"Mode:      {mode}  ({'every ' + str(args.interval) + 's' if mode == 'interval' else 'threshold ' + str(args.scene)})")
         print()
 
+    def _done(n, result):
+        if result.error:
+            print(f"  Error processing {result.video_path.name}: {result.error}", file=sys.stderr)
+        elif not args.quiet:
+            print(f"  {result.video_path.name}: {len(result.frame_paths)} frames "
+                  f"-> {result.frames_dir}  ({n} of {len(videos)})")
+
+    try:
+        results = _extract_video_batch(ws, videos, opts, workers=args.jobs, on_done=_done)
+    except ImportError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        print("Install with: pip install opencv-python", file=sys.stderr)
+        sys.exit(1)
+
+    # Register in video order, whatever order the workers finished in.
     all_frame_items = []
-    for video in videos:
-        if not args.quiet:
-            print(f"  Extracting frames: {video.name}")
-        try:
-            frame_items = _extract_one_video_into_workspace(ws, video, opts, source)
-            all_frame_items.extend(frame_items)
-            if not args.quiet:
-                print(f"    {len(frame_items)} frames -> {ws.derived_dir('frames') / video.stem}")
-        except ImportError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            print("Install with: pip install opencv-python", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"  Error processing {video.name}: {e}", file=sys.stderr)
+    for video, result in zip(videos, results):
+        if not result.error:
+            all_frame_items.extend(
+                _extract_one_video_into_workspace(ws, video, opts, source, result=result)
+            )
 
     total_frames = len(all_frame_items)
     if not args.quiet:
@@ -928,6 +1122,7 @@ def cmd_video(args):
     if args.describe and total_frames > 0:
         print()
         from idt_core.pipeline import WorkspacePipeline, RunOptions
+        from idt_core.payload_cache import shared_cache
         from idt_core.progress import Progress
         from idt_core.config import UserConfig
 
@@ -951,6 +1146,7 @@ def cmd_video(args):
             prompt_text=prompt_text,
             extract_metadata=False,  # extracted frames carry no EXIF
             redescribe=args.redescribe,
+            payload_cache=shared_cache(),
         )
         progress = Progress(total=total_frames, quiet=args.quiet)
         described = errors = 0
@@ -1811,12 +2007,14 @@ def cmd_chat(args):
 # ------------------------------------------------------------------ #
 
 def cmd_watch(args):
-    import time
     from idt_core.workspace import source_relative_subfolder
     from idt_core.pipeline import WorkspacePipeline, RunOptions
-    from idt_core.scanner import scan_images
+    from idt_core.payload_cache import shared_cache
+    from idt_core.scan_snapshot import ScanSnapshot, snapshot_path
+    from idt_core.watcher import FolderWatcher
     from idt_core.config import UserConfig
 
+    _require_gazetteer(args)
     source = Path(args.source).resolve()
     if not source.is_dir():
         print(f"Error: not a directory: {source}", file=sys.stderr)
@@ -1834,11 +2032,26 @@ def cmd_watch(args):
     prompt_name, prompt_text = _resolve_prompt(args, ws.defaults)
     provider = _make_provider(provider_name, model, args.ollama_host)
 
+    # The tree as last seen (by this or an earlier watch), so each rescan
+    # lists only the directories that changed instead of the whole tree.
+    snapshot = ScanSnapshot.load(snapshot_path(source, ws.path), source)
+    try:
+        watcher = FolderWatcher(snapshot, backend=args.backend, interval=args.interval)
+    except ImportError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        sys.exit(1)
+    watcher.start()
+
     if not args.quiet:
         print(f"Watching:  {source}")
         print(f"Workspace: {ws.path}")
         print(f"Provider:  {provider_name}  model: {model}")
-        print(f"Interval:  {args.interval}s  prompt: {prompt_name}")
+        if watcher.backend == "events":
+            print(f"Mode:      filesystem events  prompt: {prompt_name}")
+        else:
+            print(f"Interval:  {args.interval}s  prompt: {prompt_name}")
+        if watcher.fallback_reason:
+            print(f"           (filesystem events unavailable: {watcher.fallback_reason})")
         print("Press Ctrl+C to stop.\n")
 
     ws.defaults.prompt_name = prompt_name
@@ -1847,28 +2060,24 @@ def cmd_watch(args):
         prompt_name=prompt_name,
         prompt_text=prompt_text,
         extract_metadata=getattr(args, "extract_metadata", True),
-        geocode=getattr(args, "geocode", False),
+        geocode=_geocode_mode(args),
+        gazetteer_path=getattr(args, "gazetteer", None),
+        on_geocode=_geocode_progress(args),
+        payload_cache=shared_cache(),
     )
 
-    def _describe(new_items) -> None:
-        pipeline = WorkspacePipeline(ws, provider)
-        for event in pipeline.run_items(new_items, options):
-            if event.success:
-                desc = event.item.active_description
-                if not args.quiet:
-                    print(f"Described: {event.item.display_name}")
-                    if desc:
-                        preview = desc.text[:120] + ("..." if len(desc.text) > 120 else "")
-                        print(f"  {preview}\n")
-                elif desc:
-                    print(f"{event.item.source_path}\t{desc.text}")
-            else:
-                print(f"Error: {event.item.display_name}: {event.error}", file=sys.stderr)
-        if any(i.described for i in new_items):
-            ws.defaults.provider = provider_name
-            ws.defaults.model = model
-            ws.has_any_descriptions = True
-            ws.save_manifest()
+    def _report(event) -> None:
+        if event.success:
+            desc = event.item.active_description
+            if not args.quiet:
+                print(f"Described: {event.item.display_name}")
+                if desc:
+                    preview = desc.text[:120] + ("..." if len(desc.text) > 120 else "")
+                    print(f"  {preview}\n")
+            elif desc:
+                print(f"{event.item.source_path}\t{desc.text}")
+        else:
+            print(f"Error: {event.item.display_name}: {event.error}", file=sys.stderr)
 
     def _add_source_images(paths) -> list:
         added = []
@@ -1880,29 +2089,47 @@ def cmd_watch(args):
             ))
         return added
 
-    try:
-        # Initial pass: add everything currently in the folder and describe what's new.
-        known = set(scan_images(source))
-        initial = [i for i in _add_source_images(known) if not i.described]
-        if initial:
-            _describe(initial)
+    def _arrivals():
+        """Batches of items for the pipeline: what is waiting now, then each settled arrival."""
+        resumed = snapshot.loaded
+        delta = snapshot.rescan()
+        # A file still being copied in waits for the watcher, like any arrival;
+        # until it settles the snapshot stays unsaved, so a stop re-finds it.
+        settled = watcher.hold(delta.added)
+        if not watcher.pending:
+            snapshot.save()
+
+        # Initial pass: add what is new and describe everything from this
+        # folder still waiting. A first watch adds the whole folder.
+        _add_source_images(settled)
+        current = {str(p) for p in snapshot.paths()}
+        initial = [
+            ws.get_item(e.image, e.subfolder) for e in ws.entries()
+            if e.item_type != "video" and not e.described and e.source_path in current
+        ]
+        if resumed and not args.quiet and (delta.added or delta.removed):
+            print(f"Since last watch: {len(delta.added)} new, {len(delta.removed)} removed\n")
+        yield [i for i in initial if i is not None]
 
-        # Poll loop
-        while True:
-            remaining = args.interval
-            while remaining > 0:
-                if not args.quiet and remaining % 30 == 0:
-                    print(f"  ... next scan in {remaining}s", flush=True)
-                time.sleep(min(5, remaining))
-                remaining -= 5
-
-            current = set(scan_images(source))
-            new_paths = current - known
-            known |= current
-            if new_paths:
-                new_items = [i for i in _add_source_images(new_paths) if not i.described]
-                if new_items:
-                    _describe(new_items)
+        if not args.quiet:
+            print("Waiting for new images...", flush=True)
+        for delta in watcher.changes():
+            if not args.quiet and (delta.removed or delta.modified):
+                print(f"  {len(delta.removed)} removed, {len(delta.modified)} changed", flush=True)
+            if delta.added:
+                yield _add_source_images(delta.added)
+
+    recorded = False
+    try:
+        with watcher:
+            for event in WorkspacePipeline(ws, provider).run_feed(_arrivals(), options):
+                _report(event)
+                if event.success and not recorded:
+                    ws.defaults.provider = provider_name
+                    ws.defaults.model = model
+                    ws.has_any_descriptions = True
+                    ws.save_manifest()
+                    recorded = True
     except KeyboardInterrupt:
         if not args.quiet:
             print("\nWatcher stopped.")
@@ -2202,6 +2429,7 @@ Examples:
   idt describe ~/Pictures/Vacation/ --provider ollama --model llava
   idt describe ~/Pictures/Vacation/ --prompt concise --limit 10 --embed
   idt describe ~/Pictures/Vacation/ --geocode            # add city/state to prompt context
+  idt describe ~/Pictures/Vacation/ --geocoder offline   # same, from a local gazetteer (no network)
   idt describe ~/Pictures/Web/ --prompt aialttext --quiet
   idt download https://www.nytimes.com/ --max 20 --describe --prompt aialttext
   idt download https://example.com/gallery ~/Photos/web --max 50
@@ -2272,6 +2500,19 @@ Supported providers:
                         help="Generate a new description even for already-described images")
     p_desc.add_argument("--limit", type=int, metavar="N",
                         help="Stop after describing N images")
+    p_desc.add_argument("--jobs", "-j", type=int, default=1, metavar="N",
+                        help="Describe N images at once (default: 1). Overlaps provider "
+                             "round trips; most useful with cloud providers")
+    p_desc.add_argument("--full-resolution", action="store_true",
+                        help="Send images at their original size. By default each image is "
+                             "downscaled to what the chosen model actually uses before upload")
+    p_desc.add_argument("--batch-api", action="store_true",
+                        help="Submit the images to the provider's batch endpoint (anthropic, "
+                             "openai): about half the price, results within 24 hours. If "
+                             "interrupted, run the same command again to collect the results")
+    p_desc.add_argument("--batch-poll", type=int, default=60, metavar="SECONDS",
+                        help="With --batch-api, how often to check for results (default: 60). "
+                             "0 submits or collects once and exits")
     p_desc.add_argument("--embed", action="store_true",
                         help="Automatically embed descriptions into image copies after describing")
     p_desc.add_argument("--copy-originals", dest="copy_originals", action="store_true", default=None,
@@ -2317,6 +2558,16 @@ Supported providers:
                       help="Minimum image size to download (e.g. 200x200)")
     p_dl.add_argument("--timeout", type=int, default=30,
                       help="Request timeout in seconds (default: 30)")
+    p_dl.add_argument("--jobs", "-j", type=int, default=8, metavar="N",
+                      help="Download N images at once (default: 8). At most 2 go to any one "
+                           "host, spaced out, whatever N is")
+    p_dl.add_argument("--depth", type=int, default=0, metavar="N",
+                      help="Crawl: also download from pages up to N links away from URL "
+                           "(default: 0, URL's page only)")
+    p_dl.add_argument("--max-pages", dest="max_pages", type=int, default=20, metavar="N",
+                      help="Crawl: fetch at most N pages, URL's included (default: 20)")
+    p_dl.add_argument("--any-domain", dest="any_domain", action="store_true",
+                      help="Crawl: follow links to other sites too (default: URL's domain only)")
     p_dl.add_argument("--describe", action="store_true",
                       help="Describe downloaded images immediately")
     p_dl.add_argument("--embed", action="store_true",
@@ -2360,11 +2611,18 @@ Supported providers:
     )
     p_vid.add_argument(
         "--scene", type=float, default=0.0, metavar="THRESHOLD",
-        help="Scene-change extraction; threshold 0-100, lower=more sensitive (e.g. --scene 30). "
-             "Mutually exclusive with --interval.",
+        help="Scene-change extraction; threshold 0-100, the percentage of the picture that must "
+             "change, lower=more sensitive (e.g. --scene 30). Mutually exclusive with --interval.",
+    )
+    p_vid.add_argument(
+        "--min-scene", type=float, default=1.0, metavar="SECONDS",
+        help="With --scene: changes closer together than this count as one scene (default: 1.0)",
     )
     p_vid.add_argument("--max-frames", type=int, metavar="N",
                        help="Maximum frames to extract per video")
+    p_vid.add_argument("--jobs", "-j", type=int, default=None, metavar="N",
+                       help="Extract N videos at once (default: one per CPU core). A long "
+                            "video on its own is split into time segments extracted side by side")
     p_vid.add_argument("--describe", action="store_true",
                        help="Describe extracted frames after extraction")
     p_vid.add_argument("--redescribe", action="store_true",
@@ -2532,8 +2790,8 @@ Supported providers:
         "watch",
         help="Monitor a directory and describe new images automatically",
         description=(
-            "Describes undescribed images, then polls for new arrivals. "
-            "Press Ctrl+C to stop."
+            "Describes undescribed images, then describes new arrivals once they have "
+            "finished copying. Press Ctrl+C to stop."
         ),
     )
     p_watch.add_argument("source", help="Directory to watch")
@@ -2541,7 +2799,11 @@ Supported providers:
                          help="Workspace to describe into (bare name → under the workspace "
                               "root; path/.idtw → that location). Default: mirrored from the source.")
     p_watch.add_argument("--interval", type=int, default=30, metavar="SECONDS",
-                         help="Polling interval in seconds (default: 30)")
+                         help="Polling interval in seconds when polling; with filesystem "
+                              "events, the most time between safety rescans (default: 30)")
+    p_watch.add_argument("--backend", choices=["auto", "events", "poll"], default="auto",
+                         help="How new files are noticed: filesystem events (needs the "
+                              "watchdog package) or polling. Default: events when available")
     _provider_args(p_watch)
     _prompt_args(p_watch)
     _metadata_args(p_watch)
@@ -2654,4 +2916,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen builds re-launch this executable for process-pool workers
+    # (MetadataExtractor.extract_many); this returns at once otherwise.
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
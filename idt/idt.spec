@@ -62,6 +62,14 @@ a = Analysis(
         'idt_core.image_item',
         'idt_core.scanner',
         'idt_core.metadata',
+        'idt_core.exif_reader',
+        'idt_core.metadata_cache',
+        'idt_core.download_cache',
+        'idt_core.file_copy',
+        'idt_core.web_images',
+        'idt_core.gazetteer',
+        'idt_core.scan_snapshot',
+        'idt_core.watcher',
         'idt_core.embedder',
         'idt_core.exporter',
         'idt_core.config',
@@ -70,6 +78,10 @@ a = Analysis(
         'idt_core.downloader',
         'idt_core.video',
         'idt_core.workspace',
+        'idt_core.catalog',
+        'idt_core.payload_cache',
+        'idt_core.rate_limit',
+        'idt_core.batch_api',
         'idt_core.logger',
         'idt_core.providers',
         'idt_core.providers.base',
@@ -8,7 +8,8 @@ from .pipeline import Pipeline, RunOptions, PipelineEvent, WorkspacePipeline, Wo
 from .image_item import ImageItem, Description
 from .scanner import scan_images, IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
 from .config import UserConfig, BUILT_IN_PROMPTS, DEFAULT_PROMPT_NAME
-from .metadata import MetadataExtractor, NominatimGeocoder, ImageMetadata
+from .metadata import MetadataExtractor, NominatimGeocoder, ImageMetadata, make_geocoder
+from .gazetteer import OfflineGeocoder, load_gazetteer
 from .downloader import download_into_workspace, WorkspaceDownloadResult, domain_name
 from .video import VideoExtractionOptions, VideoExtractionResult, scan_videos, extract_frames_to_dir
 from .embedder import Embedder, embed_image_file
@@ -29,7 +30,8 @@ __all__ = [
     "ImageItem", "Description",
     "scan_images", "scan_videos", "IMAGE_EXTENSIONS", "VIDEO_EXTENSIONS",
     "UserConfig", "BUILT_IN_PROMPTS", "DEFAULT_PROMPT_NAME",
-    "MetadataExtractor", "NominatimGeocoder", "ImageMetadata",
+    "MetadataExtractor", "NominatimGeocoder", "ImageMetadata", "make_geocoder",
+    "OfflineGeocoder", "load_gazetteer",
     "download_into_workspace", "WorkspaceDownloadResult", "domain_name",
     "VideoExtractionOptions", "VideoExtractionResult", "extract_frames_to_dir",
     "Embedder", "embed_image_file",
@@ -0,0 +1,167 @@
+"""
+Vendor batch endpoints — describe a queue asynchronously, at batch prices.
+
+Anthropic's Message Batches API and OpenAI's Batch API take a file of ordinary
+requests and return the answers within 24 hours at half the price, with no
+per-minute rate limit in the way. That suits an overnight archive run, where
+nobody is waiting on the first description. The requests are built by the
+provider's own ``request_params`` so a batch asks exactly what a live describe
+would.
+
+A run is submitted, then collected, possibly by a different process days
+later, so everything needed to finish it is written to the workspace manifest
+under ``batch_state[STATE_KEY]``:
+
+    {"provider", "model", "prompt_name", "prompt_text", "total", "done",
+     "submitted", "jobs": [{"id", "requests": {custom_id: {"image", "subfolder",
+     "meta"}}}]}
+
+A job leaves the list once its results are written; the key goes when the last
+one does. The rest of ``batch_state`` belongs to the GUI's own batch queue and
+is left alone. See WorkspacePipeline.submit_batch / collect_batch.
+"""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from .providers.base import BaseProvider, DescriptionResult
+
+#: Where a vendor batch run keeps its job ids in Workspace.batch_state.
+STATE_KEY = "api_batch"
+
+#: Requests per job. Both vendors allow more (Anthropic 100,000, OpenAI
+#: 50,000); smaller jobs start returning results sooner and lose less when one
+#: fails.
+MAX_REQUESTS_PER_JOB = 10_000
+
+#: Encoded request bytes per job, under both vendors' ceilings (Anthropic
+#: 256 MB per batch, OpenAI 200 MB per input file).
+MAX_JOB_BYTES = 150 * 1024 * 1024
+
+
+@dataclass
+class BatchRequest:
+    custom_id: str
+    params: dict          # provider.request_params(...)
+
+
+@dataclass
+class BatchOutcome:
+    custom_id: str
+    result: Optional[DescriptionResult] = None
+    error: Optional[str] = None
+
+
+class BatchClient(ABC):
+    """One vendor's batch endpoint, driven through the provider's SDK client."""
+
+    def __init__(self, provider: BaseProvider):
+        self.provider = provider
+
+    @abstractmethod
+    def submit(self, requests: list[BatchRequest]) -> str:
+        """Create a job for *requests*; return its id."""
+
+    @abstractmethod
+    def finished(self, job_id: str) -> bool:
+        """True once the job will not change again (ended, expired, failed, cancelled)."""
+
+    @abstractmethod
+    def results(self, job_id: str) -> Iterator[BatchOutcome]:
+        """One outcome per request the vendor reported on. Requests it never
+        reached (an expired or failed job) are simply absent."""
+
+
+class ClaudeBatchClient(BatchClient):
+    """Anthropic Message Batches: POST /v1/messages/batches, results as JSONL."""
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        batch = self.provider._client.messages.batches.create(
+            requests=[{"custom_id": r.custom_id, "params": r.params} for r in requests]
+        )
+        return batch.id
+
+    def finished(self, job_id: str) -> bool:
+        batch = self.provider._client.messages.batches.retrieve(job_id)
+        return batch.processing_status == "ended"
+
+    def results(self, job_id: str) -> Iterator[BatchOutcome]:
+        for entry in self.provider._client.messages.batches.results(job_id):
+            result = entry.result
+            if result.type == "succeeded":
+                yield BatchOutcome(entry.custom_id, self.provider.result_from_message(result.message))
+            elif result.type == "errored":
+                error = getattr(getattr(result, "error", None), "error", None)
+                yield BatchOutcome(entry.custom_id, error=getattr(error, "message", None) or "errored")
+            else:  # canceled / expired
+                yield BatchOutcome(entry.custom_id, error=f"request {result.type}")
+
+
+class OpenAIBatchClient(BatchClient):
+    """OpenAI Batch API: upload a JSONL file, create a batch over it, read the output file."""
+
+    ENDPOINT = "/v1/chat/completions"
+
+    def submit(self, requests: list[BatchRequest]) -> str:
+        lines = "".join(
+            json.dumps({"custom_id": r.custom_id, "method": "POST",
+                        "url": self.ENDPOINT, "body": r.params}) + "\n"
+            for r in requests
+        )
+        client = self.provider._client
+        upload = client.files.create(file=("idt-batch.jsonl", lines.encode("utf-8")),
+                                     purpose="batch")
+        batch = client.batches.create(input_file_id=upload.id, endpoint=self.ENDPOINT,
+                                      completion_window="24h")
+        return batch.id
+
+    def finished(self, job_id: str) -> bool:
+        batch = self.provider._client.batches.retrieve(job_id)
+        return batch.status in ("completed", "failed", "expired", "cancelled")
+
+    def results(self, job_id: str) -> Iterator[BatchOutcome]:
+        client = self.provider._client
+        batch = client.batches.retrieve(job_id)
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    yield self._outcome(json.loads(line))
+
+    def _outcome(self, record: dict) -> BatchOutcome:
+        custom_id = record.get("custom_id", "")
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or body.get("error") or {}
+            message = error.get("message") if isinstance(error, dict) else str(error)
+            return BatchOutcome(custom_id, error=message or f"status {response.get('status_code')}")
+        usage = body.get("usage") or {}
+        return BatchOutcome(custom_id, DescriptionResult(
+            text=body["choices"][0]["message"]["content"],
+            model=self.provider.model_name,
+            provider="openai",
+            input_tokens=usage.get("prompt_tokens"),
+            output_tokens=usage.get("completion_tokens"),
+        ))
+
+
+def batch_client_for(provider: BaseProvider) -> Optional[BatchClient]:
+    """The batch client for *provider*, or None when it has no batch endpoint."""
+    from .providers.claude import ClaudeProvider
+    from .providers.openai_provider import OpenAIProvider
+
+    if isinstance(provider, ClaudeProvider):
+        return ClaudeBatchClient(provider)
+    if isinstance(provider, OpenAIProvider):
+        return OpenAIBatchClient(provider)
+    return None
+
+
+def request_size(params: dict) -> int:
+    """Bytes *params* add to a job, near enough (the JSON of the request)."""
+    return len(json.dumps(params)) + 200
@@ -0,0 +1,273 @@
+"""
+Catalog — an index of a workspace bundle's sidecars, so that listing, counting
+and looking up items does not mean opening and parsing every one of them.
+
+``descriptions/`` stays the source of truth. The catalog
+(``derived/catalog.sqlite3``) is a cache of it: one row per sidecar holding the
+parsed item, the handful of columns that status and queue building need, and
+the sidecar's size and mtime at the moment the row was taken.
+
+Every read starts with :meth:`Catalog.refresh`, which walks ``descriptions/``
+with ``os.scandir`` (a stat per file, no reads) and re-parses only the sidecars
+whose size or mtime no longer match their row. A sidecar written by hand, by an
+older build, or by the other tool is therefore picked up on the next read, and
+nothing unchanged is read at all. ``Workspace.save_item`` updates the row in the
+same breath as it writes the file, so after a describe run the walk normally
+finds nothing to do.
+
+Two properties this module exists to guarantee:
+
+* **A bad catalog is never worse than no catalog.** A deleted, truncated or
+  foreign-version file is simply rebuilt from the sidecars. Only when SQLite
+  cannot be used at all (read-only media, a share that refuses locks) does a
+  call raise :class:`CatalogUnavailable`, and ``Workspace`` answers that by
+  reading the sidecars directly, exactly as it did before the catalog existed.
+* **It never holds a file open between calls.** Every operation opens its own
+  connection and closes it, so a bundle can be moved, zipped or deleted (Windows
+  refuses to delete an open file) the moment a call returns, and worker threads
+  never share a connection.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+#: Bumped when the table shape changes. A file carrying any other version is
+#: dropped and rebuilt rather than migrated — everything in it can be re-derived
+#: from the sidecars.
+SCHEMA_VERSION = 1
+
+CATALOG_NAME = "catalog.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    rel                   TEXT PRIMARY KEY,  -- sidecar path under descriptions/, '/'-separated
+    image                 TEXT,
+    subfolder             TEXT,
+    item_type             TEXT,
+    storage               TEXT,
+    source_path           TEXT,
+    described             INTEGER,
+    is_missing            INTEGER,
+    active_description_id TEXT,
+    mtime_ns              INTEGER NOT NULL,
+    size                  INTEGER NOT NULL,
+    data                  TEXT               -- compact item JSON; NULL if the sidecar did not parse
+);
+CREATE INDEX IF NOT EXISTS items_image ON items (image);
+CREATE INDEX IF NOT EXISTS items_source ON items (source_path);
+"""
+
+_COLUMNS = ("image", "subfolder", "item_type", "storage", "source_path",
+            "described", "is_missing", "active_description_id")
+
+
+class CatalogUnavailable(Exception):
+    """SQLite cannot be used for this bundle; read the sidecars directly."""
+
+
+@dataclass
+class CatalogEntry:
+    """The indexed columns of one item — enough to count, filter and locate it
+    without parsing its descriptions."""
+    image: str
+    subfolder: Optional[str]
+    item_type: str
+    storage: str
+    source_path: str
+    described: bool
+    is_missing: bool
+    active_description_id: Optional[str]
+
+
+def _columns(data: dict) -> tuple:
+    return (
+        data.get("image"),
+        data.get("subfolder"),
+        data.get("item_type", "image"),
+        data.get("storage", "copy"),
+        data.get("source_path", ""),
+        1 if data.get("descriptions") else 0,
+        1 if data.get("is_missing") else 0,
+        data.get("active_description_id"),
+    )
+
+
+class Catalog:
+    """The catalog of one bundle. Cheap to construct; nothing is opened until used."""
+
+    def __init__(self, db_path: Path, descriptions_dir: Path):
+        self.db_path = Path(db_path)
+        self.descriptions_dir = Path(descriptions_dir)
+
+    # ----- connection ----- #
+    def _open(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        # The file is a cache: losing the last few writes to a power cut costs a
+        # re-parse, never data, so there is no reason to pay for an fsync.
+        conn.execute("PRAGMA synchronous = OFF")
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS items")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the catalog, rebuilding it once if the file is not a usable database."""
+        try:
+            return self._open()
+        except sqlite3.DatabaseError:
+            pass
+        try:
+            self.db_path.unlink()
+        except OSError:
+            pass
+        try:
+            return self._open()
+        except (sqlite3.Error, OSError) as exc:
+            raise CatalogUnavailable(str(exc)) from exc
+
+    def _rel(self, sidecar: Path) -> str:
+        return Path(os.path.relpath(sidecar, self.descriptions_dir)).as_posix()
+
+    # ----- maintenance ----- #
+    def _walk(self) -> dict[str, tuple[int, int]]:
+        """rel -> (mtime_ns, size) for every sidecar on disk. Stat only."""
+        found: dict[str, tuple[int, int]] = {}
+        stack = [self.descriptions_dir]
+        while stack:
+            folder = stack.pop()
+            try:
+                entries = os.scandir(folder)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            stack.append(Path(entry.path))
+                        elif entry.name.endswith(".json") and entry.is_file():
+                            st = entry.stat()
+                            found[self._rel(Path(entry.path))] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        return found
+
+    def refresh(self) -> int:
+        """Bring the catalog in line with descriptions/. Returns how many sidecars were re-read."""
+        on_disk = self._walk()
+        try:
+            with closing(self._connect()) as conn:
+                known = {
+                    rel: (mtime_ns, size)
+                    for rel, mtime_ns, size in conn.execute("SELECT rel, mtime_ns, size FROM items")
+                }
+                gone = [(rel,) for rel in known.keys() - on_disk.keys()]
+                stale = [rel for rel, stamp in on_disk.items() if known.get(rel) != stamp]
+                if gone:
+                    conn.executemany("DELETE FROM items WHERE rel = ?", gone)
+                for rel in stale:
+                    self._reindex(conn, rel)
+                if gone or stale:
+                    conn.commit()
+                return len(stale)
+        except sqlite3.Error as exc:
+            raise CatalogUnavailable(str(exc)) from exc
+
+    def _reindex(self, conn: sqlite3.Connection, rel: str) -> None:
+        path = self.descriptions_dir / rel
+        try:
+            # Stat the open file, not the path: a save landing between a stat
+            # and a read would otherwise pair new content with an old mtime.
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                raw = f.read()
+        except OSError:
+            conn.execute("DELETE FROM items WHERE rel = ?", (rel,))
+            return
+        try:
+            data = json.loads(raw.decode("utf-8"))
+            if not isinstance(data, dict) or "image" not in data:
+                raise ValueError("not an item sidecar")
+        except Exception:
+            # Remembered as unparseable, so a broken file is not re-read on
+            # every call — only once it changes again.
+            conn.execute(
+                "INSERT OR REPLACE INTO items (rel, mtime_ns, size, data) VALUES (?, ?, ?, NULL)",
+                (rel, st.st_mtime_ns, st.st_size),
+            )
+            return
+        self._upsert(conn, rel, data, st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, rel: str, data: dict, mtime_ns: int, size: int) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO items (rel, " + ", ".join(_COLUMNS)
+            + ", mtime_ns, size, data) VALUES (?" + ", ?" * (len(_COLUMNS) + 3) + ")",
+            (rel, *_columns(data), mtime_ns, size,
+             json.dumps(data, ensure_ascii=False, separators=(",", ":"))),
+        )
+
+    def record(self, sidecar: Path, data: dict) -> None:
+        """Note that *sidecar* was just written with *data*."""
+        self.record_many([(sidecar, data)])
+
+    def record_many(self, written: list[tuple[Path, dict]]) -> None:
+        """record() for a batch of sidecars, in one transaction (called by
+        Workspace._write_sidecars)."""
+        try:
+            with closing(self._connect()) as conn:
+                for sidecar, data in written:
+                    st = sidecar.stat()
+                    self._upsert(conn, self._rel(sidecar), data, st.st_mtime_ns, st.st_size)
+                conn.commit()
+        except sqlite3.Error as exc:
+            raise CatalogUnavailable(str(exc)) from exc
+
+    # ----- queries (callers refresh first) ----- #
+    def _select(self, sql: str, params: tuple = ()) -> list:
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute(sql, params).fetchall()
+        except sqlite3.Error as exc:
+            raise CatalogUnavailable(str(exc)) from exc
+
+    def item_dicts(self) -> Iterator[dict]:
+        """Every parseable item, in the order a sorted glob of descriptions/ gives."""
+        rows = self._select("SELECT rel, data FROM items WHERE data IS NOT NULL")
+        rows.sort(key=lambda r: self.descriptions_dir / r[0])
+        for _, data in rows:
+            yield json.loads(data)
+
+    def entries(self) -> list[CatalogEntry]:
+        """Indexed columns for every parseable item, same order as item_dicts()."""
+        rows = self._select(
+            "SELECT rel, " + ", ".join(_COLUMNS) + " FROM items WHERE data IS NOT NULL"
+        )
+        rows.sort(key=lambda r: self.descriptions_dir / r[0])
+        return [
+            CatalogEntry(
+                image=r[1], subfolder=r[2], item_type=r[3] or "image", storage=r[4] or "copy",
+                source_path=r[5] or "", described=bool(r[6]), is_missing=bool(r[7]),
+                active_description_id=r[8],
+            )
+            for r in rows
+        ]
+
+    def find(self, image_name: str) -> Optional[dict]:
+        """The first item (in sorted order) whose bundle key is *image_name*, any subfolder."""
+        rows = self._select(
+            "SELECT rel, data FROM items WHERE image = ? AND data IS NOT NULL", (image_name,)
+        )
+        if not rows:
+            return None
+        rows.sort(key=lambda r: self.descriptions_dir / r[0])
+        return json.loads(rows[0][1])
@@ -18,9 +18,9 @@ abandons the generator (the user pressing Stop) does not leak a connection.
 from __future__ import annotations
 
 import base64
-import io
 from typing import Iterator, List, Optional, Sequence, Tuple
 
+from ..converter import shape_for_wire, wire_profile_for
 from ..providers.base import (
     ChatDelta,
     ChatProvider,
@@ -33,10 +33,11 @@ from ..providers.base import (
 )
 from .messages import Attachment, ChatMessage, conversation_turns
 
-#: OpenAI images are resized to this longest edge before upload, matching the
-#: batch describe path in imagedescriber/ai_providers.py.
-OPENAI_MAX_IMAGE_DIM = 1600
-OPENAI_JPEG_QUALITY = 85
+#: OpenAI images are shaped by the same wire profile as the describe paths
+#: (idt_core.converter.wire_profile_for), so chat and batch cannot drift.
+OPENAI_WIRE_PROFILE = wire_profile_for("openai")
+OPENAI_MAX_IMAGE_DIM = OPENAI_WIRE_PROFILE.max_edge
+OPENAI_JPEG_QUALITY = OPENAI_WIRE_PROFILE.quality
 
 
 # ---------------------------------------------------------------------------
@@ -55,24 +56,8 @@ def encode_image_openai(att: Attachment) -> dict:
     Falls back to the raw bytes if Pillow is unavailable or the image cannot be
     decoded — sending something oversized beats failing the turn.
     """
-    raw = att.read_bytes()
-    try:
-        from PIL import Image
-
-        img = Image.open(io.BytesIO(raw))
-        if img.mode != "RGB":
-            img = img.convert("RGB")
-        if max(img.size) > OPENAI_MAX_IMAGE_DIM:
-            ratio = OPENAI_MAX_IMAGE_DIM / max(img.size)
-            img = img.resize(
-                (int(img.width * ratio), int(img.height * ratio)),
-                Image.Resampling.LANCZOS,
-            )
-        buf = io.BytesIO()
-        img.save(buf, format="JPEG", quality=OPENAI_JPEG_QUALITY)
-        payload = base64.b64encode(buf.getvalue()).decode("utf-8")
-    except Exception:
-        payload = base64.b64encode(raw).decode("utf-8")
+    data, _mime = shape_for_wire(att.read_bytes(), OPENAI_WIRE_PROFILE)
+    payload = base64.b64encode(data).decode("utf-8")
     return {
         "type": "image_url",
         "image_url": {"url": f"data:image/jpeg;base64,{payload}"},
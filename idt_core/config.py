@@ -92,6 +92,10 @@ class UserConfig:
     # ISO timestamp of the last startup check, used to throttle to once a day so
     # every launch does not hit the GitHub API.
     last_update_check: Optional[str] = None
+    # Size bound, in MB, of the prepared-payload cache in ~/.idt/cache/payloads
+    # (downscaled/converted images ready to upload; see idt_core/payload_cache.py).
+    # 0 turns the cache off.
+    payload_cache_mb: int = 2048
 
     def workspace_root_path(self) -> Path:
         """Resolved workspace root. Defaults to ~/Documents/idt."""
@@ -116,6 +120,10 @@ class UserConfig:
         obj.copy_originals = bool(data.get("copy_originals", False))
         obj.preserve_alt_text = bool(data.get("preserve_alt_text", True))
         obj.auto_check_updates = bool(data.get("auto_check_updates", True))
+        try:
+            obj.payload_cache_mb = int(data.get("payload_cache_mb", obj.payload_cache_mb))
+        except (TypeError, ValueError):
+            pass
         return obj
 
     def save(self) -> None:
@@ -128,6 +136,7 @@ class UserConfig:
             "copy_originals": self.copy_originals,
             "preserve_alt_text": self.preserve_alt_text,
             "auto_check_updates": self.auto_check_updates,
+            "payload_cache_mb": self.payload_cache_mb,
         }
         if self.workspace_root:
             data["workspace_root"] = self.workspace_root
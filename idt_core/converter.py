@@ -2,11 +2,20 @@
 Image loading and format conversion.
 All HEIC conversion is done in memory — nothing is written to the source directory.
 When a persistent JPEG copy is needed (for .idt/ storage), callers use save_heic_copy().
+
+Wire profiles: every vision model downsamples internally, so a 12–48 MP phone
+photo sent at full size buys nothing but upload time (and, for tile-billed
+models, tokens). load_for_api() takes an optional WireProfile describing what a
+provider/model will actually look at; wire_profile_for() is the table. Images
+already within the profile go over the wire untouched.
 """
 from __future__ import annotations
 
 import io
+import math
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import Optional
 
 MIME_TYPES: dict[str, str] = {
     ".jpg":  "image/jpeg",
@@ -24,22 +33,236 @@ MIME_TYPES: dict[str, str] = {
 # Formats that need to be converted before sending to an API
 _NEEDS_CONVERSION = frozenset({".heic", ".heif", ".bmp", ".tiff", ".tif"})
 
+_WIRE_MIME_TYPES: dict[str, str] = {
+    "JPEG": "image/jpeg",
+    "PNG":  "image/png",
+    "WEBP": "image/webp",
+}
+
+# Pillow format names every vision API accepts as uploaded (registry._IMAGE_MIMES).
+_PASSTHROUGH_FORMATS = frozenset({"JPEG", "PNG", "WEBP", "GIF"})
+
 
-def load_for_api(path: Path) -> tuple[bytes, str]:
+@dataclass(frozen=True)
+class WireProfile:
+    """How an image should look on the wire for one provider/model.
+
+    Every limit is optional; an image within all of them (and in a format the
+    API accepts) is sent as-is when ``passthrough`` is True. Anything else is
+    decoded once, turned upright, flattened onto white, scaled to fit and
+    re-encoded as ``format``; if that is still over ``max_bytes`` the quality
+    and then the size are stepped down until it fits.
+    """
+    max_edge: Optional[int] = None        # longest side, pixels
+    max_pixels: Optional[int] = None      # width × height
+    max_bytes: Optional[int] = None       # encoded payload
+    format: str = "JPEG"
+    quality: int = 85
+    passthrough: bool = True              # False: always re-encode, even small images
+
+    @property
+    def mime_type(self) -> str:
+        return _WIRE_MIME_TYPES[self.format]
+
+    def scale_for(self, width: int, height: int) -> float:
+        """Factor (≤ 1) that brings width × height within the pixel limits."""
+        scale = 1.0
+        if self.max_edge and max(width, height) > self.max_edge:
+            scale = min(scale, self.max_edge / max(width, height))
+        if self.max_pixels and width * height > self.max_pixels:
+            scale = min(scale, math.sqrt(self.max_pixels / (width * height)))
+        return scale
+
+
+# What each provider actually looks at. Sources, so the numbers can be checked:
+#   claude — images with a long edge over 1568 px or over ~1.15 MP are scaled
+#            down server-side before the model sees them; 5 MB per image (the
+#            registry's max_image_bytes).
+#   openai — the describe path in imagedescriber/ai_providers.py has always sent
+#            a ≤1600 px JPEG at quality 85 (PNG uploads failed far more often,
+#            hence no passthrough), and the chat window matches it.
+#   mlx    — mlx-vlm is fed a ≤1024 px JPEG temp file (the GUI's MLXProvider).
+#   ollama — models vary; 2048 px is above every vision encoder Ollama ships,
+#            with per-model overrides below where the encoder is known.
+_PROVIDER_WIRE_PROFILES: dict[str, WireProfile] = {
+    "claude": WireProfile(max_edge=1568, max_pixels=1_150_000),
+    "openai": WireProfile(max_edge=1600, quality=85, passthrough=False),
+    "mlx":    WireProfile(max_edge=1024, quality=85, passthrough=False),
+    "ollama": WireProfile(max_edge=2048),
+}
+
+# (provider, model-name prefix) → longest edge the model's vision encoder uses.
+# llama3.2-vision tiles onto a 2×2 grid of 560 px tiles, llava 1.6 onto 336 px
+# tiles up to 1344 px on the long side.
+_MODEL_MAX_EDGES: dict[tuple[str, str], int] = {
+    ("ollama", "llama3.2-vision"): 1120,
+    ("ollama", "llava"): 1344,
+}
+
+
+def wire_profile_for(provider_name: str, model: str = "") -> Optional[WireProfile]:
+    """The WireProfile for a provider/model, or None to send originals.
+
+    Provider names go through the capability registry, so "anthropic" and
+    "Claude" both find the claude profile. The byte ceiling always comes from
+    the registry's published limit rather than being restated here.
+    """
+    from .providers.registry import capabilities_for
+
+    caps = capabilities_for(provider_name or "")
+    profile = _PROVIDER_WIRE_PROFILES.get(caps.provider)
+    if profile is None:
+        return None
+    model_key = (model or "").split(":")[0].strip().lower()
+    for (provider, prefix), edge in _MODEL_MAX_EDGES.items():
+        if provider == caps.provider and model_key.startswith(prefix):
+            profile = replace(profile, max_edge=edge)
+            break
+    if caps.max_image_bytes and profile.max_bytes is None:
+        profile = replace(profile, max_bytes=caps.max_image_bytes)
+    return profile
+
+
+def load_for_api(
+    path: Path,
+    profile: Optional[WireProfile] = None,
+    cache=None,
+) -> tuple[bytes, str]:
     """
     Load an image as bytes ready for an AI provider API call.
     HEIC/HEIF and BMP are converted to JPEG in memory.
     TIFF is also converted because several cloud providers reject it.
+    With a *profile*, the image is also shaped for the wire (see WireProfile).
+    With a *cache* (idt_core.payload_cache), a conversion done before for the
+    same bytes and profile is reused rather than decoded again.
     Returns (image_bytes, mime_type).
     """
+    path = Path(path)
+    if cache is not None:
+        return cache.load(path, profile)
     suffix = path.suffix.lower()
-    if suffix in (".heic", ".heif"):
+    if profile is None and suffix in (".heic", ".heif"):
         return _heic_to_jpeg_bytes(path)
-    if suffix in (".bmp", ".tiff", ".tif"):
+    if profile is None and suffix in (".bmp", ".tiff", ".tif"):
         return _pil_to_jpeg_bytes(path)
     with open(path, "rb") as f:
         data = f.read()
-    return data, MIME_TYPES.get(suffix, "image/jpeg")
+    return prepare_payload(data, suffix, profile)
+
+
+def prepare_payload(
+    data: bytes, suffix: str, profile: Optional[WireProfile] = None
+) -> tuple[bytes, str]:
+    """load_for_api() for bytes already read from a file with this *suffix*.
+
+    Returns *data* itself (the same object) when it can be sent unchanged,
+    which is how PayloadCache tells a conversion worth keeping from a
+    passthrough.
+    """
+    suffix = suffix.lower()
+    if suffix in (".heic", ".heif"):
+        _register_heif()
+    if profile is None:
+        if suffix not in _NEEDS_CONVERSION:
+            return data, MIME_TYPES.get(suffix, "image/jpeg")
+        from PIL import Image
+        with Image.open(io.BytesIO(data)) as img:
+            return _pil_image_to_jpeg_bytes(img.convert("RGB"))
+    if suffix in _NEEDS_CONVERSION:
+        from PIL import Image
+        with Image.open(io.BytesIO(data)) as img:
+            return _encode_for_wire(img, profile), profile.mime_type
+    try:
+        from PIL import Image
+        img = Image.open(io.BytesIO(data))  # header only until pixels are needed
+    except Exception:
+        # Undecodable here (or no Pillow): send it as before and let the
+        # provider be the judge.
+        return data, MIME_TYPES.get(suffix, "image/jpeg")
+    if _fits(img, len(data), profile):
+        return data, MIME_TYPES.get(suffix, "image/jpeg")
+    return _encode_for_wire(img, profile), profile.mime_type
+
+
+def shape_for_wire(data: bytes, profile: WireProfile) -> tuple[bytes, str]:
+    """Shape already-loaded image bytes for the wire (the chat window's attachments).
+
+    Bytes Pillow cannot decode are returned unchanged — sending something
+    oversized beats failing the request.
+    """
+    try:
+        from PIL import Image
+        img = Image.open(io.BytesIO(data))
+        if _fits(img, len(data), profile):
+            return data, Image.MIME.get(img.format or "", "image/jpeg")
+        return _encode_for_wire(img, profile), profile.mime_type
+    except Exception:
+        return data, "image/jpeg"
+
+
+def _register_heif() -> None:
+    try:
+        import pillow_heif
+    except ImportError:
+        raise ImportError(
+            "pillow-heif is required for HEIC/HEIF support: pip install pillow-heif"
+        )
+    pillow_heif.register_heif_opener()
+
+
+def _fits(img, size: int, profile: WireProfile) -> bool:
+    """True when the original can go over the wire untouched."""
+    return (
+        profile.passthrough
+        and img.format in _PASSTHROUGH_FORMATS
+        and (profile.max_bytes is None or size <= profile.max_bytes)
+        and profile.scale_for(*img.size) >= 1.0
+    )
+
+
+def _encode_for_wire(img, profile: WireProfile) -> bytes:
+    from PIL import Image, ImageOps
+
+    img = ImageOps.exif_transpose(img)
+    img = _flatten_to_rgb(img)
+    scale = profile.scale_for(*img.size)
+    if scale < 1.0:
+        img = img.resize(
+            (max(1, int(img.width * scale)), max(1, int(img.height * scale))),
+            Image.Resampling.LANCZOS,
+        )
+    quality = profile.quality
+    while True:
+        buf = io.BytesIO()
+        img.save(buf, profile.format, quality=quality, optimize=True)
+        data = buf.getvalue()
+        if profile.max_bytes is None or len(data) <= profile.max_bytes:
+            return data
+        if quality > 65:
+            quality -= 10
+        elif min(img.size) > 64:
+            img = img.resize(
+                (max(1, int(img.width * 0.75)), max(1, int(img.height * 0.75))),
+                Image.Resampling.LANCZOS,
+            )
+        else:
+            return data  # nothing sensible left to trade; let the API decide
+
+
+def _flatten_to_rgb(img):
+    """RGB with any transparency composited onto white (JPEG has no alpha, and
+    a black background under a transparent logo reads as a different image)."""
+    from PIL import Image
+
+    if img.mode == "P":
+        img = img.convert("RGBA")
+    if img.mode in ("RGBA", "LA"):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
 
 
 def save_heic_copy(source: Path, dest_dir: Path) -> Path:
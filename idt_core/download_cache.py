@@ -0,0 +1,186 @@
+"""
+DownloadCache — what each image URL held the last time it was downloaded.
+
+Downloading the same gallery page again used to fetch every image again, in
+full, only to find most of them were duplicates or too small. The cache keeps,
+per URL, the validators the server sent (ETag, Last-Modified), the content's
+md5 and pixel size, and where the body was saved. The next download of that
+URL is a conditional request: a 304 answers it with no body, and the image is
+skipped (too small) or copied from where it was saved before.
+
+Where it lives:
+
+* A bundle keeps its own in ``derived/downloads.sqlite3`` (see
+  :func:`cache_for`), beside the metadata cache.
+* Downloads outside a bundle use the per-user one in
+  ``~/.idt/cache/downloads.sqlite3``.
+
+Like the metadata cache it opens a connection per call and is only a cache: a
+missing, damaged, foreign-version or unwritable database costs a full
+download, never an error. A record is only trusted after the server confirms
+it with a 304, and a saved file only while its size still matches.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+#: Bumped when the table shape changes; a database at any other version is rebuilt.
+SCHEMA_VERSION = 1
+
+DOWNLOAD_CACHE_NAME = "downloads.sqlite3"
+DEFAULT_CACHE_PATH = Path.home() / ".idt" / "cache" / DOWNLOAD_CACHE_NAME
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS downloads (
+    url           TEXT PRIMARY KEY,
+    etag          TEXT,
+    last_modified TEXT,
+    md5           TEXT,     -- NULL when the download was abandoned (too small)
+    size          INTEGER,  -- bytes
+    width         INTEGER,
+    height        INTEGER,
+    path          TEXT      -- absolute path the body was saved to, or NULL
+);
+"""
+
+_COLUMNS = ("etag", "last_modified", "md5", "size", "width", "height", "path")
+
+
+@dataclass
+class DownloadRecord:
+    """One URL's last download."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    md5: Optional[str] = None
+    size: Optional[int] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    path: Optional[str] = None
+
+    @property
+    def revalidatable(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def saved_file(self) -> Optional[Path]:
+        """The file the body was saved to, if it is still there at the same size."""
+        if not self.path or self.md5 is None:
+            return None
+        path = Path(self.path)
+        try:
+            if path.stat().st_size == self.size:
+                return path
+        except OSError:
+            pass
+        return None
+
+
+class DownloadCache:
+    """One cache database. Cheap to construct; safe to share between threads."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.hits = 0     # URLs a 304 answered
+        self._broken = False
+        self._lock = threading.Lock()
+
+    def count_hit(self) -> None:
+        """Note that a 304 answered a URL (called from download threads)."""
+        with self._lock:
+            self.hits += 1
+
+    # ----- connection ----- #
+    def _open(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.execute("PRAGMA synchronous = OFF")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS downloads")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        return conn
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database, rebuilding it once if it is damaged. None if unusable."""
+        if self._broken:
+            return None
+        try:
+            return self._open()
+        except sqlite3.DatabaseError:
+            pass
+        except (sqlite3.Error, OSError):
+            self._broken = True
+            return None
+        try:
+            self.db_path.unlink()
+        except OSError:
+            pass
+        try:
+            return self._open()
+        except (sqlite3.Error, OSError):
+            self._broken = True
+            return None
+
+    # ----- lookup / storage ----- #
+    def get(self, url: str) -> Optional[DownloadRecord]:
+        conn = self._connect()
+        if conn is None:
+            return None
+        try:
+            with closing(conn):
+                row = conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM downloads WHERE url = ?", (url,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return DownloadRecord(*row) if row is not None else None
+
+    def put_many(self, entries: Iterable[tuple[str, DownloadRecord]]) -> None:
+        """Remember each URL's record, in one transaction."""
+        rows = [(url,) + tuple(getattr(rec, c) for c in _COLUMNS) for url, rec in entries]
+        conn = self._connect() if rows else None
+        if conn is None:
+            return
+        try:
+            with closing(conn):
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO downloads (url, {', '.join(_COLUMNS)})"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+_caches: dict[Path, DownloadCache] = {}
+_caches_lock = threading.Lock()
+
+
+def cache_for(bundle: Optional[Path] = None) -> DownloadCache:
+    """
+    The download cache of the .idtw bundle at *bundle*, or the per-user cache
+    when *bundle* is None or not a bundle directory.
+    """
+    if bundle is not None and (Path(bundle) / "manifest.json").is_file():
+        db_path = Path(bundle) / "derived" / DOWNLOAD_CACHE_NAME
+    else:
+        db_path = DEFAULT_CACHE_PATH
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = _caches[db_path] = DownloadCache(db_path)
+        return cache
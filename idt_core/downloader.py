@@ -4,19 +4,54 @@ Web image downloader for idt_core.
 Downloads images from a URL into a .idtw workspace's derived/downloads/ directory,
 capturing alt text alongside each image so the describer can use it as context.
 
-Requires: pip install requests beautifulsoup4
+Images are fetched concurrently by fetch_images(): up to DOWNLOAD_WORKERS at
+once over one keep-alive session, but never more than HOST_CONNECTIONS to the
+same host, with request starts to a host at least HOST_DELAY_SECONDS apart
+(the politeness that used to be a fixed sleep after every image, whatever its
+host). A 429/503 pauses just that host, for Retry-After when it says. Bodies
+are streamed to disk and hashed as they arrive. Whatever order downloads
+finish in, duplicates are resolved and files named in page order, so a page
+downloads to the same files it did one image at a time.
+
+Nothing is downloaded that is not kept if it can be helped: the first
+PROBE_BYTES of a body are enough to read an image's pixel size, so an icon or
+a tracking pixel below the minimum size is abandoned there. A DownloadCache
+(see download_cache.py) remembers each URL's validators, hash, size and saved
+file, so downloading the same page again costs a 304 per image.
+
+With max_depth > 0, download_into_workspace() crawls first (crawl_pages()):
+breadth first from the given page, following links up to max_depth away and
+fetching at most max_pages pages, on the start page's site only unless told
+otherwise. Each level's pages are fetched and parsed PAGE_WORKERS at once in
+worker threads, through the same HostScheduler as the images; the images of
+every page, in page order and each URL once, then go to fetch_images() as one
+batch. Pages are parsed with lxml when it is installed (much faster on big
+pages), html.parser otherwise.
+
+Requires: pip install requests beautifulsoup4  (optional: lxml)
 """
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import json
+import os
 import re
+import shutil
+import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 from io import BytesIO
 from pathlib import Path
-from typing import Callable, Iterator, Optional
-from urllib.parse import urljoin, urlparse
+from typing import Callable, Optional, Sequence
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from .download_cache import DownloadCache, DownloadRecord, cache_for as download_cache_for
+from .rate_limit import THROTTLE_STATUSES, parse_rate_limit_headers
 
 _IMAGE_EXTENSIONS = frozenset(
     {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff", ".tif"}
@@ -28,6 +63,30 @@ _UA = (
     "Chrome/124.0.0.0 Safari/537.36"
 )
 
+#: fetch_images(): downloads in flight at once, across all hosts ...
+DOWNLOAD_WORKERS = 8
+#: ... at most this many of them to any one host ...
+HOST_CONNECTIONS = 2
+#: ... whose request starts are at least this many seconds apart.
+HOST_DELAY_SECONDS = 0.25
+#: A host that throttles (429/503) without a Retry-After is left alone this long.
+HOST_BACKOFF_SECONDS = 5.0
+#: Times one image is re-requested after its host throttled it.
+THROTTLE_RETRIES = 2
+
+#: Bytes of a body read before giving up on learning the image size early.
+PROBE_BYTES = 64 * 1024
+
+_CHUNK = 16 * 1024
+
+#: crawl_pages(): pages fetched and parsed at once ...
+PAGE_WORKERS = 4
+#: ... and the most a crawl fetches, the start page included.
+CRAWL_MAX_PAGES = 20
+
+# BeautifulSoup tree builder: lxml's C parser when it is installed.
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
 
 def normalize_url(url: str) -> str:
     """
@@ -64,11 +123,22 @@ def download_into_workspace(
     timeout: int = 30,
     max_images: Optional[int] = None,
     on_progress: Optional[Callable[[int, int, str], None]] = None,
+    workers: int = DOWNLOAD_WORKERS,
+    max_depth: int = 0,
+    max_pages: int = CRAWL_MAX_PAGES,
+    same_domain: bool = True,
+    on_page: Optional[Callable[[int, str], None]] = None,
 ) -> WorkspaceDownloadResult:
     """
     Download images from url straight into workspace's derived/downloads/ folder
     and register each as a WorkspaceItem (item_type="downloaded_image"), so the
     workspace's own describe pipeline can pick them up like any other image.
+    Images download *workers* at once (see fetch_images); items are registered
+    in page order.
+
+    With max_depth > 0 the pages url links to are crawled too (see
+    crawl_pages) and their images go into the same subfolder, named after the
+    start page. on_page(pages_done, page_url) is called as each page is parsed.
     """
     try:
         import requests
@@ -87,35 +157,32 @@ def download_into_workspace(
 
     url = normalize_url(url)
 
-    session = requests.Session()
-    session.headers["User-Agent"] = _UA
-
-    resp = session.get(url, timeout=timeout)
-    resp.raise_for_status()
+    session = make_session(connections=workers)
+    scheduler = HostScheduler()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    subfolder_name = _subfolder_name(url, soup)
+    pages = crawl_pages(session, url, max_depth=max_depth, max_pages=max_pages,
+                        same_domain=same_domain, timeout=timeout, scheduler=scheduler,
+                        on_page=on_page)
+    subfolder_name = _subfolder_name(url, pages[0].title)
     bundle_subfolder = f"downloads/{subfolder_name}"
     dl_dir = workspace.derived_dir("downloads") / subfolder_name
     dl_dir.mkdir(parents=True, exist_ok=True)
 
-    entries = _extract_image_entries(resp.text, url)
-    total = len(entries)
+    entries = _merge_image_entries(pages)
 
     result = WorkspaceDownloadResult(workspace=workspace, subfolder=bundle_subfolder)
-    seen_hashes: set = set()
     now = datetime.now(timezone.utc).isoformat()
 
-    for i, (img_url, alt) in enumerate(entries, 1):
-        if max_images and result.downloaded >= max_images:
-            break
-        if on_progress:
-            on_progress(i, total, img_url[:60])
-
-        path = _download_one(
-            session, img_url, i, dl_dir, seen_hashes,
-            min_width, min_height, timeout, _PILImage
-        )
+    paths = fetch_images(
+        session, [img_url for img_url, _ in entries], dl_dir,
+        min_width=min_width, min_height=min_height, timeout=timeout,
+        max_images=max_images, workers=workers, scheduler=scheduler,
+        cache=download_cache_for(workspace.path),
+        on_progress=(lambda done, n, img_url: on_progress(done, n, img_url[:60]))
+        if on_progress else None,
+    )
+    for index, path in paths.items():
+        img_url, alt = entries[index]
         if path is None:
             result.skipped += 1
             continue
@@ -131,20 +198,283 @@ def download_into_workspace(
         workspace.save_item(item)
         result.items.append(item)
 
-        if i < total:
-            time.sleep(0.3)
-
     return result
 
 
+def make_session(user_agent: Optional[str] = None, connections: int = DOWNLOAD_WORKERS):
+    """A requests.Session whose keep-alive pool holds *connections* per host."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers["User-Agent"] = user_agent or _UA
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(1, connections))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class HostScheduler:
+    """
+    Per-host politeness for concurrent downloads: at most *connections*
+    requests in flight to one host, their starts at least *delay* seconds
+    apart, and a host paused by back_off() after it throttles. Thread-safe.
+    Waiting uses time.sleep, so a test that stubs it runs at full speed.
+    """
+
+    def __init__(self, connections: int = HOST_CONNECTIONS, delay: float = HOST_DELAY_SECONDS):
+        self.connections = max(1, int(connections))
+        self.delay = max(0.0, float(delay))
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @staticmethod
+    def host(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's connections, starting no sooner than its delay allows."""
+        host = self.host(url)
+        with self._lock:
+            slots = self._slots.setdefault(host, threading.BoundedSemaphore(self.connections))
+        with slots:
+            while True:
+                with self._lock:
+                    now = time.monotonic()
+                    start = self._next_start.get(host, 0.0)
+                    if start <= now:
+                        self._next_start[host] = now + self.delay
+                        break
+                time.sleep(start - now)
+            yield
+
+    def back_off(self, url: str, seconds: float) -> None:
+        """Start nothing more on url's host for *seconds*."""
+        host = self.host(url)
+        with self._lock:
+            self._next_start[host] = max(self._next_start.get(host, 0.0),
+                                         time.monotonic() + seconds)
+
+
+def fetch_images(
+    session,
+    urls: Sequence[str],
+    out_dir: Path,
+    min_width: int = 0,
+    min_height: int = 0,
+    timeout: int = 30,
+    max_images: Optional[int] = None,
+    seen_hashes: Optional[set] = None,
+    workers: int = DOWNLOAD_WORKERS,
+    scheduler: Optional[HostScheduler] = None,
+    on_progress: Optional[Callable[[int, int, str], None]] = None,
+    cache: Optional[DownloadCache] = None,
+) -> dict[int, Optional[Path]]:
+    """
+    Download *urls* into out_dir, *workers* at once, politely per host.
+
+    Returns {index into urls: saved path, or None if it failed, was not an
+    image, was smaller than min_width x min_height, or duplicated an earlier
+    image}, in index order, for every URL tried — once max_images distinct
+    images are in hand no more are started. Duplicates (by content hash,
+    also against *seen_hashes*, which is updated) and file names are settled
+    in page order once everything has finished, so the result does not depend
+    on which download finished first. on_progress(done, total, url) is called
+    in this thread as each download finishes. With a *cache*, URLs seen
+    before are requested conditionally and what was learnt is stored.
+
+    Requires Pillow.
+    """
+    from PIL import Image as _PILImage
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    scheduler = scheduler or HostScheduler()
+    seen = seen_hashes if seen_hashes is not None else set()
+    workers = max(1, int(workers))
+    # One queue per host, in page order, so a page whose first 50 images sit
+    # on one host does not leave the workers waiting on that host's slots.
+    queues: dict[str, deque] = {}
+    for index, img_url in enumerate(urls):
+        queues.setdefault(scheduler.host(img_url), deque()).append(index)
+    in_flight: dict[str, int] = {host: 0 for host in queues}
+    fetched: dict[int, Optional[tuple]] = {}
+    distinct: set = set()
+    done = 0
+
+    def enough() -> bool:
+        return bool(max_images) and len(distinct - seen) >= max_images
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="idt-download") as pool:
+        pending: dict = {}
+        while True:
+            while len(pending) < workers and not enough():
+                ready = [q[0] for host, q in queues.items()
+                         if q and in_flight[host] < scheduler.connections]
+                if not ready:
+                    break
+                index = min(ready)
+                host = scheduler.host(urls[index])
+                queues[host].popleft()
+                in_flight[host] += 1
+                pending[pool.submit(_download_one, session, urls[index], index + 1, out_dir,
+                                    min_width, min_height, timeout, _PILImage, scheduler,
+                                    cache)] = index
+            if not pending:
+                break
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = pending.pop(future)
+                in_flight[scheduler.host(urls[index])] -= 1
+                fetched[index] = future.result()
+                if fetched[index] is not None and fetched[index].path is not None:
+                    distinct.add(fetched[index].record.md5)
+                done += 1
+                if on_progress:
+                    on_progress(done, len(urls), urls[index])
+
+    out: dict[int, Optional[Path]] = {}
+    saved: dict[str, Path] = {}      # content hash -> where this call saved it
+    remember: list = []
+    kept = 0
+    for index in sorted(fetched):
+        got = fetched[index]
+        if got is not None and got.record is not None:
+            remember.append((urls[index], got.record))
+        if got is None or got.path is None:
+            out[index] = None
+            continue
+        digest = got.record.md5
+        if digest in seen or (max_images and kept >= max_images):
+            _unlink(got.path)
+            # Remember the copy this call kept, if any — never the file just deleted.
+            got.record.path = str(saved[digest]) if digest in saved else None
+            if digest in seen:
+                out[index] = None
+            continue
+        seen.add(digest)
+        kept += 1
+        dest = _unique_path(out_dir / got.filename)
+        os.replace(got.path, dest)
+        got.record.path = str(dest.resolve())
+        saved[digest] = dest.resolve()
+        out[index] = dest
+    if cache is not None:
+        cache.put_many(remember)
+    return out
+
+
+@dataclass
+class CrawledPage:
+    """One page crawl_pages() fetched and parsed."""
+    url: str
+    depth: int                                   # links followed from the start page
+    title: str = ""
+    images: list = field(default_factory=list)  # (absolute url, alt text), in page order
+    links: list = field(default_factory=list)   # absolute http(s) page URLs, no fragment
+
+
+def crawl_pages(
+    session,
+    start_url: str,
+    max_depth: int = 0,
+    max_pages: int = CRAWL_MAX_PAGES,
+    same_domain: bool = True,
+    timeout: int = 30,
+    workers: int = PAGE_WORKERS,
+    scheduler: Optional[HostScheduler] = None,
+    on_page: Optional[Callable[[int, str], None]] = None,
+) -> list[CrawledPage]:
+    """
+    Fetch start_url and, breadth first, the pages it links to, up to
+    *max_depth* links away and at most *max_pages* pages in all. With
+    *same_domain* only pages on start_url's domain (www. or not) are followed.
+
+    Each level is fetched and parsed *workers* pages at once, in worker
+    threads, politely per host through *scheduler*. The frontier holds every
+    URL once (fragments dropped) and never more than the pages still allowed,
+    so a site with thousands of links costs no more than max_pages fetches.
+    Below the start page, pages that fail or are not HTML are skipped; the
+    start page's own HTTP error is raised. Pages are returned in breadth-first
+    discovery order, whatever order they finished in.
+    """
+    scheduler = scheduler or HostScheduler()
+    start_url = urldefrag(start_url).url
+    scope = domain_name(start_url)
+    seen = {start_url}
+    level = [start_url]
+    budget = max(1, int(max_pages))
+    pages: list[CrawledPage] = []
+
+    with ThreadPoolExecutor(max_workers=max(1, int(workers)),
+                            thread_name_prefix="idt-crawl") as pool:
+        for depth in range(max(0, int(max_depth)) + 1):
+            budget -= len(level)
+            futures = [pool.submit(_fetch_page, session, page_url, depth, timeout, scheduler)
+                       for page_url in level]
+            frontier: list[str] = []
+            for future in futures:
+                try:
+                    page = future.result()
+                except Exception:
+                    if depth == 0:
+                        raise
+                    continue
+                if page is None:
+                    continue
+                pages.append(page)
+                if on_page:
+                    on_page(len(pages), page.url)
+                for link in page.links:
+                    if len(frontier) >= budget:
+                        break
+                    if link in seen or (same_domain and domain_name(link) != scope):
+                        continue
+                    seen.add(link)
+                    frontier.append(link)
+            if not frontier:
+                break
+            level = frontier
+    return pages
+
+
+def _fetch_page(session, url: str, depth: int, timeout: int,
+                scheduler: HostScheduler) -> Optional[CrawledPage]:
+    """Worker thread: fetch and parse one page. None if a linked page is not HTML."""
+    for attempt in range(THROTTLE_RETRIES + 1):
+        with scheduler.slot(url):
+            with session.get(url, timeout=timeout, stream=True) as resp:
+                if resp.status_code in THROTTLE_STATUSES and attempt < THROTTLE_RETRIES:
+                    retry_after = parse_rate_limit_headers(resp.headers).retry_after
+                    scheduler.back_off(url, retry_after if retry_after is not None
+                                       else HOST_BACKOFF_SECONDS)
+                    continue
+                resp.raise_for_status()
+                if depth and "html" not in resp.headers.get("Content-Type", "").lower():
+                    return None     # a PDF or a zip behind an ordinary-looking link
+                html, base = resp.text, resp.url or url
+        break
+    soup = _soup(html)
+    return CrawledPage(url=url, depth=depth, title=_page_title(soup),
+                       images=_image_entries(soup, base), links=_page_links(soup, base))
+
+
 # ------------------------------------------------------------------ #
 # Helpers                                                              #
 # ------------------------------------------------------------------ #
 
+def _soup(html: str):
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(html, _HTML_PARSER)
+
+
 def _extract_image_entries(html: str, base_url: str) -> list[tuple[str, str]]:
     """Return (absolute_url, alt_text) for all images found in html."""
-    from bs4 import BeautifulSoup
-    soup = BeautifulSoup(html, "html.parser")
+    return _image_entries(_soup(html), base_url)
+
+
+def _image_entries(soup, base_url: str) -> list[tuple[str, str]]:
     seen: set = set()
     entries: list[tuple[str, str]] = []
 
@@ -178,6 +508,29 @@ def _extract_image_entries(html: str, base_url: str) -> list[tuple[str, str]]:
     return entries
 
 
+def _page_links(soup, base_url: str) -> list[str]:
+    """Absolute http(s) URLs of the pages soup links to, each once, fragments dropped."""
+    seen: set = set()
+    links: list[str] = []
+    for a in soup.find_all("a", href=True):
+        abs_url = urldefrag(urljoin(base_url, a["href"].strip())).url
+        if (urlparse(abs_url).scheme in ("http", "https") and not _is_image_url(abs_url)
+                and abs_url not in seen):
+            seen.add(abs_url)
+            links.append(abs_url)
+    return links
+
+
+def _merge_image_entries(pages: Sequence[CrawledPage]) -> list[tuple[str, str]]:
+    """Every page's images in page order, each URL once, with the first alt text found for it."""
+    alts: dict[str, str] = {}
+    for page in pages:
+        for img_url, alt in page.images:
+            if not alts.get(img_url):
+                alts[img_url] = alt
+    return list(alts.items())
+
+
 def _is_image_url(url: str) -> bool:
     return Path(urlparse(url.lower()).path).suffix in _IMAGE_EXTENSIONS
 
@@ -189,12 +542,18 @@ def domain_name(url: str) -> str:
     return re.sub(r"[^\w.\-]", "_", domain).strip("_")
 
 
-def _subfolder_name(url: str, soup) -> str:
-    domain = domain_name(url)
+def _page_title(soup) -> str:
     title_tag = soup.find("title")
+    if not title_tag:
+        return ""
+    return re.sub(r"\s+", " ", title_tag.get_text(separator=" ")).strip()
+
+
+def _subfolder_name(url: str, page_title: str) -> str:
+    domain = domain_name(url)
     title = ""
-    if title_tag:
-        t = re.sub(r"\s+", " ", title_tag.get_text(separator=" ")).strip()
+    if page_title:
+        t = page_title
         if len(t) > 60:
             last_space = t[:60].rfind(" ")
             t = t[:last_space] if last_space > 0 else t[:60]
@@ -207,44 +566,134 @@ def _subfolder_name(url: str, soup) -> str:
     return f"{domain}{title} - {ts}"
 
 
+@dataclass
+class _Fetched:
+    """What _download_one learnt about one URL."""
+    path: Optional[Path]              # temporary file holding the body, None if not kept
+    record: Optional[DownloadRecord]  # what to remember about the URL
+    filename: str = ""                # name to save it under
+
+
 def _download_one(
     session, img_url: str, index: int, out_dir: Path,
-    seen_hashes: set, min_w: int, min_h: int, timeout: int, PILImage
-) -> Optional[Path]:
+    min_w: int, min_h: int, timeout: int, PILImage, scheduler: HostScheduler,
+    cache: Optional[DownloadCache] = None,
+) -> Optional[_Fetched]:
+    """
+    Stream one image into a hidden temporary file in out_dir, hashing it as it
+    arrives and abandoning it as soon as its header shows it is smaller than
+    min_w x min_h. A URL the cache knows is requested conditionally; a 304
+    reuses the file saved last time. None if the download failed or was not
+    an image. Never raises.
+    """
+    tmp = None
     try:
-        resp = session.get(img_url, timeout=timeout, stream=True)
-        resp.raise_for_status()
-        data = resp.content
+        known = cache.get(img_url) if cache is not None else None
+        for attempt in range(THROTTLE_RETRIES + 2):
+            conditional = known is not None and known.revalidatable
+            headers = known.conditional_headers() if conditional else {}
+            with scheduler.slot(img_url):
+                with session.get(img_url, timeout=timeout, stream=True, headers=headers) as resp:
+                    if resp.status_code in THROTTLE_STATUSES and attempt < THROTTLE_RETRIES:
+                        retry_after = parse_rate_limit_headers(resp.headers).retry_after
+                        scheduler.back_off(img_url, retry_after if retry_after is not None
+                                           else HOST_BACKOFF_SECONDS)
+                        continue
+                    if resp.status_code == 304 and conditional:
+                        cache.count_hit()
+                        if _too_small(known.width, known.height, min_w, min_h):
+                            return _Fetched(None, known)
+                        source = known.saved_file()
+                        if source is not None:
+                            fd, tmp = tempfile.mkstemp(prefix=".part-", suffix=".tmp", dir=out_dir)
+                            os.close(fd)
+                            shutil.copyfile(source, tmp)
+                            return _Fetched(Path(tmp), replace(known),
+                                            _file_name(img_url, index))
+                        known = None   # the saved copy is gone: download it again
+                        continue
+                    resp.raise_for_status()
+                    record = DownloadRecord(etag=resp.headers.get("ETag"),
+                                            last_modified=resp.headers.get("Last-Modified"))
+                    digest = hashlib.md5()
+                    prefix = b""
+                    fd, tmp = tempfile.mkstemp(prefix=".part-", suffix=".tmp", dir=out_dir)
+                    with os.fdopen(fd, "wb") as f:
+                        for chunk in resp.iter_content(_CHUNK):
+                            digest.update(chunk)
+                            f.write(chunk)
+                            if record.width is None and len(prefix) < PROBE_BYTES:
+                                prefix += chunk
+                                record.width, record.height = _probe_size(prefix, PILImage)
+                                if _too_small(record.width, record.height, min_w, min_h):
+                                    break   # leaving the with-block drops the connection
+                        else:
+                            record.md5 = digest.hexdigest()
+                            record.size = f.tell()
+            break
 
-        img_hash = hashlib.md5(data).hexdigest()
-        if img_hash in seen_hashes:
-            return None
-        seen_hashes.add(img_hash)
+        if record.md5 is None:          # abandoned as too small
+            _unlink(tmp)
+            return _Fetched(None, record)
+        if record.width is None:
+            with PILImage.open(tmp) as img:
+                record.width, record.height = img.size
+        if _too_small(record.width, record.height, min_w, min_h):
+            _unlink(tmp)
+            return _Fetched(None, record)
+        return _Fetched(Path(tmp), record, _file_name(img_url, index))
 
-        img = PILImage.open(BytesIO(data))
-        w, h = img.size
-        if min_w and w < min_w:
-            return None
-        if min_h and h < min_h:
-            return None
+    except Exception:
+        if tmp:
+            _unlink(tmp)
+        return None
 
-        filename = Path(urlparse(img_url).path).name or f"image_{index:04d}.jpg"
-        filename = re.sub(r"[^\w.\-]", "_", filename)
-        if not any(filename.lower().endswith(ext) for ext in _IMAGE_EXTENSIONS):
-            filename = f"image_{index:04d}.jpg"
 
-        dest = out_dir / filename
-        counter = 1
-        while dest.exists():
-            stem, sfx = dest.stem, dest.suffix
-            dest = out_dir / f"{stem}_{counter}{sfx}"
-            counter += 1
+def _probe_size(prefix: bytes, PILImage) -> tuple[Optional[int], Optional[int]]:
+    """(width, height) from the start of an image file, or (None, None) if
+    the header is not all there yet. PNG and GIF state it in their first few
+    bytes; for the rest PIL reads only the header on open."""
+    if prefix[:8] == b"\x89PNG\r\n\x1a\n":
+        if len(prefix) < 24 or prefix[12:16] != b"IHDR":
+            return None, None
+        return int.from_bytes(prefix[16:20], "big"), int.from_bytes(prefix[20:24], "big")
+    if prefix[:6] in (b"GIF87a", b"GIF89a") and len(prefix) >= 10:
+        return int.from_bytes(prefix[6:8], "little"), int.from_bytes(prefix[8:10], "little")
+    try:
+        with PILImage.open(BytesIO(prefix)) as img:
+            return img.size
+    except Exception:
+        return None, None
 
-        dest.write_bytes(data)
-        return dest
 
-    except Exception:
-        return None
+def _too_small(width: Optional[int], height: Optional[int], min_w: int, min_h: int) -> bool:
+    if width is None or height is None:
+        return False
+    return bool((min_w and width < min_w) or (min_h and height < min_h))
+
+
+def _file_name(img_url: str, index: int) -> str:
+    filename = Path(urlparse(img_url).path).name or f"image_{index:04d}.jpg"
+    filename = re.sub(r"[^\w.\-]", "_", filename)
+    if not any(filename.lower().endswith(ext) for ext in _IMAGE_EXTENSIONS):
+        filename = f"image_{index:04d}.jpg"
+    return filename
+
+
+def _unique_path(dest: Path) -> Path:
+    out_dir, counter = dest.parent, 1
+    while dest.exists():
+        stem, sfx = dest.stem, dest.suffix
+        dest = out_dir / f"{stem}_{counter}{sfx}"
+        counter += 1
+    return dest
+
+
+def _unlink(path) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -258,10 +707,6 @@ class WebImageDownloader:
     and is used by the ImageDescriber GUI's URL-download workflow.
     """
 
-    _IMAGE_EXTS = frozenset(
-        {".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp", ".tiff", ".tif"}
-    )
-
     def __init__(
         self,
         url: str,
@@ -273,6 +718,7 @@ class WebImageDownloader:
         timeout: int = 30,
         verbose: bool = False,
         progress_callback: Optional[Callable] = None,
+        workers: int = DOWNLOAD_WORKERS,
     ) -> None:
         import logging
         self.url = url
@@ -283,14 +729,12 @@ class WebImageDownloader:
         self.timeout = timeout
         self.verbose = verbose
         self.progress_callback = progress_callback
+        self.workers = workers
         self.actual_output_dir = self.output_dir
         self._seen_hashes: set = set()
         self.logger = logging.getLogger(__name__)
 
-        import requests
-        self._session = requests.Session()
-        ua = user_agent or _UA
-        self._session.headers["User-Agent"] = ua
+        self._session = make_session(user_agent, connections=workers)
 
     def download(self) -> tuple[int, int]:
         """Fetch images from self.url. Returns (downloaded, failed)."""
@@ -307,39 +751,43 @@ class WebImageDownloader:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.actual_output_dir = self.output_dir
 
+        scheduler = HostScheduler()
         try:
-            resp = self._session.get(self.url, timeout=self.timeout)
-            resp.raise_for_status()
+            # The page is fetched and parsed once; its title and images come from there.
+            page = crawl_pages(self._session, self.url, max_depth=0, timeout=self.timeout,
+                               scheduler=scheduler)[0]
         except Exception as exc:
             self.logger.error(f"Failed to fetch {self.url}: {exc}")
             return 0, 0
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        page_title = self._page_title(soup)
+        page_title = self._page_title(page.title)
         subfolder = self._subfolder_name(self.url, page_title)
         self.actual_output_dir = self.output_dir / subfolder
         self.actual_output_dir.mkdir(parents=True, exist_ok=True)
 
-        entries = self._extract_image_urls(resp.text)
+        entries = page.images
         url_map: dict = {}
         alt_map: dict = {}
-        ok = fail = 0
 
-        for i, (img_url, alt) in enumerate(entries, 1):
-            if self.max_images and ok >= self.max_images:
-                break
+        def _progress(done: int, total: int, img_url: str) -> None:
             if self.progress_callback:
                 try:
-                    self.progress_callback(i - 1, len(entries),
-                                           f"Downloading {i}/{len(entries)}: {img_url[:60]}...")
+                    self.progress_callback(done, total,
+                                           f"Downloaded {done}/{total}: {img_url[:60]}...")
                 except Exception:
                     pass
 
-            dest = _download_one(
-                self._session, img_url, i, self.actual_output_dir,
-                self._seen_hashes, self.min_width, self.min_height,
-                self.timeout, _PILImage,
-            )
+        paths = fetch_images(
+            self._session, [img_url for img_url, _ in entries], self.actual_output_dir,
+            min_width=self.min_width, min_height=self.min_height, timeout=self.timeout,
+            max_images=self.max_images, seen_hashes=self._seen_hashes,
+            workers=self.workers, scheduler=scheduler, on_progress=_progress,
+            # The GUI downloads into <bundle>/downloaded_images/.
+            cache=download_cache_for(self.output_dir.parent),
+        )
+        ok = fail = 0
+        for index, dest in paths.items():
+            img_url, alt = entries[index]
             if dest:
                 ok += 1
                 url_map[dest.name] = img_url
@@ -348,15 +796,6 @@ class WebImageDownloader:
             else:
                 fail += 1
 
-            if self.progress_callback:
-                try:
-                    self.progress_callback(i, len(entries),
-                                           f"Downloaded {ok}, skipped {fail}")
-                except Exception:
-                    pass
-            if i < len(entries):
-                time.sleep(0.5)
-
         if url_map:
             try:
                 (self.actual_output_dir / "url_mapping.json").write_text(
@@ -374,11 +813,7 @@ class WebImageDownloader:
 
         return ok, fail
 
-    def _page_title(self, soup) -> Optional[str]:
-        tag = soup.find("title")
-        if not tag:
-            return None
-        title = re.sub(r"\s+", " ", tag.get_text(separator=" ")).strip()
+    def _page_title(self, title: str) -> Optional[str]:
         if not title:
             return None
         if len(title) > 60:
@@ -401,45 +836,3 @@ class WebImageDownloader:
             if safe:
                 return f"{domain} - {safe} - {ts}"
         return f"{domain} - {ts}"
-
-    def _extract_image_urls(self, html: str) -> list[tuple[str, str]]:
-        try:
-            from bs4 import BeautifulSoup
-        except ImportError:
-            return []
-        soup = BeautifulSoup(html, "html.parser")
-        seen: set = set()
-        result: list = []
-
-        for img in soup.find_all("img"):
-            src = img.get("src") or img.get("data-src") or img.get("data-lazy-src")
-            if src:
-                abs_url = urljoin(self.url, src)
-                if self._is_img(abs_url) and abs_url not in seen:
-                    seen.add(abs_url)
-                    result.append((abs_url, (img.get("alt") or "").strip()))
-
-        for picture in soup.find_all("picture"):
-            for source in picture.find_all("source"):
-                srcset = source.get("srcset", "")
-                for part in srcset.split(","):
-                    url = part.strip().split()[0] if part.strip() else ""
-                    if url:
-                        abs_url = urljoin(self.url, url)
-                        if self._is_img(abs_url) and abs_url not in seen:
-                            seen.add(abs_url)
-                            result.append((abs_url, ""))
-
-        for a in soup.find_all("a"):
-            href = a.get("href", "")
-            if href and self._is_img(href):
-                abs_url = urljoin(self.url, href)
-                if abs_url not in seen:
-                    seen.add(abs_url)
-                    result.append((abs_url, ""))
-
-        return result
-
-    def _is_img(self, url: str) -> bool:
-        return any(urlparse(url.lower()).path.endswith(ext)
-                   for ext in self._IMAGE_EXTS)
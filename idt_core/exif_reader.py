@@ -0,0 +1,360 @@
+"""
+Header-only EXIF reader for idt_core.metadata.
+
+Reads just the metadata block of an image — the JPEG APP1 segment, the PNG
+eXIf chunk, the WebP EXIF chunk, the IFDs of a TIFF, or the Exif item of a
+HEIC/HEIF/AVIF (ISO-BMFF) file — and decodes the handful of tags
+MetadataExtractor uses. No pixels are decoded and no image library is loaded,
+so it is cheap enough to run over tens of thousands of files, and safe to run
+in worker processes.
+
+The TIFF walk and the HEIC item lookup follow the byte-level parsers in
+MetaData/binary_exif_parser.py and MetaData/raw_exif_parser.py, but parse the
+structures properly instead of searching the bytes for tag patterns.
+
+Usage:
+    exif = read_exif(path)
+    # None  -> format not handled here (or the block is malformed): ask PIL
+    # {}    -> handled, and the file has no EXIF
+    # {...} -> {"DateTimeOriginal": "2025:09:12 14:03:11", "Make": "Apple",
+    #           "GPSInfo": {"GPSLatitude": (48.0, 8.0, 13.5), ...}, ...}
+"""
+from __future__ import annotations
+
+import io
+import struct
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+# The tags MetadataExtractor reads, named as PIL.ExifTags names them so the
+# result can be filled in by the same code as a PIL getexif() dict.
+_IMAGE_TAGS = {
+    0x010E: "ImageDescription",
+    0x010F: "Make",
+    0x0110: "Model",
+    0x0132: "DateTime",
+    0x9003: "DateTimeOriginal",
+    0x9004: "DateTimeDigitized",
+    0xA434: "LensModel",
+}
+_GPS_TAGS = {
+    0x0001: "GPSLatitudeRef",
+    0x0002: "GPSLatitude",
+    0x0003: "GPSLongitudeRef",
+    0x0004: "GPSLongitude",
+    0x0005: "GPSAltitudeRef",
+    0x0006: "GPSAltitude",
+}
+_EXIF_IFD = 0x8769
+_GPS_IFD = 0x8825
+
+# TIFF field type -> (struct code, size in bytes)
+_TYPES = {
+    1: ("B", 1), 2: ("s", 1), 3: ("H", 2), 4: ("I", 4), 5: ("II", 8),
+    7: ("s", 1), 9: ("i", 4), 10: ("ii", 8),
+}
+
+#: The largest metadata block read into memory (APP1 is capped at 64 KiB by
+#: the format; this bounds the HEIC meta box and PNG/WebP chunks).
+MAX_BLOCK = 16 * 1024 * 1024
+
+
+class _Malformed(Exception):
+    """The metadata block could not be parsed."""
+
+
+def read_exif(path: Path) -> Optional[dict]:
+    """
+    The EXIF tags MetadataExtractor uses, read from the file's header.
+    Returns None when the format is not one handled here or the block is
+    malformed (so the caller can fall back to a full decoder), {} when the
+    file has no EXIF. Raises OSError if the file cannot be read.
+    """
+    with open(path, "rb") as f:
+        head = f.read(12)
+        f.seek(0)
+        try:
+            if head[:2] == b"\xff\xd8":
+                return _read_jpeg(f)
+            if head[:8] == b"\x89PNG\r\n\x1a\n":
+                return _read_png(f)
+            if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+                return _read_webp(f)
+            if head[:4] in (b"II*\x00", b"MM\x00*"):
+                return _parse_tiff(f, 0)
+            if head[4:8] == b"ftyp":
+                return _read_isobmff(f)
+            if head[:4] == b"GIF8" or head[:2] == b"BM":
+                return {}
+        except (_Malformed, struct.error, ValueError, IndexError):
+            return None
+    return None
+
+
+# ------------------------------------------------------------------ #
+# Containers                                                           #
+# ------------------------------------------------------------------ #
+
+def _exact(f: BinaryIO, n: int) -> bytes:
+    data = f.read(n)
+    if len(data) != n:
+        raise _Malformed("truncated")
+    return data
+
+
+def _tiff_block(data: bytes) -> dict:
+    """Parse an EXIF payload, with or without its "Exif\\0\\0" prefix."""
+    if data[:6] == b"Exif\x00\x00":
+        data = data[6:]
+    return _parse_tiff(io.BytesIO(data), 0)
+
+
+def _read_jpeg(f: BinaryIO) -> dict:
+    f.seek(2)
+    while True:
+        byte = _exact(f, 1)
+        if byte != b"\xff":
+            raise _Malformed("lost marker sync")
+        marker = _exact(f, 1)[0]
+        while marker == 0xFF:  # fill bytes
+            marker = _exact(f, 1)[0]
+        if marker in (0xD9, 0xDA):  # EOI, SOS: no more headers
+            return {}
+        if 0xD0 <= marker <= 0xD7 or marker == 0x01:  # no length
+            continue
+        length = struct.unpack(">H", _exact(f, 2))[0] - 2
+        if length < 0:
+            raise _Malformed("bad segment length")
+        if marker == 0xE1:
+            data = _exact(f, length)
+            if data[:6] == b"Exif\x00\x00":
+                return _tiff_block(data)
+            continue  # an XMP APP1; the EXIF one may follow
+        f.seek(length, io.SEEK_CUR)
+
+
+def _read_png(f: BinaryIO) -> dict:
+    f.seek(8)
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return {}
+        length, ctype = struct.unpack(">I4s", header)
+        if ctype == b"eXIf":
+            if length > MAX_BLOCK:
+                raise _Malformed("eXIf too large")
+            return _tiff_block(_exact(f, length))
+        if ctype in (b"IDAT", b"IEND"):
+            return {}
+        f.seek(length + 4, io.SEEK_CUR)  # data + CRC
+
+
+def _read_webp(f: BinaryIO) -> dict:
+    f.seek(12)
+    while True:
+        header = f.read(8)
+        if len(header) < 8:
+            return {}
+        fourcc, length = struct.unpack("<4sI", header)
+        if fourcc == b"EXIF":
+            if length > MAX_BLOCK:
+                raise _Malformed("EXIF chunk too large")
+            return _tiff_block(_exact(f, length))
+        f.seek(length + (length & 1), io.SEEK_CUR)
+
+
+def _boxes(f: BinaryIO, end: Optional[int]):
+    """Yield (type, payload start, payload end) for the ISO-BMFF boxes up to *end*."""
+    while end is None or f.tell() + 8 <= end:
+        start = f.tell()
+        header = f.read(8)
+        if len(header) < 8:
+            return
+        size, btype = struct.unpack(">I4s", header)
+        if size == 1:
+            size = struct.unpack(">Q", _exact(f, 8))[0]
+        elif size == 0:
+            f.seek(0, io.SEEK_END)
+            size = f.tell() - start
+        payload = f.tell()
+        if size < payload - start:
+            raise _Malformed("bad box size")
+        yield btype, payload, start + size
+        f.seek(start + size)
+
+
+def _read_isobmff(f: BinaryIO) -> dict:
+    for btype, start, end in _boxes(f, None):
+        if btype == b"meta":
+            if end - start > MAX_BLOCK:
+                raise _Malformed("meta box too large")
+            f.seek(start)
+            return _heif_exif(f, _exact(f, end - start))
+    return {}
+
+
+def _heif_exif(f: BinaryIO, meta: bytes) -> dict:
+    """Find the Exif item in a HEIF meta box and parse it from the file."""
+    m = io.BytesIO(meta)
+    m.seek(4)  # FullBox version + flags
+    exif_id = None
+    locations: dict = {}
+    idat: Optional[bytes] = None
+    for btype, start, end in _boxes(m, len(meta)):
+        body = meta[start:end]
+        if btype == b"iinf":
+            exif_id = _iinf_exif_id(body)
+        elif btype == b"iloc":
+            locations = _iloc(body)
+        elif btype == b"idat":
+            idat = body
+    if exif_id is None:
+        return {}
+    if exif_id not in locations:
+        raise _Malformed("Exif item has no location")
+    method, extents = locations[exif_id]
+    if method == 0:
+        parts = []
+        for offset, length in extents:
+            if length > MAX_BLOCK:
+                raise _Malformed("Exif item too large")
+            f.seek(offset)
+            parts.append(_exact(f, length))
+        data = b"".join(parts)
+    elif method == 1 and idat is not None:
+        data = b"".join(idat[o:o + n] for o, n in extents)
+    else:
+        raise _Malformed("unsupported item construction")
+    # The item starts with the offset of the TIFF header past this field.
+    skip = struct.unpack(">I", data[:4])[0]
+    return _parse_tiff(io.BytesIO(data[4 + skip:]), 0)
+
+
+def _iinf_exif_id(body: bytes) -> Optional[int]:
+    version = body[0]
+    pos = 4 + (2 if version == 0 else 4)
+    b = io.BytesIO(body)
+    b.seek(pos)
+    for btype, start, end in _boxes(b, len(body)):
+        if btype != b"infe":
+            continue
+        infe = body[start:end]
+        v = infe[0]
+        if v < 2:
+            continue
+        if v == 2:
+            item_id = struct.unpack(">H", infe[4:6])[0]
+            item_type = infe[8:12]
+        else:
+            item_id = struct.unpack(">I", infe[4:8])[0]
+            item_type = infe[10:14]
+        if item_type == b"Exif":
+            return item_id
+    return None
+
+
+def _iloc(body: bytes) -> dict:
+    """{item_id: (construction_method, [(offset, length), ...])} from an iloc box."""
+    version = body[0]
+    pos = 4
+
+    def uint(size: int) -> int:
+        nonlocal pos
+        if pos + size > len(body):
+            raise _Malformed("truncated iloc")
+        value = int.from_bytes(body[pos:pos + size], "big")
+        pos += size
+        return value
+
+    sizes = uint(1)
+    offset_size, length_size = sizes >> 4, sizes & 0x0F
+    sizes = uint(1)
+    base_offset_size = sizes >> 4
+    index_size = sizes & 0x0F if version in (1, 2) else 0
+    count = uint(2 if version < 2 else 4)
+    out: dict = {}
+    for _ in range(count):
+        item_id = uint(2 if version < 2 else 4)
+        method = uint(2) & 0x0F if version in (1, 2) else 0
+        uint(2)  # data_reference_index
+        base = uint(base_offset_size)
+        extents = []
+        for _ in range(uint(2)):
+            uint(index_size)
+            offset = uint(offset_size)
+            extents.append((base + offset, uint(length_size)))
+        out[item_id] = (method, extents)
+    return out
+
+
+# ------------------------------------------------------------------ #
+# TIFF                                                                 #
+# ------------------------------------------------------------------ #
+
+def _parse_tiff(f: BinaryIO, base: int) -> dict:
+    f.seek(base)
+    header = _exact(f, 8)
+    if header[:2] == b"II":
+        order = "<"
+    elif header[:2] == b"MM":
+        order = ">"
+    else:
+        raise _Malformed("not a TIFF header")
+    if struct.unpack(order + "H", header[2:4])[0] != 42:
+        raise _Malformed("bad TIFF magic")
+    ifd0 = struct.unpack(order + "I", header[4:8])[0]
+
+    exif: dict = {}
+    pointers = _read_ifd(f, base, order, ifd0, _IMAGE_TAGS, exif)
+    if _EXIF_IFD in pointers:
+        _read_ifd(f, base, order, pointers[_EXIF_IFD], _IMAGE_TAGS, exif)
+    if _GPS_IFD in pointers:
+        gps: dict = {}
+        _read_ifd(f, base, order, pointers[_GPS_IFD], _GPS_TAGS, gps)
+        if gps:
+            exif["GPSInfo"] = gps
+    return exif
+
+
+def _read_ifd(f: BinaryIO, base: int, order: str, offset: int,
+              names: dict, out: dict) -> dict:
+    """Decode the *names* tags of the IFD at *offset* into *out*; return its sub-IFD pointers."""
+    f.seek(base + offset)
+    count = struct.unpack(order + "H", _exact(f, 2))[0]
+    entries = _exact(f, 12 * count)
+    pointers: dict = {}
+    for i in range(count):
+        tag, ftype, n, raw = struct.unpack(order + "HHI4s", entries[12 * i:12 * i + 12])
+        if tag in (_EXIF_IFD, _GPS_IFD):
+            pointers[tag] = struct.unpack(order + "I", raw)[0]
+            continue
+        name = names.get(tag)
+        if name is None or ftype not in _TYPES:
+            continue
+        code, size = _TYPES[ftype]
+        total = size * n
+        if total > 4:
+            if total > MAX_BLOCK:
+                continue
+            here = f.tell()
+            f.seek(base + struct.unpack(order + "I", raw)[0])
+            raw = _exact(f, total)
+            f.seek(here)
+        else:
+            raw = raw[:total]
+        out[name] = _value(order, ftype, code, n, raw)
+    return pointers
+
+
+def _value(order: str, ftype: int, code: str, n: int, raw: bytes):
+    if ftype == 2:
+        return raw.split(b"\x00", 1)[0].decode("utf-8", errors="replace").strip()
+    if ftype == 7:
+        return raw
+    values = struct.unpack(order + code * n, raw)
+    if ftype in (5, 10):
+        values = tuple(
+            values[i] / values[i + 1] if values[i + 1] else 0.0
+            for i in range(0, len(values), 2)
+        )
+    return values[0] if len(values) == 1 else tuple(values)
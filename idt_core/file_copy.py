@@ -0,0 +1,265 @@
+"""
+Parallel, link-aware file copying with a manifest of what was copied.
+
+Exporting a gallery copied every image, one after another, in full — and did
+it all again on the next export, though usually only a few descriptions had
+changed and none of the images. copy_files() instead:
+
+* copies COPY_WORKERS files at once;
+* places each file the cheapest way that gives an independent file: a
+  reflink (Linux FICLONE: a copy-on-write clone, on btrfs, XFS and the other
+  filesystems that support it), else a copy (copy_file_range where the OS
+  has it, so the kernel moves the bytes, otherwise shutil.copy2) — or, only
+  when asked for with method="link", a hard link;
+* skips a file the manifest in the destination folder shows is already there
+  and up to date: same source, same source size and mtime, and the placed
+  file untouched since. A source whose mtime moved but whose size did not is
+  compared by content hash before it is copied again;
+* deletes files an earlier call placed that are no longer wanted, so a
+  re-export does not leave images nothing links to. A file whose replacement
+  could not be placed keeps its earlier copy.
+
+A hard link shares its data with the source: both names show the same bytes,
+so editing or optimising the placed file in place changes the user's
+original. That is why "auto" never links; "link" is for callers that know
+the destination will only be read.
+
+The manifest is only a record of what this module placed: missing or
+unreadable, it costs a full copy, never an error. Files in the folder that it
+does not list are never touched.
+
+Usage:
+    outcomes = copy_files([(src, out / "images" / src.name) for src in sources], out)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+#: Files placed at once. Copying is I/O-bound, so threads are enough.
+COPY_WORKERS = 8
+
+#: "auto" tries reflink, then copies; the others force one way ("reflink" and
+#: "link" fail rather than fall back). Hard links are only made when asked for.
+COPY_METHODS = ("auto", "reflink", "link", "copy")
+
+MANIFEST_NAME = ".idt-copy-manifest.json"
+
+#: Bumped when the manifest's shape changes; a manifest at any other version is ignored.
+MANIFEST_VERSION = 1
+
+_FICLONE = 0x40049409      # linux/fs.h: _IOW(0x94, 9, int)
+_HASH_CHUNK = 1024 * 1024
+
+# (source device, destination device, way) combinations that have failed once;
+# not retried for every file of a 10,000-image export.
+_unsupported: set = set()
+
+
+@dataclass
+class CopyOutcome:
+    """What copy_files() did with one file."""
+    how: str = ""                  # "reflink" | "link" | "copy" | "unchanged"; "" if it failed
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def copy_file(src: Path, dest: Path, method: str = "auto") -> str:
+    """
+    Place a copy of src at dest, replacing whatever is there in one step.
+    Returns how it was placed: "reflink", "link" or "copy". Raises OSError.
+    """
+    if method not in COPY_METHODS:
+        raise ValueError(f"Unknown copy method {method!r} (expected one of {COPY_METHODS})")
+    src, dest = Path(src), Path(dest)
+    tmp = dest.with_name(f".{dest.name}.part")
+    _unlink(tmp)
+    try:
+        how = _place(src, tmp, method)
+        os.replace(tmp, dest)
+    except BaseException:
+        _unlink(tmp)
+        raise
+    return how
+
+
+def _place(src: Path, tmp: Path, method: str) -> str:
+    devices = (os.stat(src).st_dev, os.stat(tmp.parent).st_dev)
+    for way, place in (("reflink", _reflink), ("link", os.link)):
+        if method != way and not (method == "auto" and way == "reflink"):
+            continue
+        if method == "auto" and devices + (way,) in _unsupported:
+            continue
+        try:
+            place(src, tmp)
+            return way
+        except OSError:
+            _unlink(tmp)
+            if method == way:
+                raise
+            _unsupported.add(devices + (way,))
+    _copy(src, tmp)
+    return "copy"
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    """Clone src's data into a new file at dest (Linux FICLONE); OSError where unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("reflinks are not supported on this platform")
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+    shutil.copystat(src, dest)
+
+
+def _copy(src: Path, dest: Path) -> None:
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as s, open(dest, "wb") as d:
+                remaining = os.fstat(s.fileno()).st_size
+                while remaining > 0:
+                    sent = os.copy_file_range(s.fileno(), d.fileno(), remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+            if remaining <= 0:
+                shutil.copystat(src, dest)
+                return
+        except OSError:
+            pass          # EXDEV on older kernels, ENOSYS, a filesystem that refuses
+        _unlink(dest)
+    shutil.copy2(src, dest)
+
+
+class CopyManifest:
+    """What copy_files() placed in a folder, keyed by path relative to it."""
+
+    def __init__(self, path: Path, entries: Optional[dict] = None):
+        self.path = Path(path)
+        self.entries: dict[str, dict] = entries or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "CopyManifest":
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION and isinstance(data.get("files"), dict):
+                return cls(path, data["files"])
+        except (OSError, ValueError, AttributeError):
+            pass
+        return cls(path)
+
+    def save(self) -> None:
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "files": self.entries},
+                                      indent=1, sort_keys=True), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            _unlink(tmp)
+
+    def unchanged(self, name: str, src: Path, dest: Path) -> bool:
+        """True if dest still holds what src holds, as far as the recorded stats
+        (and, when only the mtime moved, the content hash) can tell."""
+        entry = self.entries.get(name)
+        if not entry or entry.get("source") != str(src):
+            return False
+        try:
+            s, d = os.stat(src), os.stat(dest)
+        except OSError:
+            return False
+        if (d.st_size, d.st_mtime_ns) != (entry.get("dest_size"), entry.get("dest_mtime_ns")):
+            return False              # the placed file was changed or replaced
+        if s.st_size != entry.get("size"):
+            return False
+        if s.st_mtime_ns == entry.get("mtime_ns"):
+            return True
+        return _md5(src) == _md5(dest)
+
+    @staticmethod
+    def entry(src: Path, dest: Path) -> dict:
+        s, d = os.stat(src), os.stat(dest)
+        return {"source": str(src), "size": s.st_size, "mtime_ns": s.st_mtime_ns,
+                "dest_size": d.st_size, "dest_mtime_ns": d.st_mtime_ns}
+
+
+def copy_files(
+    jobs: Sequence[tuple[Path, Path]],
+    root: Path,
+    method: str = "auto",
+    workers: int = COPY_WORKERS,
+    on_done: Optional[Callable[[int, int, Path], None]] = None,
+    manifest_name: str = MANIFEST_NAME,
+) -> list[CopyOutcome]:
+    """
+    Copy each (source, destination) in *jobs* — destinations somewhere under
+    *root* — *workers* at once, skipping files the manifest in root shows are
+    up to date and deleting files it lists that no job wants any more.
+
+    Returns an outcome per job, in job order. on_done(done, total, source) is
+    called in this thread as each job finishes. A file that cannot be copied
+    is reported in its outcome, never raised, and whatever an earlier call
+    placed at its destination is left there.
+    """
+    if method not in COPY_METHODS:
+        raise ValueError(f"Unknown copy method {method!r} (expected one of {COPY_METHODS})")
+    root = Path(root)
+    manifest = CopyManifest.load(root / manifest_name)
+    names = [Path(dest).relative_to(root).as_posix() for _, dest in jobs]
+    outcomes: list[CopyOutcome] = [CopyOutcome() for _ in jobs]
+    placed: dict[str, dict] = {}
+
+    def one(index: int):
+        src, dest = Path(jobs[index][0]), Path(jobs[index][1])
+        try:
+            if manifest.unchanged(names[index], src, dest):
+                how = "unchanged"
+            else:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                how = copy_file(src, dest, method)
+            return CopyOutcome(how), CopyManifest.entry(src, dest)
+        except OSError as exc:
+            return CopyOutcome(error=str(exc)), None
+
+    with ThreadPoolExecutor(max_workers=max(1, int(workers)),
+                            thread_name_prefix="idt-copy") as pool:
+        futures = {pool.submit(one, index): index for index in range(len(jobs))}
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            outcomes[index], entry = future.result()
+            if entry is None:
+                entry = manifest.entries.get(names[index])   # keep the earlier copy
+            if entry is not None:
+                placed[names[index]] = entry
+            if on_done:
+                on_done(done, len(jobs), Path(jobs[index][0]))
+
+    for name in manifest.entries.keys() - placed.keys():
+        _unlink(root / name)
+    manifest.entries = placed
+    manifest.save()
+    return outcomes
+
+
+def _md5(path: Path) -> str:
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _unlink(path) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
@@ -5,6 +5,11 @@ HTML gallery folder:
 
     <output_dir>/index.html
     <output_dir>/images/<filename>.*
+    <output_dir>/images/web/<stem>-<ext>-<width>.{avif|webp|jpg|png}
+
+The pages show the web-sized renders in images/web/ (see web_images.py)
+through srcset, so a browser downloads a file about the size it displays; the
+originals in images/ are there for anyone who wants the full resolution.
 
 All CSS and JavaScript are embedded inline so the result is a single folder
 that can be zipped and published to a web server without modification.
@@ -19,13 +24,16 @@ WCAG 2.2 AA conformance requirements met in every gallery style:
   - Truncation is visual-only — full text remains in the DOM for screen readers
 """
 
+import functools
 import html as _html
 import logging
-import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set, Tuple
 
+from .file_copy import COPY_WORKERS, copy_files
+from .web_images import MIME_TYPES, make_web_images
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,7 +47,9 @@ def export_gallery(items: dict, options: dict,
 
     Args:
         progress: Optional callback progress(done, total, name) fired per image
-                 as it is copied — the copy loop dominates export time.
+                 as it is copied, or, with web images, as its renders are
+                 ready — the per-image work dominates export time. Images are
+                 handled several at once, so names arrive in completion order.
         items:   workspace.items — Dict[str, ImageItem]
         options: {
             'output_dir':       str   — destination folder (created if needed)
@@ -47,11 +57,21 @@ def export_gallery(items: dict, options: dict,
             'style':            str   — 'card_grid' | 'photo_essay' |
                                         'lightbox_grid' | 'simple_list'
             'include_metadata': bool  — show photo date / camera / location
+            'copy_method':      str   — 'auto' (reflink, else copy) |
+                                        'reflink' | 'link' (hard link: shares
+                                        the original's data) | 'copy'
+            'web_images':       bool  — render web-sized copies for the pages
+                                        to show (default True); False shows
+                                        the originals
+            'web_cache_dir':    str   — where renders are cached between
+                                        exports (default ~/.idt/cache/web_images)
         }
 
     Returns:
         {
-            'images_copied':          int,
+            'images_copied':          int,   — images in the gallery's images/
+            'images_unchanged':       int,   — of those, left as a previous
+                                               export placed them
             'images_skipped':         int,
             'descriptions_included':  int,
             'output_file':            str,   — absolute path to index.html
@@ -66,6 +86,8 @@ def export_gallery(items: dict, options: dict,
     style = options.get('style', 'card_grid')
     include_metadata = bool(options.get('include_metadata', False))
     description_selection = options.get('description_selection', 'newest')
+    copy_method = options.get('copy_method', 'auto')
+    make_web = bool(options.get('web_images', True))
 
     output_dir.mkdir(parents=True, exist_ok=True)
     images_dir = output_dir / 'images'
@@ -84,8 +106,8 @@ def export_gallery(items: dict, options: dict,
         )
 
     # Copy images, build path mapping
-    image_paths, images_copied, images_skipped, warnings = _copy_images(
-        described_sorted, images_dir, progress
+    image_paths, images_copied, images_unchanged, images_skipped, warnings = _copy_images(
+        described_sorted, images_dir, None if make_web else progress, copy_method
     )
 
     # Keep only items whose image was successfully copied
@@ -105,14 +127,23 @@ def export_gallery(items: dict, options: dict,
         'lightbox_grid': _generate_lightbox_grid,
         'simple_list':   _generate_simple_list,
     }
+    web_images: Dict[str, dict] = {}
+    if make_web:
+        web_images = _make_web_images(
+            described_sorted, image_paths, output_dir, options.get('web_cache_dir'),
+            copy_method, progress, warnings,
+        )
+
     generator = generators.get(style, _generate_card_grid)
-    html_content = generator(described_items, image_paths, title, include_metadata, description_selection)
+    html_content = generator(described_items, image_paths, title, include_metadata,
+                             description_selection, web_images)
 
     index_path = output_dir / 'index.html'
     index_path.write_text(html_content, encoding='utf-8')
 
     return {
         'images_copied':         images_copied,
+        'images_unchanged':      images_unchanged,
         'images_skipped':        images_skipped,
         'descriptions_included': len(described_items),
         'output_file':           str(index_path),
@@ -128,27 +159,38 @@ def _copy_images(
     sorted_items: List[Tuple[str, object]],
     images_dir: Path,
     progress: Optional[Callable[[int, int, str], None]] = None,
-) -> Tuple[Dict[str, str], int, int, List[str]]:
-    """Copy source images into <output>/images/.
+    copy_method: str = 'auto',
+    workers: int = COPY_WORKERS,
+) -> Tuple[Dict[str, str], int, int, int, List[str]]:
+    """Copy source images into <output>/images/, several at once.
+
+    Images are reflinked or hard-linked where the filesystem allows, and an
+    image the output folder's copy manifest shows is already there, unchanged,
+    is left alone — re-exporting after editing a few descriptions copies
+    nothing (see file_copy.copy_files). Images a previous export placed that
+    are no longer in the gallery are removed.
 
     Returns:
-        (image_paths, copied_count, skipped_count, warnings)
+        (image_paths, copied_count, unchanged_count, skipped_count, warnings)
         image_paths maps original_file_path -> 'images/<dest_filename>'
+        copied_count includes the unchanged images.
     """
-    image_paths: Dict[str, str] = {}
     used_names: Set[str] = set()
-    copied = 0
-    skipped = 0
+    jobs: List[Tuple[Path, Path]] = []
+    job_paths: List[str] = []
     warnings: List[str] = []
+    skipped = 0
+    done = 0
 
     total = len(sorted_items)
-    for done, (file_path, _item) in enumerate(sorted_items, start=1):
+    for file_path, _item in sorted_items:
         src = Path(file_path)
-        if progress:
-            progress(done, total, src.name)
         if not src.exists():
             warnings.append(f"Source file not found, skipped: {file_path}")
             skipped += 1
+            done += 1
+            if progress:
+                progress(done, total, src.name)
             continue
 
         # Resolve collision-free destination filename
@@ -158,17 +200,109 @@ def _copy_images(
             dest_name = f"{src.stem}_{counter}{src.suffix}"
             counter += 1
         used_names.add(dest_name)
+        jobs.append((src, images_dir / dest_name))
+        job_paths.append(file_path)
 
-        dest_path = images_dir / dest_name
-        try:
-            shutil.copy2(src, dest_path)
-            image_paths[file_path] = f"images/{dest_name}"
-            copied += 1
-        except Exception as exc:
-            warnings.append(f"Failed to copy {src.name}: {exc}")
+    def on_done(_n: int, _total: int, src: Path) -> None:
+        nonlocal done
+        done += 1
+        if progress:
+            progress(done, total, src.name)
+
+    outcomes = copy_files(jobs, images_dir.parent, method=copy_method,
+                          workers=workers, on_done=on_done)
+
+    image_paths: Dict[str, str] = {}
+    copied = unchanged = 0
+    for file_path, (src, dest), outcome in zip(job_paths, jobs, outcomes):
+        if not outcome.ok:
+            warnings.append(f"Failed to copy {src.name}: {outcome.error}")
             skipped += 1
+            continue
+        image_paths[file_path] = f"images/{dest.name}"
+        copied += 1
+        if outcome.how == 'unchanged':
+            unchanged += 1
+
+    return image_paths, copied, unchanged, skipped, warnings
+
+
+def _make_web_images(
+    sorted_items: List[Tuple[str, object]],
+    image_paths: Dict[str, str],
+    output_dir: Path,
+    cache_dir: Optional[str] = None,
+    copy_method: str = 'auto',
+    progress: Optional[Callable[[int, int, str], None]] = None,
+    warnings: Optional[List[str]] = None,
+) -> Dict[str, dict]:
+    """Render web-sized copies of the copied images into <output>/images/web/.
 
-    return image_paths, copied, skipped, warnings
+    Renders come from the cache when an image was rendered before (by content,
+    whatever folder it was exported from), else are made on a process pool;
+    they are then linked or copied into the gallery like the originals, and
+    renders of images no longer in the gallery are removed. progress fires
+    once per item of sorted_items, images that were not copied included.
+
+    Returns:
+        original_file_path -> {'src', 'srcset', 'sources': [(mime, srcset)],
+        'width', 'height'} for every image that could be rendered, paths
+        relative to output_dir. Images missing from it are shown as copied.
+    """
+    total = len(sorted_items)
+    done = 0
+    for file_path, _item in sorted_items:
+        if file_path not in image_paths:
+            done += 1
+            if progress:
+                progress(done, total, Path(file_path).name)
+    file_paths = [fp for fp, _item in sorted_items if fp in image_paths]
+
+    def on_done(_n: int, _total: int, src: Path) -> None:
+        nonlocal done
+        done += 1
+        if progress:
+            progress(done, total, src.name)
+
+    renders = make_web_images([Path(fp) for fp in file_paths], cache_dir=cache_dir,
+                              on_done=on_done)
+
+    def web_rel(file_path: str, render, cached: Path) -> str:
+        """'images/web/<stem>-<ext>-<width>.<format ext>' for one cached render."""
+        dest = Path(image_paths[file_path])
+        suffix = cached.name[len(Path(render.stem).name):]      # '-<width>.<format ext>'
+        return f"images/web/{dest.stem}-{dest.suffix.lstrip('.').lower()}{suffix}"
+
+    jobs: List[Tuple[Path, Path]] = []
+    for file_path, render in zip(file_paths, renders):
+        if render is None:
+            if warnings is not None:
+                warnings.append(f"Could not make web images of {Path(file_path).name}; "
+                                f"the gallery shows the original")
+            continue
+        jobs.extend((cached, output_dir / web_rel(file_path, render, cached))
+                    for cached in render.files())
+    outcomes = copy_files(jobs, output_dir, method=copy_method,
+                          manifest_name='.idt-web-manifest.json')
+    failed = {dest for (_src, dest), outcome in zip(jobs, outcomes) if not outcome.ok}
+
+    web_images: Dict[str, dict] = {}
+    for file_path, render in zip(file_paths, renders):
+        if render is None or any(output_dir / web_rel(file_path, render, cached) in failed
+                                 for cached in render.files()):
+            continue
+        url = functools.partial(web_rel, file_path, render)
+        # The fallback <img src>: the render nearest a typical display width.
+        shown = min(render.widths, key=lambda w: abs(w - 960))
+        web_images[file_path] = {
+            'src':     url(render.path(render.fallback, shown)),
+            'srcset':  render.srcset(render.fallback, url),
+            'sources': [(MIME_TYPES[render.modern], render.srcset(render.modern, url))]
+                       if render.modern else [],
+            'width':   shown,
+            'height':  render.height_at(shown),
+        }
+    return web_images
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +319,27 @@ def _get_alt_text(file_path: str) -> str:
     return Path(file_path).name
 
 
+def _img_html(fp: str, image_paths: Dict[str, str], web_images: Optional[Dict[str, dict]],
+              sizes: str) -> str:
+    """The <img> for an image — inside a <picture> offering its web renders
+    at *sizes* when it has them, else pointing at the copied original."""
+    alt = _esc(_get_alt_text(fp))
+    web = (web_images or {}).get(fp)
+    if not web:
+        return f'<img src="{_esc(image_paths.get(fp, ""))}" alt="{alt}" loading="lazy">'
+    sources = ''.join(
+        f'<source type="{mime}" srcset="{_esc(srcset)}" sizes="{sizes}">'
+        for mime, srcset in web['sources']
+    )
+    return (
+        f'<picture>{sources}'
+        f'<img src="{_esc(web["src"])}" srcset="{_esc(web["srcset"])}" sizes="{sizes}" '
+        f'width="{web["width"]}" height="{web["height"]}" alt="{alt}" '
+        f'loading="lazy" decoding="async">'
+        f'</picture>'
+    )
+
+
 def _get_primary_description(item) -> str:
     """Return the text of the most-recently-added description, or ''."""
     if not item.descriptions:
@@ -385,6 +540,7 @@ body {
 }
 a { color: var(--color-accent); }
 a:hover { color: var(--color-accent-hover); }
+picture { display: contents; }
 a:focus-visible, button:focus-visible {
     outline: var(--focus-outline);
     outline-offset: var(--focus-offset);
@@ -574,6 +730,10 @@ _CARD_GRID_CSS = """\
 .card-meta { margin-top: auto; padding-top: .5rem; }
 """
 
+# Rendered width of a card image, for srcset: one column on phones, else a
+# grid cell of 280px and up.
+_CARD_SIZES = '(max-width: 640px) 100vw, 400px'
+
 
 def _generate_card_grid(
     described_items: List[Tuple[str, object]],
@@ -581,12 +741,12 @@ def _generate_card_grid(
     title: str,
     include_metadata: bool,
     description_selection: str = 'newest',
+    web_images: Optional[Dict[str, dict]] = None,
 ) -> str:
     toc = _build_toc(described_items)
     cards = []
     for i, (fp, item) in enumerate(described_items):
-        rel = _esc(image_paths.get(fp, ''))
-        alt = _esc(_get_alt_text(fp))
+        img_html = _img_html(fp, image_paths, web_images, _CARD_SIZES)
         filename = _esc(Path(fp).name)
         descs_html = _render_descriptions_html(
             _get_descriptions(item, description_selection), 'card-desc'
@@ -596,7 +756,7 @@ def _generate_card_grid(
             f'<li>\n'
             f'  <article class="card" id="img-{i}">\n'
             f'    <div class="card-img-wrap">\n'
-            f'      <img src="{rel}" alt="{alt}" loading="lazy">\n'
+            f'      {img_html}\n'
             f'    </div>\n'
             f'    <div class="card-body">\n'
             f'      <h2 class="card-title">{filename}</h2>\n'
@@ -684,6 +844,8 @@ _PHOTO_ESSAY_CSS = """\
 }
 """
 
+_ESSAY_SIZES = '(max-width: 640px) 100vw, 50vw'
+
 
 def _generate_photo_essay(
     described_items: List[Tuple[str, object]],
@@ -691,12 +853,12 @@ def _generate_photo_essay(
     title: str,
     include_metadata: bool,
     description_selection: str = 'newest',
+    web_images: Optional[Dict[str, dict]] = None,
 ) -> str:
     toc = _build_toc(described_items)
     entries = []
     for i, (fp, item) in enumerate(described_items):
-        rel = _esc(image_paths.get(fp, ''))
-        alt = _esc(_get_alt_text(fp))
+        img_html = _img_html(fp, image_paths, web_images, _ESSAY_SIZES)
         filename = _esc(Path(fp).name)
         descs_html = _render_descriptions_html(
             _get_descriptions(item, description_selection), 'essay-desc'
@@ -707,7 +869,7 @@ def _generate_photo_essay(
             f'  <article class="essay-entry" id="img-{i}">\n'
             f'    <div class="essay-inner">\n'
             f'      <div class="essay-img-wrap">\n'
-            f'        <img src="{rel}" alt="{alt}" loading="lazy">\n'
+            f'        {img_html}\n'
             f'      </div>\n'
             f'      <div class="essay-text">\n'
             f'        <h2 class="essay-title">{filename}</h2>\n'
@@ -859,6 +1021,9 @@ _LIGHTBOX_GRID_CSS = """\
 }
 """
 
+_THUMB_SIZES = '(max-width: 640px) 50vw, 240px'
+_LIGHTBOX_SIZES = '(max-width: 640px) 92vw, 500px'
+
 _LIGHTBOX_JS = """\
 (function () {
     'use strict';
@@ -885,6 +1050,10 @@ _LIGHTBOX_JS = """\
 
     function renderLightbox() {
         var item = GALLERY[currentIndex];
+        var source = document.getElementById('lb-source');
+        source.type = item.type || 'image/jpeg';
+        source.srcset = item.modern;
+        document.getElementById('lb-img').srcset = item.srcset;
         document.getElementById('lb-img').src = item.src;
         document.getElementById('lb-img').alt = item.alt;
         document.getElementById('lb-filename').textContent = item.filename;
@@ -952,17 +1121,23 @@ def _generate_lightbox_grid(
     title: str,
     include_metadata: bool,
     description_selection: str = 'newest',
+    web_images: Optional[Dict[str, dict]] = None,
 ) -> str:
     # Build JS data array
     js_entries = []
     for fp, item in described_items:
         rel = image_paths.get(fp, '')
+        web = (web_images or {}).get(fp)
         descs_html = _render_descriptions_html(
             _get_descriptions(item, description_selection), 'lb-desc-text'
         )
+        modern = web['sources'][0] if web and web['sources'] else ('', '')
         js_entries.append(
             '{'
-            f'src:{_js_str(rel)},'
+            f'src:{_js_str(web["src"] if web else rel)},'
+            f'srcset:{_js_str(web["srcset"] if web else "")},'
+            f'type:{_js_str(modern[0])},'
+            f'modern:{_js_str(modern[1])},'
             f'alt:{_js_str(_get_alt_text(fp))},'
             f'filename:{_js_str(Path(fp).name)},'
             f'desc:{_js_str(descs_html)},'
@@ -974,13 +1149,12 @@ def _generate_lightbox_grid(
     # Build thumbnail grid
     thumbs = []
     for i, (fp, item) in enumerate(described_items):
-        rel = _esc(image_paths.get(fp, ''))
-        alt = _esc(_get_alt_text(fp))
+        img_html = _img_html(fp, image_paths, web_images, _THUMB_SIZES)
         aria = _esc(f'View {Path(fp).name}')
         thumbs.append(
             f'<li class="thumb-item">\n'
             f'  <button aria-label="{aria}" onclick="openLightbox({i}, this)">\n'
-            f'    <img src="{rel}" alt="{alt}" loading="lazy">\n'
+            f'    {img_html}\n'
             f'  </button>\n'
             f'</li>'
         )
@@ -1002,7 +1176,8 @@ def _generate_lightbox_grid(
         '    </div>\n'
         '    <div id="lightbox-body">\n'
         '      <div id="lightbox-img-wrap">\n'
-        '        <img id="lb-img" src="" alt="">\n'
+        f'        <picture><source id="lb-source" srcset="" sizes="{_LIGHTBOX_SIZES}">'
+        f'<img id="lb-img" src="" alt="" sizes="{_LIGHTBOX_SIZES}"></picture>\n'
         '      </div>\n'
         '      <div id="lightbox-caption-area" aria-live="polite" aria-atomic="true">\n'
         '        <h2 id="lb-filename"></h2>\n'
@@ -1078,6 +1253,8 @@ _SIMPLE_LIST_CSS = """\
 .entry-meta { margin-top: 1rem; }
 """
 
+_LIST_SIZES = '100vw'
+
 
 def _generate_simple_list(
     described_items: List[Tuple[str, object]],
@@ -1085,12 +1262,12 @@ def _generate_simple_list(
     title: str,
     include_metadata: bool,
     description_selection: str = 'newest',
+    web_images: Optional[Dict[str, dict]] = None,
 ) -> str:
     toc = _build_toc(described_items)
     entries = []
     for i, (fp, item) in enumerate(described_items):
-        rel = _esc(image_paths.get(fp, ''))
-        alt = _esc(_get_alt_text(fp))
+        img_html = _img_html(fp, image_paths, web_images, _LIST_SIZES)
         filename = _esc(Path(fp).name)
         descs_html = _render_descriptions_html(
             _get_descriptions(item, description_selection), 'entry-desc'
@@ -1099,7 +1276,7 @@ def _generate_simple_list(
         entries.append(
             f'<li>\n'
             f'  <article class="image-entry" id="img-{i}">\n'
-            f'    <img src="{rel}" alt="{alt}" loading="lazy">\n'
+            f'    {img_html}\n'
             f'    <div class="entry-body">\n'
             f'      <h2 class="entry-title">{filename}</h2>\n'
             f'      <h3 class="entry-desc-heading">Description</h3>\n'
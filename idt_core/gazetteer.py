@@ -0,0 +1,270 @@
+"""
+Offline reverse geocoding from a local gazetteer.
+
+NominatimGeocoder asks OpenStreetMap, one request a second, so a 10k-photo
+trip takes hours and nothing works without a network. OfflineGeocoder answers
+the same question — which town is this photo in or nearest to — from a list of
+places held in memory, indexed by a grid of small lat/lon cells, in
+microseconds and with no network at all.
+
+The gazetteer is GeoNames' "cities" dump (https://download.geonames.org/export/dump/):
+``cities1000.zip`` (or cities500/5000/15000), either zipped or unzipped, plus
+optionally ``admin1CodesASCII.txt`` and ``countryInfo.txt`` beside it for state
+and country names. Without those two, the state is left out and the country is
+its ISO code. By default it is looked for in ``~/.idt/gazetteer/``.
+
+Usage:
+    geocoder = OfflineGeocoder(load_gazetteer())           # offline only
+    geocoder = OfflineGeocoder(load_gazetteer(), refine=NominatimGeocoder(...))
+    meta = geocoder.enrich(meta)
+
+With *refine*, the offline answer is filled in first and Nominatim's (finer,
+when the network is there) overrides it — so a run with no network still gets
+a location for every photo.
+"""
+from __future__ import annotations
+
+import io
+import math
+import threading
+import zipfile
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+DEFAULT_GAZETTEER_DIR = Path.home() / ".idt" / "gazetteer"
+
+#: Grid cell size in degrees. Small enough that a lookup in a dense region
+#: compares a few dozen places, not thousands.
+CELL_DEGREES = 0.25
+
+#: Photos farther than this from every place in the gazetteer get no location.
+DEFAULT_MAX_KM = 50.0
+
+_KM_PER_DEGREE = 111.195  # one degree of latitude (mean Earth radius 6371 km)
+
+
+class GazetteerNotFound(FileNotFoundError):
+    """No gazetteer file where one was expected."""
+
+
+class Place(NamedTuple):
+    name: str
+    admin1: Optional[str]   # state / province / region
+    country: str
+    latitude: float
+    longitude: float
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * 6371.0 * math.asin(min(1.0, math.sqrt(a)))
+
+
+class Gazetteer:
+    """Places indexed by grid cell for nearest-place lookups."""
+
+    def __init__(self, places: list[Place], cell_degrees: float = CELL_DEGREES):
+        self.places = places
+        self.cell_degrees = cell_degrees
+        self._columns = int(round(360 / cell_degrees))
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        for index, place in enumerate(places):
+            self._cells.setdefault(self._cell(place.latitude, place.longitude), []).append(index)
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def _cell(self, lat: float, lon: float) -> tuple[int, int]:
+        row = int(math.floor((lat + 90.0) / self.cell_degrees))
+        col = int(math.floor((lon + 180.0) / self.cell_degrees)) % self._columns
+        return row, col
+
+    def _ring(self, row: int, col: int, r: int) -> Iterator[tuple[int, int]]:
+        """The cells exactly *r* steps from (row, col), longitude wrapping around."""
+        if r == 0:
+            yield row, col
+            return
+        cols = {(col + dc) % self._columns for dc in range(-r, r + 1)}
+        for c in cols:
+            yield row - r, c
+            yield row + r, c
+        for dr in range(-r + 1, r):
+            yield row + dr, (col - r) % self._columns
+            yield row + dr, (col + r) % self._columns
+
+    def nearest(self, lat: float, lon: float,
+                max_km: float = DEFAULT_MAX_KM) -> Optional[tuple[Place, float]]:
+        """The nearest place to (lat, lon) and its distance in km, or None beyond *max_km*."""
+        row, col = self._cell(lat, lon)
+        best: Optional[int] = None
+        best_km = math.inf
+        r = 0
+        while r <= self._columns // 2:
+            for cell in self._ring(row, col, r):
+                for index in self._cells.get(cell, ()):
+                    place = self.places[index]
+                    km = _haversine_km(lat, lon, place.latitude, place.longitude)
+                    if km < best_km:
+                        best, best_km = index, km
+            # Anything outside ring r is at least r cells away; measure a cell
+            # along the parallel nearest the pole the next ring reaches, where
+            # it is narrowest, so the bound never overstates the distance.
+            reach_lat = min(89.9, abs(lat) + (r + 1) * self.cell_degrees)
+            next_ring_km = r * self.cell_degrees * _KM_PER_DEGREE * math.cos(math.radians(reach_lat))
+            if next_ring_km >= min(best_km, max_km):
+                break
+            r += 1
+        if best is None or best_km > max_km:
+            return None
+        return self.places[best], best_km
+
+    # ----- loading ----- #
+    @classmethod
+    def load(cls, path: Path) -> "Gazetteer":
+        """
+        Load a GeoNames cities file (.txt or .zip), or the first one found in
+        the directory *path*, with admin1CodesASCII.txt / countryInfo.txt from
+        the same directory when present.
+        """
+        source = find_gazetteer(path)
+        folder = source.parent
+        admin1 = _read_admin1(folder / "admin1CodesASCII.txt")
+        countries = _read_countries(folder / "countryInfo.txt")
+        places = []
+        for line in _lines(source):
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) < 11:
+                continue
+            try:
+                lat, lon = float(cols[4]), float(cols[5])
+            except ValueError:
+                continue
+            cc = cols[8]
+            places.append(Place(
+                name=cols[1],
+                admin1=admin1.get(f"{cc}.{cols[10]}"),
+                country=countries.get(cc, cc),
+                latitude=lat,
+                longitude=lon,
+            ))
+        return cls(places)
+
+
+def find_gazetteer(path: Optional[Path] = None) -> Path:
+    """
+    The cities file load_gazetteer(path) would read, found without reading it
+    — cheap enough to check a setting with. Raises GazetteerNotFound when
+    there is none.
+    """
+    path = Path(path).expanduser() if path is not None else DEFAULT_GAZETTEER_DIR
+    source = _find_cities_file(path) if path.is_dir() else path
+    if source is None or not source.is_file():
+        raise GazetteerNotFound(
+            f"No gazetteer at {path}. Download cities1000.zip (and optionally "
+            f"admin1CodesASCII.txt and countryInfo.txt) from "
+            f"https://download.geonames.org/export/dump/ into {DEFAULT_GAZETTEER_DIR}."
+        )
+    return source
+
+
+def _find_cities_file(folder: Path) -> Optional[Path]:
+    """The most detailed cities dump in *folder* (cities500 before cities1000 ...)."""
+    candidates = [p for p in folder.glob("cities*") if p.suffix.lower() in (".txt", ".zip")]
+
+    def size_class(p: Path) -> int:
+        digits = "".join(ch for ch in p.stem if ch.isdigit())
+        return int(digits) if digits else 0
+
+    candidates.sort(key=lambda p: (size_class(p), p.suffix.lower() != ".txt"))
+    return candidates[0] if candidates else None
+
+
+def _lines(source: Path) -> Iterator[str]:
+    if source.suffix.lower() == ".zip":
+        with zipfile.ZipFile(source) as zf:
+            name = next((n for n in zf.namelist() if n.lower().endswith(".txt")), None)
+            if name is None:
+                return
+            with zf.open(name) as raw:
+                yield from io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+        return
+    with open(source, encoding="utf-8", errors="replace") as f:
+        yield from f
+
+
+def _read_admin1(path: Path) -> dict[str, str]:
+    """'US.WI' -> 'Wisconsin'."""
+    out: dict[str, str] = {}
+    if path.is_file():
+        for line in _lines(path):
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) >= 2:
+                out[cols[0]] = cols[1]
+    return out
+
+
+def _read_countries(path: Path) -> dict[str, str]:
+    """'US' -> 'United States'."""
+    out: dict[str, str] = {}
+    if path.is_file():
+        for line in _lines(path):
+            if line.startswith("#"):
+                continue
+            cols = line.rstrip("\n").split("\t")
+            if len(cols) >= 5:
+                out[cols[0]] = cols[4]
+    return out
+
+
+_loaded: dict[Path, Gazetteer] = {}
+_loaded_lock = threading.Lock()
+
+
+def load_gazetteer(path: Optional[Path] = None) -> Gazetteer:
+    """
+    The gazetteer at *path* (default ~/.idt/gazetteer/), loaded once per
+    process and shared — loading parses the whole dump, a lookup is cheap.
+    Raises GazetteerNotFound when there is none.
+    """
+    path = Path(path) if path is not None else DEFAULT_GAZETTEER_DIR
+    key = path.expanduser().resolve()
+    with _loaded_lock:
+        gazetteer = _loaded.get(key)
+        if gazetteer is None:
+            gazetteer = _loaded[key] = Gazetteer.load(key)
+        return gazetteer
+
+
+class OfflineGeocoder:
+    """
+    Reverse geocode GPS coordinates → city/state/country from a Gazetteer.
+    Same enrich() contract as NominatimGeocoder; thread-safe (read-only).
+    """
+
+    def __init__(self, gazetteer: Gazetteer, refine=None, max_km: float = DEFAULT_MAX_KM):
+        self.gazetteer = gazetteer
+        self.refine = refine   # e.g. a NominatimGeocoder, consulted after the offline answer
+        self.max_km = max_km
+
+    def enrich(self, meta):
+        """Add city/state/country to meta if GPS coordinates are present."""
+        if meta.latitude is None or meta.longitude is None:
+            return meta
+        found = self.gazetteer.nearest(meta.latitude, meta.longitude, self.max_km)
+        if found is not None:
+            place, _km = found
+            meta.city = place.name or meta.city
+            meta.state = place.admin1 or meta.state
+            meta.country = place.country or meta.country
+            meta.place_source = "geonames"
+        if self.refine is not None:
+            meta = self.refine.enrich(meta)
+        return meta
+
+    def prefetch(self, points, progress=None, should_cancel=None) -> int:
+        """Offline lookups need no warming; passed on to *refine* when there is one."""
+        if self.refine is not None and hasattr(self.refine, "prefetch"):
+            return self.refine.prefetch(points, progress, should_cancel)
+        return 0
@@ -142,14 +142,15 @@ def gui_workspace_to_bundle(workspace_dict: dict, dest: Path,
 
     items = workspace_dict.get("items") or {}
     total = len(items)
-    for done, (key, item) in enumerate(items.items(), start=1):
-        item_type = item.get("item_type", "image")
-        if item_type == _CHAT_TYPE or str(key).startswith("chat:"):
-            _gui_chat_item_to_bundle(ws, key, item)
-        else:
-            _gui_image_item_to_bundle(ws, key, item, copy_images)
-        if progress:
-            progress(done, total, Path(str(key)).name)
+    with ws.write_behind():
+        for done, (key, item) in enumerate(items.items(), start=1):
+            item_type = item.get("item_type", "image")
+            if item_type == _CHAT_TYPE or str(key).startswith("chat:"):
+                _gui_chat_item_to_bundle(ws, key, item)
+            else:
+                _gui_image_item_to_bundle(ws, key, item, copy_images)
+            if progress:
+                progress(done, total, Path(str(key)).name)
 
     return ws
 
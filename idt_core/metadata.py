@@ -13,15 +13,27 @@ Usage:
     context = meta.prompt_context()   # "Munich, Germany  Sep 12, 2025  iPhone 14 Pro"
     geocoder = NominatimGeocoder(cache_path=~/.idt/geocode_cache.json)
     meta = geocoder.enrich(meta)
+    geocoder.prefetch(points)              # a batch: one request per distinct place
+    geocoder = make_geocoder("offline")    # local gazetteer, no network (idt_core.gazetteer)
+    metas = extractor.extract_many(paths)   # bulk pre-scan across processes
+    extractor = MetadataExtractor(cache=cache_for(bundle))  # read each file version once
 """
 from __future__ import annotations
 
 import json
+import math
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional
+
+from .exif_reader import read_exif
+from .metadata_cache import MetadataCache, file_key
 
 try:
     from PIL import Image
@@ -36,6 +48,10 @@ try:
 except ImportError:
     _HEIC_SUPPORT = False
 
+#: extract_many() below this many paths runs in-process: starting a pool costs
+#: more than header-only extraction of a few hundred files.
+EXTRACT_POOL_MIN = 200
+
 
 @dataclass
 class ImageMetadata:
@@ -56,6 +72,9 @@ class ImageMetadata:
     city: Optional[str] = None
     state: Optional[str] = None
     country: Optional[str] = None
+    # Who supplied city/state/country: "nominatim" (OpenStreetMap, ODbL
+    # attribution required) or "geonames" (the offline gazetteer)
+    place_source: Optional[str] = None
     # Source (for video frames)
     source_video: Optional[str] = None
     source_timestamp: Optional[str] = None
@@ -149,39 +168,51 @@ class ImageMetadata:
 
 
 class MetadataExtractor:
-    """Extract EXIF metadata from image files."""
+    """
+    Extract EXIF metadata from image files.
+
+    With a *cache* (idt_core.metadata_cache), a file already read in this or
+    an earlier run is answered from the cache until its size, mtime or inode
+    changes.
+    """
+
+    def __init__(self, cache: Optional[MetadataCache] = None):
+        self.cache = cache
 
     def extract(self, path: Path) -> ImageMetadata:
         """
         Extract all available metadata from an image file.
         Never raises — returns an empty ImageMetadata on any failure.
         Falls back to file mtime when no EXIF date is present.
+
+        Only the file's metadata block is read (see exif_reader); PIL is used
+        for formats the header reader does not handle.
         """
+        path = Path(path)
+        if self.cache is None:
+            return self._read(path)
+        key = file_key(path)  # taken before the read, so a concurrent edit is a miss next time
+        cached = self.cache.get(key) if key is not None else None
+        if cached is not None:
+            return ImageMetadata.from_dict(cached)
+        meta = self._read(path)
+        if key is not None:
+            self.cache.put(key, meta.to_dict())
+        return meta
+
+    def _read(self, path: Path) -> ImageMetadata:
+        """extract() without the cache."""
         meta = ImageMetadata()
 
         try:
-            with Image.open(path) as img:
-                raw_exif = img.getexif()
-                if raw_exif:
-                    exif: dict = {}
-                    for tag_id, value in raw_exif.items():
-                        tag = TAGS.get(tag_id, tag_id)
-                        exif[tag] = value
-                    # GPS lives in a sub-IFD
-                    try:
-                        gps_ifd = raw_exif.get_ifd(0x8825)
-                        if gps_ifd:
-                            gps: dict = {}
-                            for tid, val in gps_ifd.items():
-                                gps[GPSTAGS.get(tid, tid)] = val
-                            exif["GPSInfo"] = gps
-                    except (KeyError, AttributeError):
-                        pass
-
-                    self._fill_datetime(meta, exif)
-                    self._fill_location(meta, exif)
-                    self._fill_camera(meta, exif)
-                    self._fill_source(meta, exif)
+            exif = read_exif(path)
+            if exif is None:
+                exif = self._pil_exif(path)
+            if exif:
+                self._fill_datetime(meta, exif)
+                self._fill_location(meta, exif)
+                self._fill_camera(meta, exif)
+                self._fill_source(meta, exif)
         except Exception:
             pass
 
@@ -197,6 +228,81 @@ class MetadataExtractor:
 
         return meta
 
+    def extract_many(self, paths: Iterable[Path],
+                     workers: Optional[int] = None) -> list[ImageMetadata]:
+        """
+        extract() for every path, in order, spread over a process pool.
+
+        workers: pool size; defaults to the CPU count. 1 (or fewer than
+        EXTRACT_POOL_MIN files to read) extracts in this process. Files are
+        read by the base extraction, not through an overridden extract(). If
+        the pool cannot start or breaks, the remaining paths are extracted in
+        this process.
+
+        With a cache, every path is looked up in one pass and only the misses
+        are read; what they read is stored in one transaction.
+        """
+        paths = [Path(p) for p in paths]
+        keys = [file_key(p) for p in paths] if self.cache is not None else [None] * len(paths)
+        cached = self.cache.get_many(keys) if self.cache is not None else {}
+        todo = [i for i, key in enumerate(keys) if key not in cached]
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, 61)  # ProcessPoolExecutor's limit on Windows
+        read: list[ImageMetadata] = []
+        if workers > 1 and len(todo) >= EXTRACT_POOL_MIN:
+            chunksize = max(1, min(256, len(todo) // (workers * 4)))
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    for meta in pool.map(_extract_one, [paths[i] for i in todo],
+                                         chunksize=chunksize):
+                        read.append(meta)
+            except (BrokenProcessPool, OSError, NotImplementedError):
+                pass
+        read.extend(self._read(paths[i]) for i in todo[len(read):])
+
+        if self.cache is not None:
+            self.cache.put_many(
+                (keys[i], meta.to_dict()) for i, meta in zip(todo, read) if keys[i] is not None
+            )
+        out: list[ImageMetadata] = [
+            ImageMetadata.from_dict(cached[key]) if key in cached else None for key in keys
+        ]
+        for i, meta in zip(todo, read):
+            out[i] = meta
+        return out
+
+    @staticmethod
+    def _pil_exif(path: Path) -> dict:
+        """The EXIF dict via a full PIL open — for formats exif_reader can't read."""
+        with Image.open(path) as img:
+            raw_exif = img.getexif()
+            if not raw_exif:
+                return {}
+            exif: dict = {}
+            for tag_id, value in raw_exif.items():
+                tag = TAGS.get(tag_id, tag_id)
+                exif[tag] = value
+            # DateTimeOriginal and LensModel live in the Exif sub-IFD, as
+            # exif_reader reads them
+            try:
+                for tag_id, value in raw_exif.get_ifd(0x8769).items():
+                    exif.setdefault(TAGS.get(tag_id, tag_id), value)
+            except (KeyError, AttributeError):
+                pass
+            # GPS lives in a sub-IFD
+            try:
+                gps_ifd = raw_exif.get_ifd(0x8825)
+                if gps_ifd:
+                    gps: dict = {}
+                    for tid, val in gps_ifd.items():
+                        gps[GPSTAGS.get(tid, tid)] = val
+                    exif["GPSInfo"] = gps
+            except (KeyError, AttributeError):
+                pass
+            return exif
+
     # ------------------------------------------------------------------ #
 
     def _fill_datetime(self, meta: ImageMetadata, exif: dict) -> None:
@@ -226,7 +332,7 @@ class MetadataExtractor:
                 meta.longitude = lon
             if "GPSAltitude" in gps:
                 alt = float(gps["GPSAltitude"])
-                if gps.get("GPSAltitudeRef") == 1:
+                if gps.get("GPSAltitudeRef") in (1, b"\x01"):
                     alt = -alt
                 meta.altitude = alt
 
@@ -262,6 +368,15 @@ class MetadataExtractor:
 # Geocoder                                                             #
 # ------------------------------------------------------------------ #
 
+#: NominatimGeocoder's cache cell size: geohash precision 6 is about
+#: 1.2 km × 0.6 km — well inside one town, so one answer serves the cell.
+GEOCODE_CELL_PRECISION = 6
+#: A cached answer this close to a photo in a neighbouring cell is reused too.
+GEOCODE_REUSE_KM = 1.0
+#: Journal lines appended before they are folded into the cache JSON.
+JOURNAL_COMPACT = 200
+
+
 class NominatimGeocoder:
     """
     Reverse geocode GPS coordinates → city/state/country using OSM Nominatim.
@@ -269,6 +384,18 @@ class NominatimGeocoder:
     Rate-limited to 1 req/s per Nominatim policy. Results cached on disk so
     repeated runs don't re-query the same coordinates.
 
+    The cache is looked up spatially, not by exact coordinate: a photo taken
+    in the same geohash cell as a cached one (precision 6 ≈ 1.2 × 0.6 km), or
+    within *reuse_km* of one, reuses its answer — a walk around town is one
+    request per neighbourhood instead of one per photo. prefetch() resolves a
+    whole batch up front, one request per distinct cell.
+
+    On disk the cache stays the flat {"lat,lon": result} JSON it always was,
+    so any precision can read it. New results are appended to a journal beside
+    it (geocode_cache.jsonl) — one short line per lookup instead of rewriting
+    the whole file — and folded back into the JSON every JOURNAL_COMPACT lines
+    and on the next load.
+
     Requires: pip install requests
     """
 
@@ -278,12 +405,23 @@ class NominatimGeocoder:
         self,
         cache_path: Optional[Path] = None,
         delay_seconds: float = 1.1,
+        precision: int = GEOCODE_CELL_PRECISION,
+        reuse_km: float = GEOCODE_REUSE_KM,
     ):
-        self.cache_path = cache_path
+        self.cache_path = Path(cache_path) if cache_path else None
         self.delay_seconds = max(delay_seconds, 1.0)
+        self.precision = precision
+        self.reuse_km = reuse_km
+        self.requests_made = 0
         self._last_request: float = 0.0
-        self._cache: dict = {}
+        self._cache: dict = {}                 # "lat,lon" -> result, as stored on disk
+        self._cells: dict = {}                 # geohash -> [(lat, lon, result), ...]
+        self._failed: set = set()              # cells whose request failed this session
+        self._journal_lines = 0
         self._requests_ok = False
+        # A concurrent describe run enriches from several worker threads. One
+        # lock keeps the 1 req/s policy global and the cache file consistent.
+        self._lock = threading.Lock()
 
         try:
             import requests as _r
@@ -292,29 +430,67 @@ class NominatimGeocoder:
         except ImportError:
             pass
 
-        if self.cache_path and self.cache_path.exists():
-            try:
-                self._cache = json.loads(self.cache_path.read_text(encoding="utf-8"))
-            except Exception:
-                pass
+        if self.cache_path:
+            self._load()
+
+    @property
+    def journal_path(self) -> Optional[Path]:
+        return self.cache_path.with_suffix(".jsonl") if self.cache_path else None
 
     def enrich(self, meta: ImageMetadata) -> ImageMetadata:
         """Add city/state/country to meta if GPS coordinates are present."""
         if meta.latitude is None or meta.longitude is None:
             return meta
-        result = self._geocode(meta.latitude, meta.longitude)
+        with self._lock:
+            result = self._geocode(meta.latitude, meta.longitude)
         if result:
             meta.city = result.get("city") or meta.city
             meta.state = result.get("state") or meta.state
             meta.country = result.get("country") or meta.country
+            meta.place_source = "nominatim"
         return meta
 
+    def prefetch(
+        self,
+        points: Iterable[tuple[float, float]],
+        progress: Optional[Callable[[int, int], None]] = None,
+        should_cancel: Optional[Callable[[], bool]] = None,
+    ) -> int:
+        """
+        Geocode a batch's (lat, lon) points before it is described: one request
+        per distinct cell the cache cannot already answer, so enrich() on each
+        photo afterwards never waits on the network. Returns the requests made.
+
+        At 1 request/s a large batch takes minutes, so ``progress`` (optional)
+        is called with (places done, places to look up) after each one, and
+        ``should_cancel`` (optional) is polled before each; when it returns
+        True the rest are left for enrich() to look up if it is ever asked.
+        """
+        todo: dict[str, tuple[float, float]] = {}
+        with self._lock:
+            for lat, lon in points:
+                if self._lookup(lat, lon) is None:
+                    todo.setdefault(geohash(lat, lon, self.precision), (lat, lon))
+        before = self.requests_made
+        for done, (lat, lon) in enumerate(todo.values(), start=1):
+            if should_cancel is not None and should_cancel():
+                break
+            with self._lock:
+                self._geocode(lat, lon)
+            if progress is not None:
+                progress(done, len(todo))
+        with self._lock:
+            self._compact()
+        return self.requests_made - before
+
+    # ----- lookup ----- #
     def _geocode(self, lat: float, lon: float) -> Optional[dict]:
-        key = f"{lat:.6f},{lon:.6f}"
-        if key in self._cache:
-            return self._cache[key]
+        hit = self._lookup(lat, lon)
+        if hit is not None:
+            return hit
 
-        if not self._requests_ok:
+        cell = geohash(lat, lon, self.precision)
+        if not self._requests_ok or cell in self._failed:
             return None
 
         # Rate limit
@@ -322,6 +498,7 @@ class NominatimGeocoder:
         if elapsed < self.delay_seconds:
             time.sleep(self.delay_seconds - elapsed)
         self._last_request = time.monotonic()
+        self.requests_made += 1
 
         try:
             resp = self._requests.get(
@@ -339,29 +516,194 @@ class NominatimGeocoder:
                 "country": addr.get("country"),
             }
             result = {k: v for k, v in result.items() if v}
-            self._cache[key] = result
-            self._save_cache()
-            return result
         except Exception:
+            # Not retried for this cell until the next run: offline, one
+            # timeout per place rather than one per photo.
+            self._failed.add(cell)
             return None
+        key = f"{lat:.6f},{lon:.6f}"
+        self._remember(key, lat, lon, result)
+        self._append_journal(key, result)
+        return result
+
+    def _lookup(self, lat: float, lon: float) -> Optional[dict]:
+        """A cached answer for (lat, lon): exact, same cell, or nearest within reuse_km."""
+        exact = self._cache.get(f"{lat:.6f},{lon:.6f}")
+        if exact is not None:
+            return exact
+        own = geohash(lat, lon, self.precision)
+        best, best_km = None, self.reuse_km
+        for cell in _cells_around(lat, lon, self.precision, self.reuse_km):
+            for clat, clon, result in self._cells.get(cell, ()):
+                if cell == own:
+                    return result
+                km = _distance_km(lat, lon, clat, clon)
+                if km <= best_km:
+                    best, best_km = result, km
+        return best
+
+    def _remember(self, key: str, lat: float, lon: float, result: dict) -> None:
+        self._cache[key] = result
+        self._cells.setdefault(geohash(lat, lon, self.precision), []).append((lat, lon, result))
+
+    # ----- persistence ----- #
+    def _load(self) -> None:
+        if self.cache_path.exists():
+            try:
+                stored = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            except Exception:
+                stored = {}
+            for key, result in stored.items() if isinstance(stored, dict) else ():
+                self._add_stored(key, result)
+        journal = self.journal_path
+        if journal.exists():
+            try:
+                with open(journal, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            key, result = json.loads(line)
+                        except (ValueError, TypeError):
+                            continue  # a line torn by a crash mid-append
+                        self._add_stored(key, result)
+            except OSError:
+                pass
+            self._compact()
 
-    def _save_cache(self) -> None:
+    def _add_stored(self, key: str, result) -> None:
+        try:
+            lat, lon = (float(v) for v in key.split(","))
+        except (ValueError, AttributeError):
+            return
+        if isinstance(result, dict):
+            self._remember(key, lat, lon, result)
+
+    def _append_journal(self, key: str, result: dict) -> None:
         if not self.cache_path:
             return
         try:
             self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_text(
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps([key, result], ensure_ascii=False) + "\n")
+            self._journal_lines += 1
+        except OSError:
+            return
+        if self._journal_lines >= JOURNAL_COMPACT:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Fold the journal into the JSON file (written whole, atomically) and remove it."""
+        if not self.cache_path or not self.journal_path.exists():
+            return
+        try:
+            tmp = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            tmp.write_text(
                 json.dumps(self._cache, indent=2, ensure_ascii=False),
                 encoding="utf-8",
             )
-        except Exception:
+            os.replace(tmp, self.cache_path)
+            self.journal_path.unlink()
+            self._journal_lines = 0
+        except OSError:
             pass
 
 
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash(lat: float, lon: float, precision: int) -> str:
+    """The standard geohash of (lat, lon) with *precision* characters."""
+    lat_lo, lat_hi, lon_lo, lon_hi = -90.0, 90.0, -180.0, 180.0
+    lon = (lon + 180.0) % 360.0 - 180.0
+    lat = min(max(lat, -90.0), 90.0)
+    chars = []
+    bits = bit_count = 0
+    even = True  # bits alternate lon, lat, starting with lon
+    while len(chars) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            bit = lon >= mid
+            lon_lo, lon_hi = (mid, lon_hi) if bit else (lon_lo, mid)
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            bit = lat >= mid
+            lat_lo, lat_hi = (mid, lat_hi) if bit else (lat_lo, mid)
+        bits = (bits << 1) | bit
+        bit_count += 1
+        even = not even
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = bit_count = 0
+    return "".join(chars)
+
+
+def _cells_around(lat: float, lon: float, precision: int, radius_km: float) -> list:
+    """The geohash cells that may hold a point within *radius_km* of (lat, lon), own cell first."""
+    lon_bits = (5 * precision + 1) // 2
+    height = 180.0 / (1 << (5 * precision - lon_bits))
+    width = 360.0 / (1 << lon_bits)
+    dlat = radius_km / 111.195
+    dlon = dlat / max(math.cos(math.radians(min(abs(lat), 89.0))), 0.01)
+    rows, cols = math.ceil(dlat / height), math.ceil(dlon / width)
+    cells = [geohash(lat, lon, precision)]
+    for i in range(-rows, rows + 1):
+        for j in range(-cols, cols + 1):
+            cell = geohash(lat + i * height, lon + j * width, precision)
+            if cell not in cells:
+                cells.append(cell)
+    return cells
+
+
+def _distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((p2 - p1) / 2) ** 2
+         + math.cos(p1) * math.cos(p2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * 6371.0 * math.asin(min(1.0, math.sqrt(a)))
+
+
+#: RunOptions.geocode / --geocode values. "online" asks Nominatim, "offline"
+#: looks the place up in the local gazetteer (idt_core.gazetteer), "refine"
+#: does the offline lookup and lets Nominatim improve on it.
+GEOCODE_MODES = ("online", "offline", "refine")
+DEFAULT_GEOCODE_CACHE = Path.home() / ".idt" / "geocode_cache.json"
+
+
+def geocode_mode(value) -> Optional[str]:
+    """Normalise a geocode setting: False/None/"off" → None, True → "online"."""
+    if value is True:
+        return "online"
+    if not value or value == "off":
+        return None
+    if value not in GEOCODE_MODES:
+        raise ValueError(f"Unknown geocode mode {value!r} (expected one of {', '.join(GEOCODE_MODES)})")
+    return value
+
+
+def make_geocoder(mode, cache_path: Optional[Path] = None, gazetteer_path: Optional[Path] = None):
+    """
+    The geocoder for *mode* (see geocode_mode), or None when geocoding is off.
+    Offline modes raise gazetteer.GazetteerNotFound when no gazetteer is installed.
+    """
+    mode = geocode_mode(mode)
+    if mode is None:
+        return None
+    online = None
+    if mode in ("online", "refine"):
+        online = NominatimGeocoder(cache_path=cache_path or DEFAULT_GEOCODE_CACHE)
+        if mode == "online":
+            return online
+    from .gazetteer import OfflineGeocoder, load_gazetteer
+    return OfflineGeocoder(load_gazetteer(gazetteer_path), refine=online)
+
+
 # ------------------------------------------------------------------ #
 # Helpers                                                              #
 # ------------------------------------------------------------------ #
 
+def _extract_one(path: Path) -> ImageMetadata:
+    """extract_many()'s pool task (module level so it pickles)."""
+    return MetadataExtractor()._read(path)
+
+
 def _parse_exif_dt(s: str) -> Optional[datetime]:
     for fmt in ("%Y:%m:%d %H:%M:%S", "%Y-%m-%d %H:%M:%S"):
         try:
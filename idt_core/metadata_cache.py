@@ -0,0 +1,178 @@
+"""
+MetadataCache — the EXIF metadata of each image file, read once per file version.
+
+A describe run, the GUI worker and the viewer all ask MetadataExtractor about
+the same files, run after run, and none of those files has changed. The cache
+keeps each file's extracted ImageMetadata (as its to_dict(), before any
+geocoding) under the file's absolute path, together with the size, mtime and
+inode it had when it was read. A lookup stats the file and trusts the row only
+while all three still match, so an edited, replaced or restored file is read
+again and nothing stale is ever returned.
+
+Where it lives:
+
+* A bundle keeps its own in ``derived/metadata.sqlite3`` (see
+  :func:`cache_for`), beside the catalog — removable at any time, rebuilt as
+  the files are next read.
+* Callers with no bundle (an unsaved GUI workspace, shared.exif_utils) use the
+  per-user one in ``~/.idt/cache/metadata.sqlite3``.
+
+Like the catalog, it opens a connection per call and never holds the file
+open, and like the payload cache it is only a cache: a missing, damaged,
+foreign-version or unwritable database costs a re-extraction, never an error.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable, Optional
+
+#: Bumped when the table shape, or what MetadataExtractor produces for the same
+#: file, changes. A file carrying any other version is dropped and rebuilt.
+SCHEMA_VERSION = 1
+
+METADATA_CACHE_NAME = "metadata.sqlite3"
+DEFAULT_CACHE_PATH = Path.home() / ".idt" / "cache" / METADATA_CACHE_NAME
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    path     TEXT PRIMARY KEY,  -- absolute path of the image
+    size     INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode    INTEGER NOT NULL,
+    data     TEXT NOT NULL      -- ImageMetadata.to_dict() as compact JSON
+);
+"""
+
+#: (absolute path, size, mtime_ns, inode) — one version of one file.
+FileKey = tuple
+
+
+def file_key(path: Path) -> Optional[FileKey]:
+    """The cache key for *path* as it is on disk now, or None if it cannot be stat'ed."""
+    try:
+        path = Path(os.path.abspath(path))
+        st = path.stat()
+    except (OSError, ValueError):
+        return None
+    return (str(path), st.st_size, st.st_mtime_ns, st.st_ino)
+
+
+class MetadataCache:
+    """One cache database. Cheap to construct; safe to share between threads."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.hits = 0
+        self.misses = 0
+        self._broken = False  # SQLite unusable here; stop trying for this object
+
+    # ----- connection ----- #
+    def _open(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        # A cache: a power cut costs a re-read, so skip the fsync.
+        conn.execute("PRAGMA synchronous = OFF")
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.execute("DROP TABLE IF EXISTS metadata")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+        return conn
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database, rebuilding it once if it is damaged. None if unusable."""
+        if self._broken:
+            return None
+        try:
+            return self._open()
+        except sqlite3.DatabaseError:
+            pass
+        except (sqlite3.Error, OSError):
+            self._broken = True
+            return None
+        try:
+            self.db_path.unlink()
+        except OSError:
+            pass
+        try:
+            return self._open()
+        except (sqlite3.Error, OSError):
+            self._broken = True
+            return None
+
+    # ----- lookup ----- #
+    def get(self, key: FileKey) -> Optional[dict]:
+        """The stored metadata dict for this file version, or None."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[FileKey]) -> dict:
+        """{key: metadata dict} for every key whose file version is stored."""
+        keys = [k for k in keys if k is not None]
+        found: dict = {}
+        conn = self._connect() if keys else None
+        if conn is not None:
+            try:
+                with closing(conn):
+                    for key in keys:
+                        row = conn.execute(
+                            "SELECT size, mtime_ns, inode, data FROM metadata WHERE path = ?",
+                            (key[0],),
+                        ).fetchone()
+                        if row is not None and tuple(row[:3]) == tuple(key[1:]):
+                            found[key] = json.loads(row[3])
+            except (sqlite3.Error, ValueError):
+                pass
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    # ----- storage ----- #
+    def put(self, key: FileKey, data: dict) -> None:
+        """Remember *data* for this file version (key taken before it was read)."""
+        self.put_many([(key, data)])
+
+    def put_many(self, entries: Iterable[tuple[FileKey, dict]]) -> None:
+        rows = [
+            (key[0], key[1], key[2], key[3],
+             json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+            for key, data in entries if key is not None
+        ]
+        conn = self._connect() if rows else None
+        if conn is None:
+            return
+        try:
+            with closing(conn):
+                conn.executemany(
+                    "INSERT OR REPLACE INTO metadata (path, size, mtime_ns, inode, data)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.commit()
+        except sqlite3.Error:
+            pass
+
+
+_caches: dict[Path, MetadataCache] = {}
+_caches_lock = threading.Lock()
+
+
+def cache_for(bundle: Optional[Path] = None) -> MetadataCache:
+    """
+    The metadata cache of the .idtw bundle at *bundle*, or the per-user cache
+    when *bundle* is None or not a bundle directory. One object per database,
+    so hit counts and the unusable-database flag are shared by every caller.
+    """
+    if bundle is not None and (Path(bundle) / "manifest.json").is_file():
+        db_path = Path(bundle) / "derived" / METADATA_CACHE_NAME
+    else:
+        db_path = DEFAULT_CACHE_PATH
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = _caches[db_path] = MetadataCache(db_path)
+        return cache
@@ -0,0 +1,196 @@
+"""
+PayloadCache — ready-to-send image bytes, keyed by what they were made from.
+
+Preparing an image for a provider (HEIC decode, downscale, re-encode — see
+converter.prepare_payload) costs far more than reading it, and a redescribe or
+a five-model comparison repeats that work for every image on every run. The
+cache stores the result under the SHA-256 of the source bytes plus the wire
+profile, so the same picture is prepared once however many models, runs,
+bundles or file names it turns up under.
+
+What is and is not kept:
+
+* Only conversions. An image that goes over the wire unchanged is never copied
+  in — a second copy of the original would save nothing.
+* Entries are bounded by ``max_bytes``. A hit touches the entry's mtime, and
+  when a store pushes the total over the bound the least recently used entries
+  are removed until it is back under 90% of it (so a full cache does not
+  evict on every store).
+
+The per-user cache lives in ``~/.idt/cache/payloads`` rather than inside a
+bundle: bundles are meant to be zipped and moved, and content addressing lets
+every bundle on the machine share one copy. Everything here is a cache — a
+missing, damaged or unwritable entry costs one re-conversion, never an error.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .converter import WireProfile, prepare_payload
+
+DEFAULT_CACHE_DIR = Path.home() / ".idt" / "cache" / "payloads"
+
+#: Bumped when prepare_payload's output for the same input changes (encoder
+#: settings, resampling), so entries made by an older build stop matching.
+ENCODING_VERSION = 1
+
+_EXTENSIONS = {"image/jpeg": ".jpg", "image/png": ".png", "image/webp": ".webp"}
+_LOW_WATER = 0.9
+
+
+def _profile_token(suffix: str, profile: Optional[WireProfile]) -> bytes:
+    return f"v{ENCODING_VERSION}|{suffix}|{profile!r}".encode("utf-8")
+
+
+class PayloadCache:
+    """A directory of prepared payloads. Safe to share between threads and processes."""
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # bytes on disk; counted on first store
+
+    # ----- lookup ----- #
+    def load(self, path: Path, profile: Optional[WireProfile] = None) -> tuple[bytes, str]:
+        """load_for_api(path, profile), converting only if this exact input was never seen."""
+        payload, mime, _, _ = self._prepare(Path(path), profile)
+        return payload, mime
+
+    def path_for(self, path: Path, profile: Optional[WireProfile] = None) -> Path:
+        """A file holding the prepared payload: the cache entry, or *path*
+        itself when the image needs no conversion. For callers that hand a
+        path, not bytes, to the provider (the GUI workers).
+
+        Raises OSError if a conversion was needed but could not be stored.
+        """
+        path = Path(path)
+        _, _, entry, stored = self._prepare(path, profile)
+        if entry is None:
+            return path
+        if not stored:
+            raise OSError(f"could not write {entry}")
+        return entry
+
+    def _prepare(
+        self, path: Path, profile: Optional[WireProfile]
+    ) -> tuple[bytes, str, Optional[Path], bool]:
+        """(payload, mime, entry, stored) — entry is None when the original goes as-is."""
+        with open(path, "rb") as f:
+            data = f.read()
+        entry, mime = self._entry(data, path.suffix.lower(), profile)
+        try:
+            payload = entry.read_bytes()
+        except OSError:
+            payload = b""
+        if payload:
+            self._touch(entry)
+            self.hits += 1
+            return payload, mime, entry, True
+        self.misses += 1
+        payload, mime = prepare_payload(data, path.suffix, profile)
+        if payload is data:
+            return payload, mime, None, False
+        return payload, mime, entry, self._store(entry, payload)
+
+    def _entry(self, data: bytes, suffix: str, profile: Optional[WireProfile]) -> tuple[Path, str]:
+        digest = hashlib.sha256(data)
+        digest.update(b"\0" + _profile_token(suffix, profile))
+        key = digest.hexdigest()
+        # Every stored payload is a conversion, whose type the profile decides
+        # (no profile means the legacy JPEG conversion).
+        mime = profile.mime_type if profile is not None else "image/jpeg"
+        return self.root / key[:2] / (key + _EXTENSIONS[mime]), mime
+
+    @staticmethod
+    def _touch(entry: Path) -> None:
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+
+    # ----- storage ----- #
+    def _store(self, entry: Path, payload: bytes) -> bool:
+        tmp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(payload)
+            os.replace(tmp, entry)  # readers see the whole entry or none of it
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return False
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, _, size in self._scan())
+            else:
+                self._size += len(payload)
+            if self._size > self.max_bytes:
+                self._evict()
+        return True
+
+    def _scan(self) -> list[tuple[int, Path, int]]:
+        """(mtime_ns, path, size) for every entry."""
+        found = []
+        try:
+            shards = list(os.scandir(self.root))
+        except OSError:
+            return found
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            try:
+                with os.scandir(shard.path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".tmp") or not entry.is_file():
+                            continue
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        found.append((st.st_mtime_ns, Path(entry.path), st.st_size))
+            except OSError:
+                continue
+        return found
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under the low-water mark. Caller holds the lock."""
+        entries = sorted(self._scan())
+        total = sum(size for _, _, size in entries)
+        target = int(self.max_bytes * _LOW_WATER)
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                continue
+        self._size = total
+
+
+_shared: Optional[PayloadCache] = None
+_shared_lock = threading.Lock()
+
+
+def shared_cache() -> Optional[PayloadCache]:
+    """The per-user cache in ~/.idt/cache/payloads, sized by
+    UserConfig.payload_cache_mb. None when the user has set that to 0."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            from .config import UserConfig
+
+            limit_mb = UserConfig.load().payload_cache_mb
+            if limit_mb <= 0:
+                return None
+            _shared = PayloadCache(DEFAULT_CACHE_DIR, limit_mb * 1024 * 1024)
+        return _shared
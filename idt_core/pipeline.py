@@ -6,23 +6,40 @@ Design:
   - HEIC → JPEG conversion happens in memory for the API call; if a persistent copy
     is needed (stored in .idt/), it is saved there and tracked in the sidecar
   - Extracts EXIF metadata before the API call; injects context into the prompt
-    so the AI knows when/where the photo was taken (dramatic quality improvement)
+    so the AI knows when/where the photo was taken (dramatic quality improvement);
+    each file version is read once and then answered from the metadata cache
+  - Images go to the provider shaped by its wire profile (downscaled/re-encoded
+    to what the model actually looks at); RunOptions.full_resolution opts out
+  - Or, for Claude/OpenAI, submitted to the vendor's batch endpoint and collected
+    later (submit_batch / collect_batch; job ids live in the manifest)
+  - Or fed batches as they arrive (run_feed, used by `idt watch`): one run,
+    one limiter and one run log for as long as the feed lasts
+  - Provider calls go through the shared AdaptiveLimiter for the provider,
+    model and account (rate_limit.py), so 429s slow every worker down together
   - Yields PipelineEvent objects so the caller (CLI or GUI) controls output
   - Stateless: create a new Pipeline per run; the Project holds all state
 """
 from __future__ import annotations
 
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Iterable, Iterator, Optional, Union
 
-from .converter import load_for_api, save_heic_copy
+from .batch_api import (
+    MAX_JOB_BYTES, MAX_REQUESTS_PER_JOB, STATE_KEY, BatchClient, BatchRequest, request_size,
+)
+from .converter import WireProfile, load_for_api, save_heic_copy, wire_profile_for
 from .image_item import Description, ImageItem
-from .metadata import ImageMetadata, MetadataExtractor, NominatimGeocoder
+from .metadata import ImageMetadata, MetadataExtractor, make_geocoder
+from .metadata_cache import METADATA_CACHE_NAME, MetadataCache, cache_for
+from .payload_cache import PayloadCache
 from .project import Project
-from .providers.base import BaseProvider
+from .providers.base import BaseProvider, DescriptionResult
+from .rate_limit import AdaptiveLimiter, limiter_for
 from .scanner import is_heic
 from .workspace import Workspace, WorkspaceItem, WorkspaceDescription
 
@@ -45,8 +62,21 @@ class RunOptions:
     redescribe: bool = False      # re-run images that already have descriptions
     limit: Optional[int] = None   # stop after N images (useful for testing)
     extract_metadata: bool = True  # extract EXIF and inject context into prompt
-    geocode: bool = False          # reverse-geocode GPS → city/state (requires internet)
+    geocode: Union[bool, str] = False  # reverse-geocode GPS → city/state: True/"online", "offline", "refine" (metadata.GEOCODE_MODES)
     geocode_cache: Optional[Path] = None  # path to geocoding cache JSON
+    gazetteer_path: Optional[Path] = None  # offline modes: GeoNames cities file or folder (default ~/.idt/gazetteer)
+    on_geocode: Optional[Callable[[int, int], None]] = None  # (done, total) per location looked up before describing
+    concurrency: int = 1           # WorkspacePipeline: images described at once (provider calls overlap)
+    prefetch: int = 2              # WorkspacePipeline: images prepared (decode/convert/EXIF) ahead of the provider
+    full_resolution: bool = False  # send originals instead of the provider's wire profile (converter.WireProfile)
+    payload_cache: Optional[PayloadCache] = None  # reuse conversions from earlier runs (payload_cache.shared_cache())
+
+
+def _wire_profile(provider: BaseProvider, options: RunOptions) -> Optional[WireProfile]:
+    """How this run's images are shaped before upload; None sends originals."""
+    if options.full_resolution:
+        return None
+    return wire_profile_for(provider.provider_name, provider.model_name)
 
 
 @dataclass
@@ -67,7 +97,8 @@ class Pipeline:
         self.project = project
         self.provider = provider
         self._extractor: Optional[MetadataExtractor] = None
-        self._geocoder: Optional[NominatimGeocoder] = None
+        self._geocoder = None  # NominatimGeocoder or gazetteer.OfflineGeocoder
+        self._wire: Optional[WireProfile] = None
 
     def run(self, options: RunOptions) -> Iterator[PipelineEvent]:
         """
@@ -76,12 +107,13 @@ class Pipeline:
         """
         # Lazy-init metadata extractor once per run
         if options.extract_metadata:
-            self._extractor = MetadataExtractor()
-            if options.geocode:
-                cache = options.geocode_cache or (
-                    Path.home() / ".idt" / "geocode_cache.json"
-                )
-                self._geocoder = NominatimGeocoder(cache_path=cache)
+            self._extractor = MetadataExtractor(
+                cache=MetadataCache(self.project.idt_dir / METADATA_CACHE_NAME)
+            )
+            self._geocoder = make_geocoder(
+                options.geocode, options.geocode_cache, options.gazetteer_path
+            )
+        self._wire = _wire_profile(self.provider, options)
 
         queue = list(
             self.project.items() if options.redescribe
@@ -89,6 +121,8 @@ class Pipeline:
         )
         if options.limit is not None:
             queue = queue[: options.limit]
+        _prefetch_locations(self._extractor, self._geocoder, [i.source_path for i in queue],
+                            options.on_geocode)
 
         total = len(queue)
         for index, item in enumerate(queue, start=1):
@@ -123,7 +157,7 @@ class Pipeline:
             if meta_context:
                 prompt = f"{META_PREFIX}{meta_context}\n\n{prompt}"
 
-            image_bytes, mime_type = load_for_api(item.processable_path)
+            image_bytes, mime_type = load_for_api(item.processable_path, self._wire, options.payload_cache)
             result = self.provider.describe(image_bytes, mime_type, prompt)
 
             desc = Description.create(
@@ -167,6 +201,22 @@ def _extract_and_build_prompt(extractor, geocoder, exif_path, prompt_text):
     return meta, meta_context, prompt
 
 
+def _prefetch_locations(extractor, geocoder, exif_paths, progress=None) -> None:
+    """
+    Before a run describes anything: read the queue's EXIF (extract_many, which
+    also warms the metadata cache the per-image step reads) and have the
+    geocoder resolve every distinct place once, so no image waits on Nominatim
+    mid-run and photos taken together share one lookup. progress(done, total)
+    is called after each place (RunOptions.on_geocode).
+    """
+    prefetch = getattr(geocoder, "prefetch", None)
+    if extractor is None or prefetch is None:
+        return
+    metas = extractor.extract_many(list(exif_paths))
+    prefetch(((m.latitude, m.longitude) for m in metas
+              if m.latitude is not None and m.longitude is not None), progress)
+
+
 # --------------------------------------------------------------------------- #
 # WorkspacePipeline — same logic, but runs over a unified .idtw bundle          #
 # --------------------------------------------------------------------------- #
@@ -191,26 +241,38 @@ class WorkspacePipeline:
         self.workspace = workspace
         self.provider = provider
         self._extractor: Optional[MetadataExtractor] = None
-        self._geocoder: Optional[NominatimGeocoder] = None
+        self._geocoder = None  # NominatimGeocoder or gazetteer.OfflineGeocoder
+        self._wire: Optional[WireProfile] = None
+        self._limiter: Optional[AdaptiveLimiter] = None
 
     def run(self, options: RunOptions) -> Iterator[WorkspaceEvent]:
-        all_items = self.workspace.media_items()
-        # Skip items whose image is missing on disk (e.g. a moved/deleted reference
-        # original). Mark them so the state is durable, and never queue them — this
-        # is the single place that decides what gets processed.
-        live_items = []
-        for i in all_items:
-            if not self.workspace.image_path(i).exists():
-                if not i.is_missing:
-                    i.is_missing = True
-                    self.workspace.save_item(i)
+        yield from self._run_queue(self._queue(options), options)
+
+    def _queue(self, options: RunOptions) -> list[WorkspaceItem]:
+        """The items a run over the whole workspace should describe, in order."""
+        # Decided from the catalog's indexed columns; only the items chosen
+        # (and any newly missing ones) are loaded in full.
+        ws = self.workspace
+        chosen = []
+        for entry in ws.entries():
+            if entry.item_type == "video":
+                continue
+            # Skip items whose image is missing on disk (e.g. a moved/deleted reference
+            # original). Mark them so the state is durable, and never queue them — this
+            # is the single place that decides what gets processed.
+            if not ws.image_path(entry).exists():
+                if not entry.is_missing:
+                    item = ws.get_item(entry.image, entry.subfolder)
+                    if item is not None:
+                        item.is_missing = True
+                        ws.save_item(item)
                 continue
-            live_items.append(i)
-        queue = live_items if options.redescribe else [i for i in live_items if not i.described]
+            if options.redescribe or not entry.described:
+                chosen.append(entry)
         if options.limit is not None:
-            queue = queue[: options.limit]
-
-        yield from self._run_queue(queue, options)
+            chosen = chosen[: options.limit]
+        items = (ws.get_item(e.image, e.subfolder) for e in chosen)
+        return [i for i in items if i is not None]
 
     def run_items(self, items: list[WorkspaceItem], options: RunOptions) -> Iterator[WorkspaceEvent]:
         """
@@ -228,15 +290,64 @@ class WorkspacePipeline:
 
         yield from self._run_queue(queue, options)
 
-    def _run_queue(self, queue: list[WorkspaceItem], options: RunOptions) -> Iterator[WorkspaceEvent]:
+    def _begin(self, options: RunOptions) -> None:
+        """Per-run setup shared by live and batch runs: EXIF, geocoding, wire profile."""
+        if options.extract_metadata:
+            self._extractor = MetadataExtractor(cache=cache_for(self.workspace.path))
+            self._geocoder = make_geocoder(
+                options.geocode, options.geocode_cache, options.gazetteer_path
+            )
+        self._wire = _wire_profile(self.provider, options)
+
+    def run_feed(self, batches: Iterable[list[WorkspaceItem]],
+                 options: RunOptions) -> Iterator[WorkspaceEvent]:
+        """
+        Describe items as they arrive. *batches* yields lists of items and may
+        block between them (e.g. `idt watch` waiting on a FolderWatcher); one
+        run spans them all, so the EXIF extractor, geocoder, rate limiter and
+        run log are set up once rather than per batch. Each batch is processed
+        like run_items() — already-described items are skipped unless
+        `options.redescribe` — and its sidecars are on disk before the next
+        batch is waited for.
+        """
         from .logger import open_run_log, close_run_log
 
-        if options.extract_metadata:
-            self._extractor = MetadataExtractor()
-            if options.geocode:
-                cache = options.geocode_cache or (Path.home() / ".idt" / "geocode_cache.json")
-                self._geocoder = NominatimGeocoder(cache_path=cache)
+        self._start(options)
+        log = open_run_log(self.workspace.logs_dir)
+        log.info(
+            f"provider={self.provider.provider_name}  model={self.provider.model_name}"
+            f"  prompt={options.prompt_name}  feed"
+        )
+        t0 = time.monotonic()
+        counts = [0, 0]
+        try:
+            for items in batches:
+                queue = list(items) if options.redescribe else [i for i in items if not i.described]
+                if queue:
+                    yield from self._run_batch(queue, options, log, counts)
+                    self.workspace.save_manifest()
+        except BaseException as exc:
+            if not isinstance(exc, (GeneratorExit, KeyboardInterrupt)):
+                log.exception("run aborted")
+            raise
+        finally:
+            elapsed = time.monotonic() - t0
+            log.info(f"done  described={counts[0]}  errors={counts[1]}  elapsed={elapsed:.1f}s")
+            close_run_log(log)
+
+    def _start(self, options: RunOptions) -> None:
+        """_begin() plus the run's rate limiter — setup for a live (not batch-API) run."""
+        self._begin(options)
+        self._limiter = limiter_for(
+            self.provider.provider_name, self.provider.model_name,
+            getattr(self.provider, "account", ""),
+            concurrency=max(1, int(options.concurrency or 1)),
+        )
+
+    def _run_queue(self, queue: list[WorkspaceItem], options: RunOptions) -> Iterator[WorkspaceEvent]:
+        from .logger import open_run_log, close_run_log
 
+        self._start(options)
         total = len(queue)
         log = open_run_log(self.workspace.logs_dir)
         log.info(
@@ -244,13 +355,30 @@ class WorkspacePipeline:
             f"  prompt={options.prompt_name}  images={total}"
         )
         t0 = time.monotonic()
-        described = errors = 0
+        counts = [0, 0]
 
         try:
-            for index, item in enumerate(queue, start=1):
-                event = self._process(item, index, total, options)
+            yield from self._run_batch(queue, options, log, counts)
+            elapsed = time.monotonic() - t0
+            log.info(f"done  described={counts[0]}  errors={counts[1]}  elapsed={elapsed:.1f}s")
+            self.workspace.save_manifest()
+        except BaseException:
+            log.exception("run aborted")
+            raise
+        finally:
+            close_run_log(log)
+
+    def _run_batch(self, queue: list[WorkspaceItem], options: RunOptions, log,
+                   counts: list[int]) -> Iterator[WorkspaceEvent]:
+        """Describe *queue* and log each item; counts is [described, errors], updated in place."""
+        _prefetch_locations(self._extractor, self._geocoder,
+                            [self.workspace.image_path(i) for i in queue], options.on_geocode)
+        total = len(queue)
+        with self.workspace.write_behind():
+            for event in self._events(queue, options):
+                index, item = event.index, event.item
                 if event.success:
-                    described += 1
+                    counts[0] += 1
                     tokens = ""
                     if item.descriptions:
                         last = item.descriptions[-1]
@@ -258,21 +386,110 @@ class WorkspacePipeline:
                             tokens = f"  ({last.input_tokens} in, {last.output_tokens} out)"
                     log.info(f"{index}/{total}  {item.image}: described{tokens}")
                 else:
-                    errors += 1
+                    counts[1] += 1
                     log.error(f"{index}/{total}  {item.image}: ERROR — {event.error}")
                 yield event
 
-            elapsed = time.monotonic() - t0
-            log.info(f"done  described={described}  errors={errors}  elapsed={elapsed:.1f}s")
-            self.workspace.save_manifest()
-        except BaseException:
-            log.exception("run aborted")
-            raise
+    def _events(self, queue: list[WorkspaceItem], options: RunOptions) -> Iterator[WorkspaceEvent]:
+        """
+        Process *queue* and yield one event per item, always in queue order.
+
+        Each item goes through three stages (see _prepare / _describe_prepared /
+        _persist). With concurrency 1 and no prefetch they run back to back on
+        this thread — the plain serial loop. Otherwise they run as a staged
+        pipeline on three pools:
+
+          prepare   `prefetch` threads: HEIC conversion, EXIF, load_for_api.
+                    CPU work for the next items overlaps the provider call for
+                    the current one.
+          describe  `concurrency` threads: the provider round trip.
+          persist   one thread: sidecar writes, so no describe worker blocks
+                    on the disk.
+
+        At most concurrency + prefetch items are in flight, so a 20k-image
+        queue is never submitted up front and never held in memory. Each item's
+        sidecar is its own file, written atomically, so there is no shared write
+        to serialize — only the events are reordered, which keeps the run log
+        and the CLI progress lines identical to a serial run. _run_queue holds
+        the saves in a write_behind() block, so sidecars reach the disk in
+        batches a couple of seconds apart rather than one fsync per image.
+
+        If the consumer stops iterating, work not yet started is cancelled; the
+        items already at the provider finish and are saved.
+        """
+        total = len(queue)
+        workers = max(1, int(options.concurrency or 1))
+        prefetch = max(0, int(options.prefetch or 0))
+        if (workers == 1 and prefetch == 0) or total <= 1:
+            for index, item in enumerate(queue, start=1):
+                yield self._process(item, index, total, options)
+            return
+
+        prep_pool = ThreadPoolExecutor(max_workers=max(1, prefetch),
+                                       thread_name_prefix="idt-prepare")
+        describe_pool = ThreadPoolExecutor(max_workers=workers,
+                                           thread_name_prefix="idt-describe")
+        writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="idt-persist")
+
+        def submit(index: int, item: WorkspaceItem):
+            prepared = prep_pool.submit(self._prepare, item, index, total, options)
+            return describe_pool.submit(self._describe_stage, prepared, item, index, total,
+                                        writer, options)
+
+        pending: deque = deque()
+        todo = iter(enumerate(queue, start=1))
+        try:
+            for index, item in todo:
+                pending.append(submit(index, item))
+                if len(pending) >= workers + prefetch:
+                    break
+            while pending:
+                event = pending.popleft().result().result()
+                nxt = next(todo, None)
+                if nxt is not None:
+                    pending.append(submit(*nxt))
+                yield event
         finally:
-            close_run_log(log)
+            # Order matters: cancel queued preparation first so a describe
+            # worker waiting on it is released, then let in-flight describes
+            # finish (they hand their results to the writer), then drain the
+            # writer so nothing already paid for is lost.
+            prep_pool.shutdown(wait=False, cancel_futures=True)
+            describe_pool.shutdown(wait=True, cancel_futures=True)
+            prep_pool.shutdown(wait=True)
+            writer.shutdown(wait=True)
+
+    def _describe_stage(self, prepared: Future, item: WorkspaceItem, index: int, total: int,
+                        writer: ThreadPoolExecutor, options: RunOptions) -> Future:
+        """Describe-pool task: wait for the item's preparation, call the provider,
+        queue the save. Returns the writer's future, which resolves to the event."""
+        try:
+            prep = prepared.result()
+        except Exception as exc:  # cancelled because the run was abandoned
+            prep = _PreparedItem(item=item, index=index, total=total, error=str(exc) or "cancelled")
+        if prep.error is None:
+            self._describe_prepared(prep)
+        if prep.error is not None:
+            done: Future = Future()
+            done.set_result(prep.error_event())
+            return done
+        return writer.submit(self._persist, prep, options)
 
     def _process(self, item: WorkspaceItem, index: int, total: int,
                  options: RunOptions) -> WorkspaceEvent:
+        """All three stages in sequence, on the calling thread."""
+        prep = self._prepare(item, index, total, options)
+        if prep.error is None:
+            self._describe_prepared(prep)
+        if prep.error is not None:
+            return prep.error_event()
+        return self._persist(prep, options)
+
+    # ----- stages ----- #
+    def _prepare(self, item: WorkspaceItem, index: int, total: int,
+                 options: RunOptions) -> "_PreparedItem":
+        """Stage 1 — everything before the provider call. CPU and local disk only."""
+        prep = _PreparedItem(item=item, index=index, total=total)
         try:
             bundle_image = self.workspace.image_path(item)
             read_path = bundle_image
@@ -287,15 +504,177 @@ class WorkspacePipeline:
                     read_path = conv
 
             # EXIF is read from the bundle copy (copy2 preserved it)
-            meta, meta_context, prompt = _extract_and_build_prompt(
+            prep.meta, prep.meta_context, prep.prompt = _extract_and_build_prompt(
                 self._extractor, self._geocoder, bundle_image, options.prompt_text
             )
-            if meta:
-                item.metadata = meta.to_dict()
+            if prep.meta:
+                item.metadata = prep.meta.to_dict()
 
-            image_bytes, mime_type = load_for_api(read_path)
-            result = self.provider.describe(image_bytes, mime_type, prompt)
+            prep.image_bytes, prep.mime_type = load_for_api(read_path, self._wire, options.payload_cache)
+        except Exception as exc:
+            prep.error = str(exc)
+        return prep
+
+    def _describe_prepared(self, prep: "_PreparedItem") -> None:
+        """Stage 2 — the provider round trip. Stores the result (or error) on *prep*.
+
+        The call waits its turn on the run's limiter, which also re-sends it
+        when the provider answers 429/529 (after the shared cooldown).
+        """
+        try:
+            if self._limiter is None:
+                prep.result = self.provider.describe(prep.image_bytes, prep.mime_type, prep.prompt)
+            else:
+                prep.result = self._limiter.call(self.provider.describe, prep.image_bytes,
+                                                 prep.mime_type, prep.prompt)
+        except Exception as exc:
+            prep.error = str(exc)
+        finally:
+            prep.image_bytes = b""  # the payload is not needed past this point
+
+    # ----- vendor batch endpoints (batch_api.py) ----- #
+    def pending_batch(self) -> Optional[dict]:
+        """The workspace's unfinished batch run, or None."""
+        return (self.workspace.batch_state or {}).get(STATE_KEY)
+
+    def _save_batch(self, state: Optional[dict]) -> None:
+        """Write *state* into batch_state (None removes it) and save the manifest,
+        leaving the GUI's keys in batch_state as they are."""
+        batch_state = dict(self.workspace.batch_state or {})
+        if state is None:
+            batch_state.pop(STATE_KEY, None)
+        else:
+            batch_state[STATE_KEY] = state
+        self.workspace.batch_state = batch_state or None
+        self.workspace.save_manifest()
+
+    def submit_batch(self, client: BatchClient, options: RunOptions) -> Iterator[WorkspaceEvent]:
+        """
+        Prepare the queue exactly as run() would and submit it as batch jobs.
+
+        Each job id is saved to the manifest as soon as the vendor accepts it,
+        so a crash part-way through loses nothing already paid for. Yields an
+        error event for each item that could not be prepared or submitted; the
+        rest are reported by collect_batch once their job finishes.
+        """
+        if self.pending_batch():
+            raise RuntimeError("this workspace already has a batch run in progress")
+        queue = self._queue(options)
+        self._begin(options)
+        _prefetch_locations(self._extractor, self._geocoder,
+                            [self.workspace.image_path(i) for i in queue], options.on_geocode)
+        total = len(queue)
+        state = {
+            "provider": self.provider.provider_name,
+            "model": self.provider.model_name,
+            "prompt_name": options.prompt_name,
+            "prompt_text": options.prompt_text,
+            "total": total,
+            "done": 0,
+            "submitted": datetime.now(timezone.utc).isoformat(),
+            "jobs": [],
+        }
+        pending: list[tuple[BatchRequest, _PreparedItem]] = []
+        size = 0
+
+        def flush() -> Iterator[WorkspaceEvent]:
+            try:
+                job_id = client.submit([request for request, _ in pending])
+            except Exception as exc:
+                for _, prep in pending:
+                    prep.error = f"batch submission failed: {exc}"
+                    state["done"] += 1
+                    yield prep.error_event()
+                return
+            state["jobs"].append({"id": job_id, "requests": {
+                request.custom_id: {"image": prep.item.image, "subfolder": prep.item.subfolder,
+                                    "meta": prep.meta_context}
+                for request, prep in pending
+            }})
+            self._save_batch(state)
+
+        for index, item in enumerate(queue, start=1):
+            prep = self._prepare(item, index, total, options)
+            if prep.error is not None:
+                state["done"] += 1
+                yield prep.error_event()
+                continue
+            if prep.meta is not None or item.converted:
+                self.workspace.save_item(item)  # keep the EXIF / HEIC copy found now
+            params = self.provider.request_params(prep.image_bytes, prep.mime_type, prep.prompt)
+            prep.image_bytes = b""
+            cost = request_size(params)
+            if pending and (len(pending) >= MAX_REQUESTS_PER_JOB or size + cost > MAX_JOB_BYTES):
+                yield from flush()
+                pending, size = [], 0
+            pending.append((BatchRequest(custom_id=f"idt-{index}", params=params), prep))
+            size += cost
+        if pending:
+            yield from flush()
+        if not state["jobs"]:
+            self._save_batch(None)
+
+    def collect_batch(self, client: BatchClient) -> Iterator[WorkspaceEvent]:
+        """
+        Write the results of every finished job of the pending batch run, and
+        yield one event per request. Jobs still running are left for a later
+        call. Safe to repeat after a crash: an item that already has this run's
+        description is not given a second one.
+        """
+        state = self.pending_batch()
+        if not state:
+            return
+        for job in list(state["jobs"]):
+            if not client.finished(job["id"]):
+                continue
+            requests = job["requests"]
+            # Every result is on disk before the manifest forgets the job.
+            with self.workspace.write_behind():
+                for outcome in client.results(job["id"]):
+                    entry = requests.pop(outcome.custom_id, None)
+                    if entry is not None:
+                        event = self._record_batch_result(state, entry, outcome.result, outcome.error)
+                        if event is not None:
+                            yield event
+                for entry in requests.values():  # never reached: the job expired, failed or was cancelled
+                    event = self._record_batch_result(state, entry, None, "no result (batch job ended early)")
+                    if event is not None:
+                        yield event
+            state["jobs"].remove(job)
+            self._save_batch(state if state["jobs"] else None)
+
+    def _record_batch_result(self, state: dict, entry: dict, result: Optional[DescriptionResult],
+                             error: Optional[str]) -> Optional[WorkspaceEvent]:
+        item = self.workspace.get_item(entry["image"], entry.get("subfolder"))
+        if item is None:  # removed from the bundle while the job ran
+            return None
+        state["done"] += 1
+        index, total = state["done"], state["total"]
+        if error is not None:
+            return WorkspaceEvent(item=item, index=index, total=total, error=error)
+        if any(d.model == state["model"] and d.prompt_text == state["prompt_text"]
+               and d.created >= state["submitted"] for d in item.descriptions):
+            return WorkspaceEvent(item=item, index=index, total=total)
+        try:
+            item.add_description(WorkspaceDescription.create(
+                text=result.text,
+                provider=result.provider,
+                model=result.model,
+                prompt_name=state["prompt_name"],
+                prompt_text=state["prompt_text"],
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+                metadata_context=entry.get("meta") or None,
+            ))
+            self.workspace.save_item(item)
+            return WorkspaceEvent(item=item, index=index, total=total)
+        except Exception as exc:
+            return WorkspaceEvent(item=item, index=index, total=total, error=str(exc))
 
+    def _persist(self, prep: "_PreparedItem", options: RunOptions) -> WorkspaceEvent:
+        """Stage 3 — record the description and write the item's sidecar."""
+        item, result = prep.item, prep.result
+        try:
             desc = WorkspaceDescription.create(
                 text=result.text,
                 provider=result.provider,
@@ -304,11 +683,29 @@ class WorkspacePipeline:
                 prompt_text=options.prompt_text,
                 input_tokens=result.input_tokens,
                 output_tokens=result.output_tokens,
-                metadata_context=meta_context or None,
+                metadata_context=prep.meta_context or None,
             )
             item.add_description(desc)
             self.workspace.save_item(item)
-            return WorkspaceEvent(item=item, index=index, total=total, metadata=meta)
+            return WorkspaceEvent(item=item, index=prep.index, total=prep.total, metadata=prep.meta)
 
         except Exception as exc:
-            return WorkspaceEvent(item=item, index=index, total=total, error=str(exc))
+            return WorkspaceEvent(item=item, index=prep.index, total=prep.total, error=str(exc))
+
+
+@dataclass
+class _PreparedItem:
+    """One item as it moves through WorkspacePipeline's stages."""
+    item: WorkspaceItem
+    index: int
+    total: int
+    meta: Optional[ImageMetadata] = None
+    meta_context: str = ""
+    prompt: str = ""
+    image_bytes: bytes = b""
+    mime_type: str = ""
+    result: Optional[DescriptionResult] = None
+    error: Optional[str] = None
+
+    def error_event(self) -> WorkspaceEvent:
+        return WorkspaceEvent(item=self.item, index=self.index, total=self.total, error=self.error)
@@ -22,6 +22,7 @@ Nothing here imports a vendor SDK — concrete implementations do that lazily.
 """
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Callable, Iterator, Optional, Sequence, Union
@@ -34,6 +35,9 @@ class DescriptionResult:
     provider: str
     input_tokens: Optional[int] = None
     output_tokens: Optional[int] = None
+    # What the response's rate-limit headers said (idt_core.rate_limit.RateLimitInfo),
+    # for providers that report them. Feedback for the limiter, not part of the result.
+    rate_limit: Optional[object] = field(default=None, compare=False, repr=False)
 
 
 class BaseProvider(ABC):
@@ -46,6 +50,24 @@ class BaseProvider(ABC):
         """
         ...
 
+    async def describe_async(
+        self, image_bytes: bytes, mime_type: str, prompt: str
+    ) -> DescriptionResult:
+        """:meth:`describe` for asyncio callers, who bound their own concurrency
+        (an ``asyncio.Semaphore`` around the await).
+
+        Runs the sync call on the loop's default executor rather than through a
+        vendor async client. Those clients belong to the event loop that made
+        them, so one held by a long-lived provider breaks the second time
+        ``asyncio.run`` is called, and the GUI and pipeline have no loop at all
+        (see :class:`ChatProvider` for why). The connection pooling is the same
+        either way: every provider keeps one SDK client, and with it one
+        keep-alive pool, for its lifetime, shared by every thread and task.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.describe, image_bytes, mime_type, prompt
+        )
+
     @property
     @abstractmethod
     def provider_name(self) -> str: ...
@@ -54,6 +76,13 @@ class BaseProvider(ABC):
     @abstractmethod
     def model_name(self) -> str: ...
 
+    @property
+    def account(self) -> str:
+        """Which account requests are billed to, as an opaque label
+        (rate_limit.account_key). Calls under one label share a rate limiter;
+        "" for providers with no per-account limits."""
+        return ""
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(model={self.model_name!r})"
 
@@ -7,6 +7,7 @@ from __future__ import annotations
 import base64
 from typing import Optional
 
+from ..rate_limit import account_key, parse_rate_limit_headers
 from .base import BaseProvider, DescriptionResult
 
 # The list below is no longer the source of truth for *which* models exist --
@@ -241,7 +242,8 @@ def _created_timestamp(model) -> float:
 
 
 class ClaudeProvider(BaseProvider):
-    def __init__(self, model: str = DEFAULT_MODEL, api_key: Optional[str] = None):
+    def __init__(self, model: str = DEFAULT_MODEL, api_key: Optional[str] = None,
+                 base_url: Optional[str] = None):
         try:
             import anthropic
         except ImportError:
@@ -249,8 +251,9 @@ class ClaudeProvider(BaseProvider):
                 "anthropic package is required for Claude: pip install anthropic"
             )
         self._model = model
-        # api_key=None → SDK reads ANTHROPIC_API_KEY from environment
-        self._client = __import__("anthropic").Anthropic(api_key=api_key)
+        # api_key=None → SDK reads ANTHROPIC_API_KEY from environment;
+        # base_url=None → the SDK default (or ANTHROPIC_BASE_URL)
+        self._client = __import__("anthropic").Anthropic(api_key=api_key, base_url=base_url)
 
     @property
     def provider_name(self) -> str:
@@ -260,12 +263,18 @@ class ClaudeProvider(BaseProvider):
     def model_name(self) -> str:
         return self._model
 
-    def describe(self, image_bytes: bytes, mime_type: str, prompt: str) -> DescriptionResult:
+    @property
+    def account(self) -> str:
+        return account_key(self._client.api_key)
+
+    def request_params(self, image_bytes: bytes, mime_type: str, prompt: str) -> dict:
+        """The Messages API parameters for one description — also the ``params``
+        of a Message Batches request, so both paths ask the same question."""
         b64 = base64.standard_b64encode(image_bytes).decode("ascii")
-        message = self._client.messages.create(
-            model=self._model,
-            max_tokens=2048,
-            messages=[
+        return {
+            "model": self._model,
+            "max_tokens": 2048,
+            "messages": [
                 {
                     "role": "user",
                     "content": [
@@ -281,11 +290,21 @@ class ClaudeProvider(BaseProvider):
                     ],
                 }
             ],
-        )
+        }
+
+    def result_from_message(self, message, rate_limit=None) -> DescriptionResult:
         return DescriptionResult(
             text=message.content[0].text,
             model=self._model,
             provider="anthropic",
             input_tokens=message.usage.input_tokens,
             output_tokens=message.usage.output_tokens,
+            rate_limit=rate_limit,
+        )
+
+    def describe(self, image_bytes: bytes, mime_type: str, prompt: str) -> DescriptionResult:
+        # with_raw_response: same call, but the rate-limit headers come back too
+        raw = self._client.messages.with_raw_response.create(
+            **self.request_params(image_bytes, mime_type, prompt)
         )
+        return self.result_from_message(raw.parse(), parse_rate_limit_headers(raw.headers))
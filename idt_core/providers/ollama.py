@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import base64
 import os
+import threading
 import time
 from typing import Optional
 
@@ -227,6 +228,13 @@ class OllamaProvider(BaseProvider):
         # Hardcoding localhost here sent every capability/context probe to the
         # local daemon while the chat turns themselves went to the real server.
         self._host = host.rstrip("/") if host else None
+        # One client for the provider's lifetime, so describe calls reuse its
+        # keep-alive connection pool instead of opening a connection (and, for
+        # a remote or cloud host, a TLS session) per image. The SDK client is
+        # an httpx.Client underneath and safe to share between the pipeline's
+        # describe threads.
+        self._client = None
+        self._client_lock = threading.Lock()
 
     @property
     def provider_name(self) -> str:
@@ -236,12 +244,16 @@ class OllamaProvider(BaseProvider):
     def model_name(self) -> str:
         return self._model
 
-    def describe(self, image_bytes: bytes, mime_type: str, prompt: str) -> DescriptionResult:
-        import ollama
+    def _describe_client(self):
+        with self._client_lock:
+            if self._client is None:
+                import ollama
+                self._client = ollama.Client(host=self._host)
+            return self._client
 
+    def describe(self, image_bytes: bytes, mime_type: str, prompt: str) -> DescriptionResult:
         b64 = base64.standard_b64encode(image_bytes).decode("ascii")
-        client = ollama.Client(host=self._host)
-        response = client.chat(
+        response = self._describe_client().chat(
             model=self._model,
             messages=[
                 {
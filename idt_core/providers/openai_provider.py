@@ -8,6 +8,7 @@ import base64
 import re
 from typing import Iterable, List, Optional, Sequence
 
+from ..rate_limit import account_key, parse_rate_limit_headers
 from .base import BaseProvider, DescriptionResult
 
 # The list below is no longer the source of truth for *which* models exist --
@@ -256,7 +257,8 @@ def list_models_live(client=None, api_key: Optional[str] = None,
 
 
 class OpenAIProvider(BaseProvider):
-    def __init__(self, model: str = DEFAULT_MODEL, api_key: Optional[str] = None):
+    def __init__(self, model: str = DEFAULT_MODEL, api_key: Optional[str] = None,
+                 base_url: Optional[str] = None):
         try:
             from openai import OpenAI  # noqa: F401
         except ImportError:
@@ -265,8 +267,9 @@ class OpenAIProvider(BaseProvider):
             )
         from openai import OpenAI
         self._model = model
-        # api_key=None → SDK reads OPENAI_API_KEY from environment
-        self._client = OpenAI(api_key=api_key)
+        # api_key=None → SDK reads OPENAI_API_KEY from environment;
+        # base_url=None → the SDK default (or OPENAI_BASE_URL)
+        self._client = OpenAI(api_key=api_key, base_url=base_url)
 
     @property
     def provider_name(self) -> str:
@@ -276,12 +279,18 @@ class OpenAIProvider(BaseProvider):
     def model_name(self) -> str:
         return self._model
 
-    def describe(self, image_bytes: bytes, mime_type: str, prompt: str) -> DescriptionResult:
+    @property
+    def account(self) -> str:
+        return account_key(self._client.api_key)
+
+    def request_params(self, image_bytes: bytes, mime_type: str, prompt: str) -> dict:
+        """The Chat Completions body for one description — also the ``body`` of
+        a Batch API request line, so both paths ask the same question."""
         b64 = base64.standard_b64encode(image_bytes).decode("ascii")
-        response = self._client.chat.completions.create(
-            model=self._model,
-            max_tokens=2048,
-            messages=[
+        return {
+            "model": self._model,
+            "max_tokens": 2048,
+            "messages": [
                 {
                     "role": "user",
                     "content": [
@@ -293,7 +302,9 @@ class OpenAIProvider(BaseProvider):
                     ],
                 }
             ],
-        )
+        }
+
+    def result_from_completion(self, response, rate_limit=None) -> DescriptionResult:
         usage = response.usage
         return DescriptionResult(
             text=response.choices[0].message.content,
@@ -301,4 +312,12 @@ class OpenAIProvider(BaseProvider):
             provider="openai",
             input_tokens=usage.prompt_tokens if usage else None,
             output_tokens=usage.completion_tokens if usage else None,
+            rate_limit=rate_limit,
+        )
+
+    def describe(self, image_bytes: bytes, mime_type: str, prompt: str) -> DescriptionResult:
+        # with_raw_response: same call, but the rate-limit headers come back too
+        raw = self._client.chat.completions.with_raw_response.create(
+            **self.request_params(image_bytes, mime_type, prompt)
         )
+        return self.result_from_completion(raw.parse(), parse_rate_limit_headers(raw.headers))
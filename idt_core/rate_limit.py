@@ -0,0 +1,279 @@
+"""
+Adaptive rate limiting, shared by every worker that talks to the same account.
+
+Retrying each 429 on its own (jittered backoff per call, as
+``retry_on_api_error`` in imagedescriber/ai_providers.py did) lets N workers
+keep hammering a provider that has already said stop: each backs off, then they
+all come back together and trip the limit again. One :class:`AdaptiveLimiter`
+per (provider, model, account) makes that decision once, for all of them:
+
+* **Concurrency is AIMD.** A throttle response (429, Anthropic's 529
+  "overloaded", 503) halves the number of requests allowed in flight. Every
+  ``limit`` clean successes raise it by one, back up to the ceiling the caller
+  asked for. Throttles that land together — every in-flight request failing
+  from the same burst — count as one decrease, not one each.
+* **A shared cooldown.** ``Retry-After``, or a rate-limit header saying the
+  window is spent, holds every worker until the stated time, not just the one
+  that was told. Without either, the pause starts at a second and doubles per
+  consecutive throttle.
+* **A request bucket.** When the provider publishes its requests-per-minute
+  limit, requests are paced to it, so a long run stays just under the limit
+  instead of hitting it at the top of every minute.
+
+Only what the provider reports is trusted; with no headers the limiter runs on
+AIMD and Retry-After alone. Waiting uses ``time.sleep`` (never a condition
+timeout) so a test that stubs the sleep runs at full speed.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+#: Statuses that mean "slow down" rather than "this request is wrong".
+THROTTLE_STATUSES = frozenset({429, 503, 529})
+
+#: How many times :meth:`AdaptiveLimiter.call` re-sends a throttled request.
+THROTTLE_RETRIES = 5
+
+_FIRST_PAUSE = 1.0
+_MAX_PAUSE = 60.0
+
+
+@dataclass
+class RateLimitInfo:
+    """What a provider's response headers say about the account's limits."""
+    requests_limit: Optional[int] = None      # per minute
+    requests_remaining: Optional[int] = None
+    requests_reset: Optional[float] = None    # seconds until the request window refills
+    tokens_remaining: Optional[int] = None
+    tokens_reset: Optional[float] = None
+    retry_after: Optional[float] = None       # seconds
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+def _seconds(value) -> Optional[float]:
+    """A reset/retry value as seconds from now.
+
+    Accepts plain seconds ("20", Retry-After), Go-style durations ("6m0s",
+    "20ms", OpenAI) and RFC 3339 timestamps (Anthropic's ``*-reset``).
+    """
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text:
+        return None
+    try:
+        return max(0.0, float(text))
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(text)
+    if parts and "".join(n + u for n, u in parts) == text:
+        scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+        return sum(float(n) * scale[u] for n, u in parts)
+    try:
+        when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _int(value) -> Optional[int]:
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_rate_limit_headers(headers) -> RateLimitInfo:
+    """Read Anthropic (``anthropic-ratelimit-*``) and OpenAI (``x-ratelimit-*``)
+    headers, plus ``retry-after``. Missing or unparseable values stay None."""
+    if not headers:
+        return RateLimitInfo()
+
+    def get(*names):
+        for name in names:
+            value = headers.get(name)
+            if value is not None:
+                return value
+        return None
+
+    return RateLimitInfo(
+        requests_limit=_int(get("anthropic-ratelimit-requests-limit", "x-ratelimit-limit-requests")),
+        requests_remaining=_int(get("anthropic-ratelimit-requests-remaining",
+                                    "x-ratelimit-remaining-requests")),
+        requests_reset=_seconds(get("anthropic-ratelimit-requests-reset", "x-ratelimit-reset-requests")),
+        tokens_remaining=_int(get("anthropic-ratelimit-tokens-remaining",
+                                  "anthropic-ratelimit-input-tokens-remaining",
+                                  "x-ratelimit-remaining-tokens")),
+        tokens_reset=_seconds(get("anthropic-ratelimit-tokens-reset",
+                                  "anthropic-ratelimit-input-tokens-reset",
+                                  "x-ratelimit-reset-tokens")),
+        retry_after=_seconds(get("retry-after")),
+    )
+
+
+def throttle_info(exc: BaseException) -> Optional[RateLimitInfo]:
+    """The rate-limit details if *exc* is a throttle response, else None.
+
+    Follows ``__cause__`` so a ProviderError raised ``from`` an SDK exception
+    is recognised by the SDK exception's status and headers.
+    """
+    seen = 0
+    while exc is not None and seen < 4:
+        status = getattr(exc, "status_code", None)
+        if isinstance(status, int) and status in THROTTLE_STATUSES:
+            response = getattr(exc, "response", None)
+            info = parse_rate_limit_headers(getattr(response, "headers", None))
+            cause = exc.__cause__
+            if info.retry_after is None and cause is not None:
+                inner = throttle_info(cause)
+                if inner is not None:
+                    return inner
+            return info
+        exc = exc.__cause__
+        seen += 1
+    return None
+
+
+class AdaptiveLimiter:
+    """Admission control for one (provider, model, account). Thread-safe."""
+
+    def __init__(self, ceiling: int = 1):
+        self.ceiling = max(1, ceiling)
+        self.limit = self.ceiling
+        self.in_flight = 0
+        self.throttles = 0
+        self._cond = threading.Condition()
+        self._successes = 0
+        self._generation = 0          # bumped on each decrease
+        self._consecutive = 0         # throttles since the last success
+        self._cooldown_until = 0.0    # time.monotonic()
+        self._rate: Optional[float] = None   # requests per second, from headers
+        self._tokens = 0.0
+        self._refilled = time.monotonic()
+
+    def raise_ceiling(self, ceiling: int) -> None:
+        """Allow up to *ceiling* in flight (another run asked for more workers)."""
+        with self._cond:
+            if ceiling > self.ceiling:
+                if self.limit == self.ceiling:
+                    self.limit = ceiling
+                self.ceiling = ceiling
+                self._cond.notify_all()
+
+    # ----- admission ----- #
+    def acquire(self) -> int:
+        """Block for a slot, then for any cooldown or bucket wait. Returns a
+        ticket for :meth:`release`."""
+        with self._cond:
+            while self.in_flight >= self.limit:
+                self._cond.wait()
+            self.in_flight += 1
+            ticket = self._generation
+            now = time.monotonic()
+            wait = max(0.0, self._cooldown_until - now)
+            if self._rate:
+                self._tokens = min(float(self.ceiling),
+                                   self._tokens + (now - self._refilled) * self._rate)
+                self._refilled = now
+                self._tokens -= 1.0  # reserve; a deficit is paid for by waiting
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._rate)
+        if wait > 0:
+            time.sleep(wait)
+        return ticket
+
+    def release(self, ticket: int, throttle: Optional[RateLimitInfo] = None,
+                info: Optional[RateLimitInfo] = None) -> None:
+        """Return a slot. *throttle* when the request was told to slow down;
+        *info* with whatever the (successful) response's headers said."""
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttle is not None:
+                self.throttles += 1
+                self._consecutive += 1
+                self._successes = 0
+                if ticket == self._generation:
+                    # First throttle from requests admitted at this limit; the
+                    # rest of the same burst must not halve it again.
+                    self.limit = max(1, self.limit // 2)
+                    self._generation += 1
+                pause = throttle.retry_after
+                if pause is None:
+                    pause = min(_MAX_PAUSE, _FIRST_PAUSE * 2 ** (self._consecutive - 1))
+                self._cooldown_until = max(self._cooldown_until, now + pause)
+                self._apply(throttle, now)
+            else:
+                self._consecutive = 0
+                self._successes += 1
+                if self._successes >= self.limit and self.limit < self.ceiling:
+                    self.limit += 1
+                    self._successes = 0
+                if info is not None:
+                    self._apply(info, now)
+            self._cond.notify_all()
+
+    def _apply(self, info: RateLimitInfo, now: float) -> None:
+        if info.requests_limit:
+            self._rate = info.requests_limit / 60.0
+        for remaining, reset in ((info.requests_remaining, info.requests_reset),
+                                 (info.tokens_remaining, info.tokens_reset)):
+            if remaining is not None and remaining <= 0 and reset:
+                self._cooldown_until = max(self._cooldown_until, now + reset)
+
+    def pause_remaining(self) -> float:
+        """Seconds until the shared cooldown ends (0 when there is none)."""
+        with self._cond:
+            return max(0.0, self._cooldown_until - time.monotonic())
+
+    # ----- convenience ----- #
+    def call(self, fn: Callable, *args, retries: int = THROTTLE_RETRIES):
+        """``fn(*args)`` under the limiter, re-sent up to *retries* times when
+        throttled. A result with a ``rate_limit`` attribute (DescriptionResult)
+        feeds its headers back. Any other exception is released and re-raised."""
+        for attempt in range(retries + 1):
+            ticket = self.acquire()
+            try:
+                result = fn(*args)
+            except Exception as exc:
+                throttle = throttle_info(exc)
+                self.release(ticket, throttle=throttle)
+                if throttle is None or attempt == retries:
+                    raise
+                continue
+            self.release(ticket, info=getattr(result, "rate_limit", None))
+            return result
+
+
+def account_key(api_key: Optional[str]) -> str:
+    """A stable, non-reversible label for an API key, so two keys get separate
+    limiters without the key itself being held in another place."""
+    if not api_key:
+        return ""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:12]
+
+
+_LIMITERS: dict[tuple[str, str, str], AdaptiveLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def limiter_for(provider: str, model: str, account: str = "",
+                concurrency: int = 1) -> AdaptiveLimiter:
+    """The process-wide limiter for (provider, model, account), created on first use."""
+    key = ((provider or "").strip().lower(), model or "", account or "")
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = _LIMITERS[key] = AdaptiveLimiter(concurrency)
+    limiter.raise_ceiling(concurrency)
+    return limiter
@@ -0,0 +1,208 @@
+"""
+ScanSnapshot — what a source tree looked like at its last scan, so the next
+scan only lists the directories that changed.
+
+`idt watch` and the GUI's folder rescan used to walk the whole tree every
+time, listing every directory and comparing full path sets. On a large
+archive folder on a NAS that is thousands of directory listings every 30
+seconds to learn that nothing happened.
+
+The snapshot stores, for each directory, its mtime, its subdirectories and
+its media files with their size and mtime. Adding, removing or renaming an
+entry changes the directory's mtime, so rescan() stats each known directory
+(one call per directory, never per file) and lists only those whose mtime
+moved, diffing the listing against the stored one into a ScanDelta of
+added / removed / modified files. A file rewritten in place, without touching
+its directory, is only seen by rescan(deep=True), which lists everything.
+
+Like git's index, a directory whose mtime is within RACY_NS of the previous
+scan is listed again regardless: it may have changed again within the same
+timestamp tick.
+
+Snapshots are JSON, keyed by root and extensions (see snapshot_path()): in a
+bundle's derived/scans/ for `idt watch`, in ~/.idt/cache/scans/ otherwise.
+Like the other caches, a missing or unreadable one only costs a full scan.
+
+Usage:
+    snapshot = ScanSnapshot.load(snapshot_path(source, ws.path), source)
+    delta = snapshot.rescan()          # first time: every file is "added"
+    snapshot.save()
+    for path in delta.added: ...
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .scanner import IMAGE_EXTENSIONS
+
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_DIR = Path.home() / ".idt" / "cache" / "scans"
+
+#: Directories modified this close to the previous scan are listed again.
+RACY_NS = 2_000_000_000
+
+
+@dataclass
+class ScanDelta:
+    added: list[Path] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+    modified: list[Path] = field(default_factory=list)
+    dirs_listed: int = 0   # directories actually listed (the rest were unchanged)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+
+def snapshot_path(root: Path, bundle: Optional[Path] = None,
+                  extensions: Iterable[str] = IMAGE_EXTENSIONS) -> Path:
+    """Where the snapshot of *root* scanned for *extensions* is kept."""
+    root = os.path.abspath(root)
+    key = hashlib.sha1(
+        (root + "|" + ",".join(sorted(e.lower() for e in extensions))).encode("utf-8")
+    ).hexdigest()[:16]
+    if bundle is not None and (Path(bundle) / "manifest.json").is_file():
+        return Path(bundle) / "derived" / "scans" / f"{key}.json"
+    return DEFAULT_SNAPSHOT_DIR / f"{key}.json"
+
+
+def _listing(path: str, extensions: frozenset) -> tuple[dict, list]:
+    """({file name: [size, mtime_ns]}, [subdirectory names]) for one directory.
+    Same exclusions as scanner.iter_media: hidden entries and .idt folders."""
+    files: dict = {}
+    subdirs: list = []
+    with os.scandir(path) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.endswith(".idt"):
+                        subdirs.append(name)
+                elif os.path.splitext(name)[1].lower() in extensions and entry.is_file():
+                    st = entry.stat()
+                    files[name] = [st.st_size, st.st_mtime_ns]
+            except OSError:
+                continue
+    subdirs.sort()
+    return files, subdirs
+
+
+class ScanSnapshot:
+    """The stored scan of one source tree."""
+
+    def __init__(self, root: Path, extensions: Iterable[str] = IMAGE_EXTENSIONS,
+                 path: Optional[Path] = None):
+        self.root = os.path.abspath(root)
+        self.extensions = frozenset(e.lower() for e in extensions)
+        self.path = Path(path) if path is not None else None
+        self.loaded = False    # True when a stored snapshot was read
+        self._scanned_at = 0   # wall clock (ns) when the last rescan started
+        # relative dir ("" = root) -> {"mtime": ns, "subdirs": [...], "files": {name: [size, mtime]}}
+        self._dirs: dict[str, dict] = {}
+
+    # ----- storage ----- #
+    @classmethod
+    def load(cls, path: Path, root: Path,
+             extensions: Iterable[str] = IMAGE_EXTENSIONS) -> "ScanSnapshot":
+        """The snapshot stored at *path*, or an empty one (first rescan lists everything)."""
+        snap = cls(root, extensions, path)
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return snap
+        if (isinstance(data, dict)
+                and data.get("version") == SNAPSHOT_VERSION
+                and data.get("root") == snap.root
+                and sorted(data.get("extensions", [])) == sorted(snap.extensions)):
+            snap._dirs = data.get("dirs", {})
+            snap._scanned_at = int(data.get("scanned_at", 0))
+            snap.loaded = True
+        return snap
+
+    def save(self, path: Optional[Path] = None) -> None:
+        """Write the snapshot atomically. Never raises — an unsaved snapshot costs a full scan."""
+        path = Path(path) if path is not None else self.path
+        if path is None:
+            return
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "root": self.root,
+            "extensions": sorted(self.extensions),
+            "scanned_at": self._scanned_at,
+            "dirs": self._dirs,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")),
+                           encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    # ----- contents ----- #
+    def _full(self, rel: str, name: str = "") -> str:
+        return os.path.join(self.root, rel, name) if rel else os.path.join(self.root, name)
+
+    def paths(self) -> Iterator[Path]:
+        """Every file in the snapshot."""
+        for rel, entry in self._dirs.items():
+            for name in entry["files"]:
+                yield Path(self._full(rel, name))
+
+    def __len__(self) -> int:
+        return sum(len(entry["files"]) for entry in self._dirs.values())
+
+    # ----- scanning ----- #
+    def rescan(self, deep: bool = False) -> ScanDelta:
+        """
+        Bring the snapshot up to date and return what changed since the last
+        rescan. Lists only new directories and those whose mtime changed
+        (every directory when *deep*).
+        """
+        started = time.time_ns()
+        racy_before = self._scanned_at - RACY_NS
+        delta = ScanDelta()
+        seen: dict[str, dict] = {}
+        stack = [""]
+        while stack:
+            rel = stack.pop()
+            full = self._full(rel)
+            old = self._dirs.get(rel)
+            try:
+                mtime = os.stat(full).st_mtime_ns
+                if old is not None and not deep and old["mtime"] == mtime and mtime < racy_before:
+                    entry = old
+                else:
+                    files, subdirs = _listing(full, self.extensions)
+                    delta.dirs_listed += 1
+                    entry = {"mtime": mtime, "subdirs": subdirs, "files": files}
+                    self._diff(rel, old["files"] if old else {}, files, delta)
+            except OSError:
+                continue  # gone or unreadable: its files are reported removed below
+            seen[rel] = entry
+            stack.extend(os.path.join(rel, s) if rel else s for s in reversed(entry["subdirs"]))
+        for rel, old in self._dirs.items():
+            if rel not in seen:
+                delta.removed.extend(Path(self._full(rel, name)) for name in old["files"])
+        self._dirs = seen
+        self._scanned_at = started
+        delta.removed.sort()
+        return delta
+
+    def _diff(self, rel: str, before: dict, after: dict, delta: ScanDelta) -> None:
+        for name, signature in after.items():
+            previous = before.get(name)
+            if previous is None:
+                delta.added.append(Path(self._full(rel, name)))
+            elif list(previous) != list(signature):
+                delta.modified.append(Path(self._full(rel, name)))
+        for name in before.keys() - after.keys():
+            delta.removed.append(Path(self._full(rel, name)))
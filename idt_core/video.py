@@ -6,15 +6,61 @@ so they can be described by the pipeline like regular images.
 
 Two extraction modes:
   - interval: one frame every N seconds (good for continuous footage)
-  - scene: extract on scene changes using frame difference threshold (good for events)
+  - scene: extract on scene changes (good for events); see SceneDetector
+
+Interval mode decodes only what it keeps. With targets seconds apart it
+seeks to each one (the decoder starts at the preceding keyframe and decodes
+forward to the exact frame), so an hour of 60 fps video every 5 s decodes a
+few GOPs per saved frame instead of all 216k frames. Targets closer together
+than SEEK_MIN_GAP_SECONDS are cheaper to reach by grab() — demux and decode
+without the colour conversion — so those, containers that report no frame
+count, and containers whose seeks land in the wrong place (some MPEG-PS
+files) use the sequential walk. Both strategies save the same frames under
+the same names; tools/benchmark_video_extraction.py compares them.
+
+Scene mode compares small luma thumbnails rather than full frames: a 4K
+frame is reduced once to SCENE_ANALYSIS_WIDTH pixels, and the score is the
+share of grid blocks (or of the brightness histogram) that changed — sensor
+noise averages out inside a block, where a per-pixel difference counted it.
+Only every SCENE_SAMPLE_SECONDS is analysed (the frames between are grab()ed,
+never converted), a new scene must last min_scene_seconds, and a cut back to
+the scene last saved (a flash, a cutaway and back) is not saved again.
+
+extract_videos() runs many videos on a process pool, one video per worker
+(decoding is single-threaded in practice), so a folder of phone clips uses
+every core. When there are fewer videos than workers, long interval-mode
+videos are split by time range into segments extracted side by side and
+merged back in order. Targets stay on the same multiples of the interval,
+so the frames and their names are exactly those a single pass would save.
 
 Requires: pip install opencv-python
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Callable, Iterator, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+INTERVAL_STRATEGIES = ("auto", "seek", "sequential")
+
+#: Interval targets at least this far apart are seeked to; closer ones are
+#: walked to with grab(), which is cheaper than re-decoding from a keyframe.
+SEEK_MIN_GAP_SECONDS = 1.0
+
+#: Scene analysis: thumbnail width, block grid, and how often a frame is analysed.
+SCENE_ANALYSIS_WIDTH = 160
+SCENE_GRID = (16, 9)
+SCENE_SAMPLE_SECONDS = 0.2
+#: A block (or pixel, in the histogram) counts as changed past this many grey levels.
+SCENE_BLOCK_DELTA = 30
+
+#: extract_videos(): interval-mode videos at least this long are split into
+#: time segments when workers would otherwise sit idle.
+SEGMENT_MIN_SECONDS = 600.0
 
 
 @dataclass
@@ -22,8 +68,14 @@ class VideoExtractionOptions:
     mode: str = "interval"           # "interval" or "scene"
     interval_seconds: float = 5.0   # used when mode="interval"
     scene_threshold: float = 30.0   # used when mode="scene", 0-100 (lower=more sensitive)
+    min_scene_seconds: float = 1.0  # scene mode: cuts closer together than this are one scene
+    scene_sample_seconds: float = SCENE_SAMPLE_SECONDS  # scene mode: analyse a frame this often
     max_frames: Optional[int] = None
     on_progress: Optional[Callable[[int, str], None]] = None
+    interval_strategy: str = "auto"  # "auto", "seek" or "sequential" (see INTERVAL_STRATEGIES)
+    start_seconds: float = 0.0      # interval mode: first target at or after this time
+    end_seconds: Optional[float] = None  # interval mode: no target at or after this time
+    embed_metadata: bool = False    # copy the video's GPS/date (ffprobe) into each frame's EXIF
 
 
 @dataclass
@@ -33,6 +85,8 @@ class VideoExtractionResult:
     frame_paths: List[Path]
     duration_seconds: float = 0.0
     fps: float = 0.0
+    strategy: str = ""               # how interval frames were reached: "seek" or "sequential"
+    error: Optional[str] = None      # extract_videos(): why this video produced nothing
 
 
 def extract_frames_to_dir(
@@ -43,7 +97,8 @@ def extract_frames_to_dir(
     """
     Extract frames from video_path into output_dir.
     Standalone — does not require a Project object.
-    Frames are named frame_0001.jpg, frame_0002.jpg, …
+    Frames are named by their timestamp: <stem>_12.00s.jpg (interval) or
+    <stem>_scene_0001_12.00s.jpg (scene).
     """
     try:
         import cv2
@@ -53,6 +108,9 @@ def extract_frames_to_dir(
         )
 
     opts = options or VideoExtractionOptions()
+    if opts.interval_strategy not in INTERVAL_STRATEGIES:
+        raise ValueError(f"Unknown interval strategy: {opts.interval_strategy!r}")
+    video_path = Path(video_path)
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -64,59 +122,436 @@ def extract_frames_to_dir(
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     duration = total_frames / fps if fps else 0.0
 
-    frame_paths: List[Path] = []
-    prev_gray = None
-    frame_number = 0
-    saved_count = 0
-    interval_frames = max(1, int(fps * opts.interval_seconds))
-
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            break
-
-        should_save = False
-
+    saver = _FrameSaver(video_path, output_dir, fps, opts)
+    strategy = ""
+    try:
         if opts.mode == "interval":
-            should_save = (frame_number % interval_frames == 0)
+            interval_frames = max(1, int(fps * opts.interval_seconds))
+            targets = _interval_targets(opts, fps, interval_frames, total_frames)
+            strategy = _interval_strategy(opts.interval_strategy, interval_frames / fps, total_frames)
+            if strategy == "seek":
+                missed = _extract_by_seeking(cap, targets, saver)
+                if missed is not None:
+                    # Seeks landed in the wrong place: walk the rest of the file
+                    # instead, keeping the frames already saved.
+                    strategy = "sequential"
+                    cap.release()
+                    cap = cv2.VideoCapture(str(video_path))
+                    _extract_sequentially(cap, missed, saver)
+            elif strategy == "sequential":
+                _extract_sequentially(cap, targets, saver)
         elif opts.mode == "scene":
-            import numpy as np
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-            if prev_gray is None:
-                should_save = True
-            else:
-                diff = cv2.absdiff(gray, prev_gray)
-                score = float(np.mean(diff))
-                should_save = score > opts.scene_threshold
-            prev_gray = gray
-
-        if should_save:
-            if opts.max_frames and saved_count >= opts.max_frames:
-                break
-            # Name frames by their timestamp in the video (seconds in) so the
-            # filename tells you where each frame came from — matches the GUI.
-            ts = frame_number / fps if fps else 0.0
-            if opts.mode == "scene":
-                filename = f"{video_path.stem}_scene_{saved_count + 1:04d}_{ts:.2f}s.jpg"
-            else:
-                filename = f"{video_path.stem}_{ts:.2f}s.jpg"
-            dest = output_dir / filename
-            cv2.imwrite(str(dest), frame)
-            frame_paths.append(dest)
-            saved_count += 1
-            if opts.on_progress:
-                opts.on_progress(saved_count, f"{ts:.1f}s")
-
-        frame_number += 1
+            _extract_scenes(cap, opts, saver)
+    finally:
+        cap.release()
 
-    cap.release()
+    if opts.embed_metadata and saver.paths:
+        _embed_video_metadata(video_path, saver)
 
     return VideoExtractionResult(
         video_path=video_path,
         frames_dir=output_dir,
-        frame_paths=frame_paths,
+        frame_paths=saver.paths,
         duration_seconds=duration,
         fps=fps,
+        strategy=strategy,
+    )
+
+
+def _interval_targets(opts: VideoExtractionOptions, fps: float, interval_frames: int,
+                      total_frames: int) -> range:
+    """
+    Frame numbers interval mode saves: the multiples of interval_frames from
+    start_seconds up to end_seconds (or the end of the video). A range that
+    does not start at 0 still lands on the same multiples, so segments of one
+    video together save exactly what a single pass would.
+    """
+    first = math.ceil(round(opts.start_seconds * fps) / interval_frames) * interval_frames
+    stop = round(opts.end_seconds * fps) if opts.end_seconds is not None else None
+    if total_frames > 0:
+        stop = total_frames if stop is None else min(stop, total_frames)
+    elif stop is None:
+        stop = 1 << 62   # unknown length: read until the decoder runs out
+    return range(first, stop, interval_frames)
+
+
+def _interval_strategy(requested: str, gap_seconds: float, total_frames: int) -> str:
+    if total_frames <= 0:
+        return "sequential"      # nothing to seek against
+    if requested != "auto":
+        return requested
+    return "seek" if gap_seconds >= SEEK_MIN_GAP_SECONDS else "sequential"
+
+
+class _FrameSaver:
+    """Names, writes and counts extracted frames; reports progress."""
+
+    def __init__(self, video_path: Path, output_dir: Path, fps: float,
+                 opts: VideoExtractionOptions):
+        self.video_path = video_path
+        self.output_dir = output_dir
+        self.fps = fps
+        self.opts = opts
+        self.paths: List[Path] = []
+        self.times: List[float] = []    # seconds into the video, per saved frame
+
+    @property
+    def full(self) -> bool:
+        return bool(self.opts.max_frames) and len(self.paths) >= self.opts.max_frames
+
+    def save(self, frame, frame_number: int) -> None:
+        import cv2
+
+        # Name frames by their timestamp in the video (seconds in) so the
+        # filename tells you where each frame came from — matches the GUI.
+        ts = frame_number / self.fps if self.fps else 0.0
+        if self.opts.mode == "scene":
+            filename = f"{self.video_path.stem}_scene_{len(self.paths) + 1:04d}_{ts:.2f}s.jpg"
+        else:
+            filename = f"{self.video_path.stem}_{ts:.2f}s.jpg"
+        dest = self.output_dir / filename
+        cv2.imwrite(str(dest), frame)
+        self.paths.append(dest)
+        self.times.append(ts)
+        if self.opts.on_progress:
+            self.opts.on_progress(len(self.paths), f"{ts:.1f}s")
+
+
+def _extract_by_seeking(cap, targets: range, saver: _FrameSaver) -> Optional[range]:
+    """
+    Seek to every interval target and decode just that frame. Seeks go by
+    time (CAP_PROP_POS_MSEC): MPEG containers often ignore frame-number seeks.
+    Returns None when done; as soon as a seek lands more than a frame away
+    from its target, stops without saving that frame and returns the targets
+    still to extract, from the missed one on.
+    """
+    import cv2
+
+    for target in targets:
+        if saver.full:
+            break
+        cap.set(cv2.CAP_PROP_POS_MSEC, target / saver.fps * 1000.0)
+        ok, frame = cap.read()
+        if not ok:
+            break
+        landed = int(round(cap.get(cv2.CAP_PROP_POS_FRAMES))) - 1
+        if abs(landed - target) > 1:
+            return range(target, targets.stop, targets.step)
+        saver.save(frame, target)
+    return None
+
+
+def _extract_sequentially(cap, targets: range, saver: _FrameSaver) -> None:
+    """
+    Walk every frame with grab() (no colour conversion) and retrieve only the
+    kept ones. A range that starts mid-video (a segment) is reached with one
+    frame-number seek; the walk counts on from the frame the capture reports
+    it landed on, so each segment decodes only its own stretch of the file.
+    """
+    import cv2
+
+    frame_number = 0
+    if targets.start > 0 and cap.set(cv2.CAP_PROP_POS_FRAMES, targets.start):
+        landed = int(round(cap.get(cv2.CAP_PROP_POS_FRAMES)))
+        if 0 <= landed <= targets.start:
+            frame_number = landed
+        else:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)   # overshot the range: walk from the start
+    while not saver.full and frame_number < targets.stop:
+        if not cap.grab():
+            break
+        if frame_number >= targets.start and (frame_number - targets.start) % targets.step == 0:
+            ok, frame = cap.retrieve()
+            if ok:
+                saver.save(frame, frame_number)
+        frame_number += 1
+
+
+class SceneDetector:
+    """
+    Decides which frames start a new scene. Feed it frames in order with
+    observe(); it keeps only small luma thumbnails, never a full frame.
+
+    The score between two thumbnails, 0-100, is the larger of
+      - the percentage of SCENE_GRID blocks whose mean brightness moved more
+        than SCENE_BLOCK_DELTA grey levels (content moved or changed), and
+      - the histogram distance: the percentage of pixels that would have to
+        change brightness band to turn one histogram into the other (a cut
+        between two shots framed alike).
+    """
+
+    def __init__(self, threshold: float = 30.0, min_scene_frames: int = 0,
+                 width: int = SCENE_ANALYSIS_WIDTH):
+        self.threshold = threshold
+        self.min_scene_frames = max(0, int(min_scene_frames))
+        self.width = width
+        self._previous = None     # thumbnail of the last frame observed
+        self._scene = None        # thumbnail of the last frame that started a scene
+        self._scene_frame = None  # and its frame number
+
+    def thumbnail(self, frame):
+        """(block means, 32-band histogram) of a BGR frame, via a small grey copy."""
+        import cv2
+        import numpy as np
+
+        h, w = frame.shape[:2]
+        if w > 4 * self.width:
+            # Point-sample down to 4x the thumbnail first: INTER_AREA over a
+            # whole 4K frame costs ten times as much, and the 4x4 average
+            # below still smooths out the noise the sampling lets through.
+            frame = cv2.resize(frame, (4 * self.width, max(1, round(h * 4 * self.width / w))),
+                               interpolation=cv2.INTER_NEAREST)
+            h, w = frame.shape[:2]
+        if w > self.width:
+            frame = cv2.resize(frame, (self.width, max(1, round(h * self.width / w))),
+                               interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        blocks = cv2.resize(gray, SCENE_GRID, interpolation=cv2.INTER_AREA).astype(np.int16)
+        hist = np.bincount((gray >> 3).ravel(), minlength=32) / gray.size
+        return blocks, hist
+
+    @staticmethod
+    def difference(a, b) -> float:
+        import numpy as np
+
+        blocks = float(np.count_nonzero(np.abs(a[0] - b[0]) > SCENE_BLOCK_DELTA)) / a[0].size
+        hist = float(np.abs(a[1] - b[1]).sum()) / 2
+        return 100.0 * max(blocks, hist)
+
+    def observe(self, frame, frame_number: int) -> bool:
+        """True when *frame* starts a new scene (the first frame always does)."""
+        thumb = self.thumbnail(frame)
+        previous, self._previous = self._previous, thumb
+        if previous is not None:
+            if self.difference(previous, thumb) <= self.threshold:
+                return False
+            if frame_number - self._scene_frame < self.min_scene_frames:
+                return False
+            if self.difference(self._scene, thumb) <= self.threshold:
+                return False   # back to the scene already saved
+        self._scene, self._scene_frame = thumb, frame_number
+        return True
+
+
+def _extract_scenes(cap, opts: VideoExtractionOptions, saver: _FrameSaver) -> None:
+    """Analyse one frame per scene_sample_seconds; grab() past the rest."""
+    detector = SceneDetector(opts.scene_threshold,
+                             min_scene_frames=round(opts.min_scene_seconds * saver.fps))
+    step = max(1, round(opts.scene_sample_seconds * saver.fps))
+    frame_number = 0
+    while True:
+        if frame_number % step:
+            if not cap.grab():
+                break
+        else:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            if detector.observe(frame, frame_number):
+                if saver.full:
+                    break
+                saver.save(frame, frame_number)
+        frame_number += 1
+
+
+def _embed_video_metadata(video_path: Path, saver: _FrameSaver) -> None:
+    """Copy the video's GPS/date/camera into every saved frame. A no-op without ffprobe."""
+    metadata = VideoMetadataExtractor().extract_metadata(video_path)
+    if not metadata:
+        return
+    embedder = ExifEmbedder()
+    for path, ts in zip(saver.paths, saver.times):
+        embedder.embed_metadata(path, metadata, frame_time=ts, source_video_path=video_path)
+
+
+# ---------------------------------------------------------------------------
+# extract_videos — many videos (or segments of one) on a process pool
+# ---------------------------------------------------------------------------
+
+def extract_videos(
+    jobs: Iterable[Tuple[Path, Path]],
+    options: Optional[VideoExtractionOptions] = None,
+    workers: Optional[int] = None,
+) -> List[VideoExtractionResult]:
+    """
+    extract_frames_to_dir() for every (video_path, output_dir) job, spread
+    over a process pool; results come back in job order.
+
+    A video that fails gets a result with no frames and .error set, rather
+    than stopping the others. Raises ImportError if opencv-python is not
+    installed. options.on_progress is called in this process with the frames
+    saved so far across all videos and "<video name> (n of N videos)", as each
+    video (or segment) finishes — and per frame when extracting in-process.
+    See iter_extract_videos() to handle each video as soon as it is done.
+    """
+    jobs = list(jobs)
+    results: List[Optional[VideoExtractionResult]] = [None] * len(jobs)
+    for index, result in iter_extract_videos(jobs, options, workers):
+        results[index] = result
+    return results
+
+
+def frame_dir_names(videos: Iterable[Path]) -> List[str]:
+    """
+    A frames folder name for each video, unique within the list: the video's
+    stem, with "_2", "_3", ... added for later videos whose stem repeats one
+    already taken (compared case-insensitively, for Windows and macOS). Two
+    "clip.mp4"s in different subfolders extracting at once would otherwise
+    write the same frame files.
+    """
+    taken: set = set()
+    names: List[str] = []
+    for video in videos:
+        stem = Path(video).stem
+        name, n = stem, 1
+        while name.lower() in taken:
+            n += 1
+            name = f"{stem}_{n}"
+        taken.add(name.lower())
+        names.append(name)
+    return names
+
+
+def iter_extract_videos(
+    jobs: Iterable[Tuple[Path, Path]],
+    options: Optional[VideoExtractionOptions] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[int, VideoExtractionResult]]:
+    """
+    Yield (job index, result) as each video finishes, in completion order.
+
+    workers: pool size; defaults to the CPU count. 1, or a single video that
+    is not worth splitting, extracts in this process. If the pool cannot
+    start or breaks, the remaining work is extracted in this process. Each
+    video's frames and result are the same whatever the worker count.
+    """
+    opts = options or VideoExtractionOptions()
+    if opts.interval_strategy not in INTERVAL_STRATEGIES:
+        raise ValueError(f"Unknown interval strategy: {opts.interval_strategy!r}")
+    jobs = [(Path(video), Path(out)) for video, out in jobs]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, 61))  # ProcessPoolExecutor's limit on Windows
+
+    # One unit per video, or several per long video when cores would be idle.
+    units: List[Tuple[int, VideoExtractionOptions]] = []
+    for index, (video, _) in enumerate(jobs):
+        for segment in _segments(video, opts, workers if len(jobs) < workers else 1):
+            units.append((index, segment))
+    remaining = [sum(1 for i, _ in units if i == index) for index in range(len(jobs))]
+    parts: List[List[Tuple[VideoExtractionOptions, VideoExtractionResult]]] = [[] for _ in jobs]
+    saved = done = 0
+
+    def finished(unit: int, result: VideoExtractionResult):
+        nonlocal saved, done
+        index, segment = units[unit]
+        parts[index].append((segment, result))
+        remaining[index] -= 1
+        saved += len(result.frame_paths)
+        done += not remaining[index]
+        if opts.on_progress:
+            opts.on_progress(saved, f"{jobs[index][0].name} ({done} of {len(jobs)} videos)")
+        return None if remaining[index] else (index, _merge(parts[index]))
+
+    def in_process(unit: int) -> VideoExtractionOptions:
+        """The unit's options with progress per frame, counted on from the pool's total."""
+        if not opts.on_progress:
+            return pool_opts[unit]
+        name = jobs[units[unit][0]][0].name
+        return replace(pool_opts[unit], on_progress=lambda n, at: opts.on_progress(
+            saved + n, f"{name} {at} ({done} of {len(jobs)} videos)"))
+
+    todo = list(range(len(units)))
+    pool_opts = [replace(segment, on_progress=None) for _, segment in units]
+    if workers > 1 and len(units) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(units))) as pool:
+                pending = {
+                    pool.submit(_extract_unit, jobs[units[u][0]][0], jobs[units[u][0]][1],
+                                pool_opts[u]): u
+                    for u in todo
+                }
+                while pending:
+                    ready, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in ready:
+                        unit = pending.pop(future)
+                        result = future.result()
+                        todo.remove(unit)
+                        merged = finished(unit, result)
+                        if merged:
+                            yield merged
+        except (BrokenProcessPool, OSError, NotImplementedError):
+            pass
+    for unit in list(todo):
+        index, _ = units[unit]
+        merged = finished(unit, _extract_unit(jobs[index][0], jobs[index][1], in_process(unit)))
+        if merged:
+            yield merged
+
+
+def _segments(video: Path, opts: VideoExtractionOptions, pieces: int) -> List[VideoExtractionOptions]:
+    """
+    opts split into up to *pieces* time ranges of *video*, each starting on an
+    interval target. Only interval mode without max_frames (which counts from
+    the start) is split, and only videos of SEGMENT_MIN_SECONDS or more.
+    """
+    if pieces < 2 or opts.mode != "interval" or opts.max_frames:
+        return [opts]
+    try:
+        import cv2
+    except ImportError:
+        return [opts]
+    cap = cv2.VideoCapture(str(video))
+    try:
+        fps = cap.get(cv2.CAP_PROP_FPS) or 25.0
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    finally:
+        cap.release()
+    if total_frames <= 0 or total_frames / fps < SEGMENT_MIN_SECONDS:
+        return [opts]
+    interval_frames = max(1, int(fps * opts.interval_seconds))
+    targets = _interval_targets(opts, fps, interval_frames, total_frames)
+    pieces = min(pieces, len(targets))
+    if pieces < 2:
+        return [opts]
+    # Boundaries on target frames, expressed in seconds that round back to them.
+    starts = [targets[len(targets) * k // pieces] for k in range(pieces)]
+    bounds = [frame / fps for frame in starts] + [opts.end_seconds]
+    return [
+        replace(opts, start_seconds=bounds[k] if k else opts.start_seconds, end_seconds=bounds[k + 1])
+        for k in range(pieces)
+    ]
+
+
+def _extract_unit(video: Path, output_dir: Path,
+                  opts: VideoExtractionOptions) -> VideoExtractionResult:
+    """iter_extract_videos()'s pool task (module level so it pickles).
+    Raises only ImportError (no OpenCV), which no other video would survive either."""
+    try:
+        return extract_frames_to_dir(video, output_dir, opts)
+    except ImportError:
+        raise
+    except Exception as exc:
+        return VideoExtractionResult(video_path=video, frames_dir=output_dir, frame_paths=[],
+                                     error=str(exc) or type(exc).__name__)
+
+
+def _merge(parts: List[Tuple[VideoExtractionOptions, VideoExtractionResult]]) -> VideoExtractionResult:
+    """One video's segment results, in time order, as one result."""
+    parts = sorted(parts, key=lambda part: part[0].start_seconds)
+    results = [result for _, result in parts]
+    if len(results) == 1:
+        return results[0]
+    first = results[0]
+    errors = [r.error for r in results if r.error]
+    return VideoExtractionResult(
+        video_path=first.video_path,
+        frames_dir=first.frames_dir,
+        frame_paths=[path for r in results for path in r.frame_paths],
+        duration_seconds=max(r.duration_seconds for r in results),
+        fps=max(r.fps for r in results),
+        strategy="sequential" if any(r.strategy == "sequential" for r in results) else first.strategy,
+        error=errors[0] if errors else None,
     )
 
 
@@ -126,20 +561,8 @@ def scan_videos(directory: Path) -> Iterator[Path]:
     Exclusions are evaluated relative to `directory` (see scanner.scan_images):
     a scan root under a hidden ancestor must not exclude its own contents.
     """
-    from .scanner import VIDEO_EXTENSIONS, _is_excluded
-    directory = Path(directory)
-    matches: list[Path] = []
-    for p in directory.rglob("*"):
-        if not (p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS):
-            continue
-        try:
-            rel = p.relative_to(directory)
-        except ValueError:
-            rel = p
-        if _is_excluded(rel):
-            continue
-        matches.append(p)
-    yield from sorted(matches)
+    from .scanner import VIDEO_EXTENSIONS, iter_media
+    yield from sorted(iter_media(directory, VIDEO_EXTENSIONS))
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,224 @@
+"""
+FolderWatcher — the files that have arrived in a drop folder, once they have
+finished arriving.
+
+`idt watch` used to sleep for --interval seconds, rescan, and describe what
+was new: up to half a minute before a dropped photo was noticed, and a rescan
+every half minute whether or not anything happened. FolderWatcher asks the OS
+instead. With the optional `watchdog` package (inotify on Linux, FSEvents on
+macOS, ReadDirectoryChangesW on Windows) a burst of events wakes it, it waits
+DEBOUNCE_SECONDS for the burst to end, then rescans the ScanSnapshot — which
+lists only the directories whose mtime moved. Without watchdog, or if the OS
+refuses a watch (e.g. inotify's watch limit), it polls every *interval*
+seconds as before.
+
+A file is only handed on once its size and mtime have held still for
+SETTLE_SECONDS: a camera card copy or a browser download is visible long
+before it is complete, and describing half a JPEG wastes a provider call. A
+directory's mtime does not move while a file in it grows, so pending files are
+stat'ed directly until they settle.
+
+The snapshot is saved only while nothing is pending, so a watcher stopped
+mid-copy reports the unfinished file again on the next start.
+
+Usage:
+    watcher = FolderWatcher(snapshot, backend="auto", interval=30)
+    for delta in watcher.changes():        # blocks between changes
+        for path in delta.added: ...
+"""
+from __future__ import annotations
+
+import importlib.util
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .scan_snapshot import ScanDelta, ScanSnapshot
+
+WATCH_BACKENDS = ("auto", "events", "poll")
+
+#: Quiet time after the last filesystem event before the folder is rescanned.
+DEBOUNCE_SECONDS = 1.0
+#: A burst that never goes quiet (a long copy) is still rescanned this often.
+MAX_DEBOUNCE_SECONDS = 10.0
+#: How long a new file's size and mtime must stay unchanged before it is handed on.
+SETTLE_SECONDS = 2.0
+#: With events, a safety rescan at least this often (sooner if *interval* is
+#: shorter) in case the OS dropped some (inotify queue overflow, a network
+#: share that reports nothing).
+EVENT_RESCAN_SECONDS = 300.0
+
+# watchdog events that say nothing about content (watchdog >= 4 reports opens)
+_IGNORED_EVENTS = frozenset({"opened", "closed_no_write"})
+
+
+def watchdog_available() -> bool:
+    return importlib.util.find_spec("watchdog") is not None
+
+
+class FolderWatcher:
+    """Settled changes to the tree a ScanSnapshot covers, event-driven when possible."""
+
+    def __init__(self, snapshot: ScanSnapshot, backend: str = "auto", interval: float = 30.0,
+                 debounce: float = DEBOUNCE_SECONDS, settle: float = SETTLE_SECONDS):
+        if backend not in WATCH_BACKENDS:
+            raise ValueError(f"Unknown watch backend {backend!r} (expected one of {WATCH_BACKENDS})")
+        if backend == "events" and not watchdog_available():
+            raise ImportError("watchdog is required for event-driven watching: pip install watchdog")
+        self.snapshot = snapshot
+        self.interval = max(0.0, float(interval))
+        self.debounce = debounce
+        self.settle = settle
+        self.backend = "poll" if backend == "poll" or not watchdog_available() else "events"
+        self.fallback_reason: Optional[str] = None   # why "events" became "poll", if it did
+        self._observer = None
+        self._wake = threading.Event()
+        self._closed = False
+        # path -> ((size, mtime_ns) last seen, monotonic time it was first seen that way)
+        self._pending: dict[Path, tuple[Optional[tuple[int, int]], float]] = {}
+        self._unsaved = False
+
+    # ----- lifecycle ----- #
+    def start(self) -> None:
+        """Start the OS watch. Falls back to polling when the OS will not give one."""
+        if self.backend != "events" or self._observer is not None:
+            return
+        try:
+            self._observer = _start_observer(self.snapshot.root, self._on_event)
+        except (OSError, RuntimeError) as exc:
+            self.backend = "poll"
+            self.fallback_reason = str(exc) or type(exc).__name__
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake.set()
+        if self._observer is not None:
+            try:
+                self._observer.stop()
+                self._observer.join(timeout=5)
+            except Exception:
+                pass
+            self._observer = None
+
+    def __enter__(self) -> "FolderWatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> list[Path]:
+        """New files seen but not yet settled."""
+        return sorted(self._pending)
+
+    def hold(self, paths) -> list[Path]:
+        """
+        Take new files found outside changes() (e.g. by a first rescan) through
+        the same settle check. Returns those already settled — unmodified for
+        `settle` seconds — and keeps the rest pending, for changes() to hand on.
+        """
+        now, wall = time.monotonic(), time.time()
+        ready = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if wall - st.st_mtime >= self.settle:
+                ready.append(path)
+            else:
+                self._pending[path] = ((st.st_size, st.st_mtime_ns), now)
+                self._unsaved = True
+        return ready
+
+    # ----- changes ----- #
+    def changes(self) -> Iterator[ScanDelta]:
+        """
+        Block until something changes, then yield it; forever, until close().
+        delta.added holds only settled files; delta.removed and delta.modified
+        are reported as soon as they are seen.
+        """
+        self.start()
+        while not self._closed:
+            if self._unsaved and not self._pending:
+                self.snapshot.save()
+                self._unsaved = False
+            self._wait()
+            if self._closed:
+                return
+            delta = self.snapshot.rescan()
+            now = time.monotonic()
+            if delta:
+                self._unsaved = True
+            for path in delta.removed:
+                self._pending.pop(path, None)
+            modified = [p for p in delta.modified if p not in self._pending]
+            for path in delta.added:
+                self._pending[path] = (None, now)
+            ready = self._settled(now)
+            if ready or delta.removed or modified:
+                yield ScanDelta(added=ready, removed=delta.removed, modified=modified,
+                                dirs_listed=delta.dirs_listed)
+
+    def _settled(self, now: float) -> list[Path]:
+        """Take the pending files whose size and mtime have held still for `settle` seconds."""
+        ready = []
+        for path, (signature, since) in list(self._pending.items()):
+            try:
+                st = os.stat(path)
+            except OSError:
+                del self._pending[path]   # gone before it settled (a temp file renamed away)
+                continue
+            current = (st.st_size, st.st_mtime_ns)
+            if current != signature:
+                self._pending[path] = (current, now)
+            elif now - since >= self.settle:
+                del self._pending[path]
+                ready.append(path)
+        ready.sort()
+        return ready
+
+    def _wait(self) -> None:
+        """Sleep until the next rescan is due."""
+        tick = max(0.05, self.settle / 2)
+        if self.backend != "events":
+            self._wake.wait(min(self.interval, tick) if self._pending else self.interval)
+            return
+        rescan = min(self.interval, EVENT_RESCAN_SECONDS)
+        if not self._wake.wait(tick if self._pending else rescan):
+            return
+        # Debounce: rescan once the burst has been quiet for `debounce` seconds.
+        deadline = time.monotonic() + MAX_DEBOUNCE_SECONDS
+        while not self._closed:
+            self._wake.clear()
+            if not self._wake.wait(self.debounce) or time.monotonic() >= deadline:
+                return
+
+    def _on_event(self, event) -> None:
+        """Observer thread: wake the watcher for events that can matter to the snapshot."""
+        if event.event_type in _IGNORED_EVENTS:
+            return
+        if not event.is_directory:
+            paths = [event.src_path, getattr(event, "dest_path", "") or ""]
+            if not any(os.path.splitext(os.fsdecode(p))[1].lower() in self.snapshot.extensions
+                       for p in paths):
+                return
+        self._wake.set()
+
+
+def _start_observer(root: str, on_event):
+    """A running watchdog Observer calling *on_event* for everything under *root*."""
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    class _Handler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            on_event(event)
+
+    observer = Observer()
+    observer.schedule(_Handler(), root, recursive=True)
+    observer.start()
+    return observer
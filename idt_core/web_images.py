@@ -0,0 +1,376 @@
+"""
+Web-sized copies of images for published galleries, cached by content.
+
+A gallery page used to load each full-resolution original — often several
+megabytes — to fill a 300-pixel card. make_web_images() renders each image at
+the WEB_WIDTHS it is at least as wide as (its own width standing in for the
+larger ones), in two formats: a modern one (AVIF when Pillow can write it,
+else WebP) and a fallback every browser reads (JPEG, or PNG for images with
+transparency). The gallery offers them through srcset/<picture>, so a browser
+downloads one file of about the size it displays.
+
+Rendering:
+
+* EXIF orientation is applied and metadata dropped (GPS tags do not belong in
+  a thumbnail on a public site); JPEGs are decoded at a reduced scale (draft
+  mode) when the largest width allows it.
+* Images render on a process pool, one image per task, falling back to this
+  process if the pool cannot start or breaks.
+
+Caching: renders are stored under DEFAULT_CACHE_DIR (or *cache_dir*), named by
+the md5 of the source's content and a tag for the widths, formats and
+encoder settings, so an image renders once however often — and from whatever
+folder — it is exported. Source hashes are remembered per file version
+(path, size, mtime, inode) in the cache's hashes.json, so an unchanged image
+is not even read again. The cache can be deleted at any time; it costs a
+re-render, never an error.
+
+The cache is bounded by *max_bytes* (MAX_CACHE_BYTES by default). A hit
+touches the image's record, and when a call that rendered something leaves
+the cache over the bound, the least recently used images' renders are
+removed until it is back under 90% of it — never those the call returned.
+hashes.json forgets file versions that are no longer on disk (the file was
+edited, moved or deleted) each time it is saved.
+
+Usage:
+    renders = make_web_images([Path("a.jpg"), Path("b.png")])
+    renders[0].srcset(renders[0].modern, lambda p: "web/" + p.name)
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional, Sequence
+
+from .metadata_cache import file_key
+
+#: Widths rendered, smallest first: grid thumbnails, then display sizes.
+WEB_WIDTHS = (480, 960, 1600)
+
+#: Bumped when rendering changes, so older renders in the cache are not reused.
+WEB_IMAGE_VERSION = 1
+
+DEFAULT_CACHE_DIR = Path.home() / ".idt" / "cache" / "web_images"
+#: Size the cache is trimmed back under; None leaves it unbounded.
+MAX_CACHE_BYTES = 1024 * 1024 * 1024
+
+EXTENSIONS = {"jpeg": "jpg", "png": "png", "webp": "webp", "avif": "avif"}
+MIME_TYPES = {"jpeg": "image/jpeg", "png": "image/png", "webp": "image/webp",
+              "avif": "image/avif"}
+
+_SAVE_OPTIONS = {
+    "jpeg": {"quality": 82, "optimize": True, "progressive": True},
+    "png": {"optimize": True},
+    "webp": {"quality": 80, "method": 4},
+    "avif": {"quality": 60, "speed": 8},
+}
+
+_HASH_CHUNK = 1024 * 1024
+_HASH_INDEX = "hashes.json"
+_LOW_WATER = 0.9
+
+
+@dataclass
+class WebImage:
+    """One image's renders: widths x (modern, fallback) files in the cache."""
+    width: int                  # the original's, after EXIF orientation
+    height: int
+    widths: list                # rendered widths, ascending
+    fallback: str               # "jpeg" or "png"
+    modern: Optional[str]       # "avif", "webp", or None if Pillow writes neither
+    stem: str                   # cache path of the renders, without "-<width>.<ext>"
+
+    @property
+    def formats(self) -> list[str]:
+        return [f for f in (self.modern, self.fallback) if f]
+
+    def path(self, fmt: str, width: int) -> Path:
+        return Path(f"{self.stem}-{width}.{EXTENSIONS[fmt]}")
+
+    def files(self) -> list[Path]:
+        return [self.path(fmt, w) for fmt in self.formats for w in self.widths]
+
+    def height_at(self, width: int) -> int:
+        return max(1, round(self.height * width / self.width))
+
+    def srcset(self, fmt: str, url: Callable[[Path], str]) -> str:
+        """The srcset for *fmt*, each render's URL given by url(cache_path)."""
+        return ", ".join(f"{url(self.path(fmt, w))} {w}w" for w in self.widths)
+
+
+def modern_format() -> Optional[str]:
+    """The smallest-file format this Pillow can write: "avif", "webp", or None."""
+    try:
+        from PIL import features
+    except ImportError:
+        return None
+    for fmt in ("avif", "webp"):
+        try:
+            if features.check(fmt):
+                return fmt
+        except ValueError:      # a Pillow too old to know the feature name
+            continue
+    return None
+
+
+def make_web_images(
+    sources: Sequence[Path],
+    cache_dir: Optional[Path] = None,
+    widths: Sequence[int] = WEB_WIDTHS,
+    modern: Optional[str] = "auto",
+    workers: Optional[int] = None,
+    on_done: Optional[Callable[[int, int, Path], None]] = None,
+    max_bytes: Optional[int] = MAX_CACHE_BYTES,
+) -> list[Optional[WebImage]]:
+    """
+    Renders of every source, in order, from the cache or rendered now; None
+    for a source that cannot be read as an image.
+
+    modern: "auto" (see modern_format), "avif", "webp", or None for the
+    fallback format only. workers: pool size; defaults to the CPU count, and
+    1 renders in this process. on_done(done, total, source) is called in this
+    thread as each source is ready. max_bytes: the cache's bound (see above).
+
+    Requires Pillow.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    widths = sorted({int(w) for w in widths if int(w) > 0}) or list(WEB_WIDTHS)
+    if modern == "auto":
+        modern = modern_format()
+    recipe = hashlib.md5(repr((WEB_IMAGE_VERSION, widths, modern, _SAVE_OPTIONS))
+                         .encode()).hexdigest()[:10]
+    sources = [Path(s) for s in sources]
+    out: list[Optional[WebImage]] = [None] * len(sources)
+    done = 0
+
+    def finished(index: int) -> None:
+        nonlocal done
+        done += 1
+        if on_done:
+            on_done(done, len(sources), sources[index])
+
+    hashes = _HashIndex(cache_dir / _HASH_INDEX)
+    todo: list[tuple[int, str]] = []             # (index, cache stem)
+    for index, src in enumerate(sources):
+        digest = hashes.md5(src)
+        if digest is None:
+            finished(index)
+            continue
+        stem = str(cache_dir / digest[:2] / f"{digest}-{recipe}")
+        out[index] = _load_sidecar(stem)
+        if out[index] is None:
+            todo.append((index, stem))
+        else:
+            finished(index)
+    hashes.save()
+
+    args = [(str(sources[i]), stem, widths, modern) for i, stem in todo]
+    rendered: dict[int, Optional[dict]] = {}
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, 61)  # ProcessPoolExecutor's limit on Windows
+    if workers > 1 and len(todo) > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+                futures = {pool.submit(_render_safely, *a): n for n, a in enumerate(args)}
+                for future in as_completed(futures):
+                    n = futures[future]
+                    rendered[n] = future.result()
+                    finished(todo[n][0])
+        except (BrokenProcessPool, OSError, NotImplementedError):
+            pass
+    for n, a in enumerate(args):
+        if n not in rendered:
+            rendered[n] = _render_safely(*a)
+            finished(todo[n][0])
+
+    for n, (index, stem) in enumerate(todo):
+        info = rendered[n]
+        if info is None:
+            continue
+        out[index] = WebImage(stem=stem, **info)
+        _save_sidecar(stem, info)
+    if todo and max_bytes is not None:
+        _trim_cache(cache_dir, max_bytes, keep={Path(w.stem).name for w in out if w})
+    return out
+
+
+# ------------------------------------------------------------------ #
+# Rendering (runs in pool workers)                                     #
+# ------------------------------------------------------------------ #
+
+def _render_safely(src: str, stem: str, widths: list, modern: Optional[str]) -> Optional[dict]:
+    try:
+        return _render(src, stem, widths, modern)
+    except Exception:
+        return None
+
+
+def _render(src: str, stem: str, widths: list, modern: Optional[str]) -> dict:
+    """Write every render of src next to *stem*; returns WebImage's fields but the stem."""
+    from PIL import Image, ImageOps
+
+    Path(stem).parent.mkdir(parents=True, exist_ok=True)
+    with Image.open(src) as img:
+        full_w, full_h = img.size
+        if img.getexif().get(0x0112) in (5, 6, 7, 8):     # rotated a quarter turn
+            full_w, full_h = full_h, full_w
+        targets = [w for w in widths if w < full_w] + ([full_w] if full_w <= widths[-1] else [])
+        # Decode JPEGs at 1/2, 1/4 or 1/8 scale while that still covers the largest render.
+        img.draft(None, (targets[-1], targets[-1]))
+        img = ImageOps.exif_transpose(img)
+        alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        img = img.convert("RGBA" if alpha else "RGB")
+
+    fallback = "png" if alpha else "jpeg"
+    current = img
+    for width in reversed(targets):
+        height = max(1, round(full_h * width / full_w))
+        if current.size != (width, height):
+            current = current.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+        for fmt in (modern, fallback):
+            if fmt:
+                path = f"{stem}-{width}.{EXTENSIONS[fmt]}"
+                tmp = f"{path}.{os.getpid()}.tmp"
+                current.save(tmp, fmt.upper(), **_SAVE_OPTIONS[fmt])
+                os.replace(tmp, path)
+    return {"width": full_w, "height": full_h, "widths": targets,
+            "fallback": fallback, "modern": modern}
+
+
+# ------------------------------------------------------------------ #
+# Cache bookkeeping                                                    #
+# ------------------------------------------------------------------ #
+
+def _load_sidecar(stem: str) -> Optional[WebImage]:
+    """The renders recorded for *stem*, if the record and every file are there."""
+    try:
+        info = json.loads(Path(f"{stem}.json").read_text(encoding="utf-8"))
+        web = WebImage(stem=stem, **info)
+    except (OSError, ValueError, TypeError):
+        return None
+    if not all(p.is_file() for p in web.files()):
+        return None
+    try:
+        os.utime(f"{stem}.json")        # recently used: evicted last
+    except OSError:
+        pass
+    return web
+
+
+def _save_sidecar(stem: str, info: dict) -> None:
+    tmp = Path(f"{stem}.json.tmp")
+    try:
+        tmp.write_text(json.dumps(info), encoding="utf-8")
+        os.replace(tmp, f"{stem}.json")
+    except OSError:
+        pass
+
+
+def _trim_cache(cache_dir: Path, max_bytes: int, keep: set) -> None:
+    """Remove the least recently used images' renders until the cache is under
+    the low-water mark, if it is over *max_bytes*; stems in *keep* stay."""
+    images: dict[str, list] = {}            # stem name -> [last used, size, files]
+    try:
+        shards = [e for e in os.scandir(cache_dir) if e.is_dir()]
+    except OSError:
+        return
+    for shard in shards:
+        try:
+            with os.scandir(shard.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".tmp") or not entry.is_file():
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    # "<md5>-<recipe>.json" or "<md5>-<recipe>-<width>.<ext>"
+                    name = "-".join(entry.name.split(".")[0].split("-")[:2])
+                    image = images.setdefault(name, [0, 0, []])
+                    if entry.name.endswith(".json"):
+                        image[0] = st.st_mtime_ns
+                    image[1] += st.st_size
+                    image[2].append(entry.path)
+        except OSError:
+            continue
+    total = sum(size for _, size, _ in images.values())
+    if total <= max_bytes:
+        return
+    target = int(max_bytes * _LOW_WATER)
+    for name, (_, size, files) in sorted(images.items(), key=lambda item: item[1][0]):
+        if total <= target:
+            break
+        if name in keep:
+            continue
+        for path in files:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        total -= size
+
+
+class _HashIndex:
+    """md5 of each file version seen before, so unchanged sources are not re-read."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._changed = False
+        try:
+            self._hashes = json.loads(path.read_text(encoding="utf-8"))
+            if not isinstance(self._hashes, dict):
+                self._hashes = {}
+        except (OSError, ValueError):
+            self._hashes = {}
+
+    def md5(self, src: Path) -> Optional[str]:
+        key = file_key(src)
+        if key is None:
+            return None
+        name = json.dumps(key)
+        digest = self._hashes.get(name)
+        if digest is None:
+            try:
+                digest = _md5(src)
+            except OSError:
+                return None
+            self._hashes[name] = digest
+            self._changed = True
+        return digest
+
+    def prune(self) -> None:
+        """Forget file versions that are no longer on disk."""
+        for name in list(self._hashes):
+            try:
+                key = tuple(json.loads(name))
+            except (ValueError, TypeError):
+                key = None
+            if not key or file_key(Path(key[0])) != key:
+                del self._hashes[name]
+                self._changed = True
+
+    def save(self) -> None:
+        self.prune()
+        if not self._changed:
+            return
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(self._hashes), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
+
+
+def _md5(path: Path) -> str:
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -15,19 +15,25 @@ Layout:
         descriptions/     one <imagename>.json sidecar per image
         chats/            chat sessions not tied to a single image
         derived/          frames/, converted/, ... generated artifacts
+                          (including catalog.sqlite3, the sidecar index — see catalog.py)
         logs/
 """
 from __future__ import annotations
 
+import copy
+import hashlib
 import json
 import os
 import shutil
+import threading
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from .catalog import CATALOG_NAME, Catalog, CatalogEntry, CatalogUnavailable
 from .scanner import scan_images, is_image, is_video
 try:
     from .config import DEFAULT_OLLAMA_MODEL
@@ -37,6 +43,11 @@ except ImportError:
 BUNDLE_EXT = ".idtw"
 FORMAT_VERSION = "1.0"
 
+#: Seconds a SidecarWriter holds a save before writing it, and how many saves
+#: it lets pile up before writing them regardless of the clock.
+WRITE_BEHIND_DELAY = 2.0
+WRITE_BEHIND_MAX_PENDING = 256
+
 
 def _now() -> str:
     return datetime.now(timezone.utc).isoformat()
@@ -50,6 +61,31 @@ def _atomic_write_text(path: Path, text: str) -> None:
     tmp.replace(path)
 
 
+def _sidecar_text(data: dict) -> str:
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _digest(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make the renames just done inside *path* durable. Directories cannot be
+    opened for fsync on Windows, where the rename is already durable."""
+    if os.name == "nt":
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def source_relative_subfolder(file_path, source_root) -> Optional[str]:
     """The `subfolder` key for a file discovered under `source_root`.
 
@@ -286,6 +322,13 @@ class WorkspaceItem:
         )
 
 
+def _item_or_none(d: dict) -> Optional[WorkspaceItem]:
+    try:
+        return WorkspaceItem.from_dict(d)
+    except Exception:
+        return None
+
+
 # --------------------------------------------------------------------------- #
 # Workspace — the bundle itself.                                              #
 # --------------------------------------------------------------------------- #
@@ -298,6 +341,94 @@ class WorkspaceDefaults:
     prompt_text: str = ""
 
 
+class SidecarWriter:
+    """
+    Write-behind for Workspace.save_item — see Workspace.write_behind.
+
+    Saves wait in memory, keyed by sidecar, so an item saved five times while
+    pending is written once. They go to disk together when the oldest has
+    waited ``delay`` seconds, when ``max_pending`` have piled up, or when the
+    writer is flushed or closed, through Workspace._write_sidecars: unchanged
+    content is skipped, and each sidecar is replaced whole, so a crash loses at
+    most the saves still pending and never leaves a half-written file.
+    """
+
+    def __init__(self, workspace: "Workspace", delay: float = WRITE_BEHIND_DELAY,
+                 max_pending: int = WRITE_BEHIND_MAX_PENDING):
+        self.workspace = workspace
+        self.delay = delay
+        self.max_pending = max(1, max_pending)
+        self.written = 0          # sidecars actually rewritten
+        self.closed = False
+        self._pending: dict[Path, dict] = {}
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._error: Optional[BaseException] = None
+
+    def put(self, sidecar: Path, data: dict) -> None:
+        # A snapshot: the caller's dict shares lists with the live item, which
+        # may change before the timer thread serializes it.
+        data = copy.deepcopy(data)
+        with self._lock:
+            if self.closed:
+                self.written += self.workspace._write_sidecars({sidecar: data})
+                return
+            self._raise_deferred()
+            self._pending[sidecar] = data
+            if len(self._pending) >= self.max_pending:
+                self.flush()
+            elif self._timer is None and self.delay > 0:
+                self._timer = threading.Timer(self.delay, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def pending(self, sidecar: Path) -> Optional[dict]:
+        """The data waiting to be written to *sidecar*, if any."""
+        with self._lock:
+            return self._pending.get(sidecar)
+
+    def find(self, image_name: str) -> Optional[dict]:
+        """The data waiting to be written for *image_name* in any subfolder, if any."""
+        name = image_name + ".json"
+        with self._lock:
+            return next((d for p, d in self._pending.items() if p.name == name), None)
+
+    def flush(self) -> int:
+        """Write everything pending now. Returns the number of sidecars rewritten."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._raise_deferred()
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, {}
+            try:
+                written = self.workspace._write_sidecars(batch)
+            except BaseException:
+                self._pending = batch  # kept for the next attempt
+                raise
+            self.written += written
+            return written
+
+    def close(self) -> None:
+        """Flush, then write any later save straight through."""
+        with self._lock:
+            self.flush()
+            self.closed = True
+
+    def _flush_on_timer(self) -> None:
+        try:
+            self.flush()
+        except BaseException as exc:  # no caller here; the next put or flush raises it
+            self._error = exc
+
+    def _raise_deferred(self) -> None:
+        if self._error is not None:
+            exc, self._error = self._error, None
+            raise exc
+
+
 class Workspace:
     """A `.idtw` bundle on disk. Open or create one, then add images and descriptions."""
 
@@ -323,6 +454,21 @@ class Workspace:
         self.cli_commands: list = []
         # lazy index of source_path -> bundle image name, for idempotent adds
         self._source_index: Optional[dict] = None
+        # Index of descriptions/ (see catalog.py). Set to None for the life of
+        # this object the first time SQLite proves unusable for the bundle.
+        self._catalog: Optional[Catalog] = Catalog(
+            self.path / "derived" / CATALOG_NAME, self.path / "descriptions"
+        )
+        # Set inside write_behind(); save_item queues on it instead of writing.
+        self._writer: Optional[SidecarWriter] = None
+        # True while a write_behind() block holds a catalog it has refreshed once:
+        # its own writes reach the catalog through record_many, so lookups in the
+        # block (the GUI's save looks up every item) skip the directory walk.
+        self._catalog_fresh = False
+        # sidecar -> (content digest, mtime_ns, size) as this object last wrote
+        # or checked it, so an unchanged save can be skipped without a read
+        self._written: dict[Path, tuple[str, int, int]] = {}
+        self._write_lock = threading.Lock()
 
     # ----- directory accessors ----- #
     @property
@@ -434,9 +580,9 @@ class Workspace:
     # ----- image add ----- #
     def _build_source_index(self) -> dict:
         idx: dict = {}
-        for item in self.items():
-            if item.source_path:
-                idx[item.source_path] = (item.image, item.subfolder)
+        for entry in self.entries():
+            if entry.source_path:
+                idx[entry.source_path] = (entry.image, entry.subfolder)
         return idx
 
     def _image_copy_path(self, image_name: str, subfolder: Optional[str] = None) -> Path:
@@ -456,11 +602,11 @@ class Workspace:
         neither sidecar nor copy is silently overwritten.
         """
         base = source_path.name
-        if not self._sidecar_path(base, subfolder).exists():
+        if not self._sidecar_taken(self._sidecar_path(base, subfolder)):
             return base
         stem, suffix = source_path.stem, source_path.suffix
         n = 1
-        while self._sidecar_path(f"{stem}_{n}{suffix}", subfolder).exists():
+        while self._sidecar_taken(self._sidecar_path(f"{stem}_{n}{suffix}", subfolder)):
             n += 1
         return f"{stem}_{n}{suffix}"
 
@@ -523,10 +669,11 @@ class Workspace:
                 p for p in folder.iterdir()
                 if p.is_file() and (is_image(p) or (include_videos and is_video(p)))
             )
-        for p in paths:
-            added.append(
-                self.add_image(p, subfolder=source_relative_subfolder(p, folder), copy=copy)
-            )
+        with self.write_behind():
+            for p in paths:
+                added.append(
+                    self.add_image(p, subfolder=source_relative_subfolder(p, folder), copy=copy)
+                )
 
         entry = {"path": str(folder), "recursive": recursive, "added": _now()}
         if not any(s.get("path") == str(folder) for s in self.sources):
@@ -541,17 +688,139 @@ class Workspace:
         return self.descriptions_dir / (image_name + ".json")
 
     def save_item(self, item: WorkspaceItem) -> None:
-        _atomic_write_text(
-            self._sidecar_path(item.image, item.subfolder),
-            json.dumps(item.to_dict(), indent=2, ensure_ascii=False),
-        )
+        """Write the item's sidecar — now, or when the enclosing write_behind()
+        flushes. Nothing is rewritten if the content has not changed."""
+        sidecar = self._sidecar_path(item.image, item.subfolder)
+        data = item.to_dict()
+        writer = self._writer
+        if writer is not None:
+            writer.put(sidecar, data)
+        else:
+            self._write_sidecars({sidecar: data})
+
+    @contextmanager
+    def write_behind(self, delay: float = WRITE_BEHIND_DELAY,
+                     max_pending: int = WRITE_BEHIND_MAX_PENDING) -> Iterator[SidecarWriter]:
+        """
+        Queue save_item writes for the duration of the block and write them in
+        batches (see SidecarWriter); everything is on disk when the block exits.
+        Reads inside the block see queued saves. Nested blocks share the
+        outermost writer.
+        """
+        if self._writer is not None:
+            yield self._writer
+            return
+        writer = self._writer = SidecarWriter(self, delay, max_pending)
+        try:
+            yield writer
+        finally:
+            try:
+                writer.close()
+            finally:
+                self._writer = None
+                self._catalog_fresh = False
+
+    def flush(self) -> None:
+        """Write any saves queued by an open write_behind() block now."""
+        if self._writer is not None:
+            self._writer.flush()
+
+    def _sidecar_taken(self, sidecar: Path) -> bool:
+        writer = self._writer
+        return (writer is not None and writer.pending(sidecar) is not None) or sidecar.exists()
+
+    def _unchanged(self, sidecar: Path, text: str, digest: str) -> bool:
+        """True if *sidecar* already holds *text*. Trusts this object's record of
+        its last write while the file's size and mtime still match it; otherwise
+        compares with the file, which is still far cheaper than rewriting it."""
+        try:
+            st = sidecar.stat()
+        except OSError:
+            return False
+        known = self._written.get(sidecar)
+        if known is not None and known[1:] == (st.st_mtime_ns, st.st_size):
+            same = known[0] == digest
+        else:
+            try:
+                same = st.st_size == len(text.encode("utf-8")) and \
+                    sidecar.read_text(encoding="utf-8") == text
+            except (OSError, UnicodeDecodeError):
+                same = False
+        if same:
+            self._written[sidecar] = (digest, st.st_mtime_ns, st.st_size)
+        return same
+
+    def _write_sidecars(self, batch: dict[Path, dict]) -> int:
+        """
+        Write *batch* ({sidecar: item dict}), skipping sidecars whose content is
+        unchanged. Every temp file is written and fsynced before any is renamed
+        over its sidecar, and each directory touched is fsynced once after, so a
+        crash leaves each sidecar wholly old or wholly new. The catalog rows are
+        recorded in one transaction. Returns the number of sidecars written.
+        """
+        with self._write_lock:
+            staged = []
+            for sidecar, data in batch.items():
+                text = _sidecar_text(data)
+                digest = _digest(text)
+                if self._unchanged(sidecar, text, digest):
+                    continue
+                sidecar.parent.mkdir(parents=True, exist_ok=True)
+                tmp = sidecar.with_name(sidecar.name + ".tmp")
+                with open(tmp, "w", encoding="utf-8") as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                staged.append((sidecar, tmp, data, digest))
+            for sidecar, tmp, _data, digest in staged:
+                tmp.replace(sidecar)
+                st = sidecar.stat()
+                self._written[sidecar] = (digest, st.st_mtime_ns, st.st_size)
+            for parent in {sidecar.parent for sidecar, *_ in staged}:
+                _fsync_dir(parent)
+            if staged and self._catalog is not None:
+                try:
+                    self._catalog.record_many([(sidecar, data) for sidecar, _t, data, _d in staged])
+                except (CatalogUnavailable, OSError):
+                    self._catalog = None
+            return len(staged)
+
+    def _catalog_ready(self) -> Optional[Catalog]:
+        """The catalog, refreshed against descriptions/ — once per write_behind()
+        block, otherwise on every call — or None to read sidecars directly."""
+        if self._catalog is None or not self.descriptions_dir.is_dir():
+            return None
+        if self._catalog_fresh:
+            return self._catalog
+        try:
+            self._catalog.refresh()
+        except CatalogUnavailable:
+            self._catalog = None
+            return None
+        self._catalog_fresh = self._writer is not None
+        return self._catalog
 
     def get_item(self, image_name: str, subfolder: Optional[str] = None) -> Optional[WorkspaceItem]:
         p = self._sidecar_path(image_name, subfolder)
+        queued = self._writer.pending(p) if self._writer is not None else None
+        if queued is not None:
+            return WorkspaceItem.from_dict(copy.deepcopy(queued))
         if p.exists():
             return WorkspaceItem.from_dict(json.loads(p.read_text(encoding="utf-8")))
         if subfolder is None:
-            # Caller doesn't know the subfolder — scan recursively (e.g. GUI bridge lookup)
+            # Caller doesn't know the subfolder — look it up (e.g. GUI bridge lookup)
+            queued = self._writer.find(image_name) if self._writer is not None else None
+            if queued is not None:
+                return WorkspaceItem.from_dict(copy.deepcopy(queued))
+            catalog = self._catalog_ready()
+            if catalog is not None:
+                try:
+                    found = catalog.find(image_name)
+                    return WorkspaceItem.from_dict(found) if found else None
+                except CatalogUnavailable:
+                    self._catalog = None
+                except Exception:
+                    return None
             for p in self.descriptions_dir.glob(f"**/{image_name}.json"):
                 try:
                     return WorkspaceItem.from_dict(json.loads(p.read_text(encoding="utf-8")))
@@ -560,8 +829,15 @@ class Workspace:
         return None
 
     def items(self) -> list[WorkspaceItem]:
+        self.flush()
         if not self.descriptions_dir.is_dir():
             return []
+        catalog = self._catalog_ready()
+        if catalog is not None:
+            try:
+                return [i for i in map(_item_or_none, catalog.item_dicts()) if i is not None]
+            except CatalogUnavailable:
+                self._catalog = None
         out: list[WorkspaceItem] = []
         for p in sorted(self.descriptions_dir.glob("**/*.json")):
             try:
@@ -570,8 +846,30 @@ class Workspace:
                 continue
         return out
 
-    def image_path(self, item: WorkspaceItem) -> Path:
-        """Absolute path to the item's image (bundle copy or original reference)."""
+    def entries(self) -> list[CatalogEntry]:
+        """
+        The indexed columns of every item (image, subfolder, type, storage, source,
+        described, missing), in items() order — without loading descriptions.
+        Use this instead of items() when only those fields are needed.
+        """
+        self.flush()
+        catalog = self._catalog_ready()
+        if catalog is not None:
+            try:
+                return catalog.entries()
+            except CatalogUnavailable:
+                self._catalog = None
+        return [
+            CatalogEntry(
+                image=i.image, subfolder=i.subfolder, item_type=i.item_type,
+                storage=i.storage, source_path=i.source_path, described=i.described,
+                is_missing=i.is_missing, active_description_id=i.active_description_id,
+            )
+            for i in self.items()
+        ]
+
+    def image_path(self, item: WorkspaceItem | CatalogEntry) -> Path:
+        """Absolute path to the item's (or catalog entry's) image — bundle copy or original reference."""
         if item.storage == "reference" and item.source_path:
             return Path(item.source_path)
         return self._image_copy_path(item.image, item.subfolder)
@@ -608,8 +906,8 @@ class Workspace:
 
     # ----- status ----- #
     def status(self) -> dict:
-        all_items = self.media_items()
-        n_described = sum(1 for i in all_items if i.described)
+        all_items = [e for e in self.entries() if e.item_type != "video"]
+        n_described = sum(1 for e in all_items if e.described)
         return {
             "name": self.name,
             "path": str(self.path),
@@ -20,14 +20,6 @@ import platform
 import subprocess
 import logging
 
-# Import PIL for image processing (PNG to JPEG conversion)
-try:
-    from PIL import Image
-    import io
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
-
 # Add project root to sys.path for shared module imports
 # Works in both development mode (running script) and frozen mode (PyInstaller exe)
 if getattr(sys, 'frozen', False):
@@ -97,6 +89,13 @@ from idt_core.providers.claude import (
     get_claude_model_info,
     format_claude_model_for_display,
 )
+from idt_core.rate_limit import (
+    THROTTLE_STATUSES,
+    RateLimitInfo,
+    account_key,
+    limiter_for,
+    throttle_info,
+)
 
 # ---------------------------------------------------------------------------
 # Model listing for the GUI
@@ -187,6 +186,48 @@ def _shared_api_key(provider_name: str) -> Optional[str]:
         return None
 
 
+# One pooled session for every request to the Ollama endpoint. Bare
+# requests.post opens (and closes) a new connection per call; through a session
+# the batch worker's describe calls reuse keep-alive connections, which matters
+# most for cloud models, where each new connection is also a TLS handshake.
+# OllamaCloudProvider builds a fresh OllamaProvider per image, so the session
+# is module-level rather than per instance. requests' connection pool is
+# thread-safe; pool_maxsize covers the GUI's concurrent workers.
+_OLLAMA_SESSION = requests.Session()
+_OLLAMA_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+_OLLAMA_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+
+_MEDIA_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+}
+
+
+def _wire_image(image_path: str, provider_name: str, model: str) -> tuple:
+    """(base64 payload, media type) for one image, shaped for the provider.
+
+    Uses the provider's wire profile from idt_core.converter, so the GUI,
+    the chat window and `idt describe` upload the same bytes for the same
+    image. If the image cannot be shaped it is sent as read from disk --
+    the provider's own error is more useful than ours.
+    """
+    try:
+        from idt_core.converter import load_for_api, wire_profile_for
+        data, media_type = load_for_api(
+            Path(image_path), wire_profile_for(provider_name, model))
+    except Exception as exc:
+        logging.getLogger(__name__).warning(
+            f"Could not prepare {image_path} for {provider_name}: {exc} -- sending raw bytes"
+        )
+        with open(image_path, 'rb') as image_file:
+            data = image_file.read()
+        media_type = _MEDIA_TYPES.get(Path(image_path).suffix.lower(), 'image/jpeg')
+    return base64.b64encode(data).decode('utf-8'), media_type
+
+
 def sort_claude_models(models: List[str]) -> List[str]:
     """
     Sort Claude models by tier (haiku -> sonnet -> opus) then by version.
@@ -518,10 +559,49 @@ def raise_provider_error_from_exception(exc: BaseException, provider: str,
     ) from exc
 
 
+def _call_limiter(args, kwargs):
+    """The shared rate limiter for a decorated describe_image(self, image_path,
+    prompt, model) call, or None for anything else the decorator wraps."""
+    provider = args[0] if args else None
+    get_name = getattr(provider, "get_provider_name", None)
+    if not callable(get_name):
+        return None
+    model = kwargs.get("model", args[3] if len(args) > 3 else "")
+    try:
+        return limiter_for(get_name(), str(model or ""),
+                           account_key(getattr(provider, "api_key", None)))
+    except Exception:
+        return None
+
+
+def _result_throttle(result) -> Optional[RateLimitInfo]:
+    """A throttle described by a returned error string ("(status code: 429)")."""
+    if not isinstance(result, str):
+        return None
+    match = re.search(r"status code:\s*(\d{3})", result.lower())
+    if match and int(match.group(1)) in THROTTLE_STATUSES:
+        return RateLimitInfo()
+    return None
+
+
+def _exception_throttle(exc: BaseException) -> Optional[RateLimitInfo]:
+    """A throttle carried by an exception (or the SDK error it was raised from),
+    with any Retry-After its response held."""
+    info = throttle_info(exc)
+    if info is None and isinstance(exc, ProviderError) and exc.kind == ErrorKind.RATE_LIMIT:
+        info = RateLimitInfo()
+    return info
+
+
 def retry_on_api_error(max_retries=3, base_delay=1.0, max_delay=60.0, backoff_multiplier=2.0):
     """
     Retry decorator for API calls with exponential backoff.
 
+    On a provider's describe_image, every attempt also goes through the shared
+    idt_core.rate_limit limiter for that provider, model and API key. A 429/529
+    then pauses every worker on the account, not just this call: a throttled
+    attempt is retried after the limiter's cooldown instead of its own sleep.
+
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Initial delay between retries in seconds
@@ -532,38 +612,31 @@ def retry_on_api_error(max_retries=3, base_delay=1.0, max_delay=60.0, backoff_mu
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
-            
+            limiter = _call_limiter(args, kwargs)
+
+            def back_off(attempt, throttled, detail=""):
+                if throttled and limiter is not None:
+                    # The next acquire() waits out the shared cooldown.
+                    print(f"  [RETRY] Attempt {attempt + 1}/{max_retries + 1} rate limited{detail}, "
+                          f"pausing {limiter.pause_remaining():.1f}s for every request on this account...")
+                    return
+                delay = min(base_delay * (backoff_multiplier ** attempt), max_delay)
+                # Add jitter to prevent thundering herd
+                jitter = random.uniform(0.1, 0.5) * delay
+                sleep_time = delay + jitter
+
+                print(f"  [RETRY] Attempt {attempt + 1}/{max_retries + 1} failed{detail}, retrying in {sleep_time:.1f}s...")
+                time.sleep(sleep_time)
+
             for attempt in range(max_retries + 1):  # +1 for initial attempt
+                ticket = limiter.acquire() if limiter is not None else None
                 try:
                     result = func(*args, **kwargs)
-                    
-                    # Check if result indicates a retryable error.
-                    # Deliberately NOT gated on result.startswith("Error:") -- most
-                    # OpenAI/Claude failures come back as "Rate limit exceeded
-                    # (status code: 429) - ..." or "Server error from ... (status
-                    # code: 500) - ...", which never matched that prefix, so 5xx and
-                    # 429 from those providers silently skipped every retry.
-                    if isinstance(result, str) and _is_retryable_error(result):
-                        if attempt < max_retries:
-                            delay = min(base_delay * (backoff_multiplier ** attempt), max_delay)
-                            # Add jitter to prevent thundering herd
-                            jitter = random.uniform(0.1, 0.5) * delay
-                            sleep_time = delay + jitter
-
-                            print(f"  [RETRY] Attempt {attempt + 1}/{max_retries + 1} failed, retrying in {sleep_time:.1f}s...")
-                            time.sleep(sleep_time)
-                            continue
-                        else:
-                            print(f"  [RETRY] All {max_retries + 1} attempts failed")
-                            return result
-                    
-                    # Success or non-retryable error
-                    if attempt > 0:
-                        print(f"  [RETRY] Success on attempt {attempt + 1}")
-                    return result
-                    
                 except Exception as e:
                     last_exception = e
+                    throttle = _exception_throttle(e)
+                    if limiter is not None:
+                        limiter.release(ticket, throttle=throttle)
 
                     error_type = type(e).__name__
 
@@ -588,26 +661,44 @@ def retry_on_api_error(max_retries=3, base_delay=1.0, max_delay=60.0, backoff_mu
                             (isinstance(status, int)
                              and (status >= 500 or status == 429))
                         )
-                    
+
                     if is_retryable and attempt < max_retries:
-                        delay = min(base_delay * (backoff_multiplier ** attempt), max_delay)
-                        jitter = random.uniform(0.1, 0.5) * delay
-                        sleep_time = delay + jitter
-                        
-                        print(f"  [RETRY] Attempt {attempt + 1}/{max_retries + 1} failed ({error_type}), retrying in {sleep_time:.1f}s...")
-                        time.sleep(sleep_time)
+                        back_off(attempt, throttle is not None, f" ({error_type})")
                         continue
                     else:
                         # Non-retryable error or max retries reached
                         if attempt > 0:
                             print(f"  [RETRY] All {max_retries + 1} attempts failed")
                         raise e
-            
+
+                throttle = _result_throttle(result)
+                if limiter is not None:
+                    limiter.release(ticket, throttle=throttle)
+
+                # Check if result indicates a retryable error.
+                # Deliberately NOT gated on result.startswith("Error:") -- most
+                # OpenAI/Claude failures come back as "Rate limit exceeded
+                # (status code: 429) - ..." or "Server error from ... (status
+                # code: 500) - ...", which never matched that prefix, so 5xx and
+                # 429 from those providers silently skipped every retry.
+                if isinstance(result, str) and _is_retryable_error(result):
+                    if attempt < max_retries:
+                        back_off(attempt, throttle is not None)
+                        continue
+                    else:
+                        print(f"  [RETRY] All {max_retries + 1} attempts failed")
+                        return result
+
+                # Success or non-retryable error
+                if attempt > 0:
+                    print(f"  [RETRY] Success on attempt {attempt + 1}")
+                return result
+
             # This should not be reached, but just in case
             if last_exception:
                 raise last_exception
             return None
-            
+
         return wrapper
     return decorator
 
@@ -659,7 +750,7 @@ class OllamaProvider(AIProvider):
     def is_available(self) -> bool:
         """Check if Ollama is available"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = _OLLAMA_SESSION.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception:
             return False
@@ -678,7 +769,7 @@ class OllamaProvider(AIProvider):
             return sorted(self._models_cache)
             
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
+            response = _OLLAMA_SESSION.get(f"{self.base_url}/api/tags", timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 all_models = [model['name'] for model in data.get('models', [])]
@@ -707,7 +798,7 @@ class OllamaProvider(AIProvider):
         if cached is not None:
             return cached
         try:
-            resp = requests.post(f"{self.base_url}/api/show",
+            resp = _OLLAMA_SESSION.post(f"{self.base_url}/api/show",
                                  json={"model": name}, timeout=10)
             if resp.status_code != 200:
                 return True
@@ -727,9 +818,7 @@ class OllamaProvider(AIProvider):
     def describe_image(self, image_path: str, prompt: str, model: str) -> str:
         """Generate description using Ollama with automatic retry"""
         try:
-            # Read and encode image
-            with open(image_path, 'rb') as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            image_data, _media_type = _wire_image(image_path, "ollama", model)
             
             # Prepare request
             payload = {
@@ -740,7 +829,7 @@ class OllamaProvider(AIProvider):
             }
             
             # Make request
-            response = requests.post(
+            response = _OLLAMA_SESSION.post(
                 f"{self.base_url}/api/generate",
                 json=payload,
                 timeout=self.timeout
@@ -1009,48 +1098,9 @@ class OpenAIProvider(AIProvider):
             #   - gpt-4o-mini uses 2,833+5,667 tokens/tile (vs 85+170 for gpt-4o).
             #     Resizing a large image from ≥2048px to ≤1600px may reduce tile
             #     count from 9→4, saving ~28k tokens per image with that model.
-            image_data = None
-            file_ext = Path(image_path).suffix.lower()
-            
-            if HAS_PIL:
-                # Attempt PIL-based conversion/resize for every format
-                try:
-                    img = Image.open(image_path)
-                    
-                    # Flatten alpha / convert to RGB
-                    if img.mode in ('RGBA', 'LA', 'P'):
-                        background = Image.new('RGB', img.size, (255, 255, 255))
-                        if img.mode == 'P':
-                            img = img.convert('RGBA')
-                        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                        img = background
-                    elif img.mode != 'RGB':
-                        img = img.convert('RGB')
-                    
-                    # Resize to ≤1600px on the longest side.  At 1600×1200 a photo
-                    # maps to a 2×2 tile grid (4 tiles) under OpenAI's high-detail
-                    # algorithm, which is the minimum for most landscape photos.
-                    max_dim = 1600
-                    if max(img.size) > max_dim:
-                        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS)
-                    
-                    # Encode as JPEG
-                    buffer = io.BytesIO()
-                    img.save(buffer, format='JPEG', quality=85, optimize=True)
-                    image_data = base64.b64encode(buffer.getvalue()).decode('utf-8')
-                    
-                    logger = logging.getLogger(__name__)
-                    logger.info(f"Prepared image for OpenAI ({img.size[0]}×{img.size[1]} JPEG, ext={file_ext}): {image_path}")
-                except Exception as e:
-                    # PIL failed (unsupported format, corrupt file, etc.) – fall back to raw read
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"PIL image preparation failed for {image_path}: {e} — sending raw bytes")
-                    image_data = None
-            
-            # Fallback: read raw bytes (no PIL available, or PIL failed above)
-            if image_data is None:
-                with open(image_path, 'rb') as image_file:
-                    image_data = base64.b64encode(image_file.read()).decode('utf-8')
+            # That shape is the "openai" wire profile in idt_core.converter,
+            # shared with the chat window and `idt describe`.
+            image_data, media_type = _wire_image(image_path, "openai", model)
             
             # Use official SDK - handles retry logic, rate limits, and errors automatically
             # Build request parameters with optimized settings
@@ -1067,7 +1117,7 @@ class OpenAIProvider(AIProvider):
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": f"data:image/jpeg;base64,{image_data}"
+                                    "url": f"data:{media_type};base64,{image_data}"
                                 }
                             }
                         ]
@@ -1376,20 +1426,9 @@ class ClaudeProvider(AIProvider):
                 message="Claude API key not configured or SDK not installed")
         
         try:
-            # Read and encode image
-            with open(image_path, 'rb') as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
-            
-            # Determine media type from file extension
-            ext = Path(image_path).suffix.lower()
-            media_type_map = {
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.png': 'image/png',
-                '.gif': 'image/gif',
-                '.webp': 'image/webp'
-            }
-            media_type = media_type_map.get(ext, 'image/jpeg')
+            # Downscaled to what Claude looks at (1568px / ~1.15MP) and kept
+            # under its 5 MB per-image limit; small images go as-is.
+            image_data, media_type = _wire_image(image_path, "claude", model)
             
             # Use official SDK - handles retry logic, rate limits, and errors automatically
             message = self.client.messages.create(
@@ -1869,31 +1908,16 @@ class MLXProvider(AIProvider):
         The caller is responsible for unlinking the file when done.
         """
         try:
-            # Enable HEIC support when pillow-heif is available
-            try:
-                import pillow_heif
-                pillow_heif.register_heif_opener()
-            except ImportError:
-                pass
-
-            from PIL import Image as _PILImage
+            # ≤1024px JPEG at quality 85: the "mlx" wire profile.
+            from idt_core.converter import load_for_api, wire_profile_for
             import tempfile
 
-            max_dim = 1024
-            quality = 85
-
-            with _PILImage.open(image_path) as img:
-                img = img.convert("RGB")
-                w, h = img.size
-                if max(w, h) > max_dim:
-                    scale = max_dim / max(w, h)
-                    img = img.resize((int(w * scale), int(h * scale)), _PILImage.LANCZOS)
-                tmp = tempfile.NamedTemporaryFile(
-                    suffix=".jpg", delete=False, prefix="mlx_idt_"
-                )
-                img.save(tmp, format="JPEG", quality=quality)
-                tmp.close()
-                return tmp.name
+            data, _media_type = load_for_api(Path(image_path), wire_profile_for("mlx"))
+            with tempfile.NamedTemporaryFile(
+                suffix=".jpg", delete=False, prefix="mlx_idt_"
+            ) as tmp:
+                tmp.write(data)
+            return tmp.name
         except Exception as exc:
             print(f"  [MLX] JPEG conversion failed for {image_path}: {exc}")
             return None
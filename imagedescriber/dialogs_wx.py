@@ -57,6 +57,11 @@ except ImportError:
     # Fallback for direct execution
     from data_models import ImageDescription, ImageItem, ImageWorkspace
 
+try:
+    from idt_core.gazetteer import GazetteerNotFound, find_gazetteer
+except ImportError:
+    find_gazetteer = None
+
 try:
     from idt_core.config import DEFAULT_OLLAMA_MODEL
 except ImportError:
@@ -775,6 +780,9 @@ class ProcessingOptionsDialog(wx.Dialog):
         apply_btn = self.FindWindow(wx.ID_APPLY)
         if apply_btn is not None:
             apply_btn.Bind(wx.EVT_BUTTON, self.on_apply)
+        ok_btn = self.FindWindow(wx.ID_OK)
+        if ok_btn is not None:
+            ok_btn.Bind(wx.EVT_BUTTON, self.on_ok)
 
         self.SetSizer(main_sizer)
         
@@ -817,7 +825,7 @@ class ProcessingOptionsDialog(wx.Dialog):
 
         self.geocode_cb = wx.CheckBox(
             panel,
-            label="Ge&ocode GPS coordinates to city/state (requires internet)",
+            label="Ge&ocode GPS coordinates to city/state",
             name="Geocode GPS coordinates to city/state"
         )
         # Read from flat key first; fall back to the nested Configure Settings path.
@@ -825,11 +833,34 @@ class ProcessingOptionsDialog(wx.Dialog):
             self.config.get('metadata', {}).get('geocoding', {}).get('enabled', False)
         self.geocode_cb.SetValue(bool(_geocode_default))
         self.geocode_cb.SetToolTip(
-            "When an image has GPS coordinates, look up the city and state via OpenStreetMap "
-            "and include them in the AI prompt context. Results are cached locally."
+            "When an image has GPS coordinates, look up the city and state and include them "
+            "in the AI prompt context. Online lookups use OpenStreetMap and are cached locally."
         )
         context_sizer.Add(self.geocode_cb, 0, wx.ALL, 5)
 
+        # Where places are looked up. Offline uses the GeoNames gazetteer in
+        # ~/.idt/gazetteer (idt_core.gazetteer) — instant, and no network.
+        self._geocode_modes = [
+            ("online", "Online (OpenStreetMap, 1 photo per second)"),
+            ("offline", "Offline (local gazetteer, no internet)"),
+            ("refine", "Offline, refined online when available"),
+        ]
+        geocode_mode_label = wx.StaticText(panel, label="&Where places are looked up:")
+        context_sizer.Add(geocode_mode_label, 0, wx.LEFT | wx.RIGHT, 5)
+        self.geocode_mode_choice = wx.Choice(
+            panel, choices=[label for _, label in self._geocode_modes]
+        )
+        _modes = [mode for mode, _ in self._geocode_modes]
+        _mode = self.config.get('geocode_mode', 'online')
+        self.geocode_mode_choice.SetSelection(_modes.index(_mode) if _mode in _modes else 0)
+        set_accessible_name(self.geocode_mode_choice, "Geocoding source")
+        self.geocode_mode_choice.Enable(self.geocode_cb.GetValue())
+        self.geocode_cb.Bind(
+            wx.EVT_CHECKBOX,
+            lambda evt: self.geocode_mode_choice.Enable(self.geocode_cb.GetValue()),
+        )
+        context_sizer.Add(self.geocode_mode_choice, 0, wx.ALL | wx.EXPAND, 5)
+
         context_note = wx.StaticText(
             panel,
             label="Date and camera are always included when available — no internet needed."
@@ -1241,6 +1272,7 @@ class ProcessingOptionsDialog(wx.Dialog):
         return {
             'skip_existing': self.skip_existing_cb.GetValue(),
             'geocode_enabled': self.geocode_cb.GetValue(),
+            'geocode_mode': self._geocode_modes[max(0, self.geocode_mode_choice.GetSelection())][0],
             'embed_after_process': self.embed_after_process_cb.GetValue(),
             'copy_originals': self.copy_originals_cb.GetValue(),
             'provider': self.provider_choice.GetStringSelection().lower(),
@@ -1249,13 +1281,37 @@ class ProcessingOptionsDialog(wx.Dialog):
             'custom_prompt': self.custom_prompt_input.GetValue(),
         }
 
+    def _gazetteer_missing(self) -> bool:
+        """True (after telling the user) when an offline geocoding mode is
+        chosen but no gazetteer is installed -- the GUI counterpart of the
+        CLI's _require_gazetteer. Geocoding would otherwise do nothing."""
+        config = self.get_config()
+        if (not config['geocode_enabled'] or config['geocode_mode'] not in ("offline", "refine")
+                or find_gazetteer is None):
+            return False
+        try:
+            find_gazetteer()
+        except GazetteerNotFound as exc:
+            wx.MessageBox(
+                f"Offline geocoding needs the GeoNames gazetteer.\n\n{exc}\n\n"
+                "Install it, or choose Online.",
+                "Gazetteer Not Installed", wx.OK | wx.ICON_WARNING, self)
+            self.geocode_mode_choice.SetFocus()
+            return True
+        return False
+
+    def on_ok(self, event):
+        """Close with OK unless the chosen options cannot work."""
+        if not self._gazetteer_missing():
+            event.Skip()
+
     def on_apply(self, event):
         """Apply the current options without closing the dialog.
 
         Hands the current selections to the parent-supplied callback so they take
         effect immediately while the dialog stays open for further tweaking.
         """
-        if self._on_apply is None:
+        if self._on_apply is None or self._gazetteer_missing():
             return
         try:
             self._on_apply(self.get_config())
@@ -42,6 +42,11 @@ except ImportError:
 # Must be at module scope so all class methods can use it.
 logger = logging.getLogger(__name__)
 
+# batch_state key holding an `idt describe --batch-api` run's job ids
+# (idt_core.batch_api.STATE_KEY). Spelled out rather than imported so this
+# module still loads when idt_core is unavailable.
+_API_BATCH_KEY = "api_batch"
+
 # Add project root to path for shared module imports
 # Works in both development mode (running script) and frozen mode (PyInstaller exe)
 if getattr(sys, 'frozen', False):
@@ -104,12 +109,9 @@ try:
 except ImportError:
     cv2 = None
 
-# Video metadata and EXIF embedding (GPS extraction from video files via ffprobe)
-try:
-    from idt_core.video import VideoMetadataExtractor, ExifEmbedder
-except ImportError:
-    VideoMetadataExtractor = None
-    ExifEmbedder = None
+# Process-pool frame extraction shared with `idt video` (cv2 is imported
+# lazily; frames get the video's GPS/date EXIF via ffprobe when available).
+from idt_core.video import frame_dir_names, iter_extract_videos
 
 # The one definition of how a scanned file maps to a tree folder — shared with
 # the CLI so both tools group images identically. Imported at module scope: the
@@ -361,6 +363,17 @@ ProcessingProgressEvent, EVT_PROCESSING_PROGRESS = wx.lib.newevent.NewEvent()
 ProcessingErrorEvent, EVT_PROCESSING_ERROR = wx.lib.newevent.NewEvent()
 
 
+def _geocode_setting(options: dict):
+    """The workers' geocode argument for processing options: False or 'online'/'offline'/'refine'.
+
+    Batch state saved before geocode_mode existed has only geocode_enabled,
+    which meant online.
+    """
+    if not options.get('geocode_enabled'):
+        return False
+    return options.get('geocode_mode') or 'online'
+
+
 def _format_chat_name(provider: str, model: str, dt=None) -> str:
     """Return a display name for a new chat session.
 
@@ -878,6 +891,8 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
         """Merge key processing options back into self.config so they stick for the session."""
         if 'geocode_enabled' in options:
             self.config['geocode_enabled'] = options['geocode_enabled']
+        if 'geocode_mode' in options:
+            self.config['geocode_mode'] = options['geocode_mode']
         if 'copy_originals' in options:
             self.config['copy_originals'] = options['copy_originals']
 
@@ -967,202 +982,57 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
         # never ~/Downloads. Extraction callers ensure a bundle first.
         return get_default_workspaces_root() / "_scratch"
 
-    def _extract_video_frames_sync(self, video_path: str, extraction_config: dict) -> tuple:
-        """Extract frames from video synchronously (for auto-extraction in Process All).
+    def _extract_videos_sync(self, video_paths: list, extraction_config: dict) -> list:
+        """Extract frames from several videos at once (for auto-extraction in Process All).
 
-        Args:
-            video_path: Path to video file
-            extraction_config: Dict with extraction settings
+        Runs on idt_core's process pool — one video per core, or time segments
+        of a long video when there are fewer videos than cores — and reports
+        each finished video through _stage_progress. Call from a worker thread.
 
         Returns:
-            tuple: (list of extracted frame paths, video metadata dict)
+            list of (video path, extracted frame paths, video metadata dict) in
+            video_paths order; a video that failed has no frames.
         """
-        try:
-            import cv2
-        except ImportError:
-            raise Exception("OpenCV (cv2) not available. Please install opencv-python.")
-
-        cap = cv2.VideoCapture(video_path)
-        if not cap.isOpened():
-            raise Exception(f"Could not open video file: {video_path}")
-
-        # Get video properties
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        if fps <= 0:
-            # MPEG and some AVI containers report fps=0; fall back so
-            # downstream arithmetic doesn't divide by zero or produce a
-            # zero-frame range.
-            print("Warning: Video FPS not detected (reported 0); using 1.0 fps fallback")
-            fps = 1.0
-        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = frame_count / fps
-
-        video_metadata = {
-            'fps': fps,
-            'total_frames': frame_count,
-            'duration': duration
-        }
-
-        # Create output directory in workspace (NOT in source directory)
-        video_path_obj = Path(video_path)
-        extracted_frames_dir = self._derived_dir("frames")
-        video_dir = extracted_frames_dir / f"{video_path_obj.stem}"
-        video_dir.mkdir(parents=True, exist_ok=True)
-
-        # Clear any files from a previous extraction run so stale frames
-        # (e.g. from a different mode or a previous failed run) can never
-        # co-mingle with the current output.  Only jpg files are removed;
-        # the directory itself is preserved.
-        for _old in list(video_dir.glob("*.jpg")):
-            try:
-                _old.unlink()
-            except OSError:
-                pass
-
-        # Extract GPS/date metadata from the source video via ffprobe (if available).
-        # If ffprobe is absent or the video has no tags, this is a safe no-op and
-        # frame extraction continues exactly as before.
-        video_source_metadata = None
-        if VideoMetadataExtractor is not None:
-            try:
-                _vme = VideoMetadataExtractor()
-                if _vme.ffprobe_available:
-                    video_source_metadata = _vme.extract_metadata(video_path_obj)
-                    if video_source_metadata:
-                        logger.debug(f"Video metadata: GPS={('gps' in video_source_metadata)}, Date={('datetime' in video_source_metadata)}")
-                    else:
-                        logger.debug("No GPS/date metadata in video")
-                else:
-                    logger.debug("ffprobe unavailable; video frames will have no GPS EXIF")
-            except Exception as _e:
-                logger.debug(f"Video metadata extraction failed (non-fatal): {_e}")
-
-        extraction_mode = extraction_config.get("extraction_mode", "time_interval")
-        logger.debug(f"Extracting {Path(video_path).name}: mode={extraction_mode}, duration={duration:.1f}s, fps={fps:.2f}")
-
-        if extraction_mode == "scene_change":
-            extracted_paths = self._extract_by_scene_detection(cap, fps, video_dir, extraction_config, video_path_obj, video_source_metadata)
-        else:
-            extracted_paths = self._extract_by_time_interval(cap, fps, video_dir, extraction_config, video_path_obj, video_source_metadata)
-
-        cap.release()
-        return extracted_paths, video_metadata
-
-    def _extract_by_time_interval(self, cap, fps: float, video_dir: Path, extraction_config: dict, video_path_obj: Path, video_source_metadata: dict = None) -> list:
-        """Extract frames at time intervals"""
-        import cv2
-
-        interval_seconds = extraction_config.get("time_interval_seconds", 5)
-        start_time = extraction_config.get("start_time_seconds", 0)
-        end_time = extraction_config.get("end_time_seconds")
-
-        total_frames_in_video = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        frame_interval = max(1, int(fps * interval_seconds))  # Minimum 1 frame
-        start_frame = int(fps * start_time)
-
-        # Calculate end point (either user-specified or video end)
-        if end_time:
-            end_frame = int(fps * end_time)
-        else:
-            end_frame = total_frames_in_video
-
-        logger.debug(f"Extracting frames: interval={interval_seconds}s, frames {start_frame}-{end_frame}")
-        extracted_paths = []
-        frame_num = start_frame
-        extract_count = 0
-
-        while frame_num < end_frame:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            # Name frames by their timestamp in the video (e.g. Caddyshack_490.00s.jpg)
-            # so the filename tells you how many seconds in the frame was taken —
-            # matches the "Extract Video Frames" worker path.
-            frame_time = frame_num / fps if fps > 0 else 0.0
-            frame_filename = f"{video_path_obj.stem}_{frame_time:.2f}s.jpg"
-            frame_path = video_dir / frame_filename
-            cv2.imwrite(str(frame_path), frame)
-            if video_source_metadata and ExifEmbedder is not None:
+        frames_root = self._derived_dir("frames")
+        jobs = []
+        # Unique per video: two same-named videos must not share a folder
+        # while they extract at once.
+        names = frame_dir_names([Path(vp) for vp in video_paths])
+        for vp, name in zip(video_paths, names):
+            video_dir = frames_root / name
+            video_dir.mkdir(parents=True, exist_ok=True)
+            # Clear any files from a previous extraction run so stale frames
+            # (e.g. from a different mode or a previous failed run) can never
+            # co-mingle with the current output.  Only jpg files are removed;
+            # the directory itself is preserved.
+            for _old in list(video_dir.glob("*.jpg")):
                 try:
-                    ExifEmbedder().embed_metadata(
-                        frame_path, video_source_metadata,
-                        frame_time=frame_time,
-                        source_video_path=video_path_obj
-                    )
-                except Exception:
+                    _old.unlink()
+                except OSError:
                     pass
-            extracted_paths.append(str(frame_path))
-            extract_count += 1
-            frame_num += frame_interval
-
-        return extracted_paths
-
-    def _extract_by_scene_detection(self, cap, fps: float, video_dir: Path, extraction_config: dict, video_path_obj: Path, video_source_metadata: dict = None) -> list:
-        """Extract frames based on scene changes"""
-        import cv2
-        import numpy as np
-
-        threshold = extraction_config.get("scene_change_threshold", 30.0)  # 0-100 scale
-        min_duration = extraction_config.get("min_scene_duration_seconds", 1.0)
-        max_frames = extraction_config.get("max_frames_per_video", 50) or 50
-
-        print(f"Scene detection: threshold={threshold:.1f}%, min_duration={min_duration}s, max_frames={max_frames}")
-
-        extracted_paths = []
-        prev_frame = None
-        last_extract_frame = -1
-        # Guard: fps=1.0 fallback means min_frame_gap could be 1 actual frame;
-        # force >= 1 so we never compare two identical frames.
-        min_frame_gap = max(1, int(fps * min_duration)) if fps > 0 else 1
-        frame_num = 0
-        extract_count = 0
-
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
+            jobs.append((Path(vp), video_dir))
 
-            if extract_count >= max_frames:
-                print(f"Scene detection: reached max_frames cap ({max_frames})")
-                break
-
-            if prev_frame is not None:
-                gray_current = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                gray_prev = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-                diff = cv2.absdiff(gray_current, gray_prev)
-                # Percentage of changed pixels — matches the 0-100 threshold scale
-                change_score = (np.sum(diff > 30) / diff.size) * 100
-
-                if (change_score > threshold and
-                    frame_num - last_extract_frame >= min_frame_gap):
-
-                    # Save frame, tagging the filename with its timestamp so you
-                    # know how far into the video each scene change occurred.
-                    frame_time = frame_num / fps if fps > 0 else 0.0
-                    frame_filename = f"{video_path_obj.stem}_scene_{extract_count:04d}_{frame_time:.2f}s.jpg"
-                    frame_path = video_dir / frame_filename
-                    cv2.imwrite(str(frame_path), frame)
-                    # Embed video GPS/date into frame EXIF if metadata is available
-                    if video_source_metadata and ExifEmbedder is not None:
-                        try:
-                            ExifEmbedder().embed_metadata(
-                                frame_path, video_source_metadata,
-                                frame_time=frame_time,
-                                source_video_path=video_path_obj
-                            )
-                        except Exception as _ee:
-                            print(f"EXIF embed failed for {frame_filename} (non-fatal): {_ee}")
-                    extracted_paths.append(str(frame_path))
-
-                    last_extract_frame = frame_num
-                    extract_count += 1
-
-            prev_frame = frame.copy()
-            frame_num += 1
-
-        return extracted_paths
+        results = [(vp, [], {}) for vp in video_paths]
+        options = VideoProcessingWorker.options_from_config(extraction_config)
+        try:
+            for done, (index, result) in enumerate(iter_extract_videos(jobs, options), start=1):
+                vp = video_paths[index]
+                if result.error:
+                    logger.warning(f"Frame extraction failed for {Path(vp).name}: {result.error}")
+                else:
+                    logger.info(f"Extracted {len(result.frame_paths)} frame(s) from {Path(vp).name}")
+                    meta = {
+                        'fps': result.fps,
+                        'total_frames': round(result.duration_seconds * result.fps),
+                        'duration': result.duration_seconds,
+                    }
+                    results[index] = (vp, [str(p) for p in result.frame_paths], meta)
+                # Report after each video — extraction of a single long video
+                # can take minutes, so this is the only feedback available.
+                self._stage_progress(done, len(video_paths), Path(vp).name)
+        except ImportError as exc:
+            logger.warning(f"Frame extraction unavailable: {exc}")
+        return results
 
     def init_ui(self):
         """Initialize the user interface with dual mode support"""
@@ -3525,7 +3395,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             options.get('custom_prompt', ''),
             None,  # prompt_config_path
             api_key,
-            geocode=options.get('geocode_enabled', False),
+            geocode=_geocode_setting(options),
         )
 
         # Mark as processing with provider/model info
@@ -3544,7 +3414,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
         self.SetStatusText(f"Processing: {Path(image_item.file_path).name}...", 0)
 
     def autostart_batch(self, provider=None, model=None, prompt=None,
-                        geocode=False, copy_originals=None):
+                        geocode=False, copy_originals=None, geocode_mode=None):
         """Kick off a batch with preset options (no dialogs) — the CLI --showgui hand-off.
 
         Builds an options dict equivalent to what ProcessingOptionsDialog returns,
@@ -3554,9 +3424,12 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
         if copy_originals is not None:
             self.config['copy_originals'] = bool(copy_originals)
         self.config['geocode_enabled'] = bool(geocode)
+        if geocode_mode:
+            self.config['geocode_mode'] = geocode_mode
         options = {
             'skip_existing': True,
             'geocode_enabled': bool(geocode),
+            'geocode_mode': self.config.get('geocode_mode', 'online'),
             'embed_after_process': False,
             'copy_originals': self.config.get('copy_originals', False),
             'provider': (provider or self.config.get('default_provider', 'ollama')).lower(),
@@ -3767,19 +3640,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             logger.info(f"Starting sync video extraction: {len(videos_to_extract)} videos")
 
             def _do_all_extractions():
-                results = []
-                total_vids = len(videos_to_extract)
-                for idx, vp in enumerate(videos_to_extract, start=1):
-                    try:
-                        frames, meta = self._extract_video_frames_sync(vp, extraction_config)
-                        logger.info(f"Extracted {len(frames)} frame(s) from {Path(vp).name}")
-                        results.append((vp, frames, meta or {}))
-                    except Exception as exc:
-                        logger.warning(f"Frame extraction failed for {Path(vp).name}: {exc}")
-                        results.append((vp, [], {}))
-                    # Report after each video — extraction of a single long video
-                    # can take minutes, so this is the only feedback available.
-                    self._stage_progress(idx, total_vids, Path(vp).name)
+                results = self._extract_videos_sync(videos_to_extract, extraction_config)
                 wx.CallAfter(_after_extraction, results)
 
             def _after_extraction(results):
@@ -3964,17 +3825,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             logger.info(f"Folder batch: starting sync video extraction: {len(videos_to_extract)} videos")
 
             def _do_all_extractions():
-                results = []
-                total_vids = len(videos_to_extract)
-                for idx, vp in enumerate(videos_to_extract, start=1):
-                    try:
-                        frames, meta = self._extract_video_frames_sync(vp, extraction_config)
-                        logger.info(f"Extracted {len(frames)} frame(s) from {Path(vp).name}")
-                        results.append((vp, frames, meta or {}))
-                    except Exception as exc:
-                        logger.warning(f"Frame extraction failed for {Path(vp).name}: {exc}")
-                        results.append((vp, [], {}))
-                    self._stage_progress(idx, total_vids, Path(vp).name)
+                results = self._extract_videos_sync(videos_to_extract, extraction_config)
                 wx.CallAfter(_after_extraction, results)
 
             def _after_extraction(results):
@@ -4172,15 +4023,16 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
                 queue_position += 1
 
         # Store batch parameters
-        self.workspace.batch_state = {
+        self._set_batch_state({
             "provider": options['provider'],
             "model": options['model'],
             "prompt_style": options.get('prompt_style', 'default'),
             "custom_prompt": options.get('custom_prompt'),
             "geocode_enabled": options.get('geocode_enabled', False),
+            "geocode_mode": options.get('geocode_mode', 'online'),
             "total_queued": len(to_process),
             "started": datetime.now().isoformat()
-        }
+        })
 
         # Calculate progress offset (number of videos already extracted)
         progress_offset = len(self._videos_to_extract) if hasattr(self, '_videos_to_extract') else 0
@@ -4210,7 +4062,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             None,  # prompt_config_path
             skip_existing,
             progress_offset=progress_offset,
-            geocode=options.get('geocode_enabled', False),
+            geocode=_geocode_setting(options),
             logs_dir=self._workspace_logs_dir(),
             video_preamble=video_preamble,
         )
@@ -4468,15 +4320,16 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
                 it.batch_queue_position = i
 
         # Store batch_state so resume works
-        self.workspace.batch_state = {
+        self._set_batch_state({
             "provider": options['provider'],
             "model": options['model'],
             "prompt_style": options.get('prompt_style', 'default'),
             "custom_prompt": options.get('custom_prompt'),
             "geocode_enabled": options.get('geocode_enabled', False),
+            "geocode_mode": options.get('geocode_mode', 'online'),
             "total_queued": len(to_process),
             "started": datetime.now().isoformat(),
-        }
+        })
 
         self.batch_worker = BatchProcessingWorker(
             self,
@@ -4488,7 +4341,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             None,  # prompt_config_path
             skip_existing,
             progress_offset=0,
-            geocode=options.get('geocode_enabled', False),
+            geocode=_geocode_setting(options),
             logs_dir=self._workspace_logs_dir(),
             video_preamble=video_preamble,
         )
@@ -4726,38 +4579,40 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             return
         try:
             ws = Workspace.open(Path(self.workspace_file))
-            for file_path, item in self.workspace.items.items():
-                if item.item_type not in ("video", "extracted_frame"):
-                    continue
-                p = Path(file_path)
-                existing = ws.get_item(p.name)
-                ef = getattr(item, 'extracted_frames', None) or []
-                descs = [_gui_desc_to_ws(d.to_dict()) for d in item.descriptions]
-                if existing is not None:
-                    existing.item_type = item.item_type
-                    existing.parent_video = getattr(item, 'parent_video', None)
-                    existing.descriptions = descs
-                    if descs:
-                        existing.active_description_id = descs[-1].id
-                    if ef:
-                        existing.extra['extracted_frames'] = ef
-                    ws.save_item(existing)
-                else:
-                    wi = WorkspaceItem(
-                        image=p.name,
-                        source_path=str(p),
-                        storage="reference" if item.item_type == "video" else "copy",
-                        item_type=item.item_type,
-                        subfolder=getattr(item, 'subfolder', None),
-                    )
-                    wi.parent_video = getattr(item, 'parent_video', None)
-                    wi.is_missing = getattr(item, 'is_missing', False) or not p.exists()
-                    wi.descriptions = descs
-                    if descs:
-                        wi.active_description_id = descs[-1].id
-                    if ef:
-                        wi.extra['extracted_frames'] = ef
-                    ws.save_item(wi)
+            # One catalog refresh and batched writes for the whole loop.
+            with ws.write_behind():
+                for file_path, item in self.workspace.items.items():
+                    if item.item_type not in ("video", "extracted_frame"):
+                        continue
+                    p = Path(file_path)
+                    existing = ws.get_item(p.name)
+                    ef = getattr(item, 'extracted_frames', None) or []
+                    descs = [_gui_desc_to_ws(d.to_dict()) for d in item.descriptions]
+                    if existing is not None:
+                        existing.item_type = item.item_type
+                        existing.parent_video = getattr(item, 'parent_video', None)
+                        existing.descriptions = descs
+                        if descs:
+                            existing.active_description_id = descs[-1].id
+                        if ef:
+                            existing.extra['extracted_frames'] = ef
+                        ws.save_item(existing)
+                    else:
+                        wi = WorkspaceItem(
+                            image=p.name,
+                            source_path=str(p),
+                            storage="reference" if item.item_type == "video" else "copy",
+                            item_type=item.item_type,
+                            subfolder=getattr(item, 'subfolder', None),
+                        )
+                        wi.parent_video = getattr(item, 'parent_video', None)
+                        wi.is_missing = getattr(item, 'is_missing', False) or not p.exists()
+                        wi.descriptions = descs
+                        if descs:
+                            wi.active_description_id = descs[-1].id
+                        if ef:
+                            wi.extra['extracted_frames'] = ef
+                        ws.save_item(wi)
             logger.info("Persisted extracted frame items to bundle")
         except Exception as exc:
             logger.warning(f"Could not persist frames to bundle: {exc}")
@@ -4849,53 +4704,55 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             gui_items = ((ws_dict if ws_dict is not None
                           else self.workspace.to_dict()).get("items") or {})
             total_items = len(gui_items)
-            for done, (file_path, gui_item) in enumerate(gui_items.items(), start=1):
-                if str(file_path).startswith("chat:"):
+            # Only items whose sidecar content changed are rewritten, in batches.
+            with ws.write_behind():
+                for done, (file_path, gui_item) in enumerate(gui_items.items(), start=1):
+                    if str(file_path).startswith("chat:"):
+                        if progress:
+                            progress(done, total_items, str(file_path))
+                        continue
+                    p = Path(file_path)
+                    existing = ws.get_item(p.name)
+                    extra = {k: v for k, v in gui_item.items() if k not in {
+                        "file_path", "item_type", "descriptions", "subfolder",
+                        "parent_video", "video_metadata", "download_url",
+                        "download_timestamp", "alt_text", "exif_datetime",
+                        "file_mtime", "is_missing",
+                    }}
+                    descs = [_gui_desc_to_ws(d) for d in gui_item.get("descriptions", [])]
+
+                    if existing is not None:
+                        existing.item_type = gui_item.get("item_type", existing.item_type)
+                        existing.parent_video = gui_item.get("parent_video", existing.parent_video)
+                        existing.descriptions = descs
+                        if existing.descriptions:
+                            existing.active_description_id = existing.descriptions[-1].id
+                        existing.is_missing = gui_item.get("is_missing", False)
+                        existing.extra.update(extra)
+                    else:
+                        wi = WorkspaceItem(
+                            image=p.name,
+                            source_path=str(p),
+                            storage="reference",
+                            subfolder=gui_item.get("subfolder"),
+                        )
+                        wi.item_type = gui_item.get("item_type", "image")
+                        wi.download_url = gui_item.get("download_url")
+                        wi.download_timestamp = gui_item.get("download_timestamp")
+                        wi.alt_text = gui_item.get("alt_text")
+                        wi.exif_datetime = gui_item.get("exif_datetime")
+                        wi.file_mtime = gui_item.get("file_mtime")
+                        wi.is_missing = gui_item.get("is_missing", False) or not p.exists()
+                        wi.descriptions = descs
+                        if wi.descriptions:
+                            wi.active_description_id = wi.descriptions[-1].id
+                        wi.extra = extra
+                        existing = wi
+
+                    ws.save_item(existing)
+
                     if progress:
-                        progress(done, total_items, str(file_path))
-                    continue
-                p = Path(file_path)
-                existing = ws.get_item(p.name)
-                extra = {k: v for k, v in gui_item.items() if k not in {
-                    "file_path", "item_type", "descriptions", "subfolder",
-                    "parent_video", "video_metadata", "download_url",
-                    "download_timestamp", "alt_text", "exif_datetime",
-                    "file_mtime", "is_missing",
-                }}
-                descs = [_gui_desc_to_ws(d) for d in gui_item.get("descriptions", [])]
-
-                if existing is not None:
-                    existing.item_type = gui_item.get("item_type", existing.item_type)
-                    existing.parent_video = gui_item.get("parent_video", existing.parent_video)
-                    existing.descriptions = descs
-                    if existing.descriptions:
-                        existing.active_description_id = existing.descriptions[-1].id
-                    existing.is_missing = gui_item.get("is_missing", False)
-                    existing.extra.update(extra)
-                else:
-                    wi = WorkspaceItem(
-                        image=p.name,
-                        source_path=str(p),
-                        storage="reference",
-                        subfolder=gui_item.get("subfolder"),
-                    )
-                    wi.item_type = gui_item.get("item_type", "image")
-                    wi.download_url = gui_item.get("download_url")
-                    wi.download_timestamp = gui_item.get("download_timestamp")
-                    wi.alt_text = gui_item.get("alt_text")
-                    wi.exif_datetime = gui_item.get("exif_datetime")
-                    wi.file_mtime = gui_item.get("file_mtime")
-                    wi.is_missing = gui_item.get("is_missing", False) or not p.exists()
-                    wi.descriptions = descs
-                    if wi.descriptions:
-                        wi.active_description_id = wi.descriptions[-1].id
-                    wi.extra = extra
-                    existing = wi
-
-                ws.save_item(existing)
-
-                if progress:
-                    progress(done, total_items, p.name)
+                        progress(done, total_items, p.name)
 
             self.workspace.saved = True
             _ui(self.clear_modified)
@@ -6157,7 +6014,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
 
         # Phase 3: Clear batch state on successful completion
         if self.workspace.batch_state:
-            self.workspace.batch_state = None
+            self._set_batch_state(None)
 
             # Reset item states (leave completed/failed as-is for history)
             for item in self.workspace.items.values():
@@ -6708,7 +6565,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
         self.batch_worker.stop()
 
         # Clear batch state (won't resume automatically)
-        self.workspace.batch_state = None
+        self._set_batch_state(None)
 
         # Reset item states (leave completed/failed as-is)
         for item in self.workspace.items.values():
@@ -6748,6 +6605,19 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
         self.refresh_image_list()
         self.image_list.SetFocus()
 
+    def _set_batch_state(self, state):
+        """Replace the GUI's batch state (None clears it).
+
+        A vendor batch run submitted by `idt describe --batch-api` keeps its job
+        ids in the same manifest field, under _API_BATCH_KEY. Those ids are the
+        only way to collect results that are already paid for, so starting,
+        finishing or abandoning a GUI batch never drops them.
+        """
+        api_run = (self.workspace.batch_state or {}).get(_API_BATCH_KEY)
+        if api_run:
+            state = dict(state or {}, **{_API_BATCH_KEY: api_run})
+        self.workspace.batch_state = state or None
+
     # Phase 4: Resume functionality
     def prompt_resume_batch(self):
         """Show dialog to resume interrupted batch"""
@@ -6761,7 +6631,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
 
         if not pending_items:
             # No items to resume - clear stale batch state
-            self.workspace.batch_state = None
+            self._set_batch_state(None)
             return
 
         total = batch_state.get('total_queued', len(pending_items))
@@ -6782,7 +6652,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             self.resume_batch_processing()
         else:
             # User declined - clear batch state
-            self.workspace.batch_state = None
+            self._set_batch_state(None)
             for item in self.workspace.items.values():
                 if item.processing_state in ["pending", "paused"]:
                     item.processing_state = None
@@ -6811,7 +6681,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
 
         if not file_paths:
             show_info(self, "No images to resume processing.")
-            self.workspace.batch_state = None
+            self._set_batch_state(None)
             return
 
         # Recreate processing options from batch state
@@ -6839,7 +6709,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             custom_prompt=custom_prompt,
             prompt_config_path=str(prompt_config_path) if prompt_config_path else None,
             skip_existing=True,  # Always skip completed
-            geocode=batch_state.get('geocode_enabled', False),
+            geocode=_geocode_setting(batch_state),
             logs_dir=self._workspace_logs_dir(),
         )
         self.batch_worker.start()
@@ -7065,14 +6935,14 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
                 img_item.batch_queue_position = i
 
         # Create batch state
-        self.workspace.batch_state = {
+        self._set_batch_state({
             "provider": options['provider'],
             "model": options['model'],
             "prompt_style": options['prompt_style'],
             "custom_prompt": options.get('custom_prompt'),
             "total_queued": len(image_paths),
             "started": datetime.now().isoformat()
-        }
+        })
 
         # Prepare images for processing
         to_process = []
@@ -7109,7 +6979,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             None,  # prompt_config_path
             options.get('skip_existing', True),
             progress_offset=0,
-            geocode=options.get('geocode_enabled', False),
+            geocode=_geocode_setting(options),
             logs_dir=self._workspace_logs_dir(),
         )
         self.batch_worker.start()
@@ -7162,14 +7032,14 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
                 frame_item.batch_queue_position = i
 
         # Create batch state
-        self.workspace.batch_state = {
+        self._set_batch_state({
             "provider": options['provider'],
             "model": options['model'],
             "prompt_style": options.get('prompt_style', 'default'),
             "custom_prompt": options.get('custom_prompt'),
             "total_queued": len(frame_paths),
             "started": datetime.now().isoformat()
-        }
+        })
 
         # Start batch worker
         self.batch_worker = BatchProcessingWorker(
@@ -7181,7 +7051,7 @@ class ImageDescriberFrame(wx.Frame, ModifiedStateMixin):
             custom_prompt=options.get('custom_prompt'),
             prompt_config_path=str(prompt_config_path) if prompt_config_path else None,
             skip_existing=True,
-            geocode=options.get('geocode_enabled', False),
+            geocode=_geocode_setting(options),
             logs_dir=self._workspace_logs_dir(),
         )
         self.batch_worker.start()
@@ -9103,6 +8973,8 @@ def main():
     parser.add_argument('--model', help="Model name for --autostart")
     parser.add_argument('--prompt', help="Prompt name for --autostart")
     parser.add_argument('--geocode', action='store_true', help="Enable GPS geocoding for --autostart")
+    parser.add_argument('--geocoder', choices=['online', 'offline', 'refine'],
+                        help="Geocoding source for --autostart (default online)")
     parser.add_argument('--copy-originals', dest='copy_originals', action='store_true', default=None,
                         help="Copy originals into the workspace for --autostart")
     parser.add_argument('--no-copy-originals', dest='copy_originals', action='store_false',
@@ -9211,8 +9083,9 @@ def main():
                 provider=args.provider,
                 model=args.model,
                 prompt=args.prompt,
-                geocode=args.geocode,
+                geocode=args.geocode or bool(args.geocoder),
                 copy_originals=args.copy_originals,
+                geocode_mode=args.geocoder,
             ))
 
     frame.Show()
@@ -9221,6 +9094,10 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen builds re-launch this executable for process-pool workers
+    # (MetadataExtractor.extract_many); this returns at once otherwise.
+    import multiprocessing
+    multiprocessing.freeze_support()
     try:
         main()
     except Exception as e:
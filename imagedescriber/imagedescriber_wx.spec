@@ -92,11 +92,22 @@ a = Analysis(
         'idt_core.project',
         'idt_core.image_item',
         'idt_core.workspace',
+        'idt_core.catalog',
+        'idt_core.payload_cache',
+        'idt_core.rate_limit',
+        'idt_core.batch_api',
         'idt_core.logger',
         'idt_core.gui_bridge',
         'idt_core.pipeline',
         'idt_core.scanner',
         'idt_core.metadata',
+        'idt_core.exif_reader',
+        'idt_core.metadata_cache',
+        'idt_core.download_cache',
+        'idt_core.file_copy',
+        'idt_core.web_images',
+        'idt_core.gazetteer',
+        'idt_core.scan_snapshot',
         'idt_core.embedder',
         'idt_core.exporter',
         'idt_core.config',
@@ -7,6 +7,7 @@ Uses wx.lib.newevent for thread-to-GUI communication.
 """
 
 import sys
+import copy
 import threading
 import time
 import json
@@ -14,7 +15,7 @@ import tempfile
 import logging
 import traceback
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from datetime import datetime
 
 # Logger instance - configuration is done in imagedescriber_wx.py main()
@@ -51,6 +52,23 @@ try:
 except ImportError:
     WebImageDownloader = None
 
+try:
+    from idt_core.converter import WireProfile
+    from idt_core.payload_cache import shared_cache
+    # What ProcessingWorker has always sent: HEIC as a ≤2048px JPEG, anything
+    # else as-is unless it is over 3.75 MB (Claude's 5 MB limit less base64
+    # overhead). Prepared once per image and kept in ~/.idt/cache/payloads.
+    _HEIC_PROFILE = WireProfile(max_edge=2048, quality=85, passthrough=False)
+    _UPLOAD_PROFILE = WireProfile(max_bytes=int(3.75 * 1024 * 1024), quality=85)
+except ImportError:
+    shared_cache = None
+    _HEIC_PROFILE = _UPLOAD_PROFILE = None
+
+try:
+    from idt_core.rate_limit import account_key, limiter_for
+except ImportError:
+    account_key = limiter_for = None
+
 # Import AI providers
 try:
     from .ai_providers import get_available_providers, get_all_providers
@@ -70,13 +88,22 @@ except ImportError:
     from imagedescriber.ai_providers import is_provider_error   # dev mode
 
 try:
-    from idt_core.metadata import MetadataExtractor, NominatimGeocoder
+    from idt_core.metadata import MetadataExtractor, NominatimGeocoder, make_geocoder
 except ImportError:
     MetadataExtractor = None
     NominatimGeocoder = None
+    make_geocoder = None
 
 _IDTCoreMetadataExtractor = MetadataExtractor
-_IDTCoreNominatimGeocoder = NominatimGeocoder
+
+try:
+    from idt_core.metadata_cache import cache_for as metadata_cache_for
+except ImportError:
+    metadata_cache_for = None
+
+# The one directory walker (os.scandir, streaming). Stdlib only, so no fallback.
+from idt_core.scanner import PARALLEL_SCAN_WORKERS, iter_media
+from idt_core.scan_snapshot import ScanSnapshot, snapshot_path
 
 try:
     from idt_core.video import VideoMetadataExtractor, ExifEmbedder
@@ -84,6 +111,12 @@ except ImportError:
     VideoMetadataExtractor = None
     ExifEmbedder = None
 
+# Scene scoring and the process-pool extractor shared with `idt video`
+# (numpy/cv2 are imported lazily).
+from idt_core.video import (
+    SCENE_SAMPLE_SECONDS, SceneDetector, VideoExtractionOptions, extract_videos,
+)
+
 # Create custom event types for thread communication
 ProgressUpdateEvent, EVT_PROGRESS_UPDATE = wx.lib.newevent.NewEvent()
 ProcessingCompleteEvent, EVT_PROCESSING_COMPLETE = wx.lib.newevent.NewEvent()
@@ -235,7 +268,9 @@ class ProcessingWorker(threading.Thread):
                  prompt_style: str, custom_prompt: str = "",
                  prompt_config_path: Optional[str] = None,
                  api_key: Optional[str] = None,
-                 geocode: bool = False):
+                 geocode: Union[bool, str] = False,
+                 prompt_text: Optional[str] = None,
+                 provider_instance=None):
         """Initialize worker
 
         Args:
@@ -247,7 +282,12 @@ class ProcessingWorker(threading.Thread):
             custom_prompt: Custom prompt text (overrides prompt_style)
             prompt_config_path: Optional path to prompt config file
             api_key: Optional API key for cloud providers
-            geocode: Whether to reverse-geocode GPS coordinates (requires internet)
+            geocode: Reverse-geocode GPS coordinates: False, or True/'online',
+                'offline' (local gazetteer) or 'refine' (see idt_core.metadata.GEOCODE_MODES)
+            prompt_text: Prompt already resolved from the config (skips loading it)
+            provider_instance: Provider already resolved and keyed (skips the
+                lookup and reload_api_key) -- BatchProcessingWorker's pool
+                passes both, resolved once per batch
         """
         super().__init__(daemon=True)
         self.parent_window = parent_window
@@ -264,7 +304,15 @@ class ProcessingWorker(threading.Thread):
         except Exception:
             self._prompt_config_path = None
 
-        # Result attributes read by BatchProcessingWorker after join()
+        self._prompt_text = prompt_text
+        self._provider_instance = provider_instance
+        # EXIF is cached in the open bundle (or per user for an unsaved
+        # workspace), so _extract_metadata and _inject_exif_context read the
+        # file once between them -- and not at all on a redescribe.
+        bundle = getattr(parent_window, "workspace_file", None)
+        self._metadata_bundle = Path(bundle) if bundle else None
+
+        # Result attributes read by BatchProcessingWorker after process()
         self.result_ok = False
         self.result_input_tokens = 0
         self.result_output_tokens = 0
@@ -272,24 +320,17 @@ class ProcessingWorker(threading.Thread):
 
     def run(self):
         """Execute processing in background thread"""
+        self.process()
+
+    def process(self):
+        """Describe self.file_path and post the outcome.
+
+        Runs on this worker's own thread (run) or, for a batch, on one of
+        BatchProcessingWorker's pool threads -- the Thread is never started then.
+        """
         try:
-            # Load prompt configuration
-            config = self._load_prompt_config()
-            
-            # Get the actual prompt text
-            if self.custom_prompt:
-                prompt_text = self.custom_prompt
-            else:
-                # Check for both prompt_variations and prompts
-                prompt_data = config.get("prompt_variations", config.get("prompts", {}))
-                if self.prompt_style in prompt_data:
-                    if isinstance(prompt_data[self.prompt_style], dict):
-                        prompt_text = prompt_data[self.prompt_style].get("text", "Describe this image.")
-                    else:
-                        prompt_text = prompt_data[self.prompt_style]
-                else:
-                    prompt_text = "Describe this image."
-            
+            prompt_text = self._prompt_text or self.resolve_prompt_text()
+
             # Emit progress
             self._post_progress(f"Processing with {self.provider} {self.model}...")
 
@@ -364,7 +405,20 @@ class ProcessingWorker(threading.Thread):
         """Post progress update to parent window"""
         evt = ProgressUpdateEventData(file_path=self.file_path, message=message)
         wx.PostEvent(self.parent_window, evt)
-    
+
+    def resolve_prompt_text(self) -> str:
+        """The prompt to send: custom_prompt, else prompt_style from the config."""
+        if self.custom_prompt:
+            return self.custom_prompt
+        config = self._load_prompt_config()
+        # Check for both prompt_variations and prompts
+        prompt_data = config.get("prompt_variations", config.get("prompts", {}))
+        if self.prompt_style in prompt_data:
+            if isinstance(prompt_data[self.prompt_style], dict):
+                return prompt_data[self.prompt_style].get("text", "Describe this image.")
+            return prompt_data[self.prompt_style]
+        return "Describe this image."
+
     def _load_prompt_config(self) -> dict:
         """Load prompt configuration
         
@@ -445,27 +499,15 @@ class ProcessingWorker(threading.Thread):
     
     # Class-level provider cache for single-image mode (reduces initialization overhead)
     _provider_cache = {}
-    _cache_lock = None  # Will be initialized on first use
-    
-    def _process_with_ai(self, image_path: str, prompt: str, api_key: Optional[str] = None) -> tuple:
-        """Process image with selected AI provider
-        
-        Args:
-            image_path: Path to image file
-            prompt: Prompt text
-            api_key: Optional API key for cloud providers (overrides provider's default)
-            
-        Returns:
-            Tuple of (description_text, provider_instance) for token usage tracking
-        """
-        if not get_available_providers:
-            raise Exception("AI providers module not available")
-        
+    _cache_lock = threading.Lock()
+
+    def resolve_provider(self, api_key: Optional[str] = None):
+        """The provider instance for self.provider, keyed and ready to call."""
         # Use cached provider if available (reduces connection overhead for single-image mode)
         cache_key = f"{self.provider}_{self.model}_{api_key or ''}"
-        if cache_key in ProcessingWorker._provider_cache:
-            provider = ProcessingWorker._provider_cache[cache_key]
-        else:
+        with ProcessingWorker._cache_lock:
+            provider = ProcessingWorker._provider_cache.get(cache_key)
+        if provider is None:
             # Use get_all_providers() so we can find cloud providers (OpenAI, Claude)
             # even when the module-level singleton was initialised before a key was
             # configured (e.g. IDT_CONFIG_DIR points to a config with no API key).
@@ -479,10 +521,11 @@ class ProcessingWorker(threading.Thread):
                 provider = providers[self.provider]
             else:
                 raise Exception(f"Provider '{self.provider}' not available")
-            
+
             # Cache for future use (improves single-image performance)
-            ProcessingWorker._provider_cache[cache_key] = provider
-        
+            with ProcessingWorker._cache_lock:
+                ProcessingWorker._provider_cache[cache_key] = provider
+
         # Inject API key BEFORE availability check so providers initialised
         # without a key (module-level singleton created before a key was saved,
         # or IDT_CONFIG_DIR pointing to a keyless config) work correctly.
@@ -497,7 +540,27 @@ class ProcessingWorker(threading.Thread):
             provider.reload_api_key(explicit_key=api_key or None)
         elif api_key and hasattr(provider, 'api_key'):
             provider.api_key = api_key
+        return provider
+
+    def _process_with_ai(self, image_path: str, prompt: str, api_key: Optional[str] = None) -> tuple:
+        """Process image with selected AI provider
         
+        Args:
+            image_path: Path to image file
+            prompt: Prompt text
+            api_key: Optional API key for cloud providers (overrides provider's default)
+            
+        Returns:
+            Tuple of (description_text, provider_instance) for token usage tracking
+        """
+        if not get_available_providers:
+            raise Exception("AI providers module not available")
+
+        if self._provider_instance is not None:
+            provider = self._provider_instance
+        else:
+            provider = self.resolve_provider(api_key)
+
         try:
             # Check if it's a HEIC file and convert if needed
             path_obj = Path(image_path)
@@ -508,30 +571,35 @@ class ProcessingWorker(threading.Thread):
                 else:
                     raise Exception("Failed to convert HEIC file")
             
-            # Read and encode image with size limits
-            with open(image_path, 'rb') as f:
-                image_data = f.read()
-            
-            # Check file size and resize if too large
-            # Claude has 5MB limit, target 3.75MB to account for base64 encoding overhead
-            max_size = 3.75 * 1024 * 1024  # 3.75MB
             temp_image_path = None
-            
-            if len(image_data) > max_size:
-                # Resize and save to temporary file
-                image_data = self._resize_image_data(image_data, max_size)
+            # Over-limit images are shrunk once and kept in the payload cache;
+            # without a cache, into a temp file deleted after the call.
+            processing_path = self._cached_payload_path(image_path, _UPLOAD_PROFILE)
+            if processing_path is None:
+                # Read and encode image with size limits
+                with open(image_path, 'rb') as f:
+                    image_data = f.read()
                 
-                # Create temp file with optimized image
-                temp_dir = Path(tempfile.gettempdir())
-                temp_image_path = temp_dir / f"temp_optimized_{int(time.time())}_{Path(image_path).stem}.jpg"
-                with open(temp_image_path, 'wb') as f:
-                    f.write(image_data)
+                # Check file size and resize if too large
+                # Claude has 5MB limit, target 3.75MB to account for base64 encoding overhead
+                max_size = 3.75 * 1024 * 1024  # 3.75MB
                 
-                # Use temp file path for processing
-                processing_path = str(temp_image_path)
-            else:
-                # Use original file path
-                processing_path = image_path
+                if len(image_data) > max_size:
+                    # Resize and save to temporary file
+                    image_data = self._resize_image_data(image_data, max_size)
+                    
+                    # Create temp file with optimized image
+                    temp_dir = Path(tempfile.gettempdir())
+                    temp_image_path = temp_dir / (f"temp_optimized_{int(time.time())}_{threading.get_ident()}_"
+                                                  f"{Path(image_path).stem}.jpg")
+                    with open(temp_image_path, 'wb') as f:
+                        f.write(image_data)
+                    
+                    # Use temp file path for processing
+                    processing_path = str(temp_image_path)
+                else:
+                    # Use original file path
+                    processing_path = image_path
             
             try:
                 # Process with the selected provider.
@@ -599,8 +667,25 @@ class ProcessingWorker(threading.Thread):
         except Exception as e:
             raise Exception(f"AI processing failed: {str(e)}")
     
+    @staticmethod
+    def _cached_payload_path(image_path: str, profile) -> Optional[str]:
+        """Path of *image_path* prepared by *profile* (a WireProfile), via the shared
+        payload cache; None when there is no cache (disabled, unwritable, or
+        idt_core unavailable) and the caller should convert it itself."""
+        cache = shared_cache() if shared_cache else None
+        if cache is None:
+            return None
+        try:
+            return str(cache.path_for(Path(image_path), profile))
+        except Exception as e:
+            logging.warning(f"Payload cache unavailable for {image_path}: {e}")
+            return None
+
     def _convert_heic_to_jpeg(self, heic_path: str) -> Optional[str]:
         """Convert HEIC file to JPEG"""
+        cached = self._cached_payload_path(heic_path, _HEIC_PROFILE)
+        if cached:
+            return cached
         try:
             from PIL import Image
             import pillow_heif
@@ -670,10 +755,10 @@ class ProcessingWorker(threading.Thread):
         try:
             if not MetadataExtractor:
                 return metadata
-            meta = MetadataExtractor().extract(Path(image_path))
+            meta = MetadataExtractor(cache=self._metadata_cache()).extract(Path(image_path))
             if meta is None:
                 return metadata
-            if self.geocode and NominatimGeocoder and (meta.latitude is not None):
+            if self.geocode and make_geocoder and (meta.latitude is not None):
                 try:
                     geocoder = self._get_geocoder()
                     if geocoder:
@@ -681,7 +766,8 @@ class ProcessingWorker(threading.Thread):
                 except Exception as e:
                     logging.error(f"Geocoding failed for {image_path}: {e}")
             metadata = self._sanitize_for_json(meta.to_dict())
-            if metadata.get('city') or metadata.get('state') or metadata.get('country'):
+            # ODbL attribution is owed for Nominatim's answers, not GeoNames'.
+            if metadata.get('place_source') == "nominatim":
                 metadata['osm_attribution_required'] = True
         except Exception as e:
             logging.error(f"Metadata extraction failed: {e}")
@@ -788,40 +874,44 @@ class ProcessingWorker(threading.Thread):
             return str(obj)
     
     def _get_geocoder(self):
-        """Get or create a shared geocoder instance with caching"""
-        # Use class-level cache for geocoder to share cache across images
-        if not hasattr(ProcessingWorker, '_geocoder_instance'):
-            if NominatimGeocoder:
+        """The geocoder for this worker's geocode mode, shared by every worker.
+
+        One instance per mode (class level, locked -- several batch pool threads
+        can ask at once) so the Nominatim rate limit and cache, and the loaded
+        gazetteer, are shared across images. None if it cannot be created, e.g.
+        offline mode with no gazetteer installed; that is not remembered, so a
+        gazetteer installed later is picked up by the next batch.
+        """
+        with ProcessingWorker._cache_lock:
+            instances = ProcessingWorker._geocoder_instances
+            key = self.geocode if isinstance(self.geocode, str) else 'online'
+            if key not in instances:
+                if not make_geocoder:
+                    logging.warning("idt_core geocoding not available")
+                    return None
                 try:
-                    # Check if requests module is available
-                    try:
-                        import requests
-                        logging.info(f"requests module available: {requests.__version__}")
-                    except ImportError as req_err:
-                        logging.error(f"requests module NOT available: {req_err}")
-                    
                     cache_path = Path.home() / ".idt" / "geocode_cache.json"
-                    logging.info(f"Initializing geocoder with cache: {cache_path}")
-                    ProcessingWorker._geocoder_instance = NominatimGeocoder(
-                        delay_seconds=1.0,
-                        cache_path=cache_path,
-                    )
+                    logging.info(f"Initializing {key} geocoder (cache: {cache_path})")
+                    instances[key] = make_geocoder(key, cache_path=cache_path)
                     logging.info("Geocoder initialized successfully")
                 except Exception as e:
                     logging.error(f"Failed to initialize geocoder: {e}")
                     import traceback
                     logging.error(traceback.format_exc())
-                    ProcessingWorker._geocoder_instance = None
-            else:
-                logging.warning("NominatimGeocoder not available")
-                ProcessingWorker._geocoder_instance = None
-        
-        return ProcessingWorker._geocoder_instance
+                    return None
 
-    # Class-level idt_core metadata extractor and geocoder (shared across images for perf)
-    _idt_extractor = None
-    _idt_geocoder = None
-    _idt_geocoder_init = False  # True once we've tried to init (avoids retrying on every image)
+            return instances[key]
+
+    _geocoder_instances: dict = {}
+
+    def _metadata_cache(self):
+        """The metadata cache for this worker's workspace, or None without idt_core."""
+        if metadata_cache_for is None:
+            return None
+        try:
+            return metadata_cache_for(self._metadata_bundle)
+        except Exception:
+            return None
 
     def _inject_exif_context(self, prompt_text: str) -> tuple:
         """
@@ -836,23 +926,13 @@ class ProcessingWorker(threading.Thread):
             return prompt_text, ""
 
         try:
-            # Lazy-init extractor (cheap — no I/O)
-            if ProcessingWorker._idt_extractor is None:
-                ProcessingWorker._idt_extractor = _IDTCoreMetadataExtractor()
+            # _extract_metadata has just read this file, so this is a cache hit
+            meta = _IDTCoreMetadataExtractor(cache=self._metadata_cache()).extract(Path(self.file_path))
 
-            meta = ProcessingWorker._idt_extractor.extract(Path(self.file_path))
-
-            # Lazy-init geocoder only when this batch has geocoding enabled
-            if self.geocode and _IDTCoreNominatimGeocoder and not ProcessingWorker._idt_geocoder_init:
-                ProcessingWorker._idt_geocoder_init = True
-                try:
-                    cache = Path.home() / ".idt" / "geocode_cache.json"
-                    ProcessingWorker._idt_geocoder = _IDTCoreNominatimGeocoder(cache_path=cache)
-                except Exception:
-                    ProcessingWorker._idt_geocoder = None
-
-            if self.geocode and ProcessingWorker._idt_geocoder and (meta.latitude is not None):
-                meta = ProcessingWorker._idt_geocoder.enrich(meta)
+            # Same shared geocoder as _extract_metadata; answered from its cache
+            geocoder = self._get_geocoder() if self.geocode and meta.latitude is not None else None
+            if geocoder:
+                meta = geocoder.enrich(meta)
 
             ctx = meta.prompt_context()
             if ctx:
@@ -961,10 +1041,16 @@ class WorkflowProcessWorker(threading.Thread):
 class BatchProcessingWorker(threading.Thread):
     """Worker thread for batch processing multiple images
     
-    Processes multiple images sequentially, emitting progress for each.
-    Uses ProcessingWorker internally for each image but runs them sequentially.
+    Describes the images on a pool of describe threads that live for the whole
+    batch. The prompt is resolved and the provider looked up and keyed once, up
+    front; each pool thread then works through the shared queue with its own
+    shallow copy of that provider -- the SDK client and its connection pool are
+    shared, last_usage is not. Cloud providers get _CLOUD_POOL_SIZE threads and
+    the shared rate limiter (idt_core.rate_limit) trims that when the account
+    pushes back; local providers describe one image at a time.
     
-    Phase 2: Enhanced with pause/resume/stop controls using threading.Event
+    Phase 2: Enhanced with pause/resume/stop controls using threading.Event.
+    Every pool thread checks them before taking its next image.
     
     Events:
         ProgressUpdateEvent: Progress messages for each image
@@ -972,15 +1058,20 @@ class BatchProcessingWorker(threading.Thread):
         ProcessingFailedEvent: Error for any failed image
         WorkflowCompleteEvent: All images completed
     """
+
+    #: Describe threads for a provider that serves requests in parallel.
+    _CLOUD_POOL_SIZE = 4
+    _POOLED_PROVIDERS = ('openai', 'claude')
     
     def __init__(self, parent_window, file_paths: list, provider: str, model: str,
                  prompt_style: str, custom_prompt: str = "",
                  prompt_config_path: Optional[str] = None,
                  skip_existing: bool = False,
                  progress_offset: int = 0,
-                 geocode: bool = False,
+                 geocode: Union[bool, str] = False,
                  logs_dir: Optional[Path] = None,
-                 video_preamble: Optional[str] = None):
+                 video_preamble: Optional[str] = None,
+                 concurrency: Optional[int] = None):
         """Initialize batch worker
 
         Args:
@@ -993,7 +1084,8 @@ class BatchProcessingWorker(threading.Thread):
             prompt_config_path: Optional path to prompt config file
             skip_existing: Skip images that already have descriptions
             progress_offset: Offset to add to progress counter (for continuing after video extraction)
-            geocode: Whether to reverse-geocode GPS coordinates (requires internet)
+            geocode: False, or the geocoding mode (see ProcessingWorker)
+            concurrency: Describe threads; None picks by provider (see pool_size)
         """
         super().__init__(daemon=True)
         self.parent_window = parent_window
@@ -1008,14 +1100,143 @@ class BatchProcessingWorker(threading.Thread):
         self.geocode = geocode
         self.logs_dir = logs_dir
         self.video_preamble = video_preamble
+        self.concurrency = concurrency or self.pool_size(provider)
 
         # Phase 2: Pause/Resume/Stop controls using threading.Event
         self._stop_event = threading.Event()  # Set = stopped
         self._pause_event = threading.Event()  # Set = running, cleared = paused
         self._pause_event.set()  # Start in running state
-    
+
+        # The queue the pool threads share, and their tallies
+        self._queue_lock = threading.Lock()
+        self._queue = iter(())
+        self._completed = 0
+        self._failed = 0
+
+    @classmethod
+    def pool_size(cls, provider: str) -> int:
+        """Default describe threads for *provider*."""
+        if (provider or '').lower() in cls._POOLED_PROVIDERS:
+            return cls._CLOUD_POOL_SIZE
+        return 1
+
+    def _job(self, file_path: str, prompt_text: Optional[str] = None,
+             provider_instance=None) -> 'ProcessingWorker':
+        """A ProcessingWorker for one image; the pool calls process() on it."""
+        return ProcessingWorker(
+            self.parent_window,
+            file_path,
+            self.provider,
+            self.model,
+            self.prompt_style,
+            self.custom_prompt,
+            self.prompt_config_path,
+            geocode=self.geocode,
+            prompt_text=prompt_text,
+            provider_instance=provider_instance,
+        )
+
+    def _pool_providers(self) -> list:
+        """One provider instance per pool thread, or [None] * n when the
+        provider cannot be resolved up front (each image then resolves, and
+        reports the failure, itself -- as it always has)."""
+        try:
+            shared = self._job("").resolve_provider()
+        except Exception as e:
+            logger.warning(f"Batch could not resolve provider {self.provider}: {e}")
+            return [None] * self.concurrency
+        if self.concurrency == 1:
+            return [shared]
+        if limiter_for:
+            # The GUI's retry decorator meets the limiter with a ceiling of 1;
+            # raise it to the pool size so the threads can overlap.
+            name = getattr(shared, 'get_provider_name', lambda: self.provider)()
+            limiter_for(name, self.model, account_key(getattr(shared, 'api_key', None)),
+                        concurrency=self.concurrency)
+        return [copy.copy(shared) for _ in range(self.concurrency)]
+
+    def _prefetch_locations(self, total: int) -> None:
+        """Look up every distinct place in the batch once, before describing,
+        so no pool thread waits on Nominatim mid-batch (and the EXIF read here
+        leaves each image's metadata in the cache for its worker). Requests go
+        at 1/s, so each one is reported, and Stop ends the lookups too."""
+        job = self._job("")
+        geocoder = job._get_geocoder()
+        if not geocoder or not hasattr(geocoder, 'prefetch') or not MetadataExtractor:
+            return
+
+        def report(message: str) -> None:
+            wx.PostEvent(self.parent_window, ProgressUpdateEventData(
+                file_path="",
+                message=message,
+                current=self.progress_offset,
+                total=total + self.progress_offset,
+            ))
+
+        report("Looking up photo locations…")
+        try:
+            metas = MetadataExtractor(cache=job._metadata_cache()).extract_many(
+                [Path(p) for p in self.file_paths]
+            )
+            requests = geocoder.prefetch(
+                ((m.latitude, m.longitude) for m in metas if m.latitude is not None),
+                progress=lambda done, places: report(
+                    f"Looking up photo locations ({done} of {places})…"),
+                should_cancel=self._stop_event.is_set,
+            )
+            logger.info(f"Geocoded {requests} distinct places for {total} images")
+        except Exception as e:
+            logger.warning(f"Location prefetch failed; geocoding per image instead: {e}")
+
+    def _next_image(self):
+        """(index, path) of the next image to describe, or None once the queue
+        is empty or the batch was stopped. Blocks while paused."""
+        if self._stop_event.is_set():
+            return None
+        # Phase 2: Wait if paused (blocks here until resume)
+        self._pause_event.wait()
+        # Phase 2: Double-check stop after unpause
+        if self._stop_event.is_set():
+            return None
+        with self._queue_lock:
+            return next(self._queue, None)
+
+    def _describe_queue(self, prompt_text: str, provider_obj, run_log, total: int):
+        """Pool thread body: describe images until the queue is drained or stopped."""
+        while True:
+            item = self._next_image()
+            if item is None:
+                return
+            i, file_path = item
+
+            # Post progress with current/total counts (add offset for continuing from video extraction)
+            evt = ProgressUpdateEventData(
+                file_path=file_path,
+                message=f"Processing {i}/{total}: {Path(file_path).name}",
+                current=i + self.progress_offset,
+                total=total + self.progress_offset
+            )
+            wx.PostEvent(self.parent_window, evt)
+
+            worker = self._job(file_path, prompt_text, provider_obj)
+            worker.process()
+
+            with self._queue_lock:
+                self._completed += 1
+                if not worker.result_ok:
+                    self._failed += 1
+            if run_log:
+                if worker.result_ok:
+                    in_t = worker.result_input_tokens
+                    out_t = worker.result_output_tokens
+                    token_str = f"  ({in_t} in, {out_t} out)" if (in_t or out_t) else ""
+                    run_log.info(f"{i}/{total}  {Path(file_path).name}: described{token_str}")
+                else:
+                    err = worker.result_error or "unknown error"
+                    run_log.warning(f"{i}/{total}  {Path(file_path).name}: failed  {err}")
+
     def run(self):
-        """Process all images sequentially"""
+        """Process all images on the describe pool"""
         run_log = None
         if self.logs_dir:
             try:
@@ -1026,14 +1247,13 @@ class BatchProcessingWorker(threading.Thread):
 
         try:
             total = len(self.file_paths)
-            completed = 0
-            failed = 0
             start_time = time.time()
 
             if run_log:
                 run_log.info(
                     f"GUI batch run — provider={self.provider}  model={self.model}"
                     f"  prompt={self.prompt_style}  images={total}"
+                    f"  workers={self.concurrency}"
                 )
                 if getattr(self, 'video_preamble', None):
                     run_log.info(self.video_preamble)
@@ -1049,61 +1269,36 @@ class BatchProcessingWorker(threading.Thread):
                 )
                 wx.PostEvent(self.parent_window, evt)
 
-            for i, file_path in enumerate(self.file_paths, 1):
-                # Phase 2: Check if stopped
-                if self._stop_event.is_set():
-                    if run_log:
-                        run_log.info(f"run stopped by user after {completed} images")
-                    break
-
-                # Phase 2: Wait if paused (blocks here until resume)
-                self._pause_event.wait()
-
-                # Phase 2: Double-check stop after unpause
-                if self._stop_event.is_set():
-                    if run_log:
-                        run_log.info(f"run stopped by user after {completed} images")
-                    break
-
-                # Post progress with current/total counts (add offset for continuing from video extraction)
-                current_progress = i + self.progress_offset
-                total_progress = total + self.progress_offset
-                evt = ProgressUpdateEventData(
-                    file_path=file_path,
-                    message=f"Processing {i}/{total}: {Path(file_path).name}",
-                    current=current_progress,
-                    total=total_progress
-                )
-                wx.PostEvent(self.parent_window, evt)
-
-                # Create worker for this image
-                worker = ProcessingWorker(
-                    self.parent_window,
-                    file_path,
-                    self.provider,
-                    self.model,
-                    self.prompt_style,
-                    self.custom_prompt,
-                    self.prompt_config_path,
-                    geocode=self.geocode,
-                )
+            # Resolved once for the batch rather than once per image
+            prompt_text = self._job("").resolve_prompt_text()
+            providers = self._pool_providers()
+            if self.geocode:
+                self._prefetch_locations(total)
 
-                # Run synchronously and wait
-                worker.start()
-                worker.join()  # Wait for completion
+            self._queue = iter(enumerate(self.file_paths, 1))
+            errors = []
 
-                if run_log:
-                    if worker.result_ok:
-                        in_t = worker.result_input_tokens
-                        out_t = worker.result_output_tokens
-                        token_str = f"  ({in_t} in, {out_t} out)" if (in_t or out_t) else ""
-                        run_log.info(f"{i}/{total}  {Path(file_path).name}: described{token_str}")
-                    else:
-                        err = worker.result_error or "unknown error"
-                        run_log.warning(f"{i}/{total}  {Path(file_path).name}: failed  {err}")
-                        failed += 1
-
-                completed += 1
+            def pool_thread(provider_obj):
+                try:
+                    self._describe_queue(prompt_text, provider_obj, run_log, total)
+                except Exception as e:
+                    errors.append(e)
+                    self._stop_event.set()
+
+            threads = [threading.Thread(target=pool_thread, args=(provider_obj,),
+                                        name=f"describe-{n}", daemon=True)
+                       for n, provider_obj in enumerate(providers[1:], 2)]
+            for thread in threads:
+                thread.start()
+            pool_thread(providers[0])  # this thread is the pool's first worker
+            for thread in threads:
+                thread.join()
+            if errors:
+                raise errors[0]
+
+            completed, failed = self._completed, self._failed
+            if self._stop_event.is_set() and completed < total and run_log:
+                run_log.info(f"run stopped by user after {completed} images")
 
             elapsed = time.time() - start_time
             if run_log:
@@ -1213,6 +1408,25 @@ class VideoProcessingWorker(threading.Thread):
         self.parent_window = parent_window
         self.video_path = video_path
         self.extraction_config = extraction_config
+
+    @staticmethod
+    def options_from_config(extraction_config: dict) -> VideoExtractionOptions:
+        """The GUI extraction settings as idt_core VideoExtractionOptions.
+
+        Frames get the video's GPS/date EXIF (a no-op without ffprobe). The
+        frame cap applies to scene mode only, as it always has in the GUI.
+        """
+        scene = extraction_config.get("extraction_mode", "time_interval") == "scene_change"
+        return VideoExtractionOptions(
+            mode="scene" if scene else "interval",
+            interval_seconds=extraction_config.get("time_interval_seconds", 5),
+            scene_threshold=extraction_config.get("scene_change_threshold", 30.0),
+            min_scene_seconds=extraction_config.get("min_scene_duration_seconds", 1.0),
+            max_frames=(extraction_config.get("max_frames_per_video", 50) or 50) if scene else None,
+            start_seconds=extraction_config.get("start_time_seconds", 0) or 0,
+            end_seconds=extraction_config.get("end_time_seconds") or None,
+            embed_metadata=True,
+        )
     
     def run(self):
         """Extract frames from video"""
@@ -1331,6 +1545,13 @@ class VideoProcessingWorker(threading.Thread):
                 _old.unlink()
             except OSError:
                 pass
+
+        extraction_mode = self.extraction_config.get("extraction_mode", "time_interval")
+        if extraction_mode != "scene_change":
+            # Default to time_interval if mode not recognized
+            cap.release()
+            return self._extract_by_time_interval(video_dir, video_metadata), video_metadata
+
         # If ffprobe is absent or the video has no tags, this is a safe no-op and
         # frame extraction continues exactly as before.
         video_source_metadata = None
@@ -1352,96 +1573,37 @@ class VideoProcessingWorker(threading.Thread):
             except Exception as _e:
                 logger.warning(f"Video metadata extraction failed (non-fatal): {_e}")
 
-        # Extract based on mode
-        extraction_mode = self.extraction_config.get("extraction_mode", "time_interval")
-        if extraction_mode == "scene_change":
-            extracted_paths = self._extract_by_scene_detection(cap, fps, video_dir, video_source_metadata)
-        else:
-            # Default to time_interval if mode not recognized
-            extracted_paths = self._extract_by_time_interval(cap, fps, video_dir, video_source_metadata)
-        
+        extracted_paths = self._extract_by_scene_detection(cap, fps, video_dir, video_source_metadata)
         cap.release()
         return extracted_paths, video_metadata
     
-    def _extract_by_time_interval(self, cap, fps: float, output_dir: Path, video_source_metadata: dict = None) -> list:
+    def _extract_by_time_interval(self, output_dir: Path, video_metadata: dict) -> list:
         """Extract frames at regular time intervals.
 
-        Uses time-based seeking (CAP_PROP_POS_MSEC) rather than frame-number
-        seeking (CAP_PROP_POS_FRAMES) because MPEG/MPG containers often do not
-        support random frame-level access — cap.set(POS_FRAMES, n) is silently
-        ignored, causing the video to be read sequentially regardless of the
-        requested position.  Time-based seeking has much wider codec support.
+        Runs idt_core's extract_videos(): a long video is split into time
+        segments extracted on a process pool, one per core, and merged back in
+        order — the same frames and names as a single pass. Targets are seeked
+        to by time (CAP_PROP_POS_MSEC), with a sequential fallback for
+        containers whose seeks land in the wrong place (some MPEG files).
         """
-        import cv2
-
-        interval_seconds = self.extraction_config.get("time_interval_seconds", 5)
-        start_time = self.extraction_config.get("start_time_seconds", 0)
-        end_time_cfg = self.extraction_config.get("end_time_seconds")
-
-        # Derive total duration from fps + frame_count.  When the container
-        # doesn't report a reliable frame count we fall back to a large value
-        # and let the read loop terminate naturally on ret=False.
-        total_frames_in_video = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        if total_frames_in_video > 0 and fps > 0:
-            video_duration = total_frames_in_video / fps
-        else:
-            video_duration = None  # Unknown — read until EOF
-
-        end_time = end_time_cfg if end_time_cfg else video_duration
+        options = self.options_from_config(self.extraction_config)
+        options.mode = "interval"   # also the fallback when no scenes are detected
+        options.max_frames = None
+        video_duration = video_metadata.get('duration') or 0
 
         self._post_progress(
-            f"FPS: {fps:.2f}, Interval: {interval_seconds}s"
+            f"FPS: {video_metadata.get('fps', 0):.2f}, Interval: {options.interval_seconds}s"
             + (f", Duration: {video_duration:.1f}s" if video_duration else ", Duration: unknown")
         )
 
-        extracted_paths = []
-        current_time = float(start_time)
-        extract_count = 0
-
-        video_stem = Path(self.video_path).stem
-
-        while True:
-            # Stop when we have passed the end of the requested range
-            if end_time is not None and current_time >= end_time:
-                break
-
-            # Seek to the desired position using milliseconds (better MPEG support)
-            target_ms = current_time * 1000.0
-            cap.set(cv2.CAP_PROP_POS_MSEC, target_ms)
-            ret, frame = cap.read()
-
-            if not ret:
-                break
-
-            # Use the actual position that OpenCV landed on (seeking can snap
-            # to the nearest keyframe in some codecs)
-            actual_ms = cap.get(cv2.CAP_PROP_POS_MSEC)
-            timestamp = actual_ms / 1000.0 if actual_ms > 0 else current_time
+        def _progress(count, detail):
+            self._post_progress(f"Extracted {count} frames ({detail})...")
 
-            # Save frame with timestamp in filename (matches CLI: video_0.00s.jpg)
-            frame_filename = f"{video_stem}_{timestamp:.2f}s.jpg"
-            frame_path = output_dir / frame_filename
-            cv2.imwrite(str(frame_path), frame)
-
-            # Embed video GPS/date into frame EXIF if metadata is available
-            if video_source_metadata and ExifEmbedder is not None:
-                try:
-                    ExifEmbedder().embed_metadata(
-                        frame_path, video_source_metadata,
-                        frame_time=timestamp,
-                        source_video_path=Path(self.video_path)
-                    )
-                except Exception as _ee:
-                    logger.debug(f"EXIF embed failed for {frame_filename} (non-fatal): {_ee}")
-
-            extracted_paths.append(str(frame_path))
-            extract_count += 1
-            current_time += interval_seconds
-
-            if extract_count % 10 == 0:
-                self._post_progress(f"Extracted {extract_count} frames ({timestamp:.1f}s)...")
-        
-        return extracted_paths
+        options.on_progress = _progress
+        [result] = extract_videos([(Path(self.video_path), output_dir)], options)
+        if result.error:
+            raise Exception(result.error)
+        return [str(p) for p in result.frame_paths]
     
     def _extract_by_scene_detection(self, cap, fps: float, output_dir: Path, video_source_metadata: dict = None) -> list:
         """Extract frames based on scene changes using enhanced scene detector"""
@@ -1481,8 +1643,7 @@ class VideoProcessingWorker(threading.Thread):
             
             if not frames:
                 self._post_progress("No scenes detected, falling back to time interval")
-                cap = cv2.VideoCapture(self.video_path)
-                return self._extract_by_time_interval(cap, fps, output_dir, video_source_metadata)
+                return self._extract_by_time_interval(output_dir, {'fps': fps})
             
             self._post_progress(f"Detected {len(frames)} scenes, extracting frames...")
             
@@ -1533,69 +1694,68 @@ class VideoProcessingWorker(threading.Thread):
         """Basic scene change detection (fallback when enhanced detector is unavailable).
 
         Reads frames sequentially — no seeking — so it works on MPEG and other
-        containers that don't support random access.  Applied caps:
-        - min_frame_gap: enforces at least min_scene_duration seconds between saves
+        containers that don't support random access. Scoring is idt_core's
+        SceneDetector (downscaled block/histogram change, analysed every
+        SCENE_SAMPLE_SECONDS), the same detector `idt video --scene` uses.
+        Applied caps:
+        - min_scene_duration_seconds: cuts closer together are one scene
         - max_frames: hard stop at the configured maximum (default 50) so a
           highly-dynamic video can't produce thousands of output frames
         """
         import cv2
-        import numpy as np
-        
-        # Threshold in 0-100 range: percentage of pixels that must change
-        # significantly.  Matches the metric in enhanced_scene_detector.
+
+        # Threshold in 0-100 range: percentage of the picture that must change.
         threshold = self.extraction_config.get("scene_change_threshold", 30)  # 0-100
         min_duration = self.extraction_config.get("min_scene_duration_seconds", 1)
         max_frames = self.extraction_config.get("max_frames_per_video", 50) or 50
-        
-        extracted_paths = []
-        prev_frame = None
-        last_extract_frame = -1
+
         # Guard: fps=1.0 is a container fallback; ensure at least a 1-frame gap.
         min_frame_gap = max(1, int(fps * min_duration)) if fps > 0 else 1
+        detector = SceneDetector(threshold, min_scene_frames=min_frame_gap)
+        step = max(1, round(SCENE_SAMPLE_SECONDS * fps))
+
+        extracted_paths = []
         frame_num = 0
         extract_count = 0
-        
+
         video_stem = Path(self.video_path).stem
-        
+
         while True:
+            if frame_num % step:
+                if not cap.grab():
+                    break
+                frame_num += 1
+                continue
             ret, frame = cap.read()
             if not ret:
                 break
-            
+
             if extract_count >= max_frames:
                 logger.info(f"Basic scene detection: reached max_frames cap ({max_frames})")
                 break
-            
-            if prev_frame is not None:
-                gray_current = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                gray_prev = cv2.cvtColor(prev_frame, cv2.COLOR_BGR2GRAY)
-                diff = cv2.absdiff(gray_current, gray_prev)
-                # Percentage of pixels that changed by more than 30/255 (~12%).
-                change_score = (np.sum(diff > 30) / diff.size) * 100
-                
-                if (change_score > threshold and frame_num - last_extract_frame >= min_frame_gap):
-                    timestamp = frame_num / fps if fps > 0 else 0.0
-                    frame_filename = f"{video_stem}_scene_{extract_count:04d}_{timestamp:.2f}s.jpg"
-                    frame_path = output_dir / frame_filename
-                    cv2.imwrite(str(frame_path), frame)
-                    
-                    if video_source_metadata and ExifEmbedder is not None:
-                        try:
-                            ExifEmbedder().embed_metadata(
-                                frame_path, video_source_metadata,
-                                frame_time=timestamp,
-                                source_video_path=Path(self.video_path)
-                            )
-                        except Exception:
-                            pass
-                    
-                    extracted_paths.append(str(frame_path))
-                    last_extract_frame = frame_num
-                    extract_count += 1
-            
-            prev_frame = frame.copy()
+
+            # The opening frame primes the detector but is not saved as a scene.
+            if detector.observe(frame, frame_num) and frame_num > 0:
+                timestamp = frame_num / fps if fps > 0 else 0.0
+                frame_filename = f"{video_stem}_scene_{extract_count:04d}_{timestamp:.2f}s.jpg"
+                frame_path = output_dir / frame_filename
+                cv2.imwrite(str(frame_path), frame)
+
+                if video_source_metadata and ExifEmbedder is not None:
+                    try:
+                        ExifEmbedder().embed_metadata(
+                            frame_path, video_source_metadata,
+                            frame_time=timestamp,
+                            source_video_path=Path(self.video_path)
+                        )
+                    except Exception:
+                        pass
+
+                extracted_paths.append(str(frame_path))
+                extract_count += 1
+
             frame_num += 1
-        
+
         return extracted_paths
 
 
@@ -1852,38 +2012,35 @@ class DirectoryScanWorker(threading.Thread):
             # Post initial progress
             self._post_progress("Starting directory scan...", 0)
             
-            # Determine scan pattern
-            if self.recursive:
-                scan_pattern = '**/*'
-            else:
-                scan_pattern = '*'
-            
-            # Scan directory
-            for file_path in self.directory_path.glob(scan_pattern):
+            # Stream matches as each directory is listed (several at once, so
+            # a network share's latency overlaps); hidden and .idt folders are
+            # never entered.
+            found = iter_media(
+                self.directory_path,
+                self.IMAGE_EXTENSIONS | self.VIDEO_EXTENSIONS,
+                recursive=self.recursive,
+                workers=PARALLEL_SCAN_WORKERS,
+            )
+            for file_path in found:
                 # Check stop flag
                 if self._stop_flag:
+                    found.close()
                     logger.info("Directory scan stopped by user")
                     return
-                
-                # Skip directories
-                if file_path.is_dir():
-                    continue
-                
-                # Check if file is image or video
-                if file_path.suffix.lower() in self.IMAGE_EXTENSIONS or file_path.suffix.lower() in self.VIDEO_EXTENSIONS:
-                    batch.append(file_path)
-                    all_files.append(file_path)
-                    
-                    # Send batch when full
-                    if len(batch) >= self.batch_size:
-                        batch_number += 1
-                        self._post_batch(batch, batch_number, all_files)
-                        
-                        # Post progress update
-                        self._post_progress(f"Found {len(all_files)} files...", len(all_files))
-                        
-                        # Clear batch for next iteration
-                        batch = []
+
+                batch.append(file_path)
+                all_files.append(file_path)
+
+                # Send batch when full
+                if len(batch) >= self.batch_size:
+                    batch_number += 1
+                    self._post_batch(batch, batch_number, all_files)
+
+                    # Post progress update
+                    self._post_progress(f"Found {len(all_files)} files...", len(all_files))
+
+                    # Clear batch for next iteration
+                    batch = []
             
             # Send final batch (if any)
             if batch:
@@ -2130,16 +2287,23 @@ class FolderRescanWorker(threading.Thread):
     def run(self):
         try:
             folder = Path(self.folder_path)
-            pattern = '**/*' if self.recursive else '*'
 
-            # Discover files currently on disk
-            found_paths: set = set()
-            for p in folder.glob(pattern):
-                if p.is_dir():
-                    continue
-                if (p.suffix.lower() in self.IMAGE_EXTENSIONS
-                        or p.suffix.lower() in self.VIDEO_EXTENSIONS):
-                    found_paths.add(str(p))
+            extensions = self.IMAGE_EXTENSIONS | self.VIDEO_EXTENSIONS
+
+            # Discover files currently on disk. A recursive rescan keeps a
+            # snapshot of the tree (~/.idt/cache/scans) and lists only the
+            # directories changed since the last one.
+            if self.recursive:
+                snapshot = ScanSnapshot.load(
+                    snapshot_path(folder, extensions=extensions), folder, extensions
+                )
+                snapshot.rescan()
+                snapshot.save()
+                found_paths: set = {str(p) for p in snapshot.paths()}
+            else:
+                found_paths = {
+                    str(p) for p in iter_media(folder, extensions, recursive=False)
+                }
 
             # Build set of workspace items that live under this folder
             # (excluding extracted frames — they are derived, not source files)
@@ -28,6 +28,20 @@ def isolate_model_cache(tmp_path, monkeypatch):
     monkeypatch.setenv("IDT_MODEL_CACHE_DIR", str(tmp_path / "model_cache"))
 
 
+@pytest.fixture(autouse=True)
+def isolate_rate_limiters(monkeypatch):
+    """Give every test fresh provider rate limiters.
+
+    ``rate_limit.limiter_for`` is process-wide on purpose, so a test that drives
+    a provider into a 429 leaves a cooldown behind it. The next test to touch
+    the same provider and model would then really wait it out, and which test
+    pays depends only on the order they ran in.
+    """
+    from idt_core import rate_limit
+
+    monkeypatch.setattr(rate_limit, "_LIMITERS", {})
+
+
 @pytest.fixture
 def project_root_path():
     """Return the project root directory path."""
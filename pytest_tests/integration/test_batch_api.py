@@ -0,0 +1,264 @@
+"""Drive `describe --batch-api` against a local stand-in for the vendor batch endpoints.
+
+The stub speaks just enough of Anthropic's Message Batches API and OpenAI's
+Files + Batch API for the real SDK clients (pointed at it with base_url) to
+submit a job, poll it and read the results. Jobs report "in progress" for a
+set number of polls, so resuming in a second pipeline — a process restart —
+is exercised too.
+"""
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from idt_core.batch_api import STATE_KEY, batch_client_for
+from idt_core.pipeline import RunOptions, WorkspacePipeline
+from idt_core.workspace import Workspace
+
+pytestmark = pytest.mark.integration
+
+_ROOT = Path(__file__).resolve().parents[2]
+
+
+class _BatchHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, payload, status=200, content_type="application/json"):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _body(self) -> bytes:
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_POST(self):  # noqa: N802 - BaseHTTPRequestHandler's naming
+        srv, body = self.server, self._body()
+        with srv.lock:
+            if self.path == "/v1/messages/batches":
+                job_id = f"msgbatch_{len(srv.jobs) + 1}"
+                srv.jobs[job_id] = [r["custom_id"] for r in json.loads(body)["requests"]]
+                srv.polls[job_id] = 0
+                return self._send(self._anthropic_batch(job_id))
+            if self.path == "/v1/files":
+                file_id = f"file-in-{len(srv.files) + 1}"
+                srv.files[file_id] = [json.loads(line)["custom_id"]
+                                      for line in body.decode("utf-8", "replace").splitlines()
+                                      if line.startswith('{"custom_id"')]
+                return self._send({"id": file_id, "object": "file", "purpose": "batch"})
+            if self.path == "/v1/batches":
+                job_id = f"batch_{len(srv.jobs) + 1}"
+                srv.jobs[job_id] = srv.files[json.loads(body)["input_file_id"]]
+                srv.polls[job_id] = 0
+                return self._send(self._openai_batch(job_id))
+        self._send({"error": "unknown"}, status=404)
+
+    def do_GET(self):  # noqa: N802
+        srv = self.server
+        with srv.lock:
+            m = re.fullmatch(r"/v1/messages/batches/([\w-]+)", self.path)
+            if m:
+                srv.polls[m.group(1)] += 1
+                return self._send(self._anthropic_batch(m.group(1)))
+            m = re.fullmatch(r"/results/([\w-]+)", self.path)
+            if m:
+                return self._send(self._anthropic_results(m.group(1)), content_type="application/binary")
+            m = re.fullmatch(r"/v1/batches/([\w-]+)", self.path)
+            if m:
+                srv.polls[m.group(1)] += 1
+                return self._send(self._openai_batch(m.group(1)))
+            m = re.fullmatch(r"/v1/files/file-out-([\w-]+)/content", self.path)
+            if m:
+                return self._send(self._openai_results(m.group(1)), content_type="application/octet-stream")
+        self._send({"error": "unknown"}, status=404)
+
+    # ----- Anthropic shapes ----- #
+    def _ended(self, job_id):
+        return self.server.polls[job_id] > self.server.polls_until_done
+
+    def _anthropic_batch(self, job_id):
+        ended = self._ended(job_id)
+        host = f"http://127.0.0.1:{self.server.server_address[1]}"
+        return {"id": job_id, "type": "message_batch",
+                "processing_status": "ended" if ended else "in_progress",
+                "results_url": f"{host}/results/{job_id}" if ended else None}
+
+    def _anthropic_results(self, job_id):
+        lines = []
+        for custom_id in self.server.jobs[job_id]:
+            if custom_id in self.server.fail:
+                result = {"type": "errored", "error": {"type": "error", "error": {
+                    "type": "invalid_request_error", "message": "image too small"}}}
+            else:
+                result = {"type": "succeeded", "message": {
+                    "id": "msg", "type": "message", "role": "assistant", "model": "m",
+                    "content": [{"type": "text", "text": f"described {custom_id}"}],
+                    "stop_reason": "end_turn", "usage": {"input_tokens": 100, "output_tokens": 20}}}
+            lines.append(json.dumps({"custom_id": custom_id, "result": result}))
+        return "\n".join(lines).encode("utf-8")
+
+    # ----- OpenAI shapes ----- #
+    def _openai_batch(self, job_id):
+        ended = self._ended(job_id)
+        return {"id": job_id, "object": "batch", "endpoint": "/v1/chat/completions",
+                "status": "completed" if ended else "in_progress",
+                "output_file_id": f"file-out-{job_id}" if ended else None, "error_file_id": None}
+
+    def _openai_results(self, job_id):
+        lines = []
+        for custom_id in self.server.jobs[job_id]:
+            body = {"choices": [{"message": {"role": "assistant", "content": f"described {custom_id}"}}],
+                    "usage": {"prompt_tokens": 90, "completion_tokens": 15}}
+            lines.append(json.dumps({"custom_id": custom_id,
+                                     "response": {"status_code": 200, "body": body}, "error": None}))
+        return "\n".join(lines).encode("utf-8")
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def batch_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BatchHandler)
+    server.lock = threading.Lock()
+    server.jobs, server.polls, server.files = {}, {}, {}
+    server.polls_until_done = 1
+    server.fail = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join(timeout=5)
+
+
+def _workspace(tmp_path, count=3):
+    pics = tmp_path / "Pics"
+    pics.mkdir()
+    for i in range(count):
+        Image.new("RGB", (64, 48), (i * 40, 80, 120)).save(pics / f"p{i}.jpg")
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(pics, recursive=True)
+    return ws
+
+
+def _provider(name, server):
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    if name == "anthropic":
+        pytest.importorskip("anthropic")
+        from idt_core.providers.claude import ClaudeProvider
+        return ClaudeProvider(model="claude-sonnet-4-6", api_key="sk-test", base_url=url)
+    pytest.importorskip("openai")
+    from idt_core.providers.openai_provider import OpenAIProvider
+    return OpenAIProvider(model="gpt-4o", api_key="sk-test", base_url=url + "/v1")
+
+
+OPTIONS = RunOptions(prompt_name="concise", prompt_text="Describe briefly.", extract_metadata=False)
+
+
+@pytest.mark.parametrize("vendor", ["anthropic", "openai"])
+def test_submit_then_collect_after_a_restart(tmp_path, batch_server, vendor):
+    ws = _workspace(tmp_path)
+    provider = _provider(vendor, batch_server)
+    pipeline = WorkspacePipeline(ws, provider)
+    client = batch_client_for(provider)
+
+    assert list(pipeline.submit_batch(client, OPTIONS)) == []
+    assert list(pipeline.collect_batch(client)) == []  # still in progress
+
+    # A new process: everything it needs comes from the manifest.
+    reopened = Workspace.open(ws.path)
+    state = reopened.batch_state[STATE_KEY]
+    assert len(state["jobs"]) == 1 and len(state["jobs"][0]["requests"]) == 3
+    pipeline = WorkspacePipeline(reopened, provider)
+    events = list(pipeline.collect_batch(client))
+
+    assert [e.success for e in events] == [True] * 3
+    assert [e.index for e in events] == [1, 2, 3]
+    assert Workspace.open(ws.path).batch_state is None
+    for item in Workspace.open(ws.path).media_items():
+        (desc,) = item.descriptions
+        assert desc.text.startswith("described idt-")
+        assert (desc.provider, desc.prompt_name, desc.prompt_text) == (vendor, "concise", "Describe briefly.")
+        assert desc.input_tokens and desc.output_tokens
+
+
+def test_failed_requests_stay_undescribed(tmp_path, batch_server):
+    batch_server.fail = {"idt-2"}
+    batch_server.polls_until_done = 0
+    ws = _workspace(tmp_path)
+    provider = _provider("anthropic", batch_server)
+    pipeline = WorkspacePipeline(ws, provider)
+    client = batch_client_for(provider)
+    list(pipeline.submit_batch(client, OPTIONS))
+
+    events = list(pipeline.collect_batch(client))
+    assert sorted(e.error or "" for e in events) == ["", "", "image too small"]
+    assert sum(not i.described for i in Workspace.open(ws.path).media_items()) == 1
+
+
+def test_gui_batch_state_survives_and_a_second_submit_is_refused(tmp_path, batch_server):
+    ws = _workspace(tmp_path, count=1)
+    ws.batch_state = {"provider": "ollama", "total_queued": 4}
+    provider = _provider("anthropic", batch_server)
+    pipeline = WorkspacePipeline(ws, provider)
+    client = batch_client_for(provider)
+    list(pipeline.submit_batch(client, OPTIONS))
+    assert ws.batch_state["provider"] == "ollama" and STATE_KEY in ws.batch_state
+
+    with pytest.raises(RuntimeError):
+        list(pipeline.submit_batch(client, OPTIONS))
+
+    batch_server.polls_until_done = 0
+    list(pipeline.collect_batch(client))
+    assert ws.batch_state == {"provider": "ollama", "total_queued": 4}
+
+
+def test_gui_keeps_a_pending_batch_api_run_when_it_resets_its_own_state():
+    src = (_ROOT / "imagedescriber" / "imagedescriber_wx.py").read_text(encoding="utf-8")
+    key = re.search(r'^_API_BATCH_KEY = "(\w+)"', src, re.MULTILINE).group(1)
+    assert key == STATE_KEY
+    body = re.search(r"^    def _set_batch_state\(self.*?(?=^    \S)", src, re.MULTILINE | re.DOTALL).group(0)
+    ns = {"_API_BATCH_KEY": key}
+    exec("\n".join(line[4:] for line in body.splitlines()), ns)
+
+    class Frame:
+        workspace = type("W", (), {"batch_state": {"provider": "x", key: {"jobs": [1]}}})()
+
+    frame = Frame()
+    ns["_set_batch_state"](frame, None)
+    assert frame.workspace.batch_state == {key: {"jobs": [1]}}
+    ns["_set_batch_state"](frame, {"provider": "y"})
+    assert frame.workspace.batch_state == {"provider": "y", key: {"jobs": [1]}}
+    assert re.search(r"self\.workspace\.batch_state = (None|\{)", src) is None
+
+
+def test_collecting_a_job_twice_adds_no_second_description(tmp_path, batch_server):
+    batch_server.polls_until_done = 0
+    ws = _workspace(tmp_path, count=2)
+    provider = _provider("anthropic", batch_server)
+    pipeline = WorkspacePipeline(ws, provider)
+    client = batch_client_for(provider)
+    list(pipeline.submit_batch(client, OPTIONS))
+    saved = json.loads(json.dumps(ws.batch_state))
+
+    list(pipeline.collect_batch(client))
+    ws.batch_state = saved  # as if the process died before the manifest was saved
+    assert all(e.success for e in pipeline.collect_batch(client))
+    assert [len(i.descriptions) for i in Workspace.open(ws.path).media_items()] == [1, 1]
+
+
+def test_only_claude_and_openai_have_batch_clients():
+    class Local:
+        provider_name = "ollama"
+
+    assert batch_client_for(Local()) is None
@@ -7,7 +7,7 @@ because ollama.com's cloud vision backend started failing about half the time
 in production.
 
 The tests here stand up a socket-level HTTP server that returns 500 then 200
-and assert a description comes back. Everything between requests.post and the
+and assert a description comes back. Everything between the HTTP session and the
 retry decorator is real: the socket, the status line, the JSON body, the
 backoff loop. The only thing stubbed is the sleep.
 """
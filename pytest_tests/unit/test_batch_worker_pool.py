@@ -0,0 +1,168 @@
+"""
+BatchProcessingWorker's describe pool -- one prompt load, one provider lookup
+and one reload_api_key per batch instead of per image, overlapping calls for
+cloud providers, and pause/stop honoured by every pool thread.
+
+It used to start a ProcessingWorker thread per image and join() it at once, so
+every image re-read the prompt config and rebuilt the SDK client (and with it
+the HTTP connection) through reload_api_key, while only ever describing one at
+a time.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_ROOT))
+sys.path.insert(0, str(_ROOT / "imagedescriber"))
+
+wx = pytest.importorskip("wx", reason="workers_wx imports wx at module scope")
+
+import workers_wx  # noqa: E402
+from workers_wx import (  # noqa: E402
+    BatchProcessingWorker,
+    ProcessingCompleteEventData,
+    ProcessingWorker,
+    WorkflowCompleteEventData,
+)
+from idt_core.rate_limit import account_key, limiter_for  # noqa: E402
+
+
+class FakeProvider:
+    """Stands in for an ai_providers singleton; records overlap and key reloads."""
+
+    def __init__(self, name="Claude", delay=0.05):
+        self.name = name
+        self.delay = delay
+        self.api_key = "sk-pool"
+        self.reloads = 0
+        self.last_usage = None
+        self.instances = set()
+        self.in_flight = self.peak = 0
+        self.lock = threading.Lock()
+        self.on_call = None
+
+    def get_provider_name(self):
+        return self.name
+
+    def reload_api_key(self, explicit_key=None):
+        self.reloads += 1
+
+    def describe_image(self, image_path, prompt, model):
+        with self.lock:
+            self.instances.add(id(self))
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        if self.on_call:
+            self.on_call()
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        self.last_usage = {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+        return f"{prompt}: {Path(image_path).name}"
+
+
+@pytest.fixture
+def events(monkeypatch):
+    posted = []
+    monkeypatch.setattr(workers_wx.wx, "PostEvent", lambda _win, evt: posted.append(evt))
+    monkeypatch.setattr(workers_wx, "shared_cache", lambda: None)
+    monkeypatch.setattr(ProcessingWorker, "_provider_cache", {})
+    return posted
+
+
+@pytest.fixture
+def images(tmp_path):
+    paths = []
+    for i in range(8):
+        path = tmp_path / f"img{i}.jpg"
+        Image.new("RGB", (16, 16), (i * 20, 0, 0)).save(path)
+        paths.append(str(path))
+    return paths
+
+
+def _use(monkeypatch, key, provider):
+    monkeypatch.setattr(workers_wx, "get_all_providers", lambda: {key: provider})
+    monkeypatch.setattr(workers_wx, "get_available_providers", lambda: {key: provider})
+
+
+def _described(events):
+    return [e for e in events if isinstance(e, ProcessingCompleteEventData)]
+
+
+def test_cloud_batch_resolves_once_and_overlaps(monkeypatch, events, images):
+    shared = FakeProvider()
+    _use(monkeypatch, "claude", shared)
+    loads = []
+    real_load = ProcessingWorker._load_prompt_config
+    monkeypatch.setattr(ProcessingWorker, "_load_prompt_config",
+                        lambda self: loads.append(1) or real_load(self))
+
+    worker = BatchProcessingWorker(None, images, "claude", "claude-test", "detailed")
+    assert worker.concurrency == BatchProcessingWorker._CLOUD_POOL_SIZE
+    worker.run()
+
+    described = _described(events)
+    assert sorted(e.file_path for e in described) == sorted(images)
+    assert all(f": {Path(e.file_path).name}" in e.description for e in described)
+    assert all(e.metadata["total_tokens"] == 15 for e in described)
+    assert isinstance(events[-1], WorkflowCompleteEventData)
+    assert events[-1].input_dir == "8/8 images"
+    assert shared.reloads == 1 and len(loads) == 1
+    # each pool thread has its own copy, so last_usage never crosses images
+    assert len(shared.instances) == worker.concurrency
+    limiter = limiter_for("claude", "claude-test", account_key("sk-pool"))
+    assert limiter.ceiling == worker.concurrency
+
+
+def test_local_provider_describes_one_at_a_time(monkeypatch, events, images):
+    shared = FakeProvider(name="Ollama", delay=0.01)
+    _use(monkeypatch, "ollama", shared)
+
+    worker = BatchProcessingWorker(None, images, "ollama", "gemma", "detailed")
+    worker.run()
+
+    assert worker.concurrency == 1
+    assert len(_described(events)) == len(images)
+    assert shared.instances == {id(shared)} and shared.peak == 1
+
+
+def test_stop_halts_every_pool_thread(monkeypatch, events, images):
+    shared = FakeProvider()
+    _use(monkeypatch, "claude", shared)
+    worker = BatchProcessingWorker(None, images, "claude", "claude-test", "detailed")
+    shared.on_call = worker.stop
+    worker.run()
+
+    # the images already in flight finish; nobody takes another
+    assert 1 <= len(_described(events)) <= worker.concurrency
+    assert isinstance(events[-1], WorkflowCompleteEventData)
+
+
+def test_pause_holds_the_pool_until_resume(monkeypatch, events, images):
+    shared = FakeProvider(delay=0.01)
+    _use(monkeypatch, "claude", shared)
+    worker = BatchProcessingWorker(None, images, "claude", "claude-test", "detailed",
+                                   concurrency=2)
+    worker.pause()
+    worker.start()
+    time.sleep(0.2)
+    assert _described(events) == [] and worker.is_paused()
+
+    worker.resume()
+    worker.join(timeout=10)
+    assert len(_described(events)) == len(images)
+
+
+def test_an_unknown_provider_still_fails_image_by_image(monkeypatch, events, images):
+    _use(monkeypatch, "claude", FakeProvider())
+    worker = BatchProcessingWorker(None, images[:2], "nope", "m", "detailed")
+    worker.run()
+
+    failed = [e for e in events if isinstance(e, workers_wx.ProcessingFailedEventData)]
+    assert len(failed) == 2 and "not available" in failed[0].error
+    assert events[-1].input_dir == "2/2 images"
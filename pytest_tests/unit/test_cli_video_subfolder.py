@@ -22,6 +22,7 @@ These tests work on the item the CLI actually registers, without invoking
 opencv or extracting anything.
 """
 
+import re
 import sys
 from pathlib import Path
 
@@ -128,7 +129,7 @@ def test_the_cli_registration_site_passes_a_source_root():
              and not line.strip().startswith("def ")]
     assert calls, "no call sites found"
     for call in calls:
-        assert call.rstrip().endswith("opts, source)"), (
+        assert re.search(r"opts, source(, \w+=\w+)*(\)|,$)", call), (
             f"call site does not pass the source root: {call!r}. Without it "
             "every video reverts to subfolder=None."
         )
@@ -149,3 +150,31 @@ def test_the_video_and_its_photos_share_one_tree_group(tmp_path, source):
         "anything under None renders at the tree root, outside the folder"
     )
     assert len(groups["07"]) == 3
+
+
+def test_a_video_that_fails_to_register_does_not_stop_the_others(tmp_path, source,
+                                                                 monkeypatch, capsys):
+    from types import SimpleNamespace
+
+    from cli import main as cli_main
+    from idt_core.video import VideoExtractionResult
+
+    (source / "other.mov").write_bytes(b"\x00\x00\x00\x18ftypqt  ")
+    registered = []
+
+    def register(ws, video, opts, source_root=None, result=None, frames_name=None):
+        if video.name == "clip.mov":
+            raise OSError("disk full")
+        registered.append(video.name)
+        return []
+
+    monkeypatch.setattr(cli_main, "_extract_video_batch", lambda ws, videos, opts, on_done=None:
+                        [VideoExtractionResult(v, tmp_path, []) for v in videos])
+    monkeypatch.setattr(cli_main, "_extract_one_video_into_workspace", register)
+    monkeypatch.setattr(cli_main, "_set_console_title", lambda title: None)
+
+    ws = Workspace.create(tmp_path / "WS")
+    cli_main._extract_videos_into_workspace(ws, source, SimpleNamespace(quiet=False))
+
+    assert registered == ["other.mov"]
+    assert "clip.mov: skipped (disk full)" in capsys.readouterr().out
@@ -0,0 +1,370 @@
+"""
+Concurrent image downloads (idt_core.downloader) against a local HTTP server:
+page-order results whatever order downloads finish in, per-host limits, a
+throttled host left alone for its Retry-After, small images abandoned after
+their header, a second download of the same URLs answered by 304s, and a
+crawl that stays within its depth, page budget and domain.
+"""
+import io
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+from PIL import Image  # noqa: E402
+
+import idt_core.download_cache as download_cache  # noqa: E402
+from idt_core.download_cache import DownloadCache  # noqa: E402
+from idt_core.downloader import (  # noqa: E402
+    HostScheduler, WebImageDownloader, _download_one, crawl_pages, download_into_workspace,
+    fetch_images, make_session,
+)
+
+
+def _png(size, colour) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", size, colour).save(buf, "PNG")
+    return buf.getvalue()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802 - BaseHTTPRequestHandler's naming
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            script = server.throttle.get(self.path, [])
+            throttled = script.pop(0) if script else None
+        try:
+            time.sleep(server.delays.get(self.path, 0.02))
+            etag = f'"{hash(server.routes.get(self.path))}"'
+            if throttled is not None:
+                self._send(429, b"slow down", {"Retry-After": str(throttled)})
+            elif self.path in server.routes and self.headers.get("If-None-Match") == etag:
+                self._send(304, b"", {"ETag": etag})
+            elif self.path in server.routes:
+                body = server.routes[self.path]
+                kind = "text/html" if body.startswith(b"<") else "image/png"
+                self._send(200, body, {"Content-Type": kind, "ETag": etag})
+                with server.lock:
+                    server.bodies += 1
+            else:
+                self._send(404, b"missing")
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.lock = threading.Lock()
+    server.routes, server.delays, server.throttle, server.hits = {}, {}, {}, {}
+    server.active = server.peak = server.bodies = 0
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_results_are_in_page_order_whatever_finishes_first(site, tmp_path):
+    site.routes.update({
+        "/slow.png": _png((64, 64), "red"),
+        "/fast.png": _png((64, 64), "green"),
+        "/again.png": _png((64, 64), "red"),      # same content as slow.png
+        "/icon.png": _png((8, 8), "blue"),
+    })
+    site.delays["/slow.png"] = 0.3
+    urls = [site.url + p for p in ("/slow.png", "/fast.png", "/again.png", "/icon.png", "/gone.png")]
+
+    paths = fetch_images(make_session(), urls, tmp_path, min_width=32, workers=4,
+                         scheduler=HostScheduler(connections=4, delay=0))
+
+    assert list(paths) == [0, 1, 2, 3, 4]
+    assert [p.name if p else None for p in paths.values()] == [
+        "slow.png", "fast.png", None, None, None,
+    ]
+    assert sorted(f.name for f in tmp_path.iterdir()) == ["fast.png", "slow.png"]
+
+
+def test_max_images_counts_distinct_images(site, tmp_path):
+    for n in range(6):
+        site.routes[f"/{n}.png"] = _png((40, 40), (n * 40, 0, 0))
+    urls = [f"{site.url}/{n}.png" for n in range(6)]
+
+    paths = fetch_images(make_session(), urls, tmp_path, max_images=2, workers=1)
+
+    assert [p.name for p in paths.values() if p] == ["0.png", "1.png"]
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_one_host_gets_at_most_its_connections(site, tmp_path):
+    for n in range(8):
+        site.routes[f"/{n}.png"] = _png((40, 40), (0, n * 30, 0))
+        site.delays[f"/{n}.png"] = 0.1
+    urls = [f"{site.url}/{n}.png" for n in range(8)]
+
+    fetch_images(make_session(), urls, tmp_path, workers=8,
+                 scheduler=HostScheduler(connections=2, delay=0))
+
+    assert site.peak == 2
+
+
+def test_request_starts_to_a_host_are_spaced_out():
+    scheduler = HostScheduler(connections=4, delay=0.1)
+    starts = []
+
+    def fetch():
+        with scheduler.slot("http://example.com/a.jpg"):
+            starts.append(time.monotonic())
+
+    threads = [threading.Thread(target=fetch) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    with scheduler.slot("http://other.example/a.jpg"):
+        pass   # another host is not held up by example.com's spacing
+
+    starts.sort()
+    assert all(b - a >= 0.09 for a, b in zip(starts, starts[1:]))
+
+
+def test_a_throttled_image_is_fetched_after_retry_after(site, tmp_path):
+    site.routes["/busy.png"] = _png((40, 40), "white")
+    site.throttle["/busy.png"] = [0]
+
+    paths = fetch_images(make_session(), [site.url + "/busy.png"], tmp_path)
+
+    assert paths[0].name == "busy.png"
+    assert site.hits["/busy.png"] == 2
+
+
+def test_download_into_workspace_registers_in_page_order(site, tmp_path):
+    from idt_core.workspace import Workspace
+
+    site.routes.update({
+        "/": b"<html><title>Boats</title><img src='/b.png' alt='Blue boat'>"
+             b"<img src='a.png' alt='Red boat'></html>",
+        "/a.png": _png((50, 50), "red"),
+        "/b.png": _png((50, 50), "blue"),
+    })
+    site.delays["/b.png"] = 0.2
+    ws = Workspace.create(tmp_path / "WS")
+
+    result = download_into_workspace(ws, site.url + "/", workers=4)
+
+    assert (result.downloaded, result.skipped) == (2, 0)
+    assert [i.alt_text for i in result.items] == ["Blue boat", "Red boat"]
+    assert result.subfolder.startswith("downloads/127.0.0.1 - Boats - ")
+
+
+def test_a_small_image_is_abandoned_after_its_header(tmp_path):
+    from PIL import PngImagePlugin
+
+    info = PngImagePlugin.PngInfo()
+    info.add_text("padding", "x" * 500_000)     # a 12x12 image half a megabyte long
+    buf = io.BytesIO()
+    Image.new("RGB", (12, 12), "red").save(buf, "PNG", pnginfo=info)
+    body = buf.getvalue()
+    sent = []
+
+    class Response:
+        status_code, headers = 200, {}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, size):
+            for start in range(0, len(body), size):
+                sent.append(size)
+                yield body[start:start + size]
+
+    class Session:
+        def get(self, url, **kwargs):
+            return Response()
+
+    got = _download_one(Session(), "http://example.com/p.png", 1, tmp_path, 100, 100, 5,
+                        Image, HostScheduler(delay=0))
+
+    assert got.path is None and (got.record.width, got.record.height) == (12, 12)
+    assert sum(sent) < 20_000
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_a_png_header_split_across_chunks_is_not_misread(tmp_path):
+    body = _png((200, 150), "blue")
+
+    class Response:
+        status_code, headers = 200, {}
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def raise_for_status(self):
+            pass
+
+        def iter_content(self, size):
+            yield body[:16]                       # signature and IHDR tag, no size yet
+            yield body[16:]
+
+    class Session:
+        def get(self, url, **kwargs):
+            return Response()
+
+    got = _download_one(Session(), "http://example.com/p.png", 1, tmp_path, 100, 100, 5,
+                        Image, HostScheduler(delay=0))
+
+    assert got.path is not None and (got.record.width, got.record.height) == (200, 150)
+
+
+def test_a_second_download_of_the_same_urls_is_answered_by_304s(site, tmp_path):
+    site.routes.update({"/big.png": _png((80, 80), "red"), "/icon.png": _png((8, 8), "blue")})
+    urls = [site.url + "/big.png", site.url + "/icon.png"]
+    cache = DownloadCache(tmp_path / "downloads.sqlite3")
+
+    first = fetch_images(make_session(), urls, tmp_path / "one", min_width=32, cache=cache)
+    assert site.bodies == 2
+    second = fetch_images(make_session(), urls, tmp_path / "two", min_width=32, cache=cache)
+
+    assert site.bodies == 2 and cache.hits == 2
+    assert second[0].read_bytes() == first[0].read_bytes()
+    assert second[0].parent == tmp_path / "two" and second[1] is None
+
+    second[0].unlink()     # the copy the cache points at is gone: fetch the body again
+    third = fetch_images(make_session(), urls[:1], tmp_path / "three", cache=cache)
+    assert third[0].name == "big.png" and site.bodies == 3
+
+
+def test_a_dropped_duplicate_is_remembered_at_the_kept_file(site, tmp_path):
+    body = _png((80, 80), "red")
+    site.routes.update({"/a.png": body, "/b.png": body})
+    urls = [site.url + "/a.png", site.url + "/b.png"]
+    cache = DownloadCache(tmp_path / "downloads.sqlite3")
+
+    got = fetch_images(make_session(), urls, tmp_path / "out", cache=cache)
+
+    assert got[1] is None
+    assert cache.get(urls[1]).path == str(got[0].resolve())
+    assert [p.name for p in (tmp_path / "out").iterdir()] == ["a.png"]
+
+    seen = {cache.get(urls[0]).md5}      # already in the workspace: nothing is kept
+    again = fetch_images(make_session(), urls[:1], tmp_path / "again", seen_hashes=seen,
+                         cache=cache)
+    assert again[0] is None and cache.get(urls[0]).path is None
+
+
+def _pages(site, links):
+    """Route each path to an HTML page linking to the given hrefs."""
+    for path, hrefs in links.items():
+        anchors = "".join(f"<a href='{h}'>link</a>" for h in hrefs)
+        site.routes[path] = f"<html><title>{path}</title>{anchors}</html>".encode()
+
+
+def test_a_crawl_follows_links_breadth_first_within_its_limits(site):
+    port = site.server_address[1]
+    _pages(site, {
+        "/": ["/a", "/b", "/a#top", f"http://localhost:{port}/elsewhere", "/big.png"],
+        "/a": ["/c", "/"],
+        "/b": ["/d", "/report.pdf", "/missing"],
+        "/c": [], "/d": [], "/elsewhere": [],
+    })
+    site.routes["/report.pdf"] = b"%PDF-1.4"
+    site.delays["/a"] = 0.2         # finishes last; still listed in link order
+    crawl = dict(timeout=5, scheduler=HostScheduler(connections=4, delay=0))
+
+    one = crawl_pages(make_session(), site.url + "/", max_depth=1, **crawl)
+    assert [p.url[len(site.url):] for p in one] == ["/", "/a", "/b"]
+    assert [p.depth for p in one] == [0, 1, 1]
+    assert "/elsewhere" not in site.hits and "/big.png" not in site.hits
+    assert site.hits["/a"] == 1
+
+    two = crawl_pages(make_session(), site.url + "/", max_depth=2, **crawl)
+    assert [p.url[len(site.url):] for p in two] == ["/", "/a", "/b", "/c", "/d"]
+    assert site.hits["/report.pdf"] == 1 and site.hits["/missing"] == 1
+
+    capped = crawl_pages(make_session(), site.url + "/", max_depth=5, max_pages=2, **crawl)
+    assert [p.url[len(site.url):] for p in capped] == ["/", "/a"]
+    assert site.hits["/b"] == 2
+
+    anywhere = crawl_pages(make_session(), site.url + "/", max_depth=1, same_domain=False,
+                           **crawl)
+    assert anywhere[-1].url == f"http://localhost:{port}/elsewhere"
+
+
+def test_the_start_page_failing_is_an_error(site):
+    import requests
+
+    with pytest.raises(requests.HTTPError):
+        crawl_pages(make_session(), site.url + "/nothing-here", max_depth=2, timeout=5)
+
+
+def test_a_crawl_downloads_every_pages_images_once(site, tmp_path):
+    from idt_core.workspace import Workspace
+
+    site.routes.update({
+        "/": b"<html><title>Harbour</title><img src='/a.png'><a href='/more'>more</a></html>",
+        "/more": b"<html><img src='/b.png' alt='Blue boat'><img src='/a.png' alt='Red boat'>"
+                 b"</html>",
+        "/a.png": _png((50, 50), "red"),
+        "/b.png": _png((50, 50), "blue"),
+    })
+    ws = Workspace.create(tmp_path / "WS")
+    pages = []
+
+    result = download_into_workspace(ws, site.url + "/", max_depth=1, workers=4,
+                                     on_page=lambda n, url: pages.append(url))
+
+    assert pages == [site.url + "/", site.url + "/more"]
+    assert [(i.download_url[len(site.url):], i.alt_text) for i in result.items] == [
+        ("/a.png", "Red boat"), ("/b.png", "Blue boat"),
+    ]
+    assert site.hits["/a.png"] == 1
+    assert result.subfolder.startswith("downloads/127.0.0.1 - Harbour - ")
+
+
+def test_the_gui_downloader_fetches_and_parses_its_page_once(site, tmp_path, monkeypatch):
+    monkeypatch.setattr(download_cache, "DEFAULT_CACHE_PATH", tmp_path / "downloads.sqlite3")
+    site.routes.update({
+        "/page": b"<html><title>Holiday snaps</title>"
+                 b"<img src='/a.png' alt='A beach'><a href='/b.png'>b</a></html>",
+        "/a.png": _png((64, 64), "red"), "/b.png": _png((64, 64), "green"),
+    })
+
+    downloader = WebImageDownloader(site.url + "/page", tmp_path / "out")
+    assert downloader.download() == (2, 0)
+
+    assert site.hits["/page"] == 1
+    assert downloader.actual_output_dir.name.startswith("127.0.0.1 - Holiday snaps - ")
+    alts = (downloader.actual_output_dir / "alt_text_mapping.json").read_text(encoding="utf-8")
+    assert "A beach" in alts
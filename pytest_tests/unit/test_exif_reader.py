@@ -0,0 +1,104 @@
+"""
+The header-only EXIF reader (idt_core.exif_reader) and MetadataExtractor's
+use of it: the same tags come back from every container, without decoding
+pixels, and extract_many() matches extract() path for path.
+"""
+from pathlib import Path
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from idt_core.exif_reader import read_exif  # noqa: E402
+from idt_core.metadata import MetadataExtractor  # noqa: E402
+
+
+def _exif() -> "Image.Exif":
+    exif = Image.Exif()
+    exif[0x010F] = "Apple"
+    exif[0x0110] = "iPhone 14 Pro"
+    sub = exif.get_ifd(0x8769)
+    sub[0x9003] = "2025:09:12 14:03:11"
+    sub[0xA434] = "iPhone 14 Pro back camera"
+    gps = exif.get_ifd(0x8825)
+    gps[1], gps[2] = "N", (48.0, 8.0, 13.5)
+    gps[3], gps[4] = "W", (11.0, 34.0, 0.25)
+    gps[5], gps[6] = b"\x01", 12.5
+    return exif
+
+
+def _save(path: Path, fmt: str, exif=None) -> Path:
+    kwargs = {"exif": exif} if exif is not None else {}
+    Image.new("RGB", (16, 16), "red").save(path, fmt, **kwargs)
+    return path
+
+
+@pytest.mark.parametrize("ext,fmt", [("jpg", "JPEG"), ("png", "PNG"), ("webp", "WEBP")])
+def test_tags_are_read_from_each_container(tmp_path, ext, fmt):
+    exif = read_exif(_save(tmp_path / f"a.{ext}", fmt, _exif()))
+    assert exif["Make"] == "Apple"
+    assert exif["DateTimeOriginal"] == "2025:09:12 14:03:11"
+    assert exif["GPSInfo"]["GPSLatitude"] == (48.0, 8.0, 13.5)
+    assert exif["GPSInfo"]["GPSAltitudeRef"] == 1
+
+
+def test_heic_exif_item_is_found_in_the_meta_box(tmp_path):
+    pillow_heif = pytest.importorskip("pillow_heif")
+    pillow_heif.register_heif_opener()
+    exif = read_exif(_save(tmp_path / "a.heic", "HEIF", _exif().tobytes()))
+    assert exif["Model"] == "iPhone 14 Pro"
+    assert exif["GPSInfo"]["GPSLongitudeRef"] == "W"
+
+
+def test_no_exif_is_an_empty_dict(tmp_path):
+    assert read_exif(_save(tmp_path / "a.jpg", "JPEG")) == {}
+    assert read_exif(_save(tmp_path / "a.png", "PNG")) == {}
+
+
+def test_unknown_or_malformed_files_defer_to_pil(tmp_path):
+    odd = tmp_path / "a.bin"
+    odd.write_bytes(b"not an image at all")
+    assert read_exif(odd) is None
+
+    broken = tmp_path / "b.jpg"
+    broken.write_bytes(b"\xff\xd8\xff\xe1\x00\x20Exif\x00\x00II*\x00\xff\xff\xff\x7f")
+    assert read_exif(broken) is None
+
+
+def test_extract_fills_metadata_from_the_header(tmp_path):
+    meta = MetadataExtractor().extract(_save(tmp_path / "a.jpg", "JPEG", _exif()))
+    assert meta.date_from_exif is True
+    assert meta.date_short == "Sep 12, 2025"
+    assert meta.camera_lens == "iPhone 14 Pro back camera"
+    assert meta.latitude == pytest.approx(48.137083, abs=1e-5)
+    assert meta.longitude == pytest.approx(-11.566736, abs=1e-5)
+    assert meta.altitude == -12.5
+
+
+def test_pil_fallback_agrees_with_the_header_reader(tmp_path):
+    from idt_core.metadata import ImageMetadata
+
+    path = _save(tmp_path / "a.jpg", "JPEG", _exif())
+    extractor = MetadataExtractor()
+    via_pil = ImageMetadata()
+    exif = extractor._pil_exif(path)
+    extractor._fill_datetime(via_pil, exif)
+    extractor._fill_location(via_pil, exif)
+    extractor._fill_camera(via_pil, exif)
+    assert via_pil == extractor.extract(path)
+
+
+def test_extract_many_matches_extract_in_order(tmp_path):
+    paths = [_save(tmp_path / f"{n}.jpg", "JPEG", _exif() if n % 2 else None) for n in range(6)]
+    extractor = MetadataExtractor()
+    assert extractor.extract_many(paths) == [extractor.extract(p) for p in paths]
+
+
+def test_extract_many_uses_a_process_pool_for_large_batches(tmp_path, monkeypatch):
+    import idt_core.metadata as metadata
+
+    monkeypatch.setattr(metadata, "EXTRACT_POOL_MIN", 2)
+    paths = [_save(tmp_path / f"{n}.jpg", "JPEG", _exif()) for n in range(4)]
+    extractor = MetadataExtractor()
+    assert extractor.extract_many(paths, workers=2) == [extractor.extract(p) for p in paths]
@@ -0,0 +1,118 @@
+"""
+file_copy — parallel copies that link where they can and skip what a previous
+call already placed, going by the manifest it leaves in the destination.
+"""
+import os
+
+import pytest
+
+from idt_core.file_copy import CopyManifest, MANIFEST_NAME, copy_file, copy_files
+
+
+@pytest.fixture
+def sources(tmp_path):
+    src = tmp_path / "Photos"
+    src.mkdir()
+    paths = []
+    for n in range(4):
+        p = src / f"img{n}.jpg"
+        p.write_bytes(bytes([n]) * (1000 + n))
+        paths.append(p)
+    return paths
+
+
+def _jobs(paths, out):
+    return [(p, out / "images" / p.name) for p in paths]
+
+
+def test_each_method_places_the_same_bytes(sources, tmp_path):
+    src = sources[0]
+    out = tmp_path / "out"
+    out.mkdir()
+
+    assert copy_file(src, out / "copy.jpg", "copy") == "copy"
+    assert copy_file(src, out / "link.jpg", "link") == "link"
+    assert copy_file(src, out / "auto.jpg") in ("reflink", "copy")
+
+    for name in ("copy.jpg", "link.jpg", "auto.jpg"):
+        assert (out / name).read_bytes() == src.read_bytes()
+    assert not (out / "copy.jpg").samefile(src)
+    assert (out / "link.jpg").samefile(src)
+    assert not (out / "auto.jpg").samefile(src)       # never a hard link unless asked
+    assert os.stat(out / "copy.jpg").st_mtime_ns == os.stat(src).st_mtime_ns
+    assert sorted(p.name for p in out.iterdir()) == ["auto.jpg", "copy.jpg", "link.jpg"]
+
+    with pytest.raises(ValueError):
+        copy_file(src, out / "x.jpg", "rsync")
+
+
+def test_a_second_call_copies_only_what_changed(sources, tmp_path):
+    out = tmp_path / "out"
+    first = copy_files(_jobs(sources, out), out, method="copy")
+    assert [o.how for o in first] == ["copy"] * 4
+
+    touched, edited, dropped = sources[1], sources[2], sources[3]
+    os.utime(touched, ns=(1, 1))                   # new mtime, same bytes
+    edited.write_bytes(b"new" * 400)
+    (out / "images" / "mine.txt").write_text("not the exporter's", encoding="utf-8")
+
+    second = copy_files(_jobs(sources[:3], out), out, method="copy")
+
+    assert [o.how for o in second] == ["unchanged", "unchanged", "copy"]
+    assert (out / "images" / "img2.jpg").read_bytes() == b"new" * 400
+    assert not (out / "images" / dropped.name).exists()
+    assert (out / "images" / "mine.txt").exists()
+    third = copy_files(_jobs(sources[:3], out), out, method="copy")
+    assert [o.how for o in third] == ["unchanged"] * 3
+
+
+def test_a_placed_file_that_was_changed_is_placed_again(sources, tmp_path):
+    out = tmp_path / "out"
+    copy_files(_jobs(sources[:1], out), out, method="copy")
+    (out / "images" / "img0.jpg").write_bytes(b"scribbled")
+
+    again = copy_files(_jobs(sources[:1], out), out, method="copy")
+
+    assert again[0].how == "copy"
+    assert (out / "images" / "img0.jpg").read_bytes() == sources[0].read_bytes()
+
+
+def test_failures_are_reported_in_job_order(sources, tmp_path):
+    out = tmp_path / "out"
+    jobs = _jobs(sources[:2], out)
+    jobs.insert(1, (tmp_path / "gone.jpg", out / "images" / "gone.jpg"))
+    done = []
+
+    outcomes = copy_files(jobs, out, on_done=lambda n, total, src: done.append((n, total)))
+
+    assert [o.ok for o in outcomes] == [True, False, True]
+    assert "gone.jpg" in outcomes[1].error
+    assert sorted(done) == [(1, 3), (2, 3), (3, 3)]
+    assert sorted(CopyManifest.load(out / MANIFEST_NAME).entries) == [
+        "images/img0.jpg", "images/img1.jpg",
+    ]
+
+
+def test_a_file_whose_replacement_fails_keeps_its_earlier_copy(sources, tmp_path):
+    out = tmp_path / "out"
+    copy_files(_jobs(sources[:2], out), out, method="copy")
+    previous = sources[1].read_bytes()
+    sources[1].unlink()
+
+    again = copy_files(_jobs(sources[:2], out), out, method="copy")
+
+    assert [o.ok for o in again] == [True, False]
+    assert (out / "images" / "img1.jpg").read_bytes() == previous
+    assert sorted(CopyManifest.load(out / MANIFEST_NAME).entries) == [
+        "images/img0.jpg", "images/img1.jpg",
+    ]
+
+
+def test_a_damaged_manifest_costs_a_full_copy(sources, tmp_path):
+    out = tmp_path / "out"
+    copy_files(_jobs(sources[:2], out), out, method="copy")
+    (out / MANIFEST_NAME).write_text("{not json", encoding="utf-8")
+
+    again = copy_files(_jobs(sources[:2], out), out, method="copy")
+
+    assert [o.how for o in again] == ["copy", "copy"]
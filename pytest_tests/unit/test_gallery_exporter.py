@@ -3,24 +3,33 @@ gallery_exporter — HTML gallery export.
 
 Covers the progress callback the GUI uses to drive its "Exporting gallery"
 stage. The per-image copy loop dominates export time, so a miscount would
-leave the progress bar stuck short of the end.
+leave the progress bar stuck short of the end. Also: re-exports that leave
+unchanged images alone, and pages that show web-sized renders.
 """
 import sys
 from pathlib import Path
 
 import pytest
 
-from idt_core import gallery_exporter
+from idt_core import gallery_exporter, web_images
 
 # The GUI data model lives in imagedescriber/
 _ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(_ROOT / "imagedescriber"))
 
 
-def _make_jpeg(path: Path, color=(90, 140, 210)):
+def _make_jpeg(path: Path, color=(90, 140, 210), size=(16, 16)):
     from PIL import Image
     path.parent.mkdir(parents=True, exist_ok=True)
-    Image.new("RGB", (16, 16), color).save(path, "JPEG")
+    Image.new("RGB", size, color).save(path, "JPEG")
+
+
+@pytest.fixture(autouse=True)
+def web_cache(tmp_path, monkeypatch):
+    """Keep renders out of the real ~/.idt/cache."""
+    cache = tmp_path / "web-cache"
+    monkeypatch.setattr(web_images, "DEFAULT_CACHE_DIR", cache)
+    return cache
 
 
 @pytest.fixture
@@ -85,3 +94,57 @@ def test_progress_counts_missing_sources_too(described_items, tmp_path):
     assert result["images_skipped"] == 1
     assert result["images_copied"] == 2
     assert calls == [1, 2, 3]                # counter reached the total anyway
+
+
+def test_re_export_leaves_unchanged_images_alone(described_items, tmp_path):
+    """Editing descriptions and exporting again rewrites index.html only."""
+    options = {"output_dir": str(tmp_path / "out4"), "title": "T"}
+    first = gallery_exporter.export_gallery(described_items, options)
+    assert (first["images_copied"], first["images_unchanged"]) == (3, 0)
+
+    next(iter(described_items.values())).descriptions[-1].text = "Edited."
+    second = gallery_exporter.export_gallery(described_items, options)
+
+    assert (second["images_copied"], second["images_unchanged"]) == (3, 3)
+    assert "Edited." in Path(second["output_file"]).read_text(encoding="utf-8")
+    assert sorted(p.name for p in (tmp_path / "out4" / "images").glob("*.jpg")) == [
+        "img0.jpg", "img1.jpg", "img2.jpg",
+    ]
+
+
+def test_pages_show_web_renders_through_srcset(tmp_path, web_cache):
+    from data_models import ImageItem, ImageDescription
+
+    big = tmp_path / "Photos" / "big.jpg"
+    _make_jpeg(big, size=(2400, 1600))
+    item = ImageItem(str(big))
+    item.add_description(ImageDescription(text="A wide view.", model="m",
+                                          prompt_style="p", provider="x"))
+    out = tmp_path / "out5"
+
+    for style in ("card_grid", "lightbox_grid", "photo_essay"):
+        result = gallery_exporter.export_gallery(
+            {str(big): item}, {"output_dir": str(out), "title": "T", "style": style},
+        )
+        page = Path(result["output_file"]).read_text(encoding="utf-8")
+        assert 'images/web/big-jpg-480.jpg 480w' in page
+        assert 'images/big.jpg"' not in page             # the original is never shown
+
+    renders = sorted(p.name for p in (out / "images" / "web").iterdir())
+    assert "big-jpg-1600.jpg" in renders and "big-jpg-2400.jpg" not in renders
+    modern = web_images.modern_format()
+    if modern:
+        assert f"big-jpg-480.{web_images.EXTENSIONS[modern]}" in renders
+        assert f'<source type="{web_images.MIME_TYPES[modern]}"' in page
+    assert (out / "images" / "big.jpg").exists()       # still published, full size
+    assert len(list(web_cache.glob("*/*.json"))) == 1  # rendered once for three exports
+
+
+def test_web_images_can_be_turned_off(described_items, tmp_path):
+    result = gallery_exporter.export_gallery(
+        described_items, {"output_dir": str(tmp_path / "out6"), "title": "T",
+                          "web_images": False},
+    )
+    page = Path(result["output_file"]).read_text(encoding="utf-8")
+    assert '<img src="images/img0.jpg"' in page and "srcset" not in page
+    assert not (tmp_path / "out6" / "images" / "web").exists()
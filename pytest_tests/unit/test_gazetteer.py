@@ -0,0 +1,139 @@
+"""
+Offline reverse geocoding (idt_core.gazetteer): nearest-place lookups from a
+GeoNames-style cities file, with no network, and make_geocoder's modes.
+"""
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from idt_core.gazetteer import (
+    Gazetteer, GazetteerNotFound, OfflineGeocoder, find_gazetteer, load_gazetteer,
+)
+from idt_core.metadata import ImageMetadata, NominatimGeocoder, geocode_mode, make_geocoder
+
+# geonameid, name, asciiname, alternatenames, lat, lon, class, code, cc, cc2, admin1, ...
+_CITIES = [
+    ("5261457", "Madison", "43.07305", "-89.40123", "US", "WI"),
+    ("5261969", "Monona", "43.06222", "-89.33373", "US", "WI"),
+    ("2867714", "Munich", "48.13743", "11.57549", "DE", "02"),
+    ("2193733", "Auckland", "-36.84853", "174.76349", "NZ", "E7"),
+    ("4031574", "Apia", "-13.83333", "-171.76666", "WS", "11"),
+]
+
+
+def _row(gid, name, lat, lon, cc, admin1) -> str:
+    cols = [gid, name, name, "", lat, lon, "P", "PPL", cc, "", admin1,
+            "", "", "", "1000", "", "", "UTC", "2024-01-01"]
+    return "\t".join(cols) + "\n"
+
+
+def _gazetteer_dir(folder: Path, names: bool = True) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "cities1000.txt").write_text("".join(_row(*c) for c in _CITIES), encoding="utf-8")
+    if names:
+        (folder / "admin1CodesASCII.txt").write_text(
+            "US.WI\tWisconsin\tWisconsin\t5279468\nDE.02\tBavaria\tBavaria\t2951839\n",
+            encoding="utf-8",
+        )
+        (folder / "countryInfo.txt").write_text(
+            "#ISO\tISO3\tISO-Numeric\tfips\tCountry\n"
+            "US\tUSA\t840\tUS\tUnited States\nDE\tDEU\t276\tGM\tGermany\n",
+            encoding="utf-8",
+        )
+    return folder
+
+
+def test_nearest_place_with_state_and_country_names(tmp_path):
+    gaz = Gazetteer.load(_gazetteer_dir(tmp_path / "g"))
+    place, km = gaz.nearest(43.0642, -89.3380)
+    assert (place.name, place.admin1, place.country) == ("Monona", "Wisconsin", "United States")
+    assert km < 1
+
+
+def test_without_name_files_the_country_is_its_code(tmp_path):
+    gaz = Gazetteer.load(_gazetteer_dir(tmp_path / "g", names=False))
+    place, _ = gaz.nearest(48.14, 11.58)
+    assert (place.name, place.admin1, place.country) == ("Munich", None, "DE")
+
+
+def test_search_crosses_the_antimeridian(tmp_path):
+    gaz = Gazetteer.load(_gazetteer_dir(tmp_path / "g"))
+    place, km = gaz.nearest(-13.9, 179.9, max_km=2000)
+    assert place.name == "Apia"
+    assert km < 1000
+
+
+def test_nothing_within_max_km_is_no_answer(tmp_path):
+    gaz = Gazetteer.load(_gazetteer_dir(tmp_path / "g"))
+    assert gaz.nearest(0.0, 0.0) is None
+
+
+def test_matches_a_brute_force_scan(tmp_path):
+    import random
+    from idt_core.gazetteer import Place, _haversine_km
+
+    rng = random.Random(7)
+    places = [Place(str(n), None, "XX", rng.uniform(40, 50), rng.uniform(0, 20)) for n in range(2000)]
+    gaz = Gazetteer(places)
+    for _ in range(200):
+        lat, lon = rng.uniform(39, 51), rng.uniform(-1, 21)
+        expected = min(places, key=lambda p: _haversine_km(lat, lon, p.latitude, p.longitude))
+        found = gaz.nearest(lat, lon, max_km=1000)
+        assert found[0] == expected
+
+
+def test_a_zipped_dump_is_read_directly(tmp_path):
+    source = _gazetteer_dir(tmp_path / "src", names=False) / "cities1000.txt"
+    folder = tmp_path / "zipped"
+    folder.mkdir()
+    with zipfile.ZipFile(folder / "cities1000.zip", "w") as zf:
+        zf.write(source, "cities1000.txt")
+    assert len(load_gazetteer(folder)) == len(_CITIES)
+
+
+def test_missing_gazetteer_says_where_to_get_one(tmp_path):
+    with pytest.raises(GazetteerNotFound, match="download.geonames.org"):
+        load_gazetteer(tmp_path / "empty")
+    with pytest.raises(GazetteerNotFound):
+        find_gazetteer(tmp_path / "empty")
+
+
+def test_find_gazetteer_names_the_file_load_would_read(tmp_path):
+    folder = _gazetteer_dir(tmp_path / "g")
+    (folder / "cities15000.zip").write_bytes(b"")
+    assert find_gazetteer(folder) == folder / "cities1000.txt"
+
+
+def test_offline_geocoder_enriches_metadata(tmp_path):
+    geocoder = OfflineGeocoder(load_gazetteer(_gazetteer_dir(tmp_path / "g")))
+    meta = geocoder.enrich(ImageMetadata(latitude=48.1, longitude=11.6))
+    assert meta.prompt_context() == "Munich, Bavaria"
+    assert meta.place_source == "geonames"
+    assert geocoder.enrich(ImageMetadata()).city is None
+
+
+def test_refine_lets_nominatim_override(tmp_path):
+    class Online:
+        def enrich(self, meta):
+            meta.city = "Maxvorstadt"
+            meta.place_source = "nominatim"
+            return meta
+
+    geocoder = OfflineGeocoder(load_gazetteer(_gazetteer_dir(tmp_path / "g")), refine=Online())
+    meta = geocoder.enrich(ImageMetadata(latitude=48.1, longitude=11.6))
+    assert (meta.city, meta.state) == ("Maxvorstadt", "Bavaria")
+    assert meta.place_source == "nominatim"
+
+
+def test_make_geocoder_modes(tmp_path):
+    gaz = _gazetteer_dir(tmp_path / "g")
+    assert make_geocoder(False) is None
+    assert make_geocoder("off") is None
+    assert isinstance(make_geocoder(True, cache_path=tmp_path / "c.json"), NominatimGeocoder)
+    offline = make_geocoder("offline", gazetteer_path=gaz)
+    assert isinstance(offline, OfflineGeocoder) and offline.refine is None
+    refine = make_geocoder("refine", cache_path=tmp_path / "c.json", gazetteer_path=gaz)
+    assert isinstance(refine.refine, NominatimGeocoder)
+    with pytest.raises(ValueError):
+        geocode_mode("satellite")
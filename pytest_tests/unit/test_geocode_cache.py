@@ -0,0 +1,127 @@
+"""
+NominatimGeocoder's spatial cache: photos in the same cell, or close to a
+cached one, share a lookup; prefetch() asks once per distinct place; results
+are appended to a journal rather than rewriting the cache file each time.
+"""
+import json
+
+import pytest
+
+from idt_core import metadata as metadata_mod
+from idt_core.metadata import ImageMetadata, NominatimGeocoder, geohash
+
+
+class _FakeRequests:
+    """Stands in for the requests module: answers by rough location, counts calls."""
+
+    def __init__(self, fail: bool = False):
+        self.calls = []
+        self.fail = fail
+
+    def get(self, url, params, headers, timeout):
+        self.calls.append((params["lat"], params["lon"]))
+        if self.fail:
+            raise OSError("network is unreachable")
+        city = "Madison" if params["lon"] < 0 else "Munich"
+        test = self
+
+        class _Response:
+            def raise_for_status(self):
+                pass
+
+            def json(self):
+                return {"address": {"city": city, "country": "Somewhere", "n": len(test.calls)}}
+
+        return _Response()
+
+
+@pytest.fixture
+def geocoder(tmp_path, monkeypatch):
+    monkeypatch.setattr(metadata_mod.time, "sleep", lambda seconds: None)
+
+    def make(fail: bool = False, **kwargs) -> NominatimGeocoder:
+        geo = NominatimGeocoder(cache_path=tmp_path / "geocode_cache.json", **kwargs)
+        geo._requests, geo._requests_ok = _FakeRequests(fail), True
+        return geo
+
+    return make
+
+
+def _enrich(geo, lat, lon):
+    return geo.enrich(ImageMetadata(latitude=lat, longitude=lon))
+
+
+def test_geohash_matches_the_reference_encoding():
+    assert geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert geohash(-25.382708, -49.265506, 6) == "6gkzwg"
+
+
+def test_photos_a_few_metres_apart_share_one_request(geocoder):
+    geo = geocoder()
+    assert _enrich(geo, 43.07305, -89.40123).city == "Madison"
+    assert _enrich(geo, 43.07320, -89.40110).city == "Madison"
+    munich = _enrich(geo, 48.13743, 11.57549)
+    assert (munich.city, munich.place_source) == ("Munich", "nominatim")
+    assert len(geo._requests.calls) == 2
+
+
+def test_a_cached_answer_just_across_a_cell_edge_is_reused(geocoder):
+    geo = geocoder()
+    _enrich(geo, 43.07305, -89.40123)
+    # ~700 m north: taller than a precision-6 cell, inside reuse_km
+    nearby = (43.07935, -89.40123)
+    assert geohash(*nearby, 6) != geohash(43.07305, -89.40123, 6)
+    assert _enrich(geo, *nearby).city == "Madison"
+    assert len(geo._requests.calls) == 1
+
+
+def test_prefetch_asks_once_per_distinct_place(geocoder):
+    geo = geocoder()
+    points = [(43.07305 + i * 1e-5, -89.40123) for i in range(50)]
+    points += [(48.13743, 11.57549 + i * 1e-5) for i in range(50)]
+
+    assert geo.prefetch(points) == 2
+    for lat, lon in points:
+        _enrich(geo, lat, lon)
+    assert len(geo._requests.calls) == 2
+
+
+def test_prefetch_reports_each_request_and_stops_when_asked(geocoder):
+    geo = geocoder()
+    points = [(10.0 * i, 20.0) for i in range(5)]
+    reported = []
+
+    made = geo.prefetch(points, progress=lambda done, total: reported.append((done, total)),
+                        should_cancel=lambda: len(reported) >= 2)
+
+    assert made == 2 and reported == [(1, 5), (2, 5)]
+
+
+def test_lookups_are_journalled_and_compacted_into_the_legacy_format(geocoder, tmp_path):
+    geo = geocoder()
+    _enrich(geo, 43.07305, -89.40123)
+    _enrich(geo, 48.13743, 11.57549)
+    assert not geo.cache_path.exists()
+    assert len(geo.journal_path.read_text(encoding="utf-8").splitlines()) == 2
+
+    again = geocoder()  # loading folds the journal into the JSON file
+    assert not again.journal_path.exists()
+    stored = json.loads(again.cache_path.read_text(encoding="utf-8"))
+    assert stored["43.073050,-89.401230"]["city"] == "Madison"
+    assert _enrich(again, 48.13743, 11.57549).city == "Munich"
+    assert again._requests.calls == []
+
+
+def test_a_torn_journal_line_is_skipped(geocoder):
+    geo = geocoder()
+    _enrich(geo, 43.07305, -89.40123)
+    with open(geo.journal_path, "a", encoding="utf-8") as f:
+        f.write('["48.137430,11.5')
+    assert _enrich(geocoder(), 43.07305, -89.40123).city == "Madison"
+
+
+def test_a_failed_place_is_not_retried_for_every_photo(geocoder):
+    geo = geocoder(fail=True)
+    for i in range(5):
+        assert _enrich(geo, 43.07305 + i * 1e-5, -89.40123).city is None
+    assert len(geo._requests.calls) == 1
@@ -135,6 +135,43 @@ class TestScanner:
         found = list(scan_images(src))
         assert found == sorted(found)
 
+    def test_streaming_and_parallel_walks_find_the_same_files(self, tmp_path):
+        from idt_core.scanner import scan_images
+        src, images = _make_source_tree(tmp_path)
+        (src / "Day2" / "deeper").mkdir()
+        (src / "Day2" / "deeper" / "late.JPG").write_bytes(_make_tiny_jpeg())
+        (src / "Day1" / "notes.txt").write_text("x", encoding="utf-8")
+        (src / ".Trash").mkdir()
+        (src / ".Trash" / "hidden.jpg").write_bytes(_make_tiny_jpeg())
+
+        expected = list(scan_images(src))
+        assert len(expected) == 4
+        assert sorted(scan_images(src, sort=False)) == expected
+        assert sorted(scan_images(src, sort=False, workers=4)) == expected
+
+    def test_non_recursive_scan_lists_the_top_folder_only(self, tmp_path):
+        from idt_core.scanner import scan_images
+        src, _ = _make_source_tree(tmp_path)
+        top = src / "cover.png"
+        top.write_bytes(b"")
+        assert list(scan_images(src, recursive=False)) == [top]
+
+    def test_symlinked_folders_are_not_followed(self, tmp_path):
+        from idt_core.scanner import scan_images
+        src, images = _make_source_tree(tmp_path)
+        try:
+            (src / "Day1" / "loop").symlink_to(src, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not available")
+        assert list(scan_images(src)) == sorted(images)
+
+    def test_iter_media_takes_the_callers_extensions(self, tmp_path):
+        from idt_core.scanner import iter_media
+        src, _ = _make_source_tree(tmp_path)
+        clip = src / "Day2" / "clip.webm"
+        clip.write_bytes(b"")
+        assert list(iter_media(src, {".webm"})) == [clip]
+
 
 # ------------------------------------------------------------------ #
 # Project tests                                                        #
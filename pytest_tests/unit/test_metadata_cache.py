@@ -0,0 +1,104 @@
+"""
+The per-bundle EXIF metadata cache (idt_core.metadata_cache): a file is read
+once per version, any change to it is a miss, and a broken cache database is
+never worse than no cache.
+"""
+import os
+from pathlib import Path
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from idt_core import metadata as metadata_mod  # noqa: E402
+from idt_core.metadata import MetadataExtractor  # noqa: E402
+from idt_core.metadata_cache import METADATA_CACHE_NAME, MetadataCache, cache_for, file_key  # noqa: E402
+from idt_core.workspace import Workspace  # noqa: E402
+
+
+def _photo(path: Path, model: str = "iPhone 14 Pro") -> Path:
+    exif = Image.Exif()
+    exif[0x0110] = model
+    exif.get_ifd(0x8769)[0x9003] = "2025:09:12 14:03:11"
+    Image.new("RGB", (16, 16), "red").save(path, "JPEG", exif=exif)
+    return path
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths MetadataExtractor actually read from disk."""
+    seen = []
+    real = metadata_mod.read_exif
+
+    def counting(path):
+        seen.append(Path(path).name)
+        return real(path)
+
+    monkeypatch.setattr(metadata_mod, "read_exif", counting)
+    return seen
+
+
+def test_a_file_is_read_once_per_version(tmp_path, reads):
+    photo = _photo(tmp_path / "a.jpg")
+    cache = MetadataCache(tmp_path / METADATA_CACHE_NAME)
+
+    first = MetadataExtractor(cache=cache).extract(photo)
+    again = MetadataExtractor(cache=cache).extract(photo)
+
+    assert again == first
+    assert again.camera_model == "iPhone 14 Pro"
+    assert reads == ["a.jpg"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_a_changed_file_is_read_again(tmp_path, reads):
+    photo = _photo(tmp_path / "a.jpg")
+    extractor = MetadataExtractor(cache=MetadataCache(tmp_path / METADATA_CACHE_NAME))
+    extractor.extract(photo)
+
+    _photo(photo, model="Pixel 8")
+    st = photo.stat()
+    os.utime(photo, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert extractor.extract(photo).camera_model == "Pixel 8"
+    assert reads == ["a.jpg", "a.jpg"]
+
+
+def test_extract_many_reads_only_the_misses(tmp_path, reads):
+    photos = [_photo(tmp_path / f"{n}.jpg") for n in range(3)]
+    extractor = MetadataExtractor(cache=MetadataCache(tmp_path / METADATA_CACHE_NAME))
+    extractor.extract(photos[1])
+
+    metas = extractor.extract_many(photos, workers=1)
+
+    assert [m.camera_model for m in metas] == ["iPhone 14 Pro"] * 3
+    assert sorted(reads) == ["0.jpg", "1.jpg", "2.jpg"]
+
+
+def test_a_corrupt_cache_is_rebuilt(tmp_path):
+    db = tmp_path / METADATA_CACHE_NAME
+    db.write_bytes(b"this is not a database")
+    photo = _photo(tmp_path / "a.jpg")
+    cache = MetadataCache(db)
+
+    cache.put(file_key(photo), {"camera_model": "x"})
+
+    assert cache.get(file_key(photo)) == {"camera_model": "x"}
+
+
+def test_an_unusable_cache_is_only_a_miss(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    photo = _photo(tmp_path / "a.jpg")
+    extractor = MetadataExtractor(cache=MetadataCache(blocker / METADATA_CACHE_NAME))
+
+    assert extractor.extract(photo).camera_model == "iPhone 14 Pro"
+    assert extractor.extract(photo).camera_model == "iPhone 14 Pro"
+
+
+def test_a_bundle_keeps_its_cache_in_derived(tmp_path):
+    ws = Workspace.create(tmp_path / "WS")
+    assert cache_for(ws.path).db_path == ws.derived_dir() / METADATA_CACHE_NAME
+    assert cache_for(ws.path) is cache_for(ws.path)
+    assert cache_for(tmp_path / "plain-folder").db_path != ws.derived_dir() / METADATA_CACHE_NAME
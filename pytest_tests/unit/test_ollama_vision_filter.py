@@ -190,8 +190,8 @@ class TestGuiVisionFilter:
             name = (json or {}).get("model")
             return _Resp({"capabilities": caps.get(name)}, status=show_status)
 
-        monkeypatch.setattr(ap.requests, "get", fake_get)
-        monkeypatch.setattr(ap.requests, "post", fake_post)
+        monkeypatch.setattr(ap._OLLAMA_SESSION, "get", fake_get)
+        monkeypatch.setattr(ap._OLLAMA_SESSION, "post", fake_post)
         p = ap.OllamaProvider()
         p._models_cache = None
         return p
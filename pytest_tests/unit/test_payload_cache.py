@@ -0,0 +1,152 @@
+"""
+The prepared-payload cache (idt_core.payload_cache) — a conversion is done once
+per source bytes + wire profile, originals are never copied in, and the
+directory stays within its size bound.
+"""
+import io
+import os
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+import idt_core.payload_cache as payload_cache
+from idt_core import converter
+from idt_core.converter import WireProfile, load_for_api
+from idt_core.payload_cache import PayloadCache
+
+PROFILE = WireProfile(max_edge=256)
+
+
+def _photo(path: Path, size=(1200, 900), color=(30, 90, 160), fmt="JPEG") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color).save(path, fmt)
+    return path
+
+
+def _entries(root: Path) -> list[Path]:
+    return [p for p in root.rglob("*") if p.is_file()]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return PayloadCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+
+
+@pytest.fixture
+def count_conversions(monkeypatch):
+    calls = []
+    real = converter._encode_for_wire
+
+    def counting(img, profile):
+        calls.append(profile)
+        return real(img, profile)
+
+    monkeypatch.setattr(converter, "_encode_for_wire", counting)
+    return calls
+
+
+def test_a_second_load_reuses_the_conversion(tmp_path, cache, count_conversions):
+    path = _photo(tmp_path / "a.jpg")
+    first = load_for_api(path, PROFILE, cache)
+    second = load_for_api(path, PROFILE, cache)
+
+    assert first == second
+    assert max(Image.open(io.BytesIO(first[0])).size) == 256
+    assert len(count_conversions) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_the_result_matches_an_uncached_load(tmp_path, cache):
+    path = _photo(tmp_path / "a.jpg")
+    assert load_for_api(path, PROFILE, cache) == load_for_api(path, PROFILE)
+
+
+def test_same_bytes_under_another_name_hit(tmp_path, cache, count_conversions):
+    a = _photo(tmp_path / "a.jpg")
+    b = tmp_path / "elsewhere" / "renamed.jpg"
+    b.parent.mkdir()
+    b.write_bytes(a.read_bytes())
+    load_for_api(a, PROFILE, cache)
+    load_for_api(b, PROFILE, cache)
+    assert len(count_conversions) == 1
+
+
+def test_a_different_profile_or_changed_file_misses(tmp_path, cache, count_conversions):
+    path = _photo(tmp_path / "a.jpg")
+    load_for_api(path, PROFILE, cache)
+    load_for_api(path, WireProfile(max_edge=128), cache)
+    _photo(path, color=(200, 10, 10))
+    load_for_api(path, PROFILE, cache)
+    assert len(count_conversions) == 3
+
+
+def test_originals_sent_as_is_are_not_copied_in(tmp_path, cache):
+    path = _photo(tmp_path / "small.jpg", size=(100, 80))
+    assert load_for_api(path, PROFILE, cache) == (path.read_bytes(), "image/jpeg")
+    assert _entries(cache.root) == []
+    assert cache.path_for(path, PROFILE) == path
+
+
+def test_legacy_conversions_are_cached_too(tmp_path, cache):
+    path = _photo(tmp_path / "scan.bmp", size=(64, 64), fmt="BMP")
+    data, mime = load_for_api(path, None, cache)
+    assert mime == "image/jpeg"
+    assert load_for_api(path, None, cache) == (data, mime)
+    assert cache.hits == 1
+
+
+def test_path_for_returns_a_file_of_the_prepared_bytes(tmp_path, cache):
+    path = _photo(tmp_path / "a.jpg")
+    entry = cache.path_for(path, PROFILE)
+    assert entry.suffix == ".jpg" and entry.parent.parent == cache.root
+    assert entry.read_bytes() == load_for_api(path, PROFILE)[0]
+
+
+def test_a_damaged_entry_is_rebuilt(tmp_path, cache):
+    path = _photo(tmp_path / "a.jpg")
+    entry = cache.path_for(path, PROFILE)
+    entry.write_bytes(b"")
+    assert load_for_api(path, PROFILE, cache) == load_for_api(path, PROFILE)
+    assert entry.stat().st_size > 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    paths = [_photo(tmp_path / f"{i}.jpg", color=(i * 40, 50, 90)) for i in range(4)]
+    probe = PayloadCache(tmp_path / "probe", max_bytes=1 << 30)
+    size = probe.path_for(paths[0], PROFILE).stat().st_size
+
+    cache = PayloadCache(tmp_path / "cache", max_bytes=int(size * 3.5))
+    entries = [cache.path_for(p, PROFILE) for p in paths[:3]]
+    for age, entry in enumerate(entries):  # oldest first: 0, 1, 2
+        os.utime(entry, ns=(age * 10**9, age * 10**9))
+    load_for_api(paths[0], PROFILE, cache)  # a hit makes 0 the most recent
+    cache.path_for(paths[3], PROFILE)  # over the bound → evict down to 90%
+
+    assert not entries[1].exists()
+    assert entries[0].exists() and entries[2].exists()
+    assert sum(p.stat().st_size for p in _entries(cache.root)) <= cache.max_bytes
+
+
+def test_an_unwritable_cache_still_returns_the_payload(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("file in the way", encoding="utf-8")
+    cache = PayloadCache(blocker, max_bytes=1 << 20)
+    path = _photo(tmp_path / "a.jpg")
+    assert load_for_api(path, PROFILE, cache) == load_for_api(path, PROFILE)
+    with pytest.raises(OSError):
+        cache.path_for(path, PROFILE)
+
+
+def test_shared_cache_follows_user_config(tmp_path, monkeypatch):
+    from idt_core.config import UserConfig
+
+    monkeypatch.setattr(payload_cache, "_shared", None)
+    monkeypatch.setattr(payload_cache, "DEFAULT_CACHE_DIR", tmp_path / "payloads")
+    monkeypatch.setattr(UserConfig, "load", classmethod(lambda cls: cls(payload_cache_mb=0)))
+    assert payload_cache.shared_cache() is None
+
+    monkeypatch.setattr(UserConfig, "load", classmethod(lambda cls: cls(payload_cache_mb=5)))
+    shared = payload_cache.shared_cache()
+    assert shared.root == tmp_path / "payloads" and shared.max_bytes == 5 * 1024 * 1024
+    assert payload_cache.shared_cache() is shared
@@ -166,7 +166,7 @@ class _OllamaDriver(ProviderDriver):
                 return _FakeResponse(200, "<html>not json</html>", parseable=False)
             raise _ScriptExhausted(kind)
 
-        monkeypatch.setattr("ai_providers.requests.post", fake_post)
+        monkeypatch.setattr("ai_providers._OLLAMA_SESSION.post", fake_post)
         return script
 
     def build(self, monkeypatch, tmp_path, outcomes):
@@ -0,0 +1,116 @@
+"""
+Connection reuse and the asyncio entry point for describe providers.
+
+A batch of thousands of images should ride on a handful of keep-alive
+connections, not open one per image, and asyncio callers should be able to
+keep many describes in flight without a second, loop-bound set of clients.
+"""
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_ROOT = Path(__file__).resolve().parents[2]
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+if str(_ROOT / "imagedescriber") not in sys.path:
+    sys.path.insert(0, str(_ROOT / "imagedescriber"))
+
+from idt_core.providers.base import BaseProvider, DescriptionResult  # noqa: E402
+
+
+class SlowProvider(BaseProvider):
+    """Sleeps like a network round trip and records the peak overlap."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    @property
+    def provider_name(self):
+        return "slow"
+
+    @property
+    def model_name(self):
+        return "slow-1"
+
+    def describe(self, image_bytes, mime_type, prompt):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        return DescriptionResult(text=f"{prompt}:{len(image_bytes)}", model="slow-1", provider="slow")
+
+
+def test_describe_async_returns_what_describe_returns():
+    provider = SlowProvider(delay=0)
+    result = asyncio.run(provider.describe_async(b"abc", "image/jpeg", "p"))
+    assert result == provider.describe(b"abc", "image/jpeg", "p")
+
+
+def test_describe_async_overlaps_calls_under_a_semaphore():
+    provider = SlowProvider()
+
+    async def run_all():
+        gate = asyncio.Semaphore(4)
+
+        async def one(i):
+            async with gate:
+                return await provider.describe_async(b"x" * i, "image/jpeg", "p")
+
+        return await asyncio.gather(*(one(i) for i in range(12)))
+
+    results = asyncio.run(run_all())
+    assert [r.text for r in results] == [f"p:{i}" for i in range(12)]
+    assert provider.peak == 4
+
+
+def test_ollama_describe_reuses_one_client(monkeypatch):
+    ollama = pytest.importorskip("ollama")
+    made = []
+
+    class FakeClient:
+        def __init__(self, host=None):
+            made.append(host)
+
+        def chat(self, model, messages):
+            class Msg:
+                content = "a dock"
+
+            class Resp:
+                message = Msg()
+                prompt_eval_count = 10
+                eval_count = 2
+
+            return Resp()
+
+    monkeypatch.setattr(ollama, "Client", FakeClient)
+    from idt_core.providers.ollama import OllamaProvider
+
+    provider = OllamaProvider(model="llava", host="http://example:11434/")
+    threads = [
+        threading.Thread(target=provider.describe, args=(b"img", "image/jpeg", "p"))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert made == ["http://example:11434"]
+    assert provider.describe(b"img", "image/jpeg", "p").text == "a dock"
+
+
+def test_gui_ollama_requests_share_one_pooled_session():
+    ai_providers = pytest.importorskip("ai_providers")
+    session = ai_providers._OLLAMA_SESSION
+    adapter = session.get_adapter("http://localhost:11434/api/generate")
+    assert adapter._pool_maxsize >= 16
+    assert session.get_adapter("https://ollama.com/api/generate")._pool_maxsize >= 16
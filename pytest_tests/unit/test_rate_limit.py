@@ -0,0 +1,241 @@
+"""
+The shared adaptive rate limiter (idt_core.rate_limit) — provider feedback slows
+every worker on an account together, and the limit climbs back afterwards.
+"""
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+_ROOT = Path(__file__).resolve().parents[2]
+if str(_ROOT / "imagedescriber") not in sys.path:
+    sys.path.insert(0, str(_ROOT / "imagedescriber"))
+
+from idt_core import rate_limit  # noqa: E402
+from idt_core.pipeline import RunOptions, WorkspacePipeline  # noqa: E402
+from idt_core.providers.base import BaseProvider, DescriptionResult  # noqa: E402
+from idt_core.rate_limit import (  # noqa: E402
+    AdaptiveLimiter,
+    RateLimitInfo,
+    account_key,
+    limiter_for,
+    parse_rate_limit_headers,
+    throttle_info,
+)
+from idt_core.workspace import Workspace  # noqa: E402
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waited = []
+    monkeypatch.setattr(rate_limit.time, "sleep", waited.append)
+    return waited
+
+
+class Throttled(Exception):
+    """Shaped like an SDK status error: status_code plus response.headers."""
+
+    def __init__(self, status=429, headers=None):
+        super().__init__(f"status {status}")
+        self.status_code = status
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+# ----- reading the provider's feedback ----- #
+
+def test_anthropic_headers():
+    reset = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+    info = parse_rate_limit_headers({
+        "anthropic-ratelimit-requests-limit": "50",
+        "anthropic-ratelimit-requests-remaining": "0",
+        "anthropic-ratelimit-requests-reset": reset,
+        "retry-after": "12",
+    })
+    assert (info.requests_limit, info.requests_remaining, info.retry_after) == (50, 0, 12.0)
+    assert 28 < info.requests_reset <= 30
+
+
+def test_openai_headers():
+    info = parse_rate_limit_headers({
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-remaining-requests": "499",
+        "x-ratelimit-reset-requests": "120ms",
+        "x-ratelimit-remaining-tokens": "0",
+        "x-ratelimit-reset-tokens": "1m30s",
+    })
+    assert info.requests_limit == 500 and info.requests_reset == pytest.approx(0.12)
+    assert info.tokens_remaining == 0 and info.tokens_reset == 90.0
+
+
+def test_missing_or_odd_headers_stay_unknown():
+    assert parse_rate_limit_headers(None) == RateLimitInfo()
+    assert parse_rate_limit_headers({"retry-after": "soon", "x-ratelimit-limit-requests": ""}) == RateLimitInfo()
+
+
+def test_throttle_info_follows_the_cause():
+    try:
+        try:
+            raise Throttled(529, {"retry-after": "4"})
+        except Throttled as sdk_error:
+            raise RuntimeError("describe failed") from sdk_error
+    except RuntimeError as wrapped:
+        assert throttle_info(wrapped).retry_after == 4.0
+    assert throttle_info(Throttled(400)) is None
+    assert throttle_info(ValueError("no status")) is None
+
+
+# ----- the controller ----- #
+
+def test_a_burst_of_throttles_halves_the_limit_once(sleeps):
+    limiter = AdaptiveLimiter(ceiling=8)
+    tickets = [limiter.acquire() for _ in range(8)]
+    for ticket in tickets:
+        limiter.release(ticket, throttle=RateLimitInfo(retry_after=0))
+    assert limiter.limit == 4
+    assert limiter.throttles == 8
+
+
+def test_successes_climb_back_to_the_ceiling(sleeps):
+    limiter = AdaptiveLimiter(ceiling=4)
+    limiter.release(limiter.acquire(), throttle=RateLimitInfo(retry_after=0))
+    limiter.release(limiter.acquire(), throttle=RateLimitInfo(retry_after=0))
+    assert limiter.limit == 1
+    for _ in range(20):
+        limiter.release(limiter.acquire())
+    assert limiter.limit == 4
+
+
+def test_retry_after_holds_every_worker(sleeps):
+    limiter = AdaptiveLimiter(ceiling=4)
+    limiter.release(limiter.acquire(), throttle=RateLimitInfo(retry_after=30))
+    limiter.acquire()
+    limiter.acquire()
+    assert len(sleeps) == 2 and all(29 < s <= 30 for s in sleeps)
+
+
+def test_without_retry_after_the_pause_doubles(sleeps):
+    limiter = AdaptiveLimiter()
+    limiter.release(limiter.acquire(), throttle=RateLimitInfo())
+    first = limiter.pause_remaining()
+    limiter.release(limiter.acquire(), throttle=RateLimitInfo())
+    assert 0.9 < first <= 1.0
+    assert 1.9 < limiter.pause_remaining() <= 2.0
+
+
+def test_a_spent_window_cools_down_before_the_429(sleeps):
+    limiter = AdaptiveLimiter()
+    limiter.release(limiter.acquire(), info=RateLimitInfo(requests_remaining=0, requests_reset=5))
+    limiter.acquire()
+    assert sleeps and 4.9 < sleeps[-1] <= 5
+
+
+def test_published_rpm_paces_requests(sleeps):
+    limiter = AdaptiveLimiter(ceiling=2)
+    limiter.release(limiter.acquire(), info=RateLimitInfo(requests_limit=60))
+    for _ in range(4):
+        limiter.release(limiter.acquire())
+    # one request a second: each reserves the next slot on the bucket
+    assert sleeps == pytest.approx([1.0, 2.0, 3.0, 4.0], abs=0.05)
+
+
+def test_call_retries_throttles_and_reraises_everything_else(sleeps):
+    limiter = AdaptiveLimiter()
+    outcomes = [Throttled(429, {"retry-after": "0"}), Throttled(529), "done"]
+
+    def flaky():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert limiter.call(flaky) == "done"
+    with pytest.raises(ValueError):
+        limiter.call(lambda: (_ for _ in ()).throw(ValueError("bad request")))
+    assert limiter.in_flight == 0
+
+
+def test_limiters_are_per_provider_model_and_account():
+    a = limiter_for("Claude", "m", account_key("sk-one"))
+    assert limiter_for("claude", "m", account_key("sk-one")) is a
+    assert limiter_for("claude", "m", account_key("sk-two")) is not a
+    assert limiter_for("claude", "other", account_key("sk-one")) is not a
+    assert limiter_for("claude", "m", account_key("sk-one"), concurrency=6).ceiling == 6
+    assert account_key(None) == "" and "sk-one" not in account_key("sk-one")
+
+
+# ----- in the pipeline and the GUI ----- #
+
+class BurstyProvider(BaseProvider):
+    """429s the first few calls, then succeeds; records the peak overlap."""
+
+    def __init__(self, throttled_calls):
+        self.remaining = throttled_calls
+        self.calls = 0
+        self.in_flight = self.peak = 0
+        self._lock = threading.Lock()
+
+    provider_name = "bursty"
+    model_name = "bursty-1"
+
+    def describe(self, image_bytes, mime_type, prompt):
+        with self._lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            throttle = self.remaining > 0
+            self.remaining -= 1
+        try:
+            if throttle:
+                raise Throttled(429, {"retry-after": "1"})
+            return DescriptionResult(text="ok", model="bursty-1", provider="bursty")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_workspace_pipeline_rides_out_a_burst_of_429s(tmp_path, sleeps):
+    pics = tmp_path / "Pics"
+    pics.mkdir()
+    for i in range(6):
+        Image.new("RGB", (32, 32), (i * 30, 0, 0)).save(pics / f"{i}.jpg")
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(pics, recursive=True)
+    provider = BurstyProvider(throttled_calls=3)
+
+    options = RunOptions(prompt_text="x", extract_metadata=False, concurrency=4)
+    events = list(WorkspacePipeline(ws, provider).run(options))
+
+    assert all(e.success for e in events) and len(events) == 6
+    assert provider.calls == 9
+    limiter = limiter_for("bursty", "bursty-1")
+    assert limiter.throttles == 3
+    assert limiter.limit == 4, "six clean successes should have restored the ceiling"
+    assert provider.peak <= 4
+    assert provider.account == ""
+
+
+def test_gui_retry_waits_on_the_shared_limiter(monkeypatch, sleeps):
+    ai_providers = pytest.importorskip("ai_providers")
+    monkeypatch.setattr(ai_providers.time, "sleep", sleeps.append)
+
+    class Provider:
+        api_key = "sk-test"
+
+        def get_provider_name(self):
+            return "Claude"
+
+        @ai_providers.retry_on_api_error(max_retries=3, base_delay=5)
+        def describe_image(self, image_path, prompt, model):
+            self.calls = getattr(self, "calls", 0) + 1
+            if self.calls == 1:
+                return "Rate limit exceeded (status code: 429) - (ts)"
+            return "a harbour at dusk"
+
+    assert Provider().describe_image("x.jpg", "p", "claude-test") == "a harbour at dusk"
+    limiter = limiter_for("claude", "claude-test", account_key("sk-test"))
+    assert limiter.throttles == 1
+    # one wait, the limiter's 1 s cooldown, instead of the decorator's own 5 s+ backoff
+    assert len(sleeps) == 1 and sleeps[0] <= 1.0
@@ -185,7 +185,7 @@ def test_ollama_http_500_is_raised_as_a_retryable_failure(tmp_path, monkeypatch)
     image.write_bytes(b"\xff\xd8\xff\xe0not-a-real-jpeg")
 
     monkeypatch.setattr(
-        "ai_providers.requests.post",
+        "ai_providers._OLLAMA_SESSION.post",
         lambda *a, **k: _FakeResponse(500, '{"error":"Internal Server Error"}'),
     )
 
@@ -221,7 +221,7 @@ def test_ollama_retries_and_recovers(tmp_path, monkeypatch):
             return _FakeResponse(500, '{"error":"Internal Server Error"}')
         return _FakeResponse(200, "a cluttered desk")
 
-    monkeypatch.setattr("ai_providers.requests.post", fake_post)
+    monkeypatch.setattr("ai_providers._OLLAMA_SESSION.post", fake_post)
 
     provider = OllamaProvider()
     result = provider.describe_image(str(image), "describe", "gemma4:31b-cloud")
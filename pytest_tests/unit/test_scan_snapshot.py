@@ -0,0 +1,110 @@
+"""
+Incremental rescans (idt_core.scan_snapshot): a stored snapshot lists only the
+directories whose mtime moved and reports what changed as a delta.
+"""
+import os
+import time
+from pathlib import Path
+
+from idt_core.scan_snapshot import ScanSnapshot, snapshot_path
+
+
+def _tree(root: Path) -> Path:
+    for rel in ("2023/jan/a.jpg", "2023/jan/b.jpg", "2023/feb/c.png", "2024/d.jpg",
+                ".Trash/hidden.jpg", "Old.idt/e.jpg", "2024/notes.txt"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_bytes(b"x")
+    return root
+
+
+def _age_dirs(root: Path, seconds: int = 3600) -> None:
+    """Backdate every directory so it is not 'racy' against the next scan."""
+    past = time.time() - seconds
+    for dirpath, _, _ in os.walk(root):
+        os.utime(dirpath, (past, past))
+
+
+def _scanned(root: Path, snap_file: Path) -> ScanSnapshot:
+    _age_dirs(root)
+    snap = ScanSnapshot.load(snap_file, root)
+    snap.rescan()
+    snap.save()
+    return ScanSnapshot.load(snap_file, root)
+
+
+def test_first_scan_reports_every_file_as_added(tmp_path):
+    root = _tree(tmp_path / "src")
+    snap = ScanSnapshot.load(tmp_path / "snap.json", root)
+    assert not snap.loaded
+
+    delta = snap.rescan()
+
+    assert sorted(p.relative_to(root).as_posix() for p in delta.added) == [
+        "2023/feb/c.png", "2023/jan/a.jpg", "2023/jan/b.jpg", "2024/d.jpg",
+    ]
+    assert len(snap) == 4
+
+
+def test_an_unchanged_tree_lists_no_directories(tmp_path):
+    root = _tree(tmp_path / "src")
+    snap = _scanned(root, tmp_path / "snap.json")
+    assert snap.loaded
+
+    delta = snap.rescan()
+
+    assert not delta
+    assert delta.dirs_listed == 0
+
+
+def test_only_the_changed_directory_is_listed(tmp_path):
+    root = _tree(tmp_path / "src")
+    snap = _scanned(root, tmp_path / "snap.json")
+    new = root / "2023" / "jan" / "new.jpg"
+    new.write_bytes(b"y")
+    (root / "2024" / "d.jpg").unlink()
+
+    delta = snap.rescan()
+
+    assert delta.added == [new]
+    assert delta.removed == [root / "2024" / "d.jpg"]
+    assert delta.dirs_listed == 2
+
+
+def test_a_removed_directory_removes_its_files(tmp_path):
+    root = _tree(tmp_path / "src")
+    snap = _scanned(root, tmp_path / "snap.json")
+    for f in (root / "2023" / "jan").iterdir():
+        f.unlink()
+    (root / "2023" / "jan").rmdir()
+
+    delta = snap.rescan()
+
+    assert delta.removed == [root / "2023" / "jan" / "a.jpg", root / "2023" / "jan" / "b.jpg"]
+    assert not delta.added
+
+
+def test_deep_rescan_sees_files_rewritten_in_place(tmp_path):
+    root = _tree(tmp_path / "src")
+    snap = _scanned(root, tmp_path / "snap.json")
+    edited = root / "2023" / "feb" / "c.png"
+    edited.write_bytes(b"edited and longer")
+
+    assert not snap.rescan()
+    assert snap.rescan(deep=True).modified == [edited]
+
+
+def test_a_snapshot_is_only_reused_for_the_same_root_and_extensions(tmp_path):
+    root = _tree(tmp_path / "src")
+    snap_file = tmp_path / "snap.json"
+    _scanned(root, snap_file)
+
+    assert not ScanSnapshot.load(snap_file, tmp_path / "elsewhere").loaded
+    assert not ScanSnapshot.load(snap_file, root, {".png"}).loaded
+    assert snapshot_path(root) != snapshot_path(root, extensions={".png"})
+
+
+def test_a_bundle_keeps_snapshots_in_derived(tmp_path):
+    from idt_core.workspace import Workspace
+
+    ws = Workspace.create(tmp_path / "WS")
+    assert snapshot_path(tmp_path / "src", ws.path).parent == ws.derived_dir("scans")
@@ -0,0 +1,229 @@
+"""
+Interval frame extraction (idt_core.video): seeking to each target and walking
+the file with grab() must save the same frames under the same names, and so
+must extracting on a process pool or in time segments.
+"""
+from pathlib import Path
+
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+np = pytest.importorskip("numpy")
+
+from idt_core import video as video_mod  # noqa: E402
+from idt_core.video import (  # noqa: E402
+    VideoExtractionOptions, _FrameSaver, _extract_by_seeking, _extract_sequentially,
+    extract_frames_to_dir, extract_videos, frame_dir_names,
+)
+
+
+@pytest.fixture(scope="module")
+def clip(tmp_path_factory) -> Path:
+    """10 s at 30 fps, every frame a different shade."""
+    path = tmp_path_factory.mktemp("video") / "clip.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 30, (160, 120))
+    if not writer.isOpened():
+        pytest.skip("no mp4v encoder in this OpenCV build")
+    for i in range(300):
+        frame = np.full((120, 160, 3), (i * 7) % 256, np.uint8)
+        cv2.putText(frame, str(i), (10, 80), cv2.FONT_HERSHEY_SIMPLEX, 2, (0, 0, 255), 3)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def _extract(clip, out, **kwargs):
+    return extract_frames_to_dir(clip, out, VideoExtractionOptions(mode="interval", **kwargs))
+
+
+def test_seeking_and_walking_save_the_same_frames(clip, tmp_path):
+    seek = _extract(clip, tmp_path / "seek", interval_seconds=2, interval_strategy="seek")
+    walk = _extract(clip, tmp_path / "walk", interval_seconds=2, interval_strategy="sequential")
+
+    assert (seek.strategy, walk.strategy) == ("seek", "sequential")
+    assert [p.name for p in seek.frame_paths] == [p.name for p in walk.frame_paths] == [
+        f"clip_{t}.00s.jpg" for t in (0, 2, 4, 6, 8)
+    ]
+    for a, b in zip(seek.frame_paths, walk.frame_paths):
+        diff = cv2.absdiff(cv2.imread(str(a)), cv2.imread(str(b)))
+        assert float(diff.mean()) < 1.0
+
+
+def test_auto_seeks_only_when_targets_are_far_apart(clip, tmp_path):
+    assert _extract(clip, tmp_path / "a", interval_seconds=3).strategy == "seek"
+    assert _extract(clip, tmp_path / "b", interval_seconds=0.5).strategy == "sequential"
+
+
+def test_max_frames_stops_either_strategy(clip, tmp_path):
+    for strategy in ("seek", "sequential"):
+        result = _extract(clip, tmp_path / strategy, interval_seconds=1, max_frames=3,
+                          interval_strategy=strategy)
+        assert len(result.frame_paths) == 3
+
+
+def test_a_seek_that_lands_elsewhere_hands_back_the_remaining_targets(tmp_path):
+    class IgnoresSeeks:
+        """A capture that plays from the start whatever position is asked for."""
+        def __init__(self):
+            self.position = 0
+
+        def set(self, prop, value):
+            pass
+
+        def read(self):
+            self.position += 1
+            return True, np.zeros((8, 8, 3), np.uint8)
+
+        def get(self, prop):
+            return float(self.position)
+
+    saver = _FrameSaver(Path("clip.mp4"), tmp_path, 30.0, VideoExtractionOptions())
+    assert _extract_by_seeking(IgnoresSeeks(), range(0, 300, 60), saver) == range(60, 300, 60)
+    assert [p.name for p in saver.paths] == ["clip_0.00s.jpg"]   # kept, not redone
+
+
+def test_a_segment_walks_only_its_own_frames(tmp_path):
+    class Capture:
+        """Seeks by frame number land on the keyframe at or before the target."""
+        def __init__(self):
+            self.position = self.grabs = 0
+
+        def set(self, prop, value):
+            self.position = int(value) // 12 * 12
+            return True
+
+        def get(self, prop):
+            return float(self.position)
+
+        def grab(self):
+            self.grabs += 1
+            self.position += 1
+            return self.position <= 900
+
+        def retrieve(self):
+            return True, np.zeros((8, 8, 3), np.uint8)
+
+    cap = Capture()
+    saver = _FrameSaver(Path("clip.mp4"), tmp_path, 30.0, VideoExtractionOptions())
+    _extract_sequentially(cap, range(605, 705, 10), saver)
+
+    assert cap.grabs == 705 - 600
+    assert [p.name for p in saver.paths][:2] == ["clip_20.17s.jpg", "clip_20.50s.jpg"]
+    assert len(saver.paths) == 10
+
+
+# --------------------------------------------------------------------------- #
+# Scene mode                                                                    #
+# --------------------------------------------------------------------------- #
+
+@pytest.fixture(scope="module")
+def scenes(tmp_path_factory) -> Path:
+    """Three 2 s shots at 25 fps, with sensor noise, a one-frame flash in the
+    first and a 0.4 s cutaway in the last."""
+    path = tmp_path_factory.mktemp("video") / "scenes.mp4"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"mp4v"), 25, (320, 180))
+    if not writer.isOpened():
+        pytest.skip("no mp4v encoder in this OpenCV build")
+    rng = np.random.default_rng(1)
+    shots = []
+    for colour in ((40, 40, 40), (200, 60, 20), (20, 160, 220)):
+        shot = np.full((180, 320, 3), colour, np.uint8)
+        cv2.rectangle(shot, (40, 40), (140, 140), (255, 255, 255), -1)
+        shots.append(shot)
+    cutaway = np.full((180, 320, 3), (0, 255, 0), np.uint8)
+    for i in range(150):
+        frame = shots[i // 50]
+        if i == 20:
+            frame = np.full_like(frame, 255)        # flash
+        elif 120 <= i < 130:
+            frame = cutaway                          # cut away and back, 0.4 s
+        noise = rng.integers(-12, 13, frame.shape)
+        writer.write(np.clip(frame.astype(int) + noise, 0, 255).astype(np.uint8))
+    writer.release()
+    return path
+
+
+def _scene_times(result):
+    return [float(p.stem.rsplit("_", 1)[1].rstrip("s")) for p in result.frame_paths]
+
+
+def test_scene_mode_saves_one_frame_per_shot(scenes, tmp_path):
+    result = extract_frames_to_dir(scenes, tmp_path, VideoExtractionOptions(
+        mode="scene", scene_threshold=30, scene_sample_seconds=0))
+
+    # the flash and the cutaway return to a scene already saved, noise never counts
+    assert _scene_times(result) == [0.0, 2.0, 4.0]
+
+
+def test_min_scene_length_merges_quick_cuts(scenes, tmp_path):
+    result = extract_frames_to_dir(scenes, tmp_path, VideoExtractionOptions(
+        mode="scene", scene_threshold=30, min_scene_seconds=2.5, scene_sample_seconds=0))
+    assert _scene_times(result) == [0.0, 4.0]
+
+
+def test_sampled_analysis_finds_cuts_within_a_sample(scenes, tmp_path):
+    result = extract_frames_to_dir(scenes, tmp_path, VideoExtractionOptions(
+        mode="scene", scene_threshold=30, scene_sample_seconds=0.2))
+    times = _scene_times(result)
+    assert len(times) == 3
+    assert all(0 <= t - cut < 0.2 + 1e-9 for t, cut in zip(times, (0.0, 2.0, 4.0)))
+
+
+def test_scene_score_ignores_noise_and_sees_a_cut():
+    from idt_core.video import SceneDetector
+
+    rng = np.random.default_rng(2)
+    ramp = np.linspace(0, 255, 3840, dtype=np.uint8)
+    base = np.ascontiguousarray(np.broadcast_to(ramp[None, :, None], (2160, 3840, 3)))
+    cv2.circle(base, (1200, 1000), 600, (255, 255, 255), -1)
+    noisy = np.clip(base.astype(int) + rng.integers(-25, 26, base.shape), 0, 255).astype(np.uint8)
+    detector = SceneDetector()
+    a = detector.thumbnail(base)
+    assert detector.difference(a, detector.thumbnail(noisy)) < 10
+    assert detector.difference(a, detector.thumbnail(np.ascontiguousarray(base[:, ::-1]))) > 30
+
+
+def test_a_time_range_keeps_the_single_pass_targets(clip, tmp_path):
+    for strategy in ("seek", "sequential"):
+        result = _extract(clip, tmp_path / strategy, interval_seconds=2, start_seconds=3,
+                          end_seconds=8, interval_strategy=strategy)
+        assert [p.name for p in result.frame_paths] == ["clip_4.00s.jpg", "clip_6.00s.jpg"]
+
+
+def test_parallel_extraction_matches_one_video_at_a_time(clip, tmp_path):
+    jobs = [(clip, tmp_path / "pool" / name) for name in ("a", "b", "c")]
+    jobs.append((tmp_path / "missing.mp4", tmp_path / "pool" / "missing"))
+    progress = []
+    opts = VideoExtractionOptions(interval_seconds=2,
+                                  on_progress=lambda n, msg: progress.append((n, msg)))
+
+    results = extract_videos(jobs, opts, workers=2)
+    serial = extract_videos(jobs[:1], VideoExtractionOptions(interval_seconds=2), workers=1)
+
+    assert [r.frames_dir for r in results] == [out for _, out in jobs]
+    for result in results[:3]:
+        assert result.error is None
+        assert [p.name for p in result.frame_paths] == [p.name for p in serial[0].frame_paths]
+    assert results[3].frame_paths == [] and "Cannot open" in results[3].error
+    assert [n for n, _ in progress] == sorted(n for n, _ in progress)
+    assert progress[-1][0] == 15 and progress[-1][1].endswith("(4 of 4 videos)")
+
+
+def test_same_named_videos_get_their_own_frame_folders():
+    videos = [Path("a/clip.mp4"), Path("b/clip.mov"), Path("c/CLIP.mp4"), Path("clip_2.mp4")]
+    assert frame_dir_names(videos) == ["clip", "clip_2", "CLIP_3", "clip_2_2"]
+
+
+def test_a_long_video_is_split_into_segments(clip, tmp_path, monkeypatch):
+    monkeypatch.setattr(video_mod, "SEGMENT_MIN_SECONDS", 5.0)
+    opts = VideoExtractionOptions(interval_seconds=1)
+
+    segments = video_mod._segments(clip, opts, 4)
+    [split] = extract_videos([(clip, tmp_path / "split")], opts, workers=4)
+    [whole] = extract_videos([(clip, tmp_path / "whole")], opts, workers=1)
+
+    assert len(segments) == 4
+    assert [p.name for p in split.frame_paths] == [p.name for p in whole.frame_paths]
+    assert len(split.frame_paths) == 10
+    assert video_mod._segments(clip, VideoExtractionOptions(interval_seconds=1, max_frames=3), 4) \
+        == [VideoExtractionOptions(interval_seconds=1, max_frames=3)]
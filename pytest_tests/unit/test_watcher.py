@@ -0,0 +1,166 @@
+"""
+FolderWatcher (idt_core.watcher): new files are handed on only once they have
+stopped growing; filesystem events wake it, polling is the fallback.
+"""
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from idt_core.scan_snapshot import ScanSnapshot
+from idt_core import watcher as watcher_mod
+from idt_core.watcher import FolderWatcher
+
+
+@pytest.fixture
+def drop(tmp_path):
+    root = tmp_path / "Drop"
+    root.mkdir()
+    (root / "old.jpg").write_bytes(b"x")
+    snap = ScanSnapshot.load(tmp_path / "snap.json", root)
+    snap.rescan()
+    return root, snap
+
+
+def _next_change(w: FolderWatcher, timeout: float = 5.0):
+    """next(w.changes()) without hanging the suite if nothing ever arrives."""
+    box = {}
+    changes = w.changes()
+    t = threading.Thread(target=lambda: box.setdefault("delta", next(changes, None)), daemon=True)
+    t.start()
+    t.join(timeout)
+    w.close()
+    return box.get("delta")
+
+
+def test_a_new_file_is_handed_on_once(drop):
+    root, snap = drop
+    (root / "new.jpg").write_bytes(b"photo")
+    (root / "notes.txt").write_bytes(b"ignored")
+
+    delta = _next_change(FolderWatcher(snap, backend="poll", interval=0.05, settle=0.1))
+
+    assert delta is not None
+    assert delta.added == [root / "new.jpg"]
+    assert not delta.removed
+
+
+def test_a_growing_file_waits_until_it_stops_growing(drop):
+    root, snap = drop
+    w = FolderWatcher(snap, backend="poll", interval=0.05, settle=0.3)
+    growing = root / "copying.jpg"
+    growing.write_bytes(b"a")
+
+    def keep_writing():
+        for _ in range(8):
+            time.sleep(0.05)
+            with open(growing, "ab") as f:
+                f.write(b"more")
+
+    writer = threading.Thread(target=keep_writing)
+    writer.start()
+    delta = _next_change(w)
+    writer.join()
+
+    assert delta.added == [growing]
+    assert growing.stat().st_size == 1 + 8 * 4
+    assert not writer.is_alive()
+
+
+def test_settling_is_judged_on_size_and_mtime(drop):
+    root, snap = drop
+    w = FolderWatcher(snap, backend="poll", settle=2.0)
+    path = root / "new.jpg"
+    path.write_bytes(b"1")
+    w._pending[path] = (None, 0.0)
+
+    assert w._settled(100.0) == []      # first look records the signature
+    assert w._settled(101.0) == []      # unchanged, but not for long enough
+    path.write_bytes(b"12")
+    assert w._settled(102.5) == []      # changed: the clock starts again
+    assert w._settled(104.5) == [path]
+    assert w.pending == []
+
+
+def test_the_snapshot_is_not_saved_while_a_file_is_pending(drop, tmp_path):
+    root, snap = drop
+    (root / "slow.jpg").write_bytes(b"x")
+
+    assert _next_change(FolderWatcher(snap, backend="poll", interval=0.02, settle=60),
+                        timeout=0.3) is None
+    assert not (tmp_path / "snap.json").exists()
+
+
+def test_events_backend_needs_watchdog(drop, monkeypatch):
+    _, snap = drop
+    monkeypatch.setattr(watcher_mod, "watchdog_available", lambda: False)
+    with pytest.raises(ImportError):
+        FolderWatcher(snap, backend="events")
+    assert FolderWatcher(snap, backend="auto").backend == "poll"
+    with pytest.raises(ValueError):
+        FolderWatcher(snap, backend="inotify")
+
+
+def test_only_relevant_events_wake_the_watcher(drop):
+    root, snap = drop
+    w = FolderWatcher(snap, backend="poll")
+
+    def event(path, event_type="created", is_directory=False):
+        return SimpleNamespace(src_path=str(root / path), event_type=event_type,
+                               is_directory=is_directory)
+
+    w._on_event(event("notes.txt"))
+    w._on_event(event("photo.jpg", event_type="opened"))
+    assert not w._wake.is_set()
+    w._on_event(event("photo.JPG"))
+    assert w._wake.is_set()
+    w._wake.clear()
+    w._on_event(event("Album", is_directory=True))
+    assert w._wake.is_set()
+
+
+def test_a_burst_of_events_is_debounced(drop):
+    _, snap = drop
+    w = FolderWatcher(snap, backend="poll", debounce=0.15)
+    w.backend = "events"   # no observer needed: drive _wake by hand
+    burst = SimpleNamespace(src_path="x.jpg", event_type="created", is_directory=False)
+
+    def fire():
+        for _ in range(5):
+            w._on_event(burst)
+            time.sleep(0.05)
+
+    t0 = time.monotonic()
+    threading.Thread(target=fire).start()
+    w._wait()
+    # returns only once the burst (~0.25 s) has been quiet for `debounce`
+    assert time.monotonic() - t0 >= 0.3
+
+
+def test_with_events_the_safety_rescan_is_no_rarer_than_the_interval(drop):
+    _, snap = drop
+    w = FolderWatcher(snap, backend="poll", interval=0.1)
+    w.backend = "events"
+
+    t0 = time.monotonic()
+    w._wait()
+
+    assert time.monotonic() - t0 < watcher_mod.EVENT_RESCAN_SECONDS
+
+
+def test_files_found_before_watching_go_through_the_settle_check(drop):
+    root, snap = drop
+    w = FolderWatcher(snap, backend="poll", interval=0.05, settle=0.3)
+    earlier, copying = root / "earlier.jpg", root / "copying.jpg"
+    earlier.write_bytes(b"done")
+    past = time.time() - 60
+    os.utime(earlier, (past, past))
+    copying.write_bytes(b"half")
+
+    assert w.hold(snap.rescan().added) == [earlier]
+    assert w.pending == [copying]
+    delta = _next_change(w)
+
+    assert delta.added == [copying]
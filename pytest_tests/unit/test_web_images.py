@@ -0,0 +1,155 @@
+"""
+web_images — web-sized renders of gallery images, cached by content.
+"""
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from idt_core import web_images
+from idt_core.web_images import make_web_images
+
+
+def _save(path, size, mode="RGB", exif_orientation=None, fmt="JPEG"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    img = Image.new(mode, size, (200, 60, 30) if mode == "RGB" else (200, 60, 30, 128))
+    kwargs = {}
+    if exif_orientation:
+        exif = Image.Exif()
+        exif[0x0112] = exif_orientation
+        kwargs["exif"] = exif
+    img.save(path, fmt, **kwargs)
+    return path
+
+
+def test_renders_cover_each_width_up_to_the_original(tmp_path):
+    big = _save(tmp_path / "big.jpg", (2000, 1000))
+    small = _save(tmp_path / "small.jpg", (300, 200))
+
+    big_r, small_r = make_web_images([big, small], cache_dir=tmp_path / "cache", modern=None,
+                                     workers=1)
+
+    assert big_r.widths == [480, 960, 1600] and (big_r.width, big_r.height) == (2000, 1000)
+    with Image.open(big_r.path("jpeg", 960)) as img:
+        assert img.size == (960, 480) and not img.getexif()
+    assert small_r.widths == [300]
+    assert big_r.srcset("jpeg", lambda p: p.name.split("-")[-1]) == "480.jpg 480w, 960.jpg 960w, 1600.jpg 1600w"
+
+
+def test_exif_orientation_is_applied(tmp_path):
+    portrait = _save(tmp_path / "p.jpg", (1200, 800), exif_orientation=6)
+
+    (render,) = make_web_images([portrait], cache_dir=tmp_path / "cache", modern=None, workers=1)
+
+    assert (render.width, render.height) == (800, 1200)
+    with Image.open(render.path("jpeg", 480)) as img:
+        assert img.size == (480, 720)
+
+
+def test_transparent_images_fall_back_to_png(tmp_path):
+    logo = _save(tmp_path / "logo.png", (600, 600), mode="RGBA", fmt="PNG")
+
+    (render,) = make_web_images([logo], cache_dir=tmp_path / "cache", modern=None, workers=1)
+
+    assert render.fallback == "png"
+    with Image.open(render.path("png", 480)) as img:
+        assert img.mode == "RGBA"
+
+
+def test_the_modern_format_is_rendered_when_pillow_writes_it(tmp_path):
+    modern = web_images.modern_format()
+    if modern is None:
+        pytest.skip("this Pillow writes neither AVIF nor WebP")
+    photo = _save(tmp_path / "a.jpg", (1000, 700))
+
+    (render,) = make_web_images([photo], cache_dir=tmp_path / "cache", workers=1)
+
+    assert render.modern == modern
+    assert all(p.is_file() for p in render.files()) and len(render.files()) == 6
+
+
+def test_the_same_content_renders_once_wherever_it_lives(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    first = _save(tmp_path / "one" / "a.jpg", (1000, 700))
+    make_web_images([first], cache_dir=cache, modern=None, workers=1)
+    copy = tmp_path / "two" / "renamed.jpg"
+    copy.parent.mkdir()
+    shutil.copy2(first, copy)
+
+    def no_render(*args):
+        raise AssertionError("rendered again")
+    monkeypatch.setattr(web_images, "_render", no_render)
+    again, moved = make_web_images([first, copy], cache_dir=cache, modern=None, workers=1)
+
+    assert again.stem == moved.stem and moved.widths == [480, 960, 1000]
+
+
+def test_unreadable_sources_are_none_and_still_counted(tmp_path):
+    good = _save(tmp_path / "a.jpg", (700, 500))
+    junk = tmp_path / "b.jpg"
+    junk.write_bytes(b"not an image")
+    done = []
+
+    out = make_web_images([junk, tmp_path / "gone.jpg", good], cache_dir=tmp_path / "cache",
+                          modern=None, workers=1, on_done=lambda n, total, src: done.append(n))
+
+    assert out[0] is None and out[1] is None and out[2].widths == [480, 700]
+    assert done == [1, 2, 3]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="process pool start-up is slow on Windows")
+def test_a_process_pool_gives_the_same_renders(tmp_path):
+    photos = [_save(tmp_path / f"{n}.jpg", (900 + n, 600)) for n in range(3)]
+
+    pooled = make_web_images(photos, cache_dir=tmp_path / "pooled", modern=None, workers=2)
+    inline = make_web_images(photos, cache_dir=tmp_path / "inline", modern=None, workers=1)
+
+    assert [r.widths for r in pooled] == [r.widths for r in inline]
+    assert all(p.is_file() for r in pooled for p in r.files())
+
+
+def _cached_files(cache, render):
+    return sorted(p for p in cache.rglob(Path(render.stem).name + "*"))
+
+
+def test_the_least_recently_used_renders_are_evicted_first(tmp_path):
+    cache = tmp_path / "cache"
+    photos = [_save(tmp_path / f"{n}.jpg", (600 + 10 * n, 400)) for n in range(3)]
+    a, b, c = (make_web_images([p], cache_dir=cache, modern=None, workers=1)[0] for p in photos)
+    for age, render in enumerate((a, b, c)):
+        os.utime(f"{render.stem}.json", ns=(age + 1, age + 1))
+    make_web_images(photos[:1], cache_dir=cache, modern=None, workers=1)   # a hit: used now
+    total = sum(p.stat().st_size for r in (a, b, c) for p in _cached_files(cache, r))
+
+    web_images._trim_cache(cache, total - 1, keep={Path(c.stem).name})
+
+    assert _cached_files(cache, b) == []
+    assert _cached_files(cache, a) and _cached_files(cache, c)
+
+
+def test_a_full_cache_keeps_what_the_call_returned(tmp_path):
+    cache = tmp_path / "cache"
+    old = make_web_images([_save(tmp_path / "old.jpg", (600, 400))], cache_dir=cache,
+                          modern=None, workers=1)[0]
+
+    (new,) = make_web_images([_save(tmp_path / "new.jpg", (500, 300))], cache_dir=cache,
+                             modern=None, workers=1, max_bytes=1)
+
+    assert _cached_files(cache, old) == []
+    assert all(p.is_file() for p in new.files())
+
+
+def test_hashes_of_files_no_longer_on_disk_are_forgotten(tmp_path):
+    cache = tmp_path / "cache"
+    gone = _save(tmp_path / "gone.jpg", (600, 400))
+    make_web_images([gone], cache_dir=cache, modern=None, workers=1)
+    gone.unlink()
+    kept = _save(tmp_path / "kept.jpg", (500, 300))
+
+    make_web_images([kept], cache_dir=cache, modern=None, workers=1)
+
+    hashes = json.loads((cache / "hashes.json").read_text(encoding="utf-8"))
+    assert [json.loads(name)[0] for name in hashes] == [str(kept)]
@@ -0,0 +1,151 @@
+"""
+Wire profiles (idt_core.converter.WireProfile / wire_profile_for) — images are
+shaped to what the provider actually looks at before upload, and left alone
+when they already fit.
+"""
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from idt_core.converter import WireProfile, load_for_api, shape_for_wire, wire_profile_for
+from idt_core.pipeline import RunOptions, WorkspacePipeline
+from idt_core.providers.base import DescriptionResult
+from idt_core.workspace import Workspace
+
+
+def _photo(path: Path, size=(4000, 3000), fmt="JPEG", mode="RGB", color=(40, 120, 200), **save):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new(mode, size, color).save(path, fmt, **save)
+    return path
+
+
+def _size_of(data: bytes) -> tuple[int, int]:
+    return Image.open(io.BytesIO(data)).size
+
+
+# ----- the table ----- #
+
+def test_provider_names_resolve_through_the_registry():
+    claude = wire_profile_for("anthropic", "claude-sonnet-4-5")
+    assert claude == wire_profile_for("Claude")
+    assert claude.max_edge == 1568 and claude.max_pixels == 1_150_000
+    assert claude.max_bytes == 5 * 1024 * 1024  # the registry's published limit
+
+
+def test_known_ollama_encoders_get_their_own_edge():
+    assert wire_profile_for("ollama", "llama3.2-vision:latest").max_edge == 1120
+    assert wire_profile_for("ollama", "some-new-model").max_edge == 2048
+
+
+def test_providers_without_a_profile_send_originals():
+    assert wire_profile_for("ollama cloud") is None
+    assert wire_profile_for("fake", "fake-1") is None
+
+
+# ----- shaping ----- #
+
+def test_an_image_that_fits_is_sent_byte_for_byte(tmp_path):
+    path = _photo(tmp_path / "small.jpg", size=(800, 600))
+    data, mime = load_for_api(path, wire_profile_for("claude"))
+    assert data == path.read_bytes()
+    assert mime == "image/jpeg"
+
+
+def test_a_large_photo_is_scaled_to_the_profile(tmp_path):
+    path = _photo(tmp_path / "big.jpg")
+    data, mime = load_for_api(path, wire_profile_for("claude"))
+    w, h = _size_of(data)
+    assert mime == "image/jpeg"
+    assert max(w, h) <= 1568 and w * h <= 1_150_000
+    assert abs(w / h - 4 / 3) < 0.01
+    assert len(data) < path.stat().st_size
+
+
+def test_no_profile_keeps_the_old_behaviour(tmp_path):
+    path = _photo(tmp_path / "big.jpg")
+    assert load_for_api(path) == (path.read_bytes(), "image/jpeg")
+
+
+def test_openai_always_gets_a_jpeg(tmp_path):
+    path = _photo(tmp_path / "small.png", size=(300, 200), fmt="PNG")
+    data, mime = load_for_api(path, wire_profile_for("openai"))
+    assert mime == "image/jpeg"
+    assert Image.open(io.BytesIO(data)).format == "JPEG"
+
+
+def test_transparency_is_flattened_onto_white(tmp_path):
+    path = _photo(tmp_path / "logo.png", size=(3000, 3000), fmt="PNG",
+                  mode="RGBA", color=(0, 0, 0, 0))
+    data, _ = load_for_api(path, wire_profile_for("claude"))
+    r, g, b = Image.open(io.BytesIO(data)).convert("RGB").getpixel((10, 10))
+    assert min(r, g, b) > 245
+
+
+def test_exif_orientation_is_applied_before_encoding(tmp_path):
+    exif = Image.Exif()
+    exif[0x0112] = 6  # rotate 90° clockwise on display
+    path = _photo(tmp_path / "portrait.jpg", size=(400, 200), exif=exif.tobytes())
+    data, _ = load_for_api(path, wire_profile_for("openai"))
+    assert _size_of(data) == (200, 400)
+
+
+def test_the_byte_ceiling_is_enforced(tmp_path):
+    import random
+    rng = random.Random(7)
+    img = Image.frombytes("RGB", (1200, 900), bytes(rng.getrandbits(8) for _ in range(1200 * 900 * 3)))
+    path = tmp_path / "noise.png"
+    img.save(path, "PNG")
+    profile = WireProfile(max_edge=1568, max_bytes=150_000)
+    data, mime = load_for_api(path, profile)
+    assert len(data) <= 150_000
+    assert mime == "image/jpeg"
+
+
+def test_undecodable_bytes_go_through_unchanged(tmp_path):
+    path = tmp_path / "odd.png"
+    path.write_bytes(b"\x89PNG\r\n\x1a\nnot really")
+    assert load_for_api(path, wire_profile_for("claude")) == (path.read_bytes(), "image/png")
+    assert shape_for_wire(path.read_bytes(), wire_profile_for("openai"))[0] == path.read_bytes()
+
+
+def test_tiff_is_converted_and_scaled(tmp_path):
+    path = _photo(tmp_path / "scan.tif", size=(5000, 2000), fmt="TIFF")
+    data, mime = load_for_api(path, wire_profile_for("ollama", "llama3.2-vision"))
+    assert mime == "image/jpeg"
+    assert max(_size_of(data)) == 1120
+
+
+def test_heic_is_decoded_once_and_scaled(tmp_path):
+    pillow_heif = pytest.importorskip("pillow_heif")
+    pillow_heif.register_heif_opener()
+    path = _photo(tmp_path / "phone.heic", size=(4032, 3024), fmt="HEIF")
+    data, mime = load_for_api(path, wire_profile_for("claude"))
+    assert mime == "image/jpeg"
+    assert max(_size_of(data)) <= 1568
+
+
+# ----- in the pipeline ----- #
+
+class RecordingClaude:
+    def __init__(self):
+        self.sizes = []
+
+    provider_name = "anthropic"
+    model_name = "claude-sonnet-4-5"
+
+    def describe(self, image_bytes, mime_type, prompt):
+        self.sizes.append(_size_of(image_bytes))
+        return DescriptionResult(text="ok", provider="claude", model=self.model_name)
+
+
+@pytest.mark.parametrize("full_resolution, expected", [(False, (1238, 928)), (True, (4000, 3000))])
+def test_workspace_pipeline_uses_the_provider_profile(tmp_path, full_resolution, expected):
+    _photo(tmp_path / "Pics" / "big.jpg")
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(tmp_path / "Pics", recursive=True)
+    provider = RecordingClaude()
+    options = RunOptions(prompt_text="x", extract_metadata=False, full_resolution=full_resolution)
+    assert all(e.success for e in WorkspacePipeline(ws, provider).run(options))
+    assert provider.sizes == [expected]
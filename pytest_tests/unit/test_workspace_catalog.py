@@ -0,0 +1,159 @@
+"""
+The workspace catalog (idt_core.catalog) — the SQLite index of descriptions/.
+
+The sidecars stay the source of truth, so every test here is about the catalog
+agreeing with them: after saves, after edits made behind its back, after
+deletions, and after the catalog itself is damaged or unusable.
+"""
+import json
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from idt_core.catalog import CATALOG_NAME, Catalog
+from idt_core.workspace import Workspace, WorkspaceDescription
+
+
+def _make_png(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + path.name.encode("utf-8"))
+
+
+@pytest.fixture
+def ws(tmp_path):
+    root = tmp_path / "Pictures" / "Trip"
+    for name in ("a.jpg", "b.jpg", "Day2/a.jpg", "Day2/c.jpg"):
+        _make_png(root / name)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(root, recursive=True)
+    return ws
+
+
+def _direct_scan(ws: Workspace) -> list[dict]:
+    """What items() returned before the catalog existed."""
+    return [
+        json.loads(p.read_text(encoding="utf-8"))
+        for p in sorted(ws.descriptions_dir.glob("**/*.json"))
+    ]
+
+
+def test_catalog_lives_in_derived(ws):
+    ws.items()
+    assert (ws.derived_dir() / CATALOG_NAME).is_file()
+
+
+def test_items_match_a_direct_scan_in_order(ws):
+    item = ws.items()[1]
+    item.add_description(WorkspaceDescription.create("described"))
+    ws.save_item(item)
+
+    assert [i.to_dict() for i in ws.items()] == _direct_scan(ws)
+
+
+def test_saves_are_indexed_without_rereading(ws):
+    catalog = Catalog(ws.derived_dir() / CATALOG_NAME, ws.descriptions_dir)
+    catalog.refresh()
+    item = ws.items()[0]
+    item.add_description(WorkspaceDescription.create("x"))
+    ws.save_item(item)
+
+    assert catalog.refresh() == 0
+
+
+def test_a_sidecar_edited_behind_its_back_is_picked_up(ws):
+    ws.items()  # populate
+    sidecar = next(ws.descriptions_dir.glob("**/b.jpg.json"))
+    data = json.loads(sidecar.read_text(encoding="utf-8"))
+    data["notes"] = "edited by hand, and made longer so the size changes"
+    sidecar.write_text(json.dumps(data), encoding="utf-8")
+
+    assert next(i for i in ws.items() if i.image == "b.jpg").notes.startswith("edited by hand")
+
+
+def test_a_deleted_sidecar_disappears(ws):
+    before = len(ws.items())
+    next(ws.descriptions_dir.glob("**/c.jpg.json")).unlink()
+    assert len(ws.items()) == before - 1
+    assert all(i.image != "c.jpg" for i in ws.items())
+
+
+def test_an_unparseable_sidecar_is_skipped_like_before(ws):
+    (ws.descriptions_dir / "broken.jpg.json").write_text("{not json", encoding="utf-8")
+    assert all(i.image != "broken.jpg" for i in ws.items())
+    assert len(ws.items()) == 4
+
+
+def test_status_and_entries_come_from_the_index(ws):
+    item = ws.items()[0]
+    item.add_description(WorkspaceDescription.create("x"))
+    ws.save_item(item)
+
+    st = ws.status()
+    assert (st["total"], st["described"], st["undescribed"]) == (4, 1, 3)
+    entries = ws.entries()
+    assert [e.image for e in entries] == [i.image for i in ws.items()]
+    assert sum(e.described for e in entries) == 1
+
+
+def test_get_item_without_subfolder_uses_the_index(ws):
+    found = ws.get_item("c.jpg")
+    assert found is not None and found.image == "c.jpg"
+    assert ws.get_item("nope.jpg") is None
+
+
+def test_a_write_behind_block_refreshes_the_catalog_once(ws, monkeypatch):
+    refreshes = []
+    real_refresh = Catalog.refresh
+    monkeypatch.setattr(Catalog, "refresh",
+                        lambda self: refreshes.append(1) or real_refresh(self))
+    with ws.write_behind(delay=0, max_pending=1):
+        for name in ("c.jpg", "nope.jpg", "c.jpg"):
+            ws.get_item(name)
+        item = ws.get_item("c.jpg")
+        item.add_description(WorkspaceDescription.create("written in the block"))
+        ws.save_item(item)            # max_pending=1: on disk and in the catalog now
+        assert ws.get_item("c.jpg").described
+    assert len(refreshes) == 1
+
+    ws.get_item("nope.jpg")           # outside a block, every lookup refreshes
+    assert len(refreshes) == 2
+
+
+def test_source_index_survives_reopen(ws, tmp_path):
+    reopened = Workspace.open(ws.path)
+    again = reopened.add_image(tmp_path / "Pictures" / "Trip" / "Day2" / "a.jpg")
+    assert again.subfolder == str(Path("Trip") / "Day2")
+    assert len(reopened.items()) == 4  # idempotent: nothing new added
+
+
+def test_a_corrupt_catalog_is_rebuilt(ws):
+    ws.items()
+    (ws.derived_dir() / CATALOG_NAME).write_bytes(b"this is not a database")
+    reopened = Workspace.open(ws.path)
+    assert len(reopened.items()) == 4
+
+
+def test_a_foreign_schema_version_is_rebuilt(ws):
+    ws.items()
+    db = ws.derived_dir() / CATALOG_NAME
+    conn = sqlite3.connect(str(db))
+    conn.execute("PRAGMA user_version = 999")
+    conn.commit()
+    conn.close()
+    assert len(Workspace.open(ws.path).items()) == 4
+
+
+def test_unusable_sqlite_falls_back_to_reading_sidecars(ws, monkeypatch):
+    def refuse(self):
+        raise sqlite3.OperationalError("unable to open database file")
+
+    monkeypatch.setattr(Catalog, "_open", refuse)
+    reopened = Workspace.open(ws.path)
+    assert [i.to_dict() for i in reopened.items()] == _direct_scan(ws)
+    assert reopened.status()["total"] == 4
+    # Saving still writes the sidecar even though the index is gone.
+    item = reopened.items()[0]
+    item.add_description(WorkspaceDescription.create("x"))
+    reopened.save_item(item)
+    assert reopened.status()["described"] == 1
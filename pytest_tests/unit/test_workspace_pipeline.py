@@ -108,6 +108,27 @@ def test_limit_caps_run(tmp_path, src):
     assert provider.calls == 1
 
 
+def test_queue_is_built_from_the_catalog_and_loads_only_chosen_items(tmp_path, src, monkeypatch):
+    _make_jpeg(src / "c.jpg")
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True, copy=False)
+    list(WorkspacePipeline(ws, FakeProvider()).run(RunOptions(prompt_text="x", limit=1)))
+    (src / "c.jpg").unlink()
+
+    def no_full_listing():
+        raise AssertionError("the queue must not load every item")
+    monkeypatch.setattr(ws, "items", no_full_listing)
+    loaded = []
+    real_get_item = ws.get_item
+    monkeypatch.setattr(ws, "get_item",
+                        lambda *a, **k: loaded.append(a[0]) or real_get_item(*a, **k))
+
+    queue = WorkspacePipeline(ws, FakeProvider())._queue(RunOptions(prompt_text="x"))
+    assert [i.image for i in queue] == ["b.jpg"]
+    assert sorted(loaded) == ["b.jpg", "c.jpg"]          # c only to mark it missing
+    assert real_get_item("c.jpg").is_missing
+
+
 def test_metadata_context_stored_when_present(tmp_path, src):
     # EXIF extraction is on by default; our tiny JPEGs have no GPS/date so context
     # is empty, but the run must still succeed and store a description.
@@ -116,3 +137,256 @@ def test_metadata_context_stored_when_present(tmp_path, src):
     events = list(WorkspacePipeline(ws, FakeProvider()).run(
         RunOptions(prompt_text="x", extract_metadata=True)))
     assert all(e.success for e in events)
+
+
+# --------------------------------------------------------------------------- #
+# Concurrent run mode (RunOptions.concurrency / idt describe --jobs)            #
+# --------------------------------------------------------------------------- #
+
+def _make_many(root: Path, n: int) -> Path:
+    for i in range(n):
+        _make_jpeg(root / f"img{i:02d}.jpg")
+    return root
+
+
+class SlowFirstProvider(FakeProvider):
+    """The first call blocks until every other worker has started one.
+
+    A serial pipeline would deadlock here (the barrier times out); a concurrent
+    one passes it. That proves calls genuinely overlap, not merely that the
+    option is accepted.
+    """
+    def __init__(self, parties: int):
+        super().__init__()
+        import threading
+        self._barrier = threading.Barrier(parties, timeout=10)
+        self._lock = threading.Lock()
+        self.seen_threads = set()
+
+    def describe(self, image_bytes, mime_type, prompt):
+        import threading
+        with self._lock:
+            self.seen_threads.add(threading.get_ident())
+            first_wave = self.calls < self._barrier.parties
+            result = super().describe(image_bytes, mime_type, prompt)
+        if first_wave:
+            self._barrier.wait()
+        return result
+
+
+def test_concurrent_run_overlaps_provider_calls(tmp_path):
+    src = _make_many(tmp_path / "Pics", 8)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+
+    provider = SlowFirstProvider(parties=3)
+    events = list(WorkspacePipeline(ws, provider).run(
+        RunOptions(prompt_text="x", concurrency=3)))
+
+    assert len(events) == 8
+    assert all(e.success for e in events)
+    assert len(provider.seen_threads) == 3
+    assert all(i.described for i in ws.items())
+
+
+def test_concurrent_run_reports_events_in_queue_order(tmp_path):
+    import random
+    import time
+
+    class JitterProvider(FakeProvider):
+        def describe(self, image_bytes, mime_type, prompt):
+            time.sleep(random.uniform(0, 0.02))
+            return super().describe(image_bytes, mime_type, prompt)
+
+    src = _make_many(tmp_path / "Pics", 12)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+    serial_order = [i.image for i in ws.media_items()]
+
+    events = list(WorkspacePipeline(ws, JitterProvider()).run(
+        RunOptions(prompt_text="x", concurrency=4)))
+
+    assert [e.index for e in events] == list(range(1, 13))
+    assert [e.item.image for e in events] == serial_order
+    assert all(e.total == 12 for e in events)
+
+
+def test_concurrent_run_keeps_run_log_format(tmp_path):
+    src = _make_many(tmp_path / "Pics", 4)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+
+    list(WorkspacePipeline(ws, FakeProvider()).run(RunOptions(prompt_text="x", concurrency=2)))
+
+    log_text = next(ws.logs_dir.glob("run_*.log")).read_text(encoding="utf-8")
+    lines = [ln for ln in log_text.splitlines() if ": described" in ln]
+    assert [ln.split("  ")[0].split(" - ")[1] for ln in lines] == ["1/4", "2/4", "3/4", "4/4"]
+    assert "done  described=4  errors=0" in log_text
+
+
+def test_concurrent_run_isolates_a_failing_item(tmp_path):
+    class FailsOnce(FakeProvider):
+        def describe(self, image_bytes, mime_type, prompt):
+            if "boom" in prompt:
+                raise RuntimeError("boom")
+            return super().describe(image_bytes, mime_type, prompt)
+
+    src = _make_many(tmp_path / "Pics", 3)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+
+    pipeline = WorkspacePipeline(ws, FailsOnce())
+    items = ws.media_items()
+    good = list(pipeline.run_items(items[:2], RunOptions(prompt_text="x", concurrency=2)))
+    bad = list(pipeline.run_items(items[2:], RunOptions(prompt_text="boom", concurrency=2)))
+
+    assert all(e.success for e in good)
+    assert not bad[0].success and "boom" in bad[0].error
+
+
+def test_abandoning_a_concurrent_run_stops_submitting(tmp_path):
+    src = _make_many(tmp_path / "Pics", 20)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+
+    provider = FakeProvider()
+    gen = WorkspacePipeline(ws, provider).run(RunOptions(prompt_text="x", concurrency=2))
+    next(gen)
+    gen.close()
+
+    # At most the in-flight window ran; the rest of the queue was never started.
+    assert provider.calls <= 5
+
+
+# --------------------------------------------------------------------------- #
+# Staged prepare / describe / persist (RunOptions.prefetch)                     #
+# --------------------------------------------------------------------------- #
+
+def test_preparation_runs_ahead_of_the_provider(tmp_path, monkeypatch):
+    """While item 1 is at the provider, items 2 and 3 are already loaded."""
+    import threading
+    import idt_core.pipeline as pipeline_mod
+
+    src = _make_many(tmp_path / "Pics", 4)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+
+    loaded = []
+    third_loaded = threading.Event()
+    real_load = pipeline_mod.load_for_api
+
+    def recording_load(path, *args):
+        loaded.append(Path(path).name)
+        if len(loaded) >= 3:
+            third_loaded.set()
+        return real_load(path, *args)
+
+    monkeypatch.setattr(pipeline_mod, "load_for_api", recording_load)
+
+    class WaitsForPrefetch(FakeProvider):
+        def describe(self, image_bytes, mime_type, prompt):
+            if self.calls == 0:
+                # A serial pipeline never gets here with 3 items loaded.
+                assert third_loaded.wait(timeout=10)
+            return super().describe(image_bytes, mime_type, prompt)
+
+    events = list(WorkspacePipeline(ws, WaitsForPrefetch()).run(
+        RunOptions(prompt_text="x", concurrency=1, prefetch=2)))
+    assert [e.success for e in events] == [True] * 4
+
+
+def test_sidecars_are_written_by_the_persist_stage(tmp_path, monkeypatch):
+    import threading
+
+    src = _make_many(tmp_path / "Pics", 3)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+
+    writer_threads = set()
+    real_save = ws.save_item
+
+    def recording_save(item):
+        writer_threads.add(threading.current_thread().name)
+        real_save(item)
+
+    monkeypatch.setattr(ws, "save_item", recording_save)
+    list(WorkspacePipeline(ws, FakeProvider()).run(RunOptions(prompt_text="x", concurrency=2)))
+
+    assert len(writer_threads) == 1
+    assert next(iter(writer_threads)).startswith("idt-persist")
+    assert all(i.described for i in ws.items())
+
+
+def test_preparation_failure_is_that_items_error(tmp_path, monkeypatch):
+    import idt_core.pipeline as pipeline_mod
+
+    src = _make_many(tmp_path / "Pics", 3)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+    real_load = pipeline_mod.load_for_api
+
+    def flaky_load(path, *args):
+        if Path(path).name == "img01.jpg":
+            raise OSError("cannot decode")
+        return real_load(path, *args)
+
+    monkeypatch.setattr(pipeline_mod, "load_for_api", flaky_load)
+    provider = FakeProvider()
+    events = list(WorkspacePipeline(ws, provider).run(RunOptions(prompt_text="x", prefetch=2)))
+
+    assert [e.success for e in events] == [True, False, True]
+    assert "cannot decode" in events[1].error
+    assert provider.calls == 2  # the broken image never reached the provider
+
+
+def test_serial_mode_runs_on_the_calling_thread(tmp_path):
+    import threading
+
+    src = _make_many(tmp_path / "Pics", 2)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(src, recursive=True)
+
+    class RecordsThread(FakeProvider):
+        def describe(self, image_bytes, mime_type, prompt):
+            self.thread = threading.current_thread()
+            return super().describe(image_bytes, mime_type, prompt)
+
+    provider = RecordsThread()
+    list(WorkspacePipeline(ws, provider).run(RunOptions(prompt_text="x", prefetch=0)))
+    assert provider.thread is threading.current_thread()
+
+
+# --------------------------------------------------------------------------- #
+# Continuous runs (run_feed / idt watch)                                        #
+# --------------------------------------------------------------------------- #
+
+def test_a_feed_is_one_run_across_batches(tmp_path, monkeypatch):
+    src = _make_many(tmp_path / "Pics", 3)
+    ws = Workspace.create(tmp_path / "WS")
+    items = ws.add_source_folder(src, recursive=True)
+    starts = []
+    real_begin = WorkspacePipeline._begin
+    monkeypatch.setattr(WorkspacePipeline, "_begin",
+                        lambda self, options: (starts.append(1), real_begin(self, options)))
+
+    provided = []
+
+    def batches():
+        provided.append(1)
+        yield items[:2]
+        provided.append(2)
+        yield []
+        yield items[2:] + items[:1]   # an already-described item is skipped
+
+    events = []
+    for event in WorkspacePipeline(ws, FakeProvider()).run_feed(batches(), RunOptions(prompt_text="x")):
+        events.append(event)
+        if len(events) == 2:
+            # every event of the first batch arrives before the feed is asked again
+            assert provided == [1]
+
+    assert [e.item.image for e in events] == [i.image for i in items]
+    assert starts == [1]
+    assert len(list(ws.logs_dir.glob("run_*.log"))) == 1
+    log_text = next(ws.logs_dir.glob("run_*.log")).read_text(encoding="utf-8")
+    assert "done  described=3  errors=0" in log_text
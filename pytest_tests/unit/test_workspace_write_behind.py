@@ -0,0 +1,130 @@
+"""
+Write-behind sidecar persistence (Workspace.write_behind / SidecarWriter).
+
+Saves inside a write_behind() block are held in memory and written in batches;
+unchanged sidecars are never rewritten; reads inside the block see queued saves;
+and everything is on disk once the block exits.
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from idt_core.workspace import Workspace, WorkspaceDescription
+
+
+def _make_png(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\x89PNG\r\n\x1a\n" + path.name.encode("utf-8"))
+
+
+@pytest.fixture
+def ws(tmp_path):
+    root = tmp_path / "Pictures" / "Trip"
+    for name in ("a.jpg", "b.jpg", "Day2/c.jpg"):
+        _make_png(root / name)
+    ws = Workspace.create(tmp_path / "WS")
+    ws.add_source_folder(root, recursive=True)
+    return ws
+
+
+def _on_disk(ws: Workspace, item) -> dict:
+    sidecar = ws._sidecar_path(item.image, item.subfolder)
+    return json.loads(sidecar.read_text(encoding="utf-8"))
+
+
+def test_saves_wait_until_the_block_exits(ws):
+    item = ws.get_item("a.jpg")
+    item.add_description(WorkspaceDescription.create("queued"))
+    with ws.write_behind(delay=0):
+        ws.save_item(item)
+        assert _on_disk(ws, item)["descriptions"] == []
+        assert ws.get_item("a.jpg").descriptions[0].text == "queued"
+
+    assert _on_disk(ws, item)["descriptions"][0]["text"] == "queued"
+
+
+def test_a_queued_save_is_a_snapshot_of_the_item(ws):
+    item = ws.get_item("a.jpg")
+    item.tags = ["saved"]
+    with ws.write_behind(delay=0):
+        ws.save_item(item)
+        item.tags.append("changed after the save")
+    assert _on_disk(ws, item)["tags"] == ["saved"]
+
+
+def test_repeated_saves_of_one_item_are_coalesced(ws):
+    item = ws.get_item("a.jpg")
+    with ws.write_behind(delay=0) as writer:
+        for n in range(5):
+            item.add_description(WorkspaceDescription.create(f"take {n}"))
+            ws.save_item(item)
+    assert writer.written == 1
+    assert len(ws.get_item("a.jpg").descriptions) == 5
+
+
+def test_unchanged_items_are_not_rewritten(ws):
+    before = {p: p.stat().st_mtime_ns for p in ws.descriptions_dir.glob("**/*.json")}
+    reopened = Workspace.open(ws.path)
+    with reopened.write_behind(delay=0) as writer:
+        for item in reopened.items():
+            reopened.save_item(item)
+    assert writer.written == 0
+    assert {p: p.stat().st_mtime_ns for p in before} == before
+
+
+def test_only_the_changed_item_is_rewritten(ws):
+    with ws.write_behind(delay=0) as writer:
+        for item in ws.items():
+            if item.image == "b.jpg":
+                item.add_description(WorkspaceDescription.create("changed"))
+            ws.save_item(item)
+    assert writer.written == 1
+
+
+def test_max_pending_writes_a_batch_early(ws):
+    items = ws.items()
+    with ws.write_behind(delay=0, max_pending=2) as writer:
+        for item in items[:2]:
+            item.add_description(WorkspaceDescription.create("x"))
+            ws.save_item(item)
+        assert writer.written == 2
+        assert not list(ws.descriptions_dir.glob("**/*.tmp"))
+
+
+def test_get_item_without_subfolder_sees_a_queued_save(ws):
+    item = ws.get_item("c.jpg")
+    assert item.subfolder
+    item.add_description(WorkspaceDescription.create("deep"))
+    with ws.write_behind(delay=0):
+        ws.save_item(item)
+        assert _on_disk(ws, item)["descriptions"] == []
+        assert ws.get_item("c.jpg").descriptions[0].text == "deep"
+
+
+def test_items_inside_the_block_include_queued_saves(ws):
+    item = ws.get_item("a.jpg")
+    item.add_description(WorkspaceDescription.create("listed"))
+    with ws.write_behind(delay=0):
+        ws.save_item(item)
+        described = [i.image for i in ws.items() if i.described]
+    assert described == ["a.jpg"]
+
+
+def test_nested_blocks_share_the_outer_writer(ws):
+    with ws.write_behind(delay=0) as outer:
+        with ws.write_behind() as inner:
+            assert inner is outer
+        item = ws.get_item("a.jpg")
+        item.add_description(WorkspaceDescription.create("x"))
+        ws.save_item(item)
+        assert outer.pending(ws._sidecar_path(item.image, item.subfolder)) is not None
+
+
+def test_add_image_does_not_reuse_a_queued_name(ws, tmp_path):
+    for folder in ("One", "Two"):
+        _make_png(tmp_path / folder / "z.jpg")
+    with ws.write_behind(delay=0):
+        first = ws.add_image(tmp_path / "One" / "z.jpg", copy=False)
+        second = ws.add_image(tmp_path / "Two" / "z.jpg", copy=False)
+    assert first.image != second.image
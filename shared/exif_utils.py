@@ -16,6 +16,12 @@ Functions:
     - extract_exif_date_string() - Extract formatted date string (M/D/YYYY H:MMP)
     - extract_exif_data() - Extract complete EXIF dictionary
     - extract_gps_coordinates() - Extract GPS location from EXIF
+
+Caching:
+    When idt_core is importable, the date and GPS functions go through its
+    MetadataExtractor and per-user metadata cache (idt_core.metadata_cache),
+    so each file version is read once however often the viewer asks. Without
+    idt_core they read the file with PIL as before.
 """
 
 import os
@@ -24,6 +30,19 @@ from typing import Dict, Optional, Any, Union, Tuple
 from datetime import datetime
 
 
+def _cached_metadata(image_path: Union[str, Path]):
+    """idt_core ImageMetadata for an existing file, from the per-user cache.
+
+    Returns None when idt_core is unavailable, so callers fall back to PIL.
+    """
+    try:
+        from idt_core.metadata import MetadataExtractor
+        from idt_core.metadata_cache import cache_for
+    except ImportError:
+        return None
+    return MetadataExtractor(cache=cache_for()).extract(Path(image_path))
+
+
 def extract_exif_datetime(image_path: Union[str, Path]) -> Optional[datetime]:
     """Extract datetime object from image EXIF data with fallback to file mtime.
     
@@ -50,18 +69,23 @@ def extract_exif_datetime(image_path: Union[str, Path]) -> Optional[datetime]:
         - Returns None only if file doesn't exist
     """
     try:
+        image_path = Path(image_path)
+
+        if not image_path.exists():
+            return None
+
+        meta = _cached_metadata(image_path)
+        if meta is not None:
+            # datetime_iso is the EXIF date, or the mtime when there is none
+            return datetime.fromisoformat(meta.datetime_iso) if meta.datetime_iso else None
+
         try:
             from PIL import Image
             from PIL.ExifTags import TAGS
         except ImportError:
             # Fallback if PIL not available
-            return datetime.fromtimestamp(Path(image_path).stat().st_mtime)
-        
-        image_path = Path(image_path)
-        
-        if not image_path.exists():
-            return None
-        
+            return datetime.fromtimestamp(image_path.stat().st_mtime)
+
         with Image.open(image_path) as img:
             exif_data = img.getexif()
             
@@ -230,17 +254,28 @@ def extract_gps_coordinates(image_path: Union[str, Path]) -> Optional[Dict[str,
         - Handles malformed GPS data gracefully
     """
     try:
+        image_path = Path(image_path)
+
+        if not image_path.exists():
+            return None
+
+        meta = _cached_metadata(image_path)
+        if meta is not None:
+            coordinates = {
+                key: value for key, value in (
+                    ('latitude', meta.latitude),
+                    ('longitude', meta.longitude),
+                    ('altitude', meta.altitude),
+                ) if value is not None
+            }
+            return coordinates if coordinates else None
+
         try:
             from PIL import Image
             from PIL.ExifTags import GPSTAGS
         except ImportError:
             return None
-        
-        image_path = Path(image_path)
-        
-        if not image_path.exists():
-            return None
-        
+
         with Image.open(image_path) as img:
             exif_data = img.getexif()
             